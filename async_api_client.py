@@ -6,13 +6,24 @@ import asyncio
 import time
 from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
+from urllib.parse import urlparse
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
 from config import SERVICE_KEY
-from common import parse_xml_response, parse_api_response, API_TIMEOUT_SECONDS
+from common import (
+    parse_api_response, API_TIMEOUT_SECONDS,
+    API_PAGE_CONCURRENCY, get_total_count, remaining_page_numbers, merge_page_results
+)
 from logger import get_logger, APILogger
+from backend.cache.decorators import cache_api_response
+from parse_executor import get_parse_executor
+from rate_limiter import get_rate_limiter, TokenBucketLimiter, THROTTLE_STATUS_CODES
+from retry_policy import (
+    API_MAX_RETRIES, CIRCUIT_OPEN_ERROR_CODE, STATE_OPEN, CircuitBreaker,
+    backoff_delay, circuit_open_error, get_circuit_breaker, is_retryable_status
+)
 
 
 class AsyncAPIClient(ABC):
@@ -24,6 +35,8 @@ class AsyncAPIClient(ABC):
     - 병렬 요청 지원 (asyncio.gather)
     - BaseAPIClient와 동일한 인터페이스
     - 기존 sync 메서드와 공존 가능
+    - 호출 속도 제한 (동기 클라이언트와 같은 적응형 토큰 버킷 공유)
+    - 재시도 (지수 백오프 + Full Jitter) / 엔드포인트별 회로 차단기
 
     서브클래스는 다음을 정의해야 합니다:
     - BASE_URL: API 기본 URL
@@ -55,6 +68,25 @@ class AsyncAPIClient(ABC):
         self.api_logger = APILogger(api_name)
         self.logger = get_logger(self.__class__.__name__)
 
+        # 호스트별 공유 Rate Limiter (비활성화 시 None)
+        self.rate_limiter: Optional[TokenBucketLimiter] = get_rate_limiter(urlparse(self.BASE_URL).netloc)
+
+        # 엔드포인트별 공유 회로 차단기 (동기 클라이언트와 공유, 비활성화 시 None)
+        self.circuit_breaker: Optional[CircuitBreaker] = get_circuit_breaker(self.full_url)
+
+        # 페이지 팬아웃 동시 요청 제한 (세마포어는 이벤트 루프별로 생성)
+        self.page_concurrency = API_PAGE_CONCURRENCY
+        self._page_semaphore: Optional[asyncio.Semaphore] = None
+        self._page_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_page_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 페이지 요청 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._page_semaphore is None or self._page_semaphore_loop is not loop:
+            self._page_semaphore = asyncio.Semaphore(max(1, self.page_concurrency))
+            self._page_semaphore_loop = loop
+        return self._page_semaphore
+
     @property
     def full_url(self) -> str:
         """전체 API URL 반환"""
@@ -99,16 +131,19 @@ class AsyncAPIClient(ABC):
         session: ClientSession,
         params: Dict,
         timeout: int = API_TIMEOUT_SECONDS,
-        max_retries: int = 3
+        max_retries: int = API_MAX_RETRIES
     ) -> Dict:
         """
         비동기 HTTP GET 요청 실행
 
+        타임아웃/연결 오류/429·5xx 응답은 지수 백오프(Full Jitter) 후 재시도하고,
+        엔드포인트 회로가 열려 있으면 요청 없이 즉시 실패를 반환합니다.
+
         Args:
             session: aiohttp ClientSession
             params: 요청 파라미터
             timeout: 타임아웃 (초)
-            max_retries: 최대 재시도 횟수
+            max_retries: 최대 시도 횟수
 
         Returns:
             파싱된 응답 데이터
@@ -116,118 +151,185 @@ class AsyncAPIClient(ABC):
         url = self.full_url
         last_error = None
         start_time = time.time()
+        breaker = self.circuit_breaker
+
+        # 회로가 열려 있으면 요청하지 않음
+        if breaker and not breaker.allow_request():
+            self.api_logger.log_error("Circuit open", error_code=CIRCUIT_OPEN_ERROR_CODE)
+            return circuit_open_error(breaker)
 
         # 요청 로깅
         self.api_logger.log_request("GET", url, params)
 
         timeout_config = ClientTimeout(total=timeout)
 
-        for attempt in range(max_retries):
-            try:
-                self.logger.debug(
-                    "async_api_request_attempt",
-                    attempt=attempt + 1,
-                    max_retries=max_retries,
-                    url=url
-                )
+        # 회로 차단기에 기록할 결과 (엔드포인트가 정상 응답하면 False)
+        endpoint_failed = True
 
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=timeout_config
-                ) as response:
-                    response.raise_for_status()
-
-                    # 응답 내용 확인
-                    text_response = await response.text()
-                    text_response = text_response.strip()
-
-                    # 응답 성공 로깅
-                    response_time = time.time() - start_time
-                    self.api_logger.log_response(
-                        status_code=response.status,
-                        response_time=response_time,
-                        response_length=len(text_response)
-                    )
+        try:
+            for attempt in range(max_retries):
+                # 재시도 전 백오프 (그 사이 다른 요청으로 회로가 열렸으면 중단)
+                if attempt > 0:
+                    if breaker and breaker.state == STATE_OPEN:
+                        return circuit_open_error(breaker)
+                    await asyncio.sleep(backoff_delay(attempt - 1))
 
-                    # XML 응답 처리
-                    if text_response.startswith('<?xml') or text_response.startswith('<'):
-                        return parse_xml_response(text_response)
+                try:
+                    self.logger.debug(
+                        "async_api_request_attempt",
+                        attempt=attempt + 1,
+                        max_retries=max_retries,
+                        url=url
+                    )
 
-                    # JSON 응답 처리
-                    elif text_response.startswith('{') or text_response.startswith('['):
-                        return await response.json()
+                    if self.rate_limiter:
+                        await self.rate_limiter.acquire_async()
+
+                    async with session.get(
+                        url,
+                        params=params,
+                        timeout=timeout_config
+                    ) as response:
+                        endpoint_failed = is_retryable_status(response.status)
+                        response.raise_for_status()
+
+                        if self.rate_limiter:
+                            self.rate_limiter.on_success()
+
+                        # 응답 내용 확인 (XML은 bytes 그대로 파싱: str 디코딩/재인코딩 생략)
+                        raw_response = (await response.read()).strip()
+
+                        # 응답 성공 로깅
+                        response_time = time.time() - start_time
+                        self.api_logger.log_response(
+                            status_code=response.status,
+                            response_time=response_time,
+                            response_length=len(raw_response)
+                        )
 
-                    # 예상치 못한 형식
+                        # XML 응답 처리 (이벤트 루프 밖에서 파싱)
+                        if raw_response.startswith(b'<'):
+                            result, parse_time = await get_parse_executor().parse_xml(raw_response)
+                            self.api_logger.log_timing(fetch_time=response_time, parse_time=parse_time)
+                            return result
+
+                        # JSON 응답 처리
+                        elif raw_response.startswith(b'{') or raw_response.startswith(b'['):
+                            return await response.json()
+
+                        # 예상치 못한 형식
+                        else:
+                            text_response = raw_response[:500].decode(
+                                response.charset or 'utf-8', errors='replace'
+                            )
+                            self.logger.warning(
+                                "unexpected_response_format",
+                                format=text_response[:100]
+                            )
+                            return {
+                                'error': True,
+                                'message': '예상치 못한 응답 형식',
+                                'raw_response': text_response[:500]
+                            }
+
+                except asyncio.TimeoutError as e:
+                    last_error = e
+                    endpoint_failed = True
+                    if self.rate_limiter:
+                        self.rate_limiter.on_throttle('timeout')
+                    if attempt < max_retries - 1:
+                        self.api_logger.log_retry(
+                            attempt=attempt + 1,
+                            max_retries=max_retries,
+                            reason="Timeout"
+                        )
+                        continue
                     else:
-                        self.logger.warning(
-                            "unexpected_response_format",
-                            format=text_response[:100]
+                        self.api_logger.log_error(
+                            "Request timeout after retries",
+                            error_code="TIMEOUT"
                         )
-                        return {
-                            'error': True,
-                            'message': '예상치 못한 응답 형식',
-                            'raw_response': text_response[:500]
-                        }
-
-            except asyncio.TimeoutError as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    self.api_logger.log_retry(
-                        attempt=attempt + 1,
-                        max_retries=max_retries,
-                        reason="Timeout"
+
+                except aiohttp.ClientResponseError as e:
+                    last_error = e
+                    if self.rate_limiter and e.status in THROTTLE_STATUS_CODES:
+                        self.rate_limiter.on_throttle(f'http_{e.status}')
+                    if is_retryable_status(e.status) and attempt < max_retries - 1:
+                        self.api_logger.log_retry(
+                            attempt=attempt + 1,
+                            max_retries=max_retries,
+                            reason=f"HTTP {e.status}"
+                        )
+                        continue
+                    self.api_logger.log_error(
+                        f"HTTP error: {e.status}",
+                        error_code="HTTP_ERROR"
                     )
-                    await asyncio.sleep(1)  # 재시도 전 대기
-                    continue
-                else:
+                    return {
+                        'error': True,
+                        'message': f'HTTP 에러: {e.status}',
+                        'detail': str(e)
+                    }
+
+                except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+                    # 연결 거부/리셋, 응답 중 끊김: 일시적 장애로 보고 재시도
+                    last_error = e
+                    endpoint_failed = True
+                    if self.rate_limiter:
+                        self.rate_limiter.on_throttle('connection_error')
+                    if attempt < max_retries - 1:
+                        self.api_logger.log_retry(
+                            attempt=attempt + 1,
+                            max_retries=max_retries,
+                            reason="Connection error"
+                        )
+                        continue
+                    else:
+                        self.api_logger.log_error(
+                            "Connection failed after retries",
+                            error_code="CONNECTION_FAILED",
+                            detail=str(e)
+                        )
+
+                except aiohttp.ClientError as e:
+                    # 잘못된 요청 등 엔드포인트 장애가 아닌 오류는 재시도하지 않음
+                    last_error = e
+                    endpoint_failed = False
                     self.api_logger.log_error(
-                        "Request timeout after retries",
-                        error_code="TIMEOUT"
+                        "API request failed",
+                        error_code="REQUEST_FAILED",
+                        detail=str(e)
                     )
+                    return {
+                        'error': True,
+                        'message': f'API 요청 실패: {str(e)}'
+                    }
 
-            except aiohttp.ClientResponseError as e:
-                last_error = e
-                self.api_logger.log_error(
-                    f"HTTP error: {e.status}",
-                    error_code="HTTP_ERROR"
-                )
-                return {
-                    'error': True,
-                    'message': f'HTTP 에러: {e.status}',
-                    'detail': str(e)
-                }
-
-            except aiohttp.ClientError as e:
-                last_error = e
-                self.api_logger.log_error(
-                    "API request failed",
-                    error_code="REQUEST_FAILED",
-                    detail=str(e)
-                )
-                return {
-                    'error': True,
-                    'message': f'API 요청 실패: {str(e)}'
-                }
-
-            except Exception as e:
-                last_error = e
-                self.logger.error(
-                    "response_processing_error",
-                    error=str(e),
-                    exc_info=True
-                )
-                return {
-                    'error': True,
-                    'message': f'응답 처리 실패: {str(e)}'
-                }
-
-        # 최대 재시도 횟수 초과
-        return {
-            'error': True,
-            'message': f'최대 재시도 횟수 초과 ({max_retries}회)',
-            'detail': str(last_error)
-        }
+                except Exception as e:
+                    last_error = e
+                    self.logger.error(
+                        "response_processing_error",
+                        error=str(e),
+                        exc_info=True
+                    )
+                    return {
+                        'error': True,
+                        'message': f'응답 처리 실패: {str(e)}'
+                    }
+
+            # 최대 재시도 횟수 초과
+            return {
+                'error': True,
+                'message': f'최대 재시도 횟수 초과 ({max_retries}회)',
+                'detail': str(last_error)
+            }
+
+        finally:
+            if breaker:
+                if endpoint_failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
 
     async def get_trade_data_async(
         self,
@@ -307,6 +409,7 @@ class AsyncAPIClient(ABC):
         )
         return self.parse_response(response)
 
+    @cache_api_response()
     async def get_all_pages_async(
         self,
         session: ClientSession,
@@ -319,6 +422,11 @@ class AsyncAPIClient(ABC):
         """
         비동기 모든 페이지 데이터 조회 (페이지네이션 자동 처리)
 
+        1페이지에서 전체 건수를 확인한 뒤 나머지 페이지를 동시에 요청하고
+        (클라이언트 전체 동시 페이지 요청은 page_concurrency개로 제한),
+        페이지 순서대로 병합합니다 (페이지 간 중복 제거).
+        결과는 Redis에 캐싱됩니다 (cache_api_response, use_cache=False면 캐시 없이 조회).
+
         Args:
             session: aiohttp ClientSession
             lawd_cd: 지역코드
@@ -330,11 +438,7 @@ class AsyncAPIClient(ABC):
         Returns:
             모든 페이지 데이터를 합친 결과
         """
-        all_items = []
-        page_no = 1
-        total_count = 0
-
-        while page_no <= max_pages:
+        async def fetch_page(page_no: int) -> Dict:
             self.logger.info(
                 "async_fetching_page",
                 page=page_no,
@@ -342,8 +446,7 @@ class AsyncAPIClient(ABC):
                 lawd_cd=lawd_cd,
                 deal_ymd=deal_ymd
             )
-
-            result = await self.get_trade_data_parsed_async(
+            return await self.get_trade_data_parsed_async(
                 session=session,
                 lawd_cd=lawd_cd,
                 deal_ymd=deal_ymd,
@@ -352,57 +455,55 @@ class AsyncAPIClient(ABC):
                 **extra_params
             )
 
-            # 에러 체크
-            if result.get('error'):
-                self.logger.error(
-                    "async_page_fetch_failed",
-                    page=page_no,
-                    error=result.get('message')
-                )
-                break
-
-            # 첫 페이지에서 전체 개수 확인
-            if page_no == 1:
-                total_count = result.get('totalCount', 0)
-                self.logger.info(
-                    "async_total_count_detected",
-                    total_count=total_count
-                )
+        async def fetch_page_limited(page_no: int) -> Dict:
+            async with self._get_page_semaphore():
+                return await fetch_page(page_no)
 
-            # 아이템 추가
-            items = result.get('items', [])
-            if not items:
-                self.logger.info(
-                    "async_no_more_items",
-                    page=page_no
-                )
-                break
+        result = await fetch_page(1)
 
-            all_items.extend(items)
-            self.logger.info(
-                "async_page_collected",
-                page=page_no,
-                items_in_page=len(items),
-                total_collected=len(all_items)
+        # 첫 페이지 실패는 빈 결과로 감추지 않고 에러를 그대로 반환
+        # (거래 없는 월로 캐싱/기록되지 않도록)
+        if result.get('error'):
+            self.logger.error(
+                "async_page_fetch_failed",
+                page=1,
+                error=result.get('message')
             )
+            return {**result, 'totalCount': 0, 'items': []}
 
-            # 전체 데이터를 다 가져왔으면 종료
-            if len(all_items) >= total_count:
-                self.logger.info(
-                    "async_all_data_collected",
-                    total_items=len(all_items)
-                )
-                break
+        self.logger.info(
+            "async_total_count_detected",
+            total_count=get_total_count(result)
+        )
 
-            page_no += 1
+        page_items = {1: result.get('items', [])}
+        failed_pages: List[int] = []
+        remaining = remaining_page_numbers(result, num_of_rows, max_pages)
 
-        return {
-            'totalCount': len(all_items),
-            'items': all_items,
-            'numOfRows': num_of_rows,
-            'pageNo': page_no,
-            'error': False
-        }
+        if remaining:
+            pages = await asyncio.gather(
+                *[fetch_page_limited(page_no) for page_no in remaining],
+                return_exceptions=True
+            )
+            for page_no, page in zip(remaining, pages):
+                if isinstance(page, Exception) or page.get('error'):
+                    self.logger.error(
+                        "async_page_fetch_failed",
+                        page=page_no,
+                        error=str(page) if isinstance(page, Exception) else page.get('message')
+                    )
+                    failed_pages.append(page_no)
+                    continue
+                page_items[page_no] = page.get('items', [])
+
+        merged = merge_page_results(page_items, failed_pages, get_total_count(result), num_of_rows)
+        self.logger.info(
+            "async_all_data_collected",
+            total_items=merged['totalCount'],
+            pages=len(page_items),
+            failed_pages=failed_pages
+        )
+        return merged
 
     async def get_batch_data_async(
         self,
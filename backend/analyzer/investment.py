@@ -2,11 +2,17 @@
 투자 분석 모듈
 전세가율, 갭투자, 급매물 탐지 등
 """
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime
+import heapq
 import statistics
 
+from .utils import CHECKPOINT_INTERVAL, checkpoint, wants_section
+
+# fields 선택자로 지정 가능한 응답 섹션
+BARGAIN_SALES_SECTIONS = ("stats", "by_region", "bargain_items", "recent_bargains")
+
 
 def calculate_jeonse_ratio(items: List[Dict]) -> Dict:
     """
@@ -58,14 +64,20 @@ def calculate_jeonse_ratio(items: List[Dict]) -> Dict:
 
     # 매매 데이터 그룹화
     trade_by_key = defaultdict(list)
-    for item in trade_items:
+    for index, item in enumerate(trade_items):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         key = get_match_key(item)
         if key[0] and item.get("_deal_amount_numeric"):  # 아파트명과 가격이 있는 경우만
             trade_by_key[key].append(item)
 
     # 전세 데이터 그룹화
     jeonse_by_key = defaultdict(list)
-    for item in jeonse_items:
+    for index, item in enumerate(jeonse_items):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         key = get_match_key(item)
         # 전세 보증금 추출
         deposit = item.get("deposit", "") or item.get("보증금액", "")
@@ -81,7 +93,10 @@ def calculate_jeonse_ratio(items: List[Dict]) -> Dict:
     jeonse_ratio_data = []
     matched_count = 0
 
-    for key in trade_by_key:
+    for index, key in enumerate(trade_by_key):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         if key in jeonse_by_key:
             trade_list = trade_by_key[key]
             jeonse_list = jeonse_by_key[key]
@@ -310,18 +325,18 @@ def analyze_gap_investment(items: List[Dict]) -> Dict:
     }
 
 
-def detect_bargain_sales(items: List[Dict], threshold_pct: float = 10.0) -> Dict:
+def _compare_bargain_trades(
+    items: List[Dict], threshold_pct: float
+) -> Tuple[List[Dict], List[Dict], List[Dict]]:
     """
-    급매물 탐지
-
-    정의: 동일 아파트+면적대의 최근 3개월 평균가 대비 threshold_pct% 이상 낮은 거래
+    아파트+면적대별 직전 거래 평균가 대비 할인율 계산
 
     Args:
         items: 거래 데이터 리스트
-        threshold_pct: 급매 판단 기준 (기본 10%)
+        threshold_pct: 급매 판단 기준
 
     Returns:
-        급매물 탐지 결과
+        (매매 거래, 급매 거래, 일반 거래) - 매매 거래가 10건 미만이면 비교 없음
     """
     # 매매 데이터만 필터링 (API 02)
     trade_items = [
@@ -333,12 +348,11 @@ def detect_bargain_sales(items: List[Dict], threshold_pct: float = 10.0) -> Dict
         and item.get("_deal_date")
     ]
 
+    bargain_items = []
+    normal_items = []
+
     if len(trade_items) < 10:
-        return {
-            "has_data": False,
-            "message": f"급매물 탐지를 위한 데이터가 부족합니다. (현재 {len(trade_items)}건)",
-            "bargain_count": 0,
-        }
+        return trade_items, bargain_items, normal_items
 
     # 아파트+면적대별 그룹화
     def get_apt_key(item):
@@ -355,15 +369,18 @@ def detect_bargain_sales(items: List[Dict], threshold_pct: float = 10.0) -> Dict
 
     # 아파트별 거래 내역
     apt_trades = defaultdict(list)
-    for item in sorted_items:
+    for index, item in enumerate(sorted_items):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         key = get_apt_key(item)
         if key[0]:  # 아파트명이 있는 경우만
             apt_trades[key].append(item)
 
-    bargain_items = []
-    normal_items = []
-
     for apt_key, trades in apt_trades.items():
+        # 그룹마다 직전 거래 평균을 다시 계산하므로 그룹 단위로 확인
+        checkpoint()
+
         if len(trades) < 2:
             continue
 
@@ -403,6 +420,38 @@ def detect_bargain_sales(items: List[Dict], threshold_pct: float = 10.0) -> Dict
                 else:
                     normal_items.append(trade_info)
 
+    return trade_items, bargain_items, normal_items
+
+
+def detect_bargain_sales(
+    items: List[Dict],
+    threshold_pct: float = 10.0,
+    fields: Optional[Iterable[str]] = None,
+) -> Dict:
+    """
+    급매물 탐지
+
+    정의: 동일 아파트+면적대의 최근 3개월 평균가 대비 threshold_pct% 이상 낮은 거래
+
+    Args:
+        items: 거래 데이터 리스트
+        threshold_pct: 급매 판단 기준 (기본 10%)
+        fields: 계산할 섹션 (BARGAIN_SALES_SECTIONS 중 선택, None이면 전체)
+
+    Returns:
+        급매물 탐지 결과
+    """
+    trade_items, bargain_items, normal_items = _compare_bargain_trades(
+        items, threshold_pct
+    )
+
+    if len(trade_items) < 10:
+        return {
+            "has_data": False,
+            "message": f"급매물 탐지를 위한 데이터가 부족합니다. (현재 {len(trade_items)}건)",
+            "bargain_count": 0,
+        }
+
     if not bargain_items and not normal_items:
         return {
             "has_data": False,
@@ -416,60 +465,126 @@ def detect_bargain_sales(items: List[Dict], threshold_pct: float = 10.0) -> Dict
         (len(bargain_items) / total_compared * 100) if total_compared > 0 else 0
     )
 
+    result = {"has_data": True}
+
+    # 통계
+    if wants_section(fields, "stats"):
+        if bargain_items:
+            discount_pcts = [b["discount_pct"] for b in bargain_items]
+            result["stats"] = {
+                "total_trades": len(trade_items),
+                "compared_trades": total_compared,
+                "bargain_count": len(bargain_items),
+                "bargain_rate": bargain_rate,
+                "avg_discount": statistics.mean(discount_pcts),
+                "max_discount": max(discount_pcts),
+                "threshold_pct": threshold_pct,
+            }
+        else:
+            result["stats"] = {
+                "total_trades": len(trade_items),
+                "compared_trades": total_compared,
+                "bargain_count": 0,
+                "bargain_rate": 0,
+                "avg_discount": 0,
+                "max_discount": 0,
+                "threshold_pct": threshold_pct,
+            }
+
     # 지역별 급매율
-    region_bargains = defaultdict(lambda: {"bargain": 0, "total": 0})
-    for item in bargain_items:
-        region_bargains[item["region"]]["bargain"] += 1
-        region_bargains[item["region"]]["total"] += 1
-    for item in normal_items:
-        region_bargains[item["region"]]["total"] += 1
+    if wants_section(fields, "by_region"):
+        region_bargains = defaultdict(lambda: {"bargain": 0, "total": 0})
+        for item in bargain_items:
+            region_bargains[item["region"]]["bargain"] += 1
+            region_bargains[item["region"]]["total"] += 1
+        for item in normal_items:
+            region_bargains[item["region"]]["total"] += 1
+
+        by_region = []
+        for region, counts in region_bargains.items():
+            if counts["total"] > 0:
+                by_region.append(
+                    {
+                        "region": region,
+                        "bargain_count": counts["bargain"],
+                        "total_count": counts["total"],
+                        "bargain_rate": (counts["bargain"] / counts["total"]) * 100,
+                    }
+                )
 
-    by_region = []
-    for region, counts in region_bargains.items():
-        if counts["total"] > 0:
-            by_region.append(
-                {
-                    "region": region,
-                    "bargain_count": counts["bargain"],
-                    "total_count": counts["total"],
-                    "bargain_rate": (counts["bargain"] / counts["total"]) * 100,
-                }
-            )
+        result["by_region"] = sorted(
+            by_region, key=lambda x: x["bargain_rate"], reverse=True
+        )
+
+    # 급매물 리스트 (할인율 높은 순) - 전체 정렬 대신 상위 k개만 선택
+    if wants_section(fields, "bargain_items"):
+        result["bargain_items"] = heapq.nlargest(  # 상위 50개
+            50, bargain_items, key=lambda x: x["discount_pct"]
+        )
 
-    by_region = sorted(by_region, key=lambda x: x["bargain_rate"], reverse=True)
+    if wants_section(fields, "recent_bargains"):
+        result["recent_bargains"] = heapq.nlargest(
+            20,
+            (b for b in bargain_items if b.get("deal_date", "") >= "2024-01"),
+            key=lambda x: x["discount_pct"],
+        )
 
-    # 급매물 리스트 (할인율 높은 순)
-    bargain_items = sorted(bargain_items, key=lambda x: x["discount_pct"], reverse=True)
+    return result
 
-    # 통계
-    if bargain_items:
-        discount_pcts = [b["discount_pct"] for b in bargain_items]
-        stats = {
-            "total_trades": len(trade_items),
-            "compared_trades": total_compared,
-            "bargain_count": len(bargain_items),
-            "bargain_rate": bargain_rate,
-            "avg_discount": statistics.mean(discount_pcts),
-            "max_discount": max(discount_pcts),
-            "threshold_pct": threshold_pct,
-        }
+
+def find_bargain_trades(items: List[Dict], threshold_pct: float = 10.0) -> List[Dict]:
+    """
+    급매 거래 목록 (iter_bargain_rows의 bargains로 재사용, 읽기 전용)
+
+    Args:
+        items: 거래 데이터 리스트
+        threshold_pct: 급매 판단 기준 (기본 10%)
+
+    Returns:
+        급매 거래 정보 리스트 (비교 순서)
+    """
+    _, bargain_items, _ = _compare_bargain_trades(items, threshold_pct)
+    return bargain_items
+
+
+def iter_bargain_rows(
+    items: List[Dict],
+    threshold_pct: float = 10.0,
+    after: Optional[Tuple] = None,
+    limit: Optional[int] = None,
+    bargains: Optional[List[Dict]] = None,
+) -> Iterator[Tuple[Tuple, Dict]]:
+    """
+    급매물을 할인율 높은 순으로 하나씩 생성 (커서 페이지네이션/스트리밍용)
+
+    정렬 키는 (-할인율, 비교 순번)으로 동일 데이터에서 항상 같은 순서를
+    보장합니다. limit 지정 시 전체 정렬 대신 상위 k개(heapq.nsmallest)만
+    선택합니다.
+
+    Args:
+        items: 거래 데이터 리스트
+        threshold_pct: 급매 판단 기준 (기본 10%)
+        after: 이 정렬 키 이후부터 생성 (이전 페이지의 마지막 키)
+        limit: 최대 생성 개수 (None이면 전체)
+        bargains: items의 find_bargain_trades 결과 (있으면 다시 비교하지 않음)
+
+    Yields:
+        (정렬 키, 급매 거래 정보)
+    """
+    if bargains is None:
+        bargains = find_bargain_trades(items, threshold_pct)
+
+    candidates = (
+        ((-item["discount_pct"], seq), item)
+        for seq, item in enumerate(bargains)
+    )
+    if after is not None:
+        candidates = (entry for entry in candidates if entry[0] > after)
+
+    if limit is None:
+        ranked = sorted(candidates, key=lambda entry: entry[0])
     else:
-        stats = {
-            "total_trades": len(trade_items),
-            "compared_trades": total_compared,
-            "bargain_count": 0,
-            "bargain_rate": 0,
-            "avg_discount": 0,
-            "max_discount": 0,
-            "threshold_pct": threshold_pct,
-        }
+        ranked = heapq.nsmallest(limit, candidates, key=lambda entry: entry[0])
 
-    return {
-        "has_data": True,
-        "stats": stats,
-        "by_region": by_region,
-        "bargain_items": bargain_items[:50],  # 상위 50개
-        "recent_bargains": [
-            b for b in bargain_items if b.get("deal_date", "") >= "2024-01"
-        ][:20],
-    }
+    for sort_key, item in ranked:
+        yield sort_key, item
@@ -10,6 +10,7 @@ import statistics
 
 # Import basic stats functions for use in summarize_period
 from .basic_stats import calculate_basic_stats
+from .utils import CHECKPOINT_INTERVAL, checkpoint
 
 
 def analyze_rent_vs_jeonse(items: List[Dict]) -> Dict:
@@ -879,7 +880,10 @@ def summarize_period(items: List[Dict], start_date: datetime, end_date: datetime
         return {"has_data": False, "items": []}
 
     period_items = []
-    for item in items:
+    for index, item in enumerate(items):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         deal_date = item.get("_deal_date")
         if deal_date is None:
             continue
@@ -914,7 +918,10 @@ def summarize_period(items: List[Dict], start_date: datetime, end_date: datetime
     api_counts = defaultdict(int)
     months = set()
 
-    for item in period_items:
+    for index, item in enumerate(period_items):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         region = item.get("_region_name", "미지정")
         region_data[region]["count"] += 1
         price = item.get("_deal_amount_numeric")
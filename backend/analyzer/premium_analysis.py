@@ -2,18 +2,46 @@
 프리미엄 분석 모듈
 평당가, 층수 프리미엄, 건물연식 프리미엄 등
 """
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 from collections import defaultdict
 from datetime import datetime
 import statistics
 
-
-def calculate_price_per_area(items: List[Dict]) -> Dict:
+from .utils import wants_section
+
+# fields 선택자로 지정 가능한 응답 섹션
+PRICE_PER_AREA_SECTIONS = (
+    "stats",
+    "by_region",
+    "by_area_range",
+    "by_build_year",
+    "top_expensive",
+    "top_affordable",
+)
+FLOOR_PREMIUM_SECTIONS = (
+    "stats",
+    "by_floor_category",
+    "by_individual_floor",
+    "royal_floor_info",
+)
+BUILDING_AGE_PREMIUM_SECTIONS = (
+    "stats",
+    "by_age_range",
+    "by_build_year",
+    "rebuild_candidates",
+)
+
+
+def calculate_price_per_area(
+    items: List[Dict], fields: Optional[Iterable[str]] = None
+) -> Dict:
     """
     평당가(㎡당 가격) 분석
 
     Args:
         items: 거래 데이터 리스트
+        fields: 계산할 섹션 (PRICE_PER_AREA_SECTIONS 중 선택, None이면 전체).
+            요청되지 않은 섹션은 계산하지 않고 응답에서도 제외
 
     Returns:
         평당가 분석 데이터
@@ -28,7 +56,7 @@ def calculate_price_per_area(items: List[Dict]) -> Dict:
     ]
 
     if not valid_items:
-        return {
+        empty = {
             "stats": {},
             "by_region": [],
             "by_area_range": [],
@@ -36,137 +64,144 @@ def calculate_price_per_area(items: List[Dict]) -> Dict:
             "top_expensive": [],
             "top_affordable": [],
         }
+        return {
+            section: value
+            for section, value in empty.items()
+            if wants_section(fields, section)
+        }
 
     # 평당가 계산 추가
     for item in valid_items:
         item["_price_per_area"] = item["_deal_amount_numeric"] / item["_area_numeric"]
 
+    result = {}
+
     # 전체 평당가 통계
-    prices_per_area = [item["_price_per_area"] for item in valid_items]
-    overall_stats = {
-        "avg_price_per_area": statistics.mean(prices_per_area),
-        "median_price_per_area": statistics.median(prices_per_area),
-        "max_price_per_area": max(prices_per_area),
-        "min_price_per_area": min(prices_per_area),
-        "std_price_per_area": statistics.stdev(prices_per_area)
-        if len(prices_per_area) > 1
-        else 0,
-        "total_count": len(valid_items),
-    }
+    if wants_section(fields, "stats"):
+        prices_per_area = [item["_price_per_area"] for item in valid_items]
+        result["stats"] = {
+            "avg_price_per_area": statistics.mean(prices_per_area),
+            "median_price_per_area": statistics.median(prices_per_area),
+            "max_price_per_area": max(prices_per_area),
+            "min_price_per_area": min(prices_per_area),
+            "std_price_per_area": statistics.stdev(prices_per_area)
+            if len(prices_per_area) > 1
+            else 0,
+            "total_count": len(valid_items),
+        }
 
     # 지역별 평당가
-    region_data = defaultdict(lambda: {"prices_per_area": [], "count": 0})
-    for item in valid_items:
-        region = item.get("_region_name", "미지정")
-        region_data[region]["prices_per_area"].append(item["_price_per_area"])
-        region_data[region]["count"] += 1
-
-    by_region = []
-    for region in sorted(region_data.keys()):
-        stats = region_data[region]
-        if stats["prices_per_area"]:
-            by_region.append(
-                {
-                    "region": region,
-                    "count": stats["count"],
-                    "avg_price_per_area": statistics.mean(stats["prices_per_area"]),
-                    "median_price_per_area": statistics.median(
-                        stats["prices_per_area"]
-                    ),
-                    "max_price_per_area": max(stats["prices_per_area"]),
-                    "min_price_per_area": min(stats["prices_per_area"]),
-                }
-            )
+    if wants_section(fields, "by_region"):
+        region_data = defaultdict(lambda: {"prices_per_area": [], "count": 0})
+        for item in valid_items:
+            region = item.get("_region_name", "미지정")
+            region_data[region]["prices_per_area"].append(item["_price_per_area"])
+            region_data[region]["count"] += 1
+
+        by_region = []
+        for region in sorted(region_data.keys()):
+            stats = region_data[region]
+            if stats["prices_per_area"]:
+                by_region.append(
+                    {
+                        "region": region,
+                        "count": stats["count"],
+                        "avg_price_per_area": statistics.mean(stats["prices_per_area"]),
+                        "median_price_per_area": statistics.median(
+                            stats["prices_per_area"]
+                        ),
+                        "max_price_per_area": max(stats["prices_per_area"]),
+                        "min_price_per_area": min(stats["prices_per_area"]),
+                    }
+                )
 
-    # 면적대별 평당가 (소형/중형/대형)
-    area_ranges = [
-        ("소형 (60㎡ 미만)", 0, 60),
-        ("중소형 (60-85㎡)", 60, 85),
-        ("중형 (85-102㎡)", 85, 102),
-        ("중대형 (102-135㎡)", 102, 135),
-        ("대형 (135㎡ 이상)", 135, float("inf")),
-    ]
+        result["by_region"] = sorted(
+            by_region, key=lambda x: x["avg_price_per_area"], reverse=True
+        )
 
-    by_area_range = []
-    for range_name, min_area, max_area in area_ranges:
-        range_items = [
-            item for item in valid_items if min_area <= item["_area_numeric"] < max_area
+    # 면적대별 평당가 (소형/중형/대형)
+    if wants_section(fields, "by_area_range"):
+        area_ranges = [
+            ("소형 (60㎡ 미만)", 0, 60),
+            ("중소형 (60-85㎡)", 60, 85),
+            ("중형 (85-102㎡)", 85, 102),
+            ("중대형 (102-135㎡)", 102, 135),
+            ("대형 (135㎡ 이상)", 135, float("inf")),
         ]
-        if range_items:
-            prices = [item["_price_per_area"] for item in range_items]
-            by_area_range.append(
-                {
-                    "area_range": range_name,
-                    "count": len(range_items),
-                    "avg_price_per_area": statistics.mean(prices),
-                    "median_price_per_area": statistics.median(prices),
-                    "avg_total_price": statistics.mean(
-                        [item["_deal_amount_numeric"] for item in range_items]
-                    ),
-                    "avg_area": statistics.mean(
-                        [item["_area_numeric"] for item in range_items]
-                    ),
-                }
-            )
 
-    # 건축년도별 평당가 (신축 프리미엄 분석)
-    current_year = datetime.now().year
-    build_year_ranges = [
-        ("신축 (5년 이내)", current_year - 5, current_year + 1),
-        ("준신축 (6-10년)", current_year - 10, current_year - 5),
-        ("중년 (11-20년)", current_year - 20, current_year - 10),
-        ("구축 (21-30년)", current_year - 30, current_year - 20),
-        ("노후 (30년 이상)", 1900, current_year - 30),
-    ]
+        by_area_range = []
+        for range_name, min_area, max_area in area_ranges:
+            range_items = [
+                item
+                for item in valid_items
+                if min_area <= item["_area_numeric"] < max_area
+            ]
+            if range_items:
+                prices = [item["_price_per_area"] for item in range_items]
+                by_area_range.append(
+                    {
+                        "area_range": range_name,
+                        "count": len(range_items),
+                        "avg_price_per_area": statistics.mean(prices),
+                        "median_price_per_area": statistics.median(prices),
+                        "avg_total_price": statistics.mean(
+                            [item["_deal_amount_numeric"] for item in range_items]
+                        ),
+                        "avg_area": statistics.mean(
+                            [item["_area_numeric"] for item in range_items]
+                        ),
+                    }
+                )
 
-    by_build_year = []
-    for range_name, min_year, max_year in build_year_ranges:
-        range_items = [
-            item
-            for item in valid_items
-            if item.get("_build_year_numeric") is not None
-            and min_year <= item["_build_year_numeric"] < max_year
+        result["by_area_range"] = by_area_range
+
+    # 건축년도별 평당가 (신축 프리미엄 분석)
+    if wants_section(fields, "by_build_year"):
+        current_year = datetime.now().year
+        build_year_ranges = [
+            ("신축 (5년 이내)", current_year - 5, current_year + 1),
+            ("준신축 (6-10년)", current_year - 10, current_year - 5),
+            ("중년 (11-20년)", current_year - 20, current_year - 10),
+            ("구축 (21-30년)", current_year - 30, current_year - 20),
+            ("노후 (30년 이상)", 1900, current_year - 30),
         ]
-        if range_items:
-            prices = [item["_price_per_area"] for item in range_items]
-            by_build_year.append(
-                {
-                    "build_year_range": range_name,
-                    "count": len(range_items),
-                    "avg_price_per_area": statistics.mean(prices),
-                    "median_price_per_area": statistics.median(prices),
-                    "avg_build_year": int(
-                        statistics.mean(
-                            [item["_build_year_numeric"] for item in range_items]
-                        )
-                    ),
-                }
-            )
 
-    # TOP 10 고가 (평당가 기준)
-    sorted_by_price = sorted(
-        valid_items, key=lambda x: x["_price_per_area"], reverse=True
-    )
-    top_expensive = []
-    for item in sorted_by_price[:10]:
-        top_expensive.append(
-            {
-                "apt_name": item.get("aptNm", "") or item.get("아파트", "N/A"),
-                "region": item.get("_region_name", "N/A"),
-                "price_per_area": item["_price_per_area"],
-                "total_price": item["_deal_amount_numeric"],
-                "area": item["_area_numeric"],
-                "floor": item.get("_floor_numeric"),
-                "build_year": item.get("_build_year_numeric"),
-                "deal_date": item.get("_deal_date_str", "N/A"),
-            }
+        by_build_year = []
+        for range_name, min_year, max_year in build_year_ranges:
+            range_items = [
+                item
+                for item in valid_items
+                if item.get("_build_year_numeric") is not None
+                and min_year <= item["_build_year_numeric"] < max_year
+            ]
+            if range_items:
+                prices = [item["_price_per_area"] for item in range_items]
+                by_build_year.append(
+                    {
+                        "build_year_range": range_name,
+                        "count": len(range_items),
+                        "avg_price_per_area": statistics.mean(prices),
+                        "median_price_per_area": statistics.median(prices),
+                        "avg_build_year": int(
+                            statistics.mean(
+                                [item["_build_year_numeric"] for item in range_items]
+                            )
+                        ),
+                    }
+                )
+
+        result["by_build_year"] = by_build_year
+
+    # TOP 10 고가/저가 (평당가 기준) - 둘 다 제외되면 정렬 생략
+    if wants_section(fields, "top_expensive") or wants_section(
+        fields, "top_affordable"
+    ):
+        sorted_by_price = sorted(
+            valid_items, key=lambda x: x["_price_per_area"], reverse=True
         )
 
-    # TOP 10 저가 (평당가 기준)
-    top_affordable = []
-    for item in sorted_by_price[-10:]:
-        top_affordable.append(
-            {
+        def to_top_entry(item):
+            return {
                 "apt_name": item.get("aptNm", "") or item.get("아파트", "N/A"),
                 "region": item.get("_region_name", "N/A"),
                 "price_per_area": item["_price_per_area"],
@@ -176,18 +211,19 @@ def calculate_price_per_area(items: List[Dict]) -> Dict:
                 "build_year": item.get("_build_year_numeric"),
                 "deal_date": item.get("_deal_date_str", "N/A"),
             }
-        )
 
-    return {
-        "stats": overall_stats,
-        "by_region": sorted(
-            by_region, key=lambda x: x["avg_price_per_area"], reverse=True
-        ),
-        "by_area_range": by_area_range,
-        "by_build_year": by_build_year,
-        "top_expensive": top_expensive,
-        "top_affordable": list(reversed(top_affordable)),  # 낮은 순서대로
-    }
+        if wants_section(fields, "top_expensive"):
+            result["top_expensive"] = [
+                to_top_entry(item) for item in sorted_by_price[:10]
+            ]
+
+        if wants_section(fields, "top_affordable"):
+            # 낮은 순서대로
+            result["top_affordable"] = [
+                to_top_entry(item) for item in reversed(sorted_by_price[-10:])
+            ]
+
+    return result
 
 
 def analyze_price_per_area_trend(items: List[Dict]) -> Dict:
@@ -254,7 +290,9 @@ def analyze_price_per_area_trend(items: List[Dict]) -> Dict:
     return {"trend": trend_data}
 
 
-def analyze_floor_premium(items: List[Dict]) -> Dict:
+def analyze_floor_premium(
+    items: List[Dict], fields: Optional[Iterable[str]] = None
+) -> Dict:
     """
     층수 프리미엄 분석
 
@@ -262,6 +300,7 @@ def analyze_floor_premium(items: List[Dict]) -> Dict:
 
     Args:
         items: 거래 데이터 리스트
+        fields: 계산할 섹션 (FLOOR_PREMIUM_SECTIONS 중 선택, None이면 전체)
 
     Returns:
         층수 프리미엄 분석 결과
@@ -363,65 +402,79 @@ def analyze_floor_premium(items: List[Dict]) -> Dict:
         else:
             cat["premium_pct"] = 0
 
-    # 개별 층수별 분석
-    floor_detail = defaultdict(lambda: {"prices_per_area": [], "count": 0})
-    for item in valid_items:
-        floor = item["_floor_numeric"]
-        if 1 <= floor <= 30:  # 1-30층만
-            floor_detail[floor]["prices_per_area"].append(item["_price_per_area"])
-            floor_detail[floor]["count"] += 1
-
-    by_individual_floor = []
-    for floor in sorted(floor_detail.keys()):
-        data = floor_detail[floor]
-        if data["prices_per_area"]:
-            avg_ppa = statistics.mean(data["prices_per_area"])
-            by_individual_floor.append(
-                {
-                    "floor": floor,
-                    "count": data["count"],
-                    "avg_price_per_area": avg_ppa,
-                    "premium_pct": (
-                        (avg_ppa - base_price_per_area) / base_price_per_area
-                    )
-                    * 100
-                    if base_price_per_area > 0
-                    else 0,
-                }
+    result = {"has_data": True}
+
+    # 개별 층수별 분석 (통계/로열층 섹션도 이 결과를 사용)
+    if (
+        wants_section(fields, "stats")
+        or wants_section(fields, "by_individual_floor")
+        or wants_section(fields, "royal_floor_info")
+    ):
+        floor_detail = defaultdict(lambda: {"prices_per_area": [], "count": 0})
+        for item in valid_items:
+            floor = item["_floor_numeric"]
+            if 1 <= floor <= 30:  # 1-30층만
+                floor_detail[floor]["prices_per_area"].append(item["_price_per_area"])
+                floor_detail[floor]["count"] += 1
+
+        by_individual_floor = []
+        for floor in sorted(floor_detail.keys()):
+            data = floor_detail[floor]
+            if data["prices_per_area"]:
+                avg_ppa = statistics.mean(data["prices_per_area"])
+                by_individual_floor.append(
+                    {
+                        "floor": floor,
+                        "count": data["count"],
+                        "avg_price_per_area": avg_ppa,
+                        "premium_pct": (
+                            (avg_ppa - base_price_per_area) / base_price_per_area
+                        )
+                        * 100
+                        if base_price_per_area > 0
+                        else 0,
+                    }
+                )
+
+        # 로열층 분석 (가장 높은 평당가 층수)
+        if by_individual_floor:
+            royal_floor = max(
+                by_individual_floor, key=lambda x: x["avg_price_per_area"]
             )
+        else:
+            royal_floor = None
+
+        # 전체 통계
+        if wants_section(fields, "stats"):
+            all_prices_per_area = [item["_price_per_area"] for item in valid_items]
+            result["stats"] = {
+                "total_count": len(valid_items),
+                "avg_price_per_area": statistics.mean(all_prices_per_area),
+                "base_floor_category": base_category,
+                "base_price_per_area": base_price_per_area,
+                "royal_floor": royal_floor["floor"] if royal_floor else None,
+                "royal_premium_pct": royal_floor["premium_pct"] if royal_floor else 0,
+            }
 
-    # 로열층 분석 (가장 높은 평당가 층수)
-    if by_individual_floor:
-        royal_floor = max(by_individual_floor, key=lambda x: x["avg_price_per_area"])
-    else:
-        royal_floor = None
-
-    # 전체 통계
-    all_prices_per_area = [item["_price_per_area"] for item in valid_items]
-    stats = {
-        "total_count": len(valid_items),
-        "avg_price_per_area": statistics.mean(all_prices_per_area),
-        "base_floor_category": base_category,
-        "base_price_per_area": base_price_per_area,
-        "royal_floor": royal_floor["floor"] if royal_floor else None,
-        "royal_premium_pct": royal_floor["premium_pct"] if royal_floor else 0,
-    }
-
-    return {
-        "has_data": True,
-        "stats": stats,
-        "by_floor_category": by_floor_category,
-        "by_individual_floor": by_individual_floor,
-        "royal_floor_info": royal_floor,
-    }
-
-
-def analyze_building_age_premium(items: List[Dict]) -> Dict:
+    if wants_section(fields, "by_floor_category"):
+        result["by_floor_category"] = by_floor_category
+    if wants_section(fields, "by_individual_floor"):
+        result["by_individual_floor"] = by_individual_floor
+    if wants_section(fields, "royal_floor_info"):
+        result["royal_floor_info"] = royal_floor
+
+    return result
+
+
+def analyze_building_age_premium(
+    items: List[Dict], fields: Optional[Iterable[str]] = None
+) -> Dict:
     """
     건축년도별 프리미엄 분석 (신축 프리미엄, 감가상각률)
 
     Args:
         items: 거래 데이터 리스트
+        fields: 계산할 섹션 (BUILDING_AGE_PREMIUM_SECTIONS 중 선택, None이면 전체)
 
     Returns:
         건축년도별 프리미엄 분석 결과
@@ -499,82 +552,88 @@ def analyze_building_age_premium(items: List[Dict]) -> Dict:
         else:
             age_data["vs_new_pct"] = 0
 
+    result = {"has_data": True}
+
+    # 통계
+    if wants_section(fields, "stats"):
+        # 감가상각률 계산 (연간 평균)
+        if len(by_age_range) >= 2:
+            newest = by_age_range[0]
+            oldest = by_age_range[-1]
+            age_diff = oldest["avg_building_age"] - newest["avg_building_age"]
+            price_diff_pct = oldest["vs_new_pct"]
+            annual_depreciation = price_diff_pct / age_diff if age_diff > 0 else 0
+        else:
+            annual_depreciation = 0
+
+        all_prices_per_area = [item["_price_per_area"] for item in valid_items]
+        result["stats"] = {
+            "total_count": len(valid_items),
+            "avg_price_per_area": statistics.mean(all_prices_per_area),
+            "new_building_price": base_price,
+            "annual_depreciation_pct": annual_depreciation,
+            "rebuild_candidate_count": sum(
+                1 for item in valid_items if item["_building_age"] >= 30
+            ),
+        }
+
+    if wants_section(fields, "by_age_range"):
+        result["by_age_range"] = by_age_range
+
     # 연도별 상세 분석 (최근 20년)
-    by_build_year = defaultdict(lambda: {"prices_per_area": [], "count": 0})
-    for item in valid_items:
-        year = item["_build_year_numeric"]
-        if year >= current_year - 30:  # 최근 30년
-            by_build_year[year]["prices_per_area"].append(item["_price_per_area"])
-            by_build_year[year]["count"] += 1
-
-    year_detail = []
-    for year in sorted(by_build_year.keys(), reverse=True):
-        data = by_build_year[year]
-        if data["prices_per_area"]:
-            avg_ppa = statistics.mean(data["prices_per_area"])
-            year_detail.append(
-                {
-                    "build_year": year,
-                    "building_age": current_year - year,
-                    "count": data["count"],
-                    "avg_price_per_area": avg_ppa,
-                    "vs_new_pct": ((avg_ppa - base_price) / base_price * 100)
-                    if base_price and base_price > 0
-                    else 0,
-                }
-            )
+    if wants_section(fields, "by_build_year"):
+        by_build_year = defaultdict(lambda: {"prices_per_area": [], "count": 0})
+        for item in valid_items:
+            year = item["_build_year_numeric"]
+            if year >= current_year - 30:  # 최근 30년
+                by_build_year[year]["prices_per_area"].append(item["_price_per_area"])
+                by_build_year[year]["count"] += 1
+
+        year_detail = []
+        for year in sorted(by_build_year.keys(), reverse=True):
+            data = by_build_year[year]
+            if data["prices_per_area"]:
+                avg_ppa = statistics.mean(data["prices_per_area"])
+                year_detail.append(
+                    {
+                        "build_year": year,
+                        "building_age": current_year - year,
+                        "count": data["count"],
+                        "avg_price_per_area": avg_ppa,
+                        "vs_new_pct": ((avg_ppa - base_price) / base_price * 100)
+                        if base_price and base_price > 0
+                        else 0,
+                    }
+                )
 
-    # 감가상각률 계산 (연간 평균)
-    if len(by_age_range) >= 2:
-        newest = by_age_range[0]
-        oldest = by_age_range[-1]
-        age_diff = oldest["avg_building_age"] - newest["avg_building_age"]
-        price_diff_pct = oldest["vs_new_pct"]
-        annual_depreciation = price_diff_pct / age_diff if age_diff > 0 else 0
-    else:
-        annual_depreciation = 0
+        result["by_build_year"] = year_detail[:20]  # 최근 20개 연도
 
     # 재건축 대상 (30년 이상)
-    rebuild_candidates = [
-        {
-            "apt_name": item.get("aptNm", "") or item.get("아파트", ""),
-            "region": item.get("_region_name", ""),
-            "build_year": item["_build_year_numeric"],
-            "building_age": item["_building_age"],
-            "price_per_area": item["_price_per_area"],
-            "total_price": item["_deal_amount_numeric"],
-        }
-        for item in valid_items
-        if item["_building_age"] >= 30
-    ]
+    if wants_section(fields, "rebuild_candidates"):
+        rebuild_candidates = [
+            {
+                "apt_name": item.get("aptNm", "") or item.get("아파트", ""),
+                "region": item.get("_region_name", ""),
+                "build_year": item["_build_year_numeric"],
+                "building_age": item["_building_age"],
+                "price_per_area": item["_price_per_area"],
+                "total_price": item["_deal_amount_numeric"],
+            }
+            for item in valid_items
+            if item["_building_age"] >= 30
+        ]
 
-    # 중복 제거 및 정렬
-    seen = set()
-    unique_rebuild = []
-    for item in rebuild_candidates:
-        key = (item["apt_name"], item["region"])
-        if key not in seen and item["apt_name"]:
-            seen.add(key)
-            unique_rebuild.append(item)
+        # 중복 제거 및 정렬
+        seen = set()
+        unique_rebuild = []
+        for item in rebuild_candidates:
+            key = (item["apt_name"], item["region"])
+            if key not in seen and item["apt_name"]:
+                seen.add(key)
+                unique_rebuild.append(item)
 
-    unique_rebuild = sorted(
-        unique_rebuild, key=lambda x: x["building_age"], reverse=True
-    )[:20]
+        result["rebuild_candidates"] = sorted(
+            unique_rebuild, key=lambda x: x["building_age"], reverse=True
+        )[:20]
 
-    # 통계
-    all_prices_per_area = [item["_price_per_area"] for item in valid_items]
-    stats = {
-        "total_count": len(valid_items),
-        "avg_price_per_area": statistics.mean(all_prices_per_area),
-        "new_building_price": base_price,
-        "annual_depreciation_pct": annual_depreciation,
-        "rebuild_candidate_count": len(rebuild_candidates),
-    }
-
-    return {
-        "has_data": True,
-        "stats": stats,
-        "by_age_range": by_age_range,
-        "by_build_year": year_detail[:20],  # 최근 20개 연도
-        "rebuild_candidates": unique_rebuild,
-    }
+    return result
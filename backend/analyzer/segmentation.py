@@ -2,10 +2,13 @@
 세분화 분석 모듈
 면적, 층수, 건축년도, 지역, 아파트별 분석
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 from collections import defaultdict
+import heapq
 import statistics
 
+from .utils import CHECKPOINT_INTERVAL, checkpoint
+
 
 def analyze_by_area(items: List[Dict], bins: Optional[List[float]] = None) -> Dict:
     """
@@ -233,17 +236,16 @@ def analyze_by_region(items: List[Dict]) -> Dict:
     return {"data": result_data}
 
 
-def analyze_by_apartment(items: List[Dict]) -> Dict:
+def _group_by_apartment(items: List[Dict]) -> Dict[str, Dict]:
     """
-    아파트별 거래 분석
+    아파트별 거래 데이터 그룹화
 
     Args:
         items: 거래 데이터 리스트
 
     Returns:
-        아파트별 분석 데이터
+        아파트명 → 가격/면적/지역/건축년도 집계
     """
-    # 아파트별 데이터 그룹화
     apt_data = defaultdict(
         lambda: {
             "prices": [],
@@ -254,7 +256,10 @@ def analyze_by_apartment(items: List[Dict]) -> Dict:
         }
     )
 
-    for item in items:
+    for index, item in enumerate(items):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         apt_name = item.get("아파트", "미지정")
         price = item.get("_deal_amount_numeric")
         area = item.get("_area_numeric")
@@ -271,28 +276,106 @@ def analyze_by_apartment(items: List[Dict]) -> Dict:
         if build_year:
             apt_data[apt_name]["build_years"].add(build_year)
 
+    return apt_data
+
+
+def _apartment_row(apt_name: str, stats: Dict) -> Dict:
+    """아파트 1건의 통계 행 생성"""
+    return {
+        "apartment": apt_name,
+        "count": stats["count"],
+        "avg_price": statistics.mean(stats["prices"]),
+        "median_price": statistics.median(stats["prices"]),
+        "max_price": max(stats["prices"]),
+        "min_price": min(stats["prices"]),
+        "avg_area": statistics.mean(stats["areas"]) if stats["areas"] else 0,
+        "regions": list(stats["regions"]),
+        "build_years": sorted(list(stats["build_years"])),
+    }
+
+
+def analyze_by_apartment(items: List[Dict]) -> Dict:
+    """
+    아파트별 거래 분석
+
+    Args:
+        items: 거래 데이터 리스트
+
+    Returns:
+        아파트별 분석 데이터
+    """
+    apt_data = _group_by_apartment(items)
+
     # 아파트별 통계 계산
     result_data = []
-    for apt_name in sorted(apt_data.keys()):
+    for index, apt_name in enumerate(sorted(apt_data.keys())):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+
         stats = apt_data[apt_name]
         if stats["prices"]:
-            result_data.append(
-                {
-                    "apartment": apt_name,
-                    "count": stats["count"],
-                    "avg_price": statistics.mean(stats["prices"]),
-                    "median_price": statistics.median(stats["prices"]),
-                    "max_price": max(stats["prices"]),
-                    "min_price": min(stats["prices"]),
-                    "avg_area": statistics.mean(stats["areas"]) if stats["areas"] else 0,
-                    "regions": list(stats["regions"]),
-                    "build_years": sorted(list(stats["build_years"])),
-                }
-            )
+            result_data.append(_apartment_row(apt_name, stats))
 
     return {"data": result_data}
 
 
+def group_apartments(items: List[Dict]) -> Dict[str, Dict]:
+    """
+    아파트별 그룹화 결과 (iter_apartment_rows의 groups로 재사용, 읽기 전용)
+
+    Args:
+        items: 거래 데이터 리스트
+
+    Returns:
+        아파트명 -> 가격/면적/지역/건축년도 집계
+    """
+    return dict(_group_by_apartment(items))
+
+
+def iter_apartment_rows(
+    items: List[Dict],
+    after: Optional[Tuple] = None,
+    limit: Optional[int] = None,
+    min_count: int = 1,
+    groups: Optional[Dict[str, Dict]] = None,
+) -> Iterator[Tuple[Tuple, Dict]]:
+    """
+    아파트별 통계를 아파트명 순으로 하나씩 생성 (커서 페이지네이션/스트리밍용)
+
+    통계 행은 소비되는 시점에 계산되며, limit 지정 시 전체 정렬 대신
+    상위 k개(heapq.nsmallest)만 선택합니다.
+
+    Args:
+        items: 거래 데이터 리스트
+        after: 이 정렬 키 이후부터 생성 (이전 페이지의 마지막 키)
+        limit: 최대 생성 개수 (None이면 전체)
+        min_count: 포함할 최소 거래 건수
+        groups: items의 group_apartments 결과 (있으면 다시 그룹화하지 않음)
+
+    Yields:
+        (정렬 키, 아파트 통계 행)
+    """
+    apt_data = groups if groups is not None else _group_by_apartment(items)
+
+    candidates = (
+        apt_name
+        for apt_name, stats in apt_data.items()
+        if stats["prices"]
+        and stats["count"] >= min_count
+        and (after is None or (apt_name,) > after)
+    )
+
+    if limit is None:
+        apt_names = sorted(candidates)
+    else:
+        apt_names = heapq.nsmallest(limit, candidates)
+
+    for index, apt_name in enumerate(apt_names):
+        if index % CHECKPOINT_INTERVAL == 0:
+            checkpoint()
+        yield (apt_name,), _apartment_row(apt_name, apt_data[apt_name])
+
+
 def get_apartment_detail(items: List[Dict], apt_name: str, region: str = None) -> Dict:
     """
     특정 아파트의 상세 거래 정보
@@ -2,8 +2,14 @@
 분석 유틸리티 모듈
 공통으로 사용되는 헬퍼 함수들
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable
 from datetime import datetime
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+
+# 분석 루프에서 취소 여부를 확인하는 간격 (항목 수)
+CHECKPOINT_INTERVAL = 1024
 
 
 def categorize_floor(floor: int) -> str:
@@ -203,3 +209,93 @@ def calculate_percentage_change(old_value: float, new_value: float) -> Optional[
         return None
 
     return ((new_value - old_value) / old_value) * 100
+
+
+def wants_section(fields: Optional[Iterable[str]], section: str) -> bool:
+    """
+    응답 섹션 계산 여부 판단 (fields 선택자 푸시다운용)
+
+    Args:
+        fields: 요청된 섹션 목록 (None이면 전체 섹션)
+        section: 섹션 이름
+
+    Returns:
+        섹션을 계산해야 하면 True
+    """
+    return fields is None or section in fields
+
+
+class AnalysisCancelled(Exception):
+    """분석 취소 (클라이언트 연결 종료 또는 데드라인 초과)"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Analysis cancelled: {reason}")
+        self.reason = reason
+
+
+class CancellationToken:
+    """
+    요청 단위 취소 토큰
+
+    요청 처리 측(API)에서 cancel()을 호출하거나 데드라인이 지나면
+    분석 루프의 다음 checkpoint()에서 AnalysisCancelled가 발생합니다.
+    """
+
+    def __init__(self, deadline: Optional[float] = None):
+        """
+        Args:
+            deadline: time.monotonic() 기준 마감 시각 (None이면 무제한)
+        """
+        self.deadline = deadline
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled"):
+        """취소 요청 (이미 취소된 경우 최초 사유 유지)"""
+        if self.reason is None:
+            self.reason = reason
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """데드라인까지 남은 시간 (초)"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def check(self):
+        """취소되었거나 데드라인이 지났으면 AnalysisCancelled 발생"""
+        if self.reason is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "deadline_exceeded"
+        if self.reason is not None:
+            raise AnalysisCancelled(self.reason)
+
+
+_cancellation_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "analysis_cancellation_token", default=None
+)
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]):
+    """
+    현재 컨텍스트의 분석 루프에 취소 토큰 적용
+
+    Args:
+        token: 취소 토큰 (None이면 취소 확인 안 함)
+    """
+    reset_token = _cancellation_token.set(token)
+    try:
+        yield token
+    finally:
+        _cancellation_token.reset(reset_token)
+
+
+def checkpoint():
+    """
+    협조적 취소 지점 - 긴 분석 루프에서 CHECKPOINT_INTERVAL마다 호출
+
+    Raises:
+        AnalysisCancelled: 현재 요청이 취소되었거나 데드라인이 지난 경우
+    """
+    token = _cancellation_token.get()
+    if token is not None:
+        token.check()
@@ -3,8 +3,11 @@
 Redis 기반 API 응답 캐싱
 """
 from .redis_client import RedisCache, get_redis_cache
+from .async_redis_client import AsyncRedisCache, get_async_redis_cache
 
 __all__ = [
     'RedisCache',
     'get_redis_cache',
+    'AsyncRedisCache',
+    'get_async_redis_cache',
 ]
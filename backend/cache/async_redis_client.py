@@ -0,0 +1,503 @@
+"""
+비동기 Redis 캐싱 클라이언트
+redis.asyncio 기반 - 코루틴에서 이벤트 루프를 블로킹하지 않는 API 응답 캐싱
+"""
+import os
+import time
+import uuid
+import asyncio
+import weakref
+from typing import Optional, Dict, Any, Iterable, Set
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_ASYNC_AVAILABLE = True
+except ImportError:
+    REDIS_ASYNC_AVAILABLE = False
+
+from logger import get_logger
+from .redis_client import (
+    BaseRedisCache,
+    CacheEntry,
+    CacheKey,
+    EmptyMapKey,
+    CACHE_LOCK_TTL_MS,
+    CACHE_NEGATIVE_TTL_HISTORICAL,
+    CACHE_STALE_TTL,
+    RELEASE_LOCK_SCRIPT,
+    USE_REDIS,
+    REDIS_URL,
+)
+
+# 커넥션 풀 최대 연결 수 (동시 코루틴 수에 맞춰 조정)
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', '50'))
+
+# 풀이 가득 찼을 때 연결 반환을 기다리는 최대 시간 (초)
+REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', '5'))
+
+
+class AsyncRedisCache(BaseRedisCache):
+    """
+    redis.asyncio 기반 비동기 캐싱 클라이언트
+
+    RedisCache와 같은 키/TTL 규칙을 사용하므로 두 클라이언트가 같은 캐시를
+    공유합니다. 요청마다 PING을 보내지 않고, 공유 커넥션 풀에서 연결을
+    빌려 GET/SETEX만 수행합니다. 풀이 가득 차면 연결이 반환될 때까지
+    대기합니다 (BlockingConnectionPool).
+
+    Note:
+        redis.asyncio 커넥션은 생성된 이벤트 루프에 묶이므로 인스턴스는
+        get_async_redis_cache()로 루프별로 얻어야 합니다.
+    """
+
+    def __init__(self, url: str = REDIS_URL, max_connections: int = REDIS_MAX_CONNECTIONS):
+        """
+        Args:
+            url: Redis 연결 URL
+            max_connections: 커넥션 풀 최대 연결 수
+        """
+        if not REDIS_ASYNC_AVAILABLE:
+            raise ImportError(
+                "redis.asyncio 모듈을 사용할 수 없습니다. "
+                "설치: pip install 'redis>=5.0.0' hiredis"
+            )
+        super().__init__(url)
+
+        self.pool = aioredis.BlockingConnectionPool.from_url(
+            url,
+            encoding='utf-8',
+            decode_responses=False,
+            max_connections=max_connections,
+            timeout=REDIS_POOL_TIMEOUT,
+            socket_connect_timeout=5,
+            socket_timeout=5
+        )
+        self.client = aioredis.Redis(connection_pool=self.pool)
+
+    async def is_connected(self) -> bool:
+        """Redis 연결 상태 확인"""
+        try:
+            return bool(await self.client.ping())
+        except Exception:
+            return False
+
+    async def get(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        extra: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시에서 데이터 조회
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            extra: 추가 식별자
+
+        Returns:
+            캐시된 데이터 (없거나 논리적으로 만료됐거나 Redis 오류 시 None)
+        """
+        return self._live_data(await self.get_entry(api_type, lawd_cd, deal_ymd, extra))
+
+    async def get_entry(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        extra: Optional[str] = None
+    ) -> Optional[CacheEntry]:
+        """
+        캐시에서 데이터와 만료 메타데이터 조회
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            extra: 추가 식별자
+
+        Returns:
+            CacheEntry (없거나 Redis 오류 시 None, stale 값 포함)
+        """
+        key = self._build_key(api_type, lawd_cd, deal_ymd, extra)
+
+        try:
+            start_time = time.time()
+            data = await self.client.get(key)
+            elapsed = time.time() - start_time
+
+            if data:
+                self.stats['hits'] += 1
+                self.logger.debug(
+                    "cache_hit",
+                    key=key,
+                    response_time=f"{elapsed*1000:.2f}ms"
+                )
+                return self._unwrap_entry(self.codec.decode(data))
+            else:
+                self.stats['misses'] += 1
+                self.logger.debug("cache_miss", key=key)
+                return None
+
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_get_error", key=key, error=str(e))
+            return None
+
+    async def set(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        data: Dict[str, Any],
+        extra: Optional[str] = None,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        데이터를 캐시에 저장
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            data: 저장할 데이터
+            extra: 추가 식별자
+            ttl: TTL (None이면 자동 계산)
+
+        Returns:
+            성공 여부
+        """
+        key = self._build_key(api_type, lawd_cd, deal_ymd, extra)
+
+        # TTL 계산
+        if ttl is None:
+            ttl = self._calculate_ttl(deal_ymd)
+
+        try:
+            start_time = time.time()
+            serialized = self.codec.encode(data)
+            await self.client.setex(key, ttl, serialized)
+            elapsed = time.time() - start_time
+
+            self.stats['sets'] += 1
+            self.logger.debug(
+                "cache_set",
+                key=key,
+                ttl=ttl,
+                size=len(serialized),
+                response_time=f"{elapsed*1000:.2f}ms"
+            )
+            return True
+
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_set_error", key=key, error=str(e))
+            return False
+
+    async def set_entry(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        data: Dict[str, Any],
+        extra: Optional[str] = None,
+        ttl: Optional[int] = None,
+        delta: float = 0.0
+    ) -> bool:
+        """
+        만료 메타데이터와 함께 저장 (RedisCache.set_entry 참고)
+
+        Returns:
+            성공 여부
+        """
+        if ttl is None:
+            ttl = self._calculate_ttl(deal_ymd)
+        return await self.set(
+            api_type, lawd_cd, deal_ymd,
+            self._wrap_entry(data, ttl, delta),
+            extra=extra,
+            ttl=ttl + CACHE_STALE_TTL
+        )
+
+    async def acquire_lock(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        extra: Optional[str] = None,
+        lock_ttl_ms: int = CACHE_LOCK_TTL_MS
+    ) -> Optional[str]:
+        """
+        재계산 락 획득 (RedisCache.acquire_lock 참고)
+
+        Returns:
+            락 토큰 (다른 호출자가 보유 중이면 None)
+        """
+        lock_key = self._lock_key(self._build_key(api_type, lawd_cd, deal_ymd, extra))
+        token = uuid.uuid4().hex
+        try:
+            if await self.client.set(lock_key, token, nx=True, px=lock_ttl_ms):
+                return token
+            return None
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_lock_error", key=lock_key, error=str(e))
+            return token
+
+    async def release_lock(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        token: str,
+        extra: Optional[str] = None
+    ) -> bool:
+        """
+        재계산 락 해제 (토큰이 일치할 때만)
+
+        Returns:
+            해제 여부
+        """
+        lock_key = self._lock_key(self._build_key(api_type, lawd_cd, deal_ymd, extra))
+        try:
+            return bool(await self.client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token))
+        except Exception as e:
+            self.logger.error("cache_unlock_error", key=lock_key, error=str(e))
+            return False
+
+    async def get_many(
+        self,
+        keys: Iterable[CacheKey],
+        xfetch_beta: Optional[float] = None
+    ) -> Dict[CacheKey, Dict[str, Any]]:
+        """
+        여러 키를 MGET 한 번으로 조회
+
+        Args:
+            keys: (api_type, lawd_cd, deal_ymd) 목록
+            xfetch_beta: 지정하면 XFetch 조기 갱신에 당첨된 값도 미스 (RedisCache.get_many 참고)
+
+        Returns:
+            히트한 키만 담은 딕셔너리 (Redis 오류 시 빈 딕셔너리)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        try:
+            start_time = time.time()
+            values = await self.client.mget([self._build_key(*key) for key in keys])
+            elapsed = time.time() - start_time
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_get_many_error", keys=len(keys), error=str(e))
+            return {}
+
+        hits = self._collect_hits(keys, values, xfetch_beta)
+        self.logger.debug(
+            "cache_get_many",
+            keys=len(keys),
+            hits=len(hits),
+            response_time=f"{elapsed*1000:.2f}ms"
+        )
+        return hits
+
+    async def set_many(
+        self,
+        entries: Dict[CacheKey, Dict[str, Any]],
+        ttl: Optional[int] = None,
+        deltas: Optional[Dict[CacheKey, float]] = None
+    ) -> int:
+        """
+        여러 키를 파이프라인 SETEX로 한 번에 저장 (키별 Adaptive TTL)
+
+        만료 메타데이터 포함 (RedisCache.set_many 참고)
+
+        Args:
+            entries: (api_type, lawd_cd, deal_ymd) -> 저장할 데이터
+            ttl: 모든 키에 적용할 논리적 TTL (None이면 키별 자동 계산)
+            deltas: 키별 재계산 시간 (초, 없으면 0)
+
+        Returns:
+            저장된 키 수
+        """
+        if not entries:
+            return 0
+
+        try:
+            start_time = time.time()
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, expire, payload in self._entry_payloads(entries, ttl, deltas):
+                    pipe.setex(key, expire, payload)
+                await pipe.execute()
+            elapsed = time.time() - start_time
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_set_many_error", keys=len(entries), error=str(e))
+            return 0
+
+        self.stats['sets'] += len(entries)
+        self.logger.debug(
+            "cache_set_many",
+            keys=len(entries),
+            response_time=f"{elapsed*1000:.2f}ms"
+        )
+        return len(entries)
+
+    async def mark_empty(self, api_type: str, lawd_cd: str, deal_ymds: Iterable[str]) -> int:
+        """
+        거래가 없는 월을 빈 월 맵에 기록 (월별 빈 결과 TTL 적용)
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymds: 빈 결과였던 계약년월 목록
+
+        Returns:
+            기록한 월 수
+        """
+        fields = self._empty_map_fields(deal_ymds)
+        if not fields:
+            return 0
+
+        key = self._empty_map_key(api_type, lawd_cd)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, CACHE_NEGATIVE_TTL_HISTORICAL)
+                await pipe.execute()
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_mark_empty_error", key=key, error=str(e))
+            return 0
+
+        self.stats['negative_sets'] += len(fields)
+        return len(fields)
+
+    async def get_empty_months(self, pairs: Iterable[EmptyMapKey]) -> Dict[EmptyMapKey, Set[str]]:
+        """
+        (api_type, lawd_cd)별 빈 월 조회 (파이프라인 1회)
+
+        Args:
+            pairs: (api_type, lawd_cd) 목록
+
+        Returns:
+            (api_type, lawd_cd) -> 만료되지 않은 빈 월 집합 (Redis 오류 시 빈 딕셔너리)
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for api_type, lawd_cd in pairs:
+                    pipe.hgetall(self._empty_map_key(api_type, lawd_cd))
+                raw_maps = await pipe.execute()
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_get_empty_months_error", pairs=len(pairs), error=str(e))
+            return {}
+
+        return {
+            pair: self._live_empty_months(raw)
+            for pair, raw in zip(pairs, raw_maps)
+        }
+
+    async def delete(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        extra: Optional[str] = None
+    ) -> bool:
+        """
+        캐시 삭제
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            extra: 추가 식별자
+
+        Returns:
+            성공 여부
+        """
+        key = self._build_key(api_type, lawd_cd, deal_ymd, extra)
+
+        try:
+            deleted = await self.client.delete(key)
+            self.logger.info("cache_deleted", key=key, deleted=deleted)
+            return deleted > 0
+        except Exception as e:
+            self.logger.error("cache_delete_error", key=key, error=str(e))
+            return False
+
+    async def close(self):
+        """커넥션 풀 정리"""
+        try:
+            await self.client.aclose()
+        except AttributeError:
+            # redis<5.0.1
+            await self.client.close()
+        await self.pool.disconnect()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회 (클라이언트 측 통계만, Redis 호출 없음)
+
+        Returns:
+            통계 정보
+        """
+        stats = self._request_stats()
+        stats['pool_max_connections'] = self.pool.max_connections
+        return stats
+
+
+# 이벤트 루프별 인스턴스 (redis.asyncio 커넥션은 루프에 묶임)
+_async_redis_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Optional[AsyncRedisCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def get_async_redis_cache() -> Optional[AsyncRedisCache]:
+    """
+    현재 이벤트 루프의 비동기 Redis 캐시 인스턴스 반환
+
+    첫 호출 시 한 번만 PING으로 연결을 확인하고, 이후에는 같은 루프에서
+    커넥션 풀을 공유하는 인스턴스를 그대로 반환합니다.
+
+    Returns:
+        AsyncRedisCache 인스턴스 (비활성화 또는 연결 실패 시 None)
+    """
+    # Redis가 비활성화되어 있으면 None 반환
+    if not USE_REDIS:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if loop in _async_redis_caches:
+        return _async_redis_caches[loop]
+
+    cache: Optional[AsyncRedisCache] = None
+    try:
+        cache = AsyncRedisCache(REDIS_URL)
+        if await cache.is_connected():
+            cache.logger.info("redis_async_connected", url=REDIS_URL)
+        else:
+            cache.logger.error("redis_connection_failed", url=REDIS_URL)
+            await cache.close()
+            cache = None
+    except Exception as e:
+        logger = get_logger(__name__)
+        logger.error("redis_async_cache_init_failed", error=str(e))
+        cache = None
+
+    # 다른 코루틴이 먼저 생성했으면 그 인스턴스를 사용
+    if loop in _async_redis_caches:
+        if cache is not None:
+            await cache.close()
+        return _async_redis_caches[loop]
+
+    _async_redis_caches[loop] = cache
+    return cache
@@ -3,9 +3,11 @@ Redis 캐시 관리 CLI
 
 Usage:
     python -m backend.cache.cache_manager stats      # 통계 조회
-    python -m backend.cache.cache_manager clear      # 전체 삭제
+    python -m backend.cache.cache_manager clear      # API 응답 캐시 전체 삭제
     python -m backend.cache.cache_manager reset      # 통계 초기화
     python -m backend.cache.cache_manager ping       # 연결 테스트
+    python -m backend.cache.cache_manager invalidate --api-type api_02 --month 202401
+    python -m backend.cache.cache_manager inventory  # api_type별 / 월별 키 수와 메모리
 """
 import sys
 import argparse
@@ -50,6 +52,13 @@ def print_stats():
     print(f"  - 캐시 설정: {stats['sets']:,}건")
     print(f"  - 에러: {stats['errors']:,}건")
 
+    codec = stats['codec']
+    print(f"\n📦 페이로드 ({codec['serializer']} + {codec['compression']}):")
+    print(f"  - 키당 평균 저장 크기: {codec['avg_stored_bytes']:,.0f} bytes")
+    print(f"  - 압축률: {codec['compression_ratio']:.2f}x")
+    print(f"  - 평균 인코딩 시간: {codec['avg_encode_ms']:.3f}ms")
+    print(f"  - 평균 디코딩 시간: {codec['avg_decode_ms']:.3f}ms")
+
     if 'total_keys' in stats:
         print(f"\n🗄️  Redis 서버:")
         print(f"  - 총 키 개수: {stats['total_keys']:,}개")
@@ -74,7 +83,7 @@ def clear_cache():
         return 1
 
     # 확인 프롬프트
-    print("\n⚠️  경고: 모든 캐시를 삭제합니다.")
+    print("\n⚠️  경고: 모든 API 응답 캐시를 삭제합니다.")
     confirm = input("계속하시겠습니까? (yes/no): ").strip().lower()
 
     if confirm != 'yes':
@@ -82,13 +91,82 @@ def clear_cache():
         return 0
 
     # 삭제 실행
-    deleted = cache.clear_all(pattern='apt_insights:*')
+    deleted = cache.clear_all()
 
     print(f"\n✅ 캐시 삭제 완료: {deleted:,}개 키 삭제됨")
 
     return 0
 
 
+def invalidate(api_type=None, lawd_cd=None, deal_ymd=None, assume_yes=False):
+    """api_type / 지역 / 월 범위의 캐시 삭제 (SCAN + 배치 UNLINK)"""
+    cache = get_redis_cache()
+
+    if not cache:
+        print("❌ Redis 캐시를 사용할 수 없습니다.")
+        return 1
+
+    if not (api_type or lawd_cd or deal_ymd):
+        print("❌ --api-type, --region, --month 중 하나 이상을 지정하세요. (전체 삭제는 clear)")
+        return 1
+
+    pattern = cache.build_pattern(api_type, lawd_cd, deal_ymd)
+    print(f"\n🎯 삭제 대상 패턴: {pattern}")
+
+    if not assume_yes:
+        confirm = input("계속하시겠습니까? (yes/no): ").strip().lower()
+        if confirm != 'yes':
+            print("❌ 취소되었습니다.")
+            return 0
+
+    deleted = cache.invalidate(api_type, lawd_cd, deal_ymd)
+    print(f"\n✅ 캐시 무효화 완료: {deleted:,}개 키 삭제됨")
+
+    return 0
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:,.1f}{unit}" if unit != 'B' else f"{size:,}B"
+        size /= 1024
+
+
+def print_inventory(api_type=None, lawd_cd=None, deal_ymd=None, with_memory=True):
+    """키스페이스 현황 출력"""
+    cache = get_redis_cache()
+
+    if not cache:
+        print("❌ Redis 캐시를 사용할 수 없습니다.")
+        return 1
+
+    report = cache.inventory(cache.build_pattern(api_type, lawd_cd, deal_ymd), with_memory=with_memory)
+
+    print("\n" + "="*60)
+    print("🗂️  Redis 캐시 키스페이스 현황")
+    print("="*60)
+    print(f"\n패턴: {report['pattern']}")
+    print(f"총 키: {report['total_keys']:,}개 (재계산 락 {report['lock_keys']:,}개 제외, 빈 월 맵 {report['empty_map_keys']:,}개 포함)")
+    if with_memory:
+        print(f"총 메모리: {_format_bytes(report['total_bytes'])} (측정: {report['memory_source'] or '-'})")
+
+    def print_row(name, entry):
+        size = f"  {_format_bytes(entry['bytes']):>10}" if with_memory else ""
+        print(f"  - {name:<10} {entry['keys']:>8,}개{size}")
+
+    print(f"\n📦 API 타입별:")
+    for name, entry in sorted(report['by_api_type'].items()):
+        print_row(name, entry)
+
+    print(f"\n📅 계약년월별:")
+    for name, entry in report['by_month'].items():
+        print_row(name, entry)
+
+    print("\n" + "="*60)
+
+    return 0
+
+
 def reset_stats():
     """통계 초기화"""
     cache = get_redis_cache()
@@ -132,7 +210,7 @@ def ping():
             value = cache.client.get(test_key)
             cache.client.delete(test_key)
 
-            if value == "pong":
+            if value == b"pong":
                 print(f"   읽기/쓰기 테스트: OK")
         except Exception as e:
             print(f"   읽기/쓰기 테스트: 실패 ({e})")
@@ -170,14 +248,28 @@ Examples:
 
   # 연결 테스트
   python -m backend.cache.cache_manager ping
+
+  # 강남구 2024년 1월 매매 캐시만 삭제
+  python -m backend.cache.cache_manager invalidate --api-type api_02 --region 11680 --month 202401
+
+  # 2023년 전체 캐시 삭제 (확인 생략)
+  python -m backend.cache.cache_manager invalidate --month '2023*' --yes
+
+  # 키스페이스 현황
+  python -m backend.cache.cache_manager inventory
         """
     )
 
     parser.add_argument(
         'command',
-        choices=['stats', 'clear', 'reset', 'ping'],
+        choices=['stats', 'clear', 'reset', 'ping', 'invalidate', 'inventory'],
         help='실행할 명령'
     )
+    parser.add_argument('--api-type', help='API 타입 (예: api_02)')
+    parser.add_argument('--region', help='지역코드 (예: 11680)')
+    parser.add_argument('--month', help="계약년월 (예: 202401, '2023*')")
+    parser.add_argument('--yes', action='store_true', help='확인 프롬프트 생략')
+    parser.add_argument('--no-memory', action='store_true', help='inventory에서 메모리 측정 생략')
 
     args = parser.parse_args()
 
@@ -190,6 +282,10 @@ Examples:
         return reset_stats()
     elif args.command == 'ping':
         return ping()
+    elif args.command == 'invalidate':
+        return invalidate(args.api_type, args.region, args.month, assume_yes=args.yes)
+    elif args.command == 'inventory':
+        return print_inventory(args.api_type, args.region, args.month, with_memory=not args.no_memory)
     else:
         print(f"❌ 알 수 없는 명령: {args.command}")
         return 1
@@ -0,0 +1,262 @@
+"""
+캐시 페이로드 코덱
+직렬화(JSON/msgpack) + 압축(zstd/lz4/zlib) 계층
+
+저장 형식:
+    [헤더 1바이트][본문]
+
+    헤더 = 0x80 | (직렬화 ID << 3) | 압축 ID
+
+    헤더의 최상위 비트가 항상 1이므로, 이전 형식(평문 JSON 문자열, 첫 바이트가
+    ASCII)과 구분되어 기존 캐시 항목도 그대로 읽을 수 있습니다.
+"""
+import os
+import json
+import time
+import zlib
+from typing import Any, Callable, Dict, Tuple, Union
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+HEADER_FLAG = 0x80
+
+# 직렬화 ID (3비트)
+SERIALIZER_JSON = 0
+SERIALIZER_MSGPACK = 1
+
+# 압축 ID (3비트)
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_LZ4 = 3
+
+SERIALIZER_NAMES = {'json': SERIALIZER_JSON, 'msgpack': SERIALIZER_MSGPACK}
+COMPRESSION_NAMES = {
+    'none': COMPRESSION_NONE,
+    'zlib': COMPRESSION_ZLIB,
+    'zstd': COMPRESSION_ZSTD,
+    'lz4': COMPRESSION_LZ4,
+}
+
+# 기본값: 설치된 것 중 가장 효율적인 조합
+# (지정한 방식이 설치되지 않았으면 json / zlib로 대체)
+CACHE_SERIALIZER = os.getenv('CACHE_SERIALIZER', 'msgpack' if MSGPACK_AVAILABLE else 'json').lower()
+CACHE_COMPRESSION = os.getenv(
+    'CACHE_COMPRESSION',
+    'zstd' if ZSTD_AVAILABLE else 'lz4' if LZ4_AVAILABLE else 'zlib'
+).lower()
+
+# 이보다 작은 페이로드는 압축하지 않음 (바이트)
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv('CACHE_COMPRESS_MIN_BYTES', '512'))
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(payload: bytes) -> Any:
+    return json.loads(payload)
+
+
+def _msgpack_dumps(data: Any) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def _msgpack_loads(payload: bytes) -> Any:
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+def _serializers() -> Dict[int, Tuple[Callable, Callable]]:
+    serializers = {SERIALIZER_JSON: (_json_dumps, _json_loads)}
+    if MSGPACK_AVAILABLE:
+        serializers[SERIALIZER_MSGPACK] = (_msgpack_dumps, _msgpack_loads)
+    return serializers
+
+
+def _compressors() -> Dict[int, Tuple[Callable, Callable]]:
+    compressors = {
+        COMPRESSION_NONE: (bytes, bytes),
+        COMPRESSION_ZLIB: (lambda data: zlib.compress(data, 6), zlib.decompress),
+    }
+    if ZSTD_AVAILABLE:
+        compressors[COMPRESSION_ZSTD] = (
+            zstandard.ZstdCompressor(level=3).compress,
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    if LZ4_AVAILABLE:
+        compressors[COMPRESSION_LZ4] = (lz4.frame.compress, lz4.frame.decompress)
+    return compressors
+
+
+class CacheCodec:
+    """
+    캐시 값 인코더/디코더
+
+    - 인코딩: 설정된 직렬화 + 압축 (작은 값은 압축 생략)
+    - 디코딩: 헤더를 보고 직렬화/압축 방식을 판단 (설정과 무관)
+    - 인코딩/디코딩 크기와 시간을 누적 집계
+    """
+
+    def __init__(
+        self,
+        serializer: str = CACHE_SERIALIZER,
+        compression: str = CACHE_COMPRESSION,
+        compress_min_bytes: int = CACHE_COMPRESS_MIN_BYTES
+    ):
+        """
+        Args:
+            serializer: 'json' 또는 'msgpack'
+            compression: 'none', 'zlib', 'zstd', 'lz4'
+            compress_min_bytes: 압축을 적용할 최소 직렬화 크기
+
+        설치되지 않은 방식은 경고 후 json / zlib로 대체합니다.
+
+        Raises:
+            ValueError: 알 수 없는 방식
+        """
+        self._serializers = _serializers()
+        self._compressors = _compressors()
+
+        if serializer not in SERIALIZER_NAMES:
+            raise ValueError(f"사용할 수 없는 캐시 직렬화 방식: {serializer}")
+        if compression not in COMPRESSION_NAMES:
+            raise ValueError(f"사용할 수 없는 캐시 압축 방식: {compression}")
+
+        if SERIALIZER_NAMES[serializer] not in self._serializers:
+            logger.warning("cache_serializer_unavailable", requested=serializer, fallback='json')
+            serializer = 'json'
+        if COMPRESSION_NAMES[compression] not in self._compressors:
+            logger.warning("cache_compression_unavailable", requested=compression, fallback='zlib')
+            compression = 'zlib'
+        serializer_id = SERIALIZER_NAMES[serializer]
+        compression_id = COMPRESSION_NAMES[compression]
+
+        self.serializer = serializer
+        self.compression = compression
+        self.serializer_id = serializer_id
+        self.compression_id = compression_id
+        self.compress_min_bytes = compress_min_bytes
+        self.reset_stats()
+
+    def encode(self, data: Any) -> bytes:
+        """
+        값을 저장 형식으로 인코딩
+
+        Args:
+            data: 직렬화 가능한 값
+
+        Returns:
+            헤더 + 본문 바이트
+        """
+        start_time = time.perf_counter()
+
+        dumps = self._serializers[self.serializer_id][0]
+        payload = dumps(data)
+        serialized_size = len(payload)
+
+        compression_id = self.compression_id
+        if compression_id != COMPRESSION_NONE and serialized_size < self.compress_min_bytes:
+            compression_id = COMPRESSION_NONE
+        payload = self._compressors[compression_id][0](payload)
+
+        encoded = bytes([HEADER_FLAG | (self.serializer_id << 3) | compression_id]) + payload
+
+        self.stats['encoded'] += 1
+        self.stats['serialized_bytes'] += serialized_size
+        self.stats['stored_bytes'] += len(encoded)
+        self.stats['encode_seconds'] += time.perf_counter() - start_time
+        return encoded
+
+    def decode(self, raw: Union[bytes, str]) -> Any:
+        """
+        저장된 값을 디코딩 (이전 평문 JSON 형식 포함)
+
+        Args:
+            raw: Redis에서 읽은 값
+
+        Returns:
+            역직렬화된 값
+
+        Raises:
+            ValueError: 손상되었거나 지원하지 않는 형식
+        """
+        start_time = time.perf_counter()
+
+        if isinstance(raw, str):
+            raw = raw.encode('utf-8')
+
+        if not raw:
+            raise ValueError("빈 캐시 값")
+
+        header = raw[0]
+        if not header & HEADER_FLAG:
+            # 이전 형식: 헤더 없는 평문 JSON
+            data = json.loads(raw)
+        else:
+            serializer_id = (header >> 3) & 0x07
+            compression_id = header & 0x07
+            if serializer_id not in self._serializers or compression_id not in self._compressors:
+                raise ValueError(f"지원하지 않는 캐시 형식 헤더: {header:#04x}")
+            payload = self._compressors[compression_id][1](raw[1:])
+            data = self._serializers[serializer_id][1](payload)
+
+        self.stats['decoded'] += 1
+        self.stats['decoded_bytes'] += len(raw)
+        self.stats['decode_seconds'] += time.perf_counter() - start_time
+        return data
+
+    def reset_stats(self):
+        """통계 초기화"""
+        self.stats = {
+            'encoded': 0,
+            'serialized_bytes': 0,
+            'stored_bytes': 0,
+            'encode_seconds': 0.0,
+            'decoded': 0,
+            'decoded_bytes': 0,
+            'decode_seconds': 0.0,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        코덱 통계 (키당 평균 크기, 압축률, 평균 인코딩/디코딩 시간)
+
+        Returns:
+            통계 정보
+        """
+        encoded = self.stats['encoded']
+        decoded = self.stats['decoded']
+        serialized = self.stats['serialized_bytes']
+        stored = self.stats['stored_bytes']
+
+        return {
+            'serializer': self.serializer,
+            'compression': self.compression,
+            'encoded': encoded,
+            'decoded': decoded,
+            'avg_stored_bytes': round(stored / encoded, 1) if encoded else 0,
+            'avg_decoded_bytes': round(self.stats['decoded_bytes'] / decoded, 1) if decoded else 0,
+            'compression_ratio': round(serialized / stored, 2) if stored else 0,
+            'avg_encode_ms': round(self.stats['encode_seconds'] / encoded * 1000, 3) if encoded else 0,
+            'avg_decode_ms': round(self.stats['decode_seconds'] / decoded * 1000, 3) if decoded else 0,
+        }
@@ -1,25 +1,102 @@
 """
 캐시 데코레이터
 API 응답 자동 캐싱
+
+BaseAPIClient.get_all_pages와 AsyncAPIClient.get_all_pages_async(한 달치 전체 페이지)에
+적용됩니다. 캐시를 한 번에 조회/기록하는 수집기(BatchCollector, CollectionScheduler)는
+use_cache=False로 호출해 데코레이터를 거치지 않습니다.
 """
+import os
+import time
+import asyncio
 import functools
-from typing import Callable, Any
+import inspect
+from typing import Callable, Any, Dict, Optional, Tuple
 from logger import get_logger
-from .redis_client import get_redis_cache
+from common import is_complete_result, is_empty_result
+from .redis_client import get_redis_cache, CACHE_XFETCH_BETA
+from .async_redis_client import get_async_redis_cache
 
 logger = get_logger(__name__)
 
+# 다른 호출자가 재계산 중일 때 결과를 기다리는 최대 시간 (stale 값이 없을 때)
+CACHE_LOCK_WAIT_MS = int(os.getenv('CACHE_LOCK_WAIT_MS', '5000'))
+
+# 대기 중 캐시 재확인 간격 (초)
+_LOCK_POLL_INITIAL = 0.05
+_LOCK_POLL_MAX = 0.5
+
+
+def _detect_api_type(obj: Any) -> str:
+    """API 클라이언트의 BASE_URL로 API 타입 결정"""
+    base_url = getattr(obj, 'BASE_URL', None)
+    if not base_url:
+        return 'unknown'
+    if 'SilvTrade' in base_url:
+        return 'api_01'
+    if 'AptTradeDev' in base_url:
+        return 'api_03'
+    if 'AptTrade' in base_url:
+        return 'api_02'
+    if 'AptRent' in base_url:
+        return 'api_04'
+    return 'unknown'
+
 
-def cache_api_response(api_type_field: str = '_api_type'):
+def _extract_cache_key(args: tuple, kwargs: dict, positional_offset: int) -> Tuple[str, str, str]:
+    """
+    호출 인자에서 (api_type, lawd_cd, deal_ymd) 추출
+
+    Args:
+        args: 위치 인자 (args[0]은 self)
+        kwargs: 키워드 인자
+        positional_offset: lawd_cd의 위치 (비동기는 session 다음이라 2, 동기는 1)
+    """
+    if len(args) >= positional_offset + 2:
+        lawd_cd = args[positional_offset]
+        deal_ymd = args[positional_offset + 1]
+    else:
+        lawd_cd = kwargs['lawd_cd']
+        deal_ymd = kwargs['deal_ymd']
+    return _detect_api_type(args[0]), lawd_cd, deal_ymd
+
+
+def _is_cacheable(result: Any) -> bool:
+    """모든 페이지를 받은 결과와 거래 없음(NODATA) 결과만 캐싱"""
+    return bool(result) and (is_complete_result(result) or is_empty_result(result))
+
+
+def _entry_ttl(cache: Any, deal_ymd: str, result: Dict[str, Any]) -> Optional[int]:
+    """빈 결과는 별도 TTL(최근 월은 짧게), 나머지는 Adaptive TTL(None)"""
+    if is_empty_result(result):
+        cache.stats['negative_sets'] += 1
+        return cache._calculate_negative_ttl(deal_ymd)
+    return None
+
+
+def cache_api_response(
+    api_type_field: str = '_api_type',
+    stampede_protection: bool = True,
+    xfetch_beta: float = CACHE_XFETCH_BETA,
+    lock_wait_ms: int = CACHE_LOCK_WAIT_MS
+):
     """
     API 응답을 Redis에 캐싱하는 데코레이터
 
     Args:
         api_type_field: API 타입을 나타내는 필드명
+        stampede_protection: 캐시 스탬피드 보호 사용 여부
+            - 재계산은 락을 획득한 한 호출자만 수행
+            - 나머지는 stale 값을 사용하거나, 없으면 결과를 기다림
+        xfetch_beta: XFetch 조기 갱신 강도 (0이면 만료 시점에만 갱신)
+        lock_wait_ms: stale 값이 없을 때 다른 호출자의 재계산을 기다리는 최대 시간
+
+    데코레이트한 함수는 use_cache 키워드를 추가로 받습니다 (False면 캐시 없이 호출).
+    API 타입을 알 수 없는 클라이언트(BASE_URL로 판별)는 캐싱하지 않습니다.
 
     Usage:
-        @cache_api_response(api_type_field='api_02')
-        async def get_trade_data_parsed_async(self, session, lawd_cd, deal_ymd, **kwargs):
+        @cache_api_response()
+        async def get_all_pages_async(self, session, lawd_cd, deal_ymd, **kwargs):
             ...
 
     Cache Key Format:
@@ -29,143 +106,166 @@ def cache_api_response(api_type_field: str = '_api_type'):
         - Current month: 1 hour
         - Recent 3 months: 6 hours
         - Historical: 7 days
+        - Empty result (no deals): 1 hour for the last 2 months, 30 days before that
     """
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            """비동기 함수용 래퍼"""
-            cache = get_redis_cache()
+            """비동기 함수용 래퍼 (redis.asyncio - 이벤트 루프 블로킹 없음)"""
+            if not kwargs.pop('use_cache', True):
+                return await func(*args, **kwargs)
 
-            # Redis가 비활성화되어 있으면 캐싱 없이 실행
-            if not cache or not cache.is_connected():
+            cache = await get_async_redis_cache()
+
+            # Redis가 비활성화되어 있거나 연결 실패 시 캐싱 없이 실행
+            if not cache:
                 logger.debug("cache_disabled_or_disconnected", func=func.__name__)
                 return await func(*args, **kwargs)
 
             # 캐시 키 생성에 필요한 파라미터 추출
             # 일반적으로 (self, session, lawd_cd, deal_ymd, ...) 형태
             try:
-                # args에서 추출
-                if len(args) >= 4:
-                    self = args[0]
-                    lawd_cd = args[2]
-                    deal_ymd = args[3]
-                # kwargs에서 추출
-                else:
-                    lawd_cd = kwargs.get('lawd_cd')
-                    deal_ymd = kwargs.get('deal_ymd')
-                    self = args[0] if args else None
-
-                # API 타입 결정
-                if hasattr(self, 'BASE_URL'):
-                    # BaseURL에서 API 타입 추출
-                    if 'SilvTrade' in self.BASE_URL:
-                        api_type = 'api_01'
-                    elif 'AptTradeDev' in self.BASE_URL:
-                        api_type = 'api_03'
-                    elif 'AptTrade' in self.BASE_URL:
-                        api_type = 'api_02'
-                    elif 'AptRent' in self.BASE_URL:
-                        api_type = 'api_04'
-                    else:
-                        api_type = 'unknown'
-                else:
-                    api_type = 'unknown'
-
+                api_type, lawd_cd, deal_ymd = _extract_cache_key(args, kwargs, 2)
             except (IndexError, KeyError) as e:
                 logger.warning("cache_key_extraction_failed", error=str(e))
                 # 캐시 키 생성 실패 시 캐싱 없이 실행
                 return await func(*args, **kwargs)
+            if api_type == 'unknown':
+                return await func(*args, **kwargs)
+
+            log_context = dict(func=func.__name__, api_type=api_type, lawd_cd=lawd_cd, deal_ymd=deal_ymd)
+
+            async def recompute():
+                started = time.perf_counter()
+                result = await func(*args, **kwargs)
+                if _is_cacheable(result):
+                    await cache.set_entry(
+                        api_type, lawd_cd, deal_ymd, result,
+                        ttl=_entry_ttl(cache, deal_ymd, result),
+                        delta=time.perf_counter() - started
+                    )
+                    logger.debug("cache_set_decorator", **log_context)
+                return result
 
             # 캐시 조회
-            cached_data = cache.get(api_type, lawd_cd, deal_ymd)
-            if cached_data is not None:
-                logger.debug(
-                    "cache_hit_decorator",
-                    func=func.__name__,
-                    api_type=api_type,
-                    lawd_cd=lawd_cd,
-                    deal_ymd=deal_ymd
-                )
-                return cached_data
-
-            # 캐시 미스 - 함수 실행
-            logger.debug(
-                "cache_miss_decorator",
-                func=func.__name__,
-                api_type=api_type,
-                lawd_cd=lawd_cd,
-                deal_ymd=deal_ymd
-            )
-            result = await func(*args, **kwargs)
-
-            # 결과를 캐시에 저장 (에러가 아닌 경우에만)
-            if result and not result.get('error'):
-                cache.set(api_type, lawd_cd, deal_ymd, result)
-                logger.debug(
-                    "cache_set_decorator",
-                    func=func.__name__,
-                    api_type=api_type,
-                    lawd_cd=lawd_cd,
-                    deal_ymd=deal_ymd
-                )
-
-            return result
+            entry = await cache.get_entry(api_type, lawd_cd, deal_ymd)
+            if entry is not None and not entry.should_refresh(xfetch_beta):
+                logger.debug("cache_hit_decorator", **log_context)
+                return entry.data
+
+            if not stampede_protection:
+                if entry is not None and not entry.is_stale:
+                    return entry.data
+                logger.debug("cache_miss_decorator", **log_context)
+                return await recompute()
+
+            # 미스 / 만료 / 조기 갱신: 락을 획득한 한 호출자만 재계산
+            token = await cache.acquire_lock(api_type, lawd_cd, deal_ymd)
+            if token is not None:
+                if entry is not None and not entry.is_stale:
+                    cache.stats['early_refreshes'] += 1
+                logger.debug("cache_recompute_decorator", stale=entry is not None, **log_context)
+                try:
+                    return await recompute()
+                finally:
+                    await cache.release_lock(api_type, lawd_cd, deal_ymd, token)
+
+            # 다른 호출자가 재계산 중: 기존 값이 있으면 그대로 사용
+            if entry is not None:
+                if entry.is_stale:
+                    cache.stats['stale_hits'] += 1
+                logger.debug("cache_serve_stale_decorator", **log_context)
+                return entry.data
+
+            # 값이 없으면 재계산 결과를 기다림 (시간 초과 시 직접 호출)
+            cache.stats['lock_waits'] += 1
+            deadline = time.monotonic() + lock_wait_ms / 1000
+            delay = _LOCK_POLL_INITIAL
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                entry = await cache.get_entry(api_type, lawd_cd, deal_ymd)
+                if entry is not None:
+                    return entry.data
+                delay = min(delay * 2, _LOCK_POLL_MAX)
+
+            logger.warning("cache_lock_wait_timeout", **log_context)
+            return await recompute()
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             """동기 함수용 래퍼"""
+            if not kwargs.pop('use_cache', True):
+                return func(*args, **kwargs)
+
             cache = get_redis_cache()
 
             # Redis가 비활성화되어 있으면 캐싱 없이 실행
             if not cache or not cache.is_connected():
                 return func(*args, **kwargs)
 
-            # 캐시 키 생성 (동일 로직)
+            # 캐시 키 생성 (self, lawd_cd, deal_ymd, ...)
             try:
-                if len(args) >= 3:
-                    self = args[0]
-                    lawd_cd = args[1]
-                    deal_ymd = args[2]
-                else:
-                    lawd_cd = kwargs.get('lawd_cd')
-                    deal_ymd = kwargs.get('deal_ymd')
-                    self = args[0] if args else None
-
-                # API 타입 결정
-                if hasattr(self, 'BASE_URL'):
-                    if 'SilvTrade' in self.BASE_URL:
-                        api_type = 'api_01'
-                    elif 'AptTradeDev' in self.BASE_URL:
-                        api_type = 'api_03'
-                    elif 'AptTrade' in self.BASE_URL:
-                        api_type = 'api_02'
-                    elif 'AptRent' in self.BASE_URL:
-                        api_type = 'api_04'
-                    else:
-                        api_type = 'unknown'
-                else:
-                    api_type = 'unknown'
-
+                api_type, lawd_cd, deal_ymd = _extract_cache_key(args, kwargs, 1)
             except (IndexError, KeyError):
                 return func(*args, **kwargs)
+            if api_type == 'unknown':
+                return func(*args, **kwargs)
+
+            log_context = dict(func=func.__name__, api_type=api_type, lawd_cd=lawd_cd, deal_ymd=deal_ymd)
+
+            def recompute():
+                started = time.perf_counter()
+                result = func(*args, **kwargs)
+                if _is_cacheable(result):
+                    cache.set_entry(
+                        api_type, lawd_cd, deal_ymd, result,
+                        ttl=_entry_ttl(cache, deal_ymd, result),
+                        delta=time.perf_counter() - started
+                    )
+                return result
 
             # 캐시 조회
-            cached_data = cache.get(api_type, lawd_cd, deal_ymd)
-            if cached_data is not None:
-                logger.debug("cache_hit_sync", api_type=api_type, lawd_cd=lawd_cd, deal_ymd=deal_ymd)
-                return cached_data
+            entry = cache.get_entry(api_type, lawd_cd, deal_ymd)
+            if entry is not None and not entry.should_refresh(xfetch_beta):
+                logger.debug("cache_hit_sync", **log_context)
+                return entry.data
+
+            if not stampede_protection:
+                if entry is not None and not entry.is_stale:
+                    return entry.data
+                return recompute()
+
+            # 미스 / 만료 / 조기 갱신: 락을 획득한 한 호출자만 재계산
+            token = cache.acquire_lock(api_type, lawd_cd, deal_ymd)
+            if token is not None:
+                if entry is not None and not entry.is_stale:
+                    cache.stats['early_refreshes'] += 1
+                try:
+                    return recompute()
+                finally:
+                    cache.release_lock(api_type, lawd_cd, deal_ymd, token)
 
-            # 캐시 미스 - 함수 실행
-            result = func(*args, **kwargs)
+            # 다른 호출자가 재계산 중: 기존 값이 있으면 그대로 사용
+            if entry is not None:
+                if entry.is_stale:
+                    cache.stats['stale_hits'] += 1
+                return entry.data
 
-            # 결과 캐싱
-            if result and not result.get('error'):
-                cache.set(api_type, lawd_cd, deal_ymd, result)
+            # 값이 없으면 재계산 결과를 기다림 (시간 초과 시 직접 호출)
+            cache.stats['lock_waits'] += 1
+            deadline = time.monotonic() + lock_wait_ms / 1000
+            delay = _LOCK_POLL_INITIAL
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                entry = cache.get_entry(api_type, lawd_cd, deal_ymd)
+                if entry is not None:
+                    return entry.data
+                delay = min(delay * 2, _LOCK_POLL_MAX)
 
-            return result
+            logger.warning("cache_lock_wait_timeout", **log_context)
+            return recompute()
 
         # 함수가 코루틴이면 async_wrapper, 아니면 sync_wrapper
-        import inspect
         if inspect.iscoroutinefunction(func):
             return async_wrapper
         else:
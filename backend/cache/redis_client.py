@@ -3,9 +3,11 @@ Redis 캐싱 클라이언트
 Adaptive TTL 기반 API 응답 캐싱
 """
 import os
-import json
+import math
 import time
-from typing import Optional, Dict, Any
+import random
+import uuid
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Set, Tuple
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -17,6 +19,7 @@ except ImportError:
     REDIS_AVAILABLE = False
 
 from logger import get_logger
+from .codec import CacheCodec
 
 # 환경변수 로드
 load_dotenv()
@@ -30,21 +33,96 @@ CACHE_TTL_CURRENT_MONTH = int(os.getenv('CACHE_TTL_CURRENT_MONTH', '3600'))
 CACHE_TTL_RECENT_MONTHS = int(os.getenv('CACHE_TTL_RECENT_MONTHS', '21600'))     # 6시간
 CACHE_TTL_HISTORICAL = int(os.getenv('CACHE_TTL_HISTORICAL', '604800'))          # 7일
 
+# 빈 결과(거래 없음) TTL 설정 (초)
+# 실거래 신고 기한(30일) 때문에 최근 월은 나중에 거래가 생길 수 있어 짧게 유지
+CACHE_NEGATIVE_TTL_RECENT = int(os.getenv('CACHE_NEGATIVE_TTL_RECENT', '3600'))            # 1시간
+CACHE_NEGATIVE_TTL_HISTORICAL = int(os.getenv('CACHE_NEGATIVE_TTL_HISTORICAL', '2592000'))  # 30일
 
-class RedisCache:
+# Stampede 보호
+CACHE_STALE_TTL = int(os.getenv('CACHE_STALE_TTL', '600'))            # 논리적 만료 후 stale 값 보관 시간 (초)
+CACHE_LOCK_TTL_MS = int(os.getenv('CACHE_LOCK_TTL_MS', '30000'))      # 재계산 락 유효 시간
+CACHE_XFETCH_BETA = float(os.getenv('CACHE_XFETCH_BETA', '1.0'))      # 조기 갱신 강도 (0이면 비활성화)
+
+# 무효화 / 인벤토리 배치 크기 (SCAN COUNT 힌트, UNLINK당 키 수)
+CACHE_SCAN_COUNT = int(os.getenv('CACHE_SCAN_COUNT', '1000'))
+CACHE_DELETE_BATCH = int(os.getenv('CACHE_DELETE_BATCH', '500'))
+
+# API 응답 캐시 키 패턴 (apt_insights:{api_type}:{lawd_cd}:{deal_ymd}[:extra], 빈 월 맵 포함)
+# 같은 접두사를 쓰는 레이트 리미터/서킷 브레이커/핫 쿼리/내보내기 작업 키는 제외
+CACHE_KEY_PATTERN = 'apt_insights:api_*'
+
+# 벌크 조회/저장 키: (api_type, lawd_cd, deal_ymd)
+CacheKey = Tuple[str, str, str]
+
+# 빈 월 맵 키: (api_type, lawd_cd)
+EmptyMapKey = Tuple[str, str]
+
+# 만료 메타데이터를 담는 엔트리 필드 (set_entry로 저장한 값)
+ENTRY_META_FIELD = '__cache_meta__'
+
+# 락 소유자만 해제 (compare-and-delete)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class CacheEntry:
     """
-    Redis 기반 캐싱 클라이언트
+    캐시 값 + 만료 메타데이터
 
-    Features:
-    - Adaptive TTL (최신 데이터 짧게, 과거 데이터 길게)
-    - 자동 직렬화/역직렬화
-    - 캐시 통계 추적
-    - CLI 관리 명령어
+    XFetch (Vattani et al., "Optimal Probabilistic Cache Stampede Prevention"):
+    재계산 시간(delta)이 길수록, 만료가 가까울수록 높은 확률로 만료 전에
+    미리 갱신하여 TTL 경계에서 동시 미스가 몰리지 않게 합니다.
+    """
 
-    TTL 전략:
-    - 현재 월: 1시간 (자주 변경됨)
-    - 최근 3개월: 6시간 (간헐적 변경)
-    - 과거 데이터: 7일 (거의 변경 안 됨)
+    def __init__(self, data: Any, expires_at: Optional[float] = None, delta: float = 0.0):
+        """
+        Args:
+            data: 캐시된 값
+            expires_at: 논리적 만료 시각 (Unix time, 메타데이터 없는 값은 None)
+            delta: 값 재계산에 걸린 시간 (초)
+        """
+        self.data = data
+        self.expires_at = expires_at
+        self.delta = delta
+
+    @property
+    def is_stale(self) -> bool:
+        """논리적 만료 여부 (stale 보관 기간 중)"""
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def should_refresh(self, beta: float = CACHE_XFETCH_BETA) -> bool:
+        """
+        지금 갱신해야 하는지 판단 (만료됐거나 XFetch 조기 갱신 당첨)
+
+        Args:
+            beta: 조기 갱신 강도 (1.0 권장, 클수록 일찍 갱신)
+
+        Returns:
+            갱신 필요 여부
+        """
+        if self.expires_at is None:
+            return False
+        if self.is_stale:
+            return True
+        if self.delta <= 0 or beta <= 0:
+            return False
+        # now - delta * beta * ln(U), U ~ (0, 1]
+        early = -self.delta * beta * math.log(1.0 - random.random())
+        return time.time() + early >= self.expires_at
+
+
+class BaseRedisCache:
+    """
+    동기/비동기 Redis 캐시 공통 로직
+
+    - 캐시 키 생성
+    - Adaptive TTL 계산
+    - 페이로드 직렬화/압축 (CacheCodec)
+    - 캐시 통계
     """
 
     def __init__(self, url: str = REDIS_URL):
@@ -60,44 +138,22 @@ class RedisCache:
 
         self.logger = get_logger(__name__)
         self.url = url
-        self.client: Optional[Redis] = None
-        self.stats = {
+        self.codec = CacheCodec()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
             'hits': 0,
             'misses': 0,
             'sets': 0,
             'errors': 0,
+            'stale_hits': 0,
+            'early_refreshes': 0,
+            'lock_waits': 0,
+            'negative_sets': 0,
         }
 
-        # Redis 연결 시도
-        self._connect()
-
-    def _connect(self):
-        """Redis 연결"""
-        try:
-            self.client = redis.from_url(
-                self.url,
-                encoding='utf-8',
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
-            # 연결 테스트
-            self.client.ping()
-            self.logger.info("redis_connected", url=self.url)
-        except Exception as e:
-            self.logger.error("redis_connection_failed", error=str(e))
-            self.client = None
-
-    def is_connected(self) -> bool:
-        """Redis 연결 상태 확인"""
-        if not self.client:
-            return False
-        try:
-            self.client.ping()
-            return True
-        except:
-            return False
-
     def _calculate_ttl(self, deal_ymd: str) -> int:
         """
         Adaptive TTL 계산
@@ -130,6 +186,58 @@ class RedisCache:
             self.logger.warning("invalid_date_format", deal_ymd=deal_ymd)
             return CACHE_TTL_RECENT_MONTHS
 
+    def _calculate_negative_ttl(self, deal_ymd: str) -> int:
+        """
+        빈 결과 TTL 계산
+
+        Args:
+            deal_ymd: 계약년월 (YYYYMM 형식)
+
+        Returns:
+            TTL (초) - 신고 기한이 지나지 않은 최근 2개월은 짧게, 그 이전은 길게
+        """
+        try:
+            deal_date = datetime.strptime(deal_ymd, '%Y%m')
+        except ValueError:
+            self.logger.warning("invalid_date_format", deal_ymd=deal_ymd)
+            return CACHE_NEGATIVE_TTL_RECENT
+
+        if deal_date >= datetime.now() - timedelta(days=62):
+            return CACHE_NEGATIVE_TTL_RECENT
+        return CACHE_NEGATIVE_TTL_HISTORICAL
+
+    @staticmethod
+    def _empty_map_key(api_type: str, lawd_cd: str) -> str:
+        """빈 월 맵 키 (HASH: deal_ymd -> 만료 시각)"""
+        return f"apt_insights:{api_type}:{lawd_cd}:empty"
+
+    def _empty_map_fields(self, deal_ymds: Iterable[str]) -> Dict[str, str]:
+        """
+        빈 월 맵에 기록할 필드 (월 -> 만료 시각)
+
+        필드별 만료는 값으로 판단하고, 맵 키 자체는 가장 긴 빈 결과 TTL로 유지
+        """
+        now = time.time()
+        return {
+            deal_ymd: str(int(now + self._calculate_negative_ttl(deal_ymd)))
+            for deal_ymd in deal_ymds
+        }
+
+    @staticmethod
+    def _live_empty_months(raw: Dict[Any, Any]) -> Set[str]:
+        """HGETALL 결과에서 만료되지 않은 월만 추출"""
+        now = time.time()
+        months = set()
+        for field, expires_at in (raw or {}).items():
+            if isinstance(field, bytes):
+                field = field.decode('utf-8')
+            try:
+                if float(expires_at) > now:
+                    months.add(field)
+            except (TypeError, ValueError):
+                continue
+        return months
+
     def _build_key(
         self,
         api_type: str,
@@ -154,6 +262,179 @@ class RedisCache:
             parts.append(extra)
         return ':'.join(parts)
 
+    def _collect_hits(
+        self,
+        keys: List[CacheKey],
+        values: List[Optional[str]],
+        xfetch_beta: Optional[float] = None
+    ) -> Dict[CacheKey, Dict[str, Any]]:
+        """
+        MGET 결과를 키별 데이터로 변환 (히트/미스 통계 반영, stale 값은 미스)
+
+        Args:
+            keys: 조회한 키 목록
+            values: MGET 응답 (keys와 같은 순서)
+            xfetch_beta: 지정하면 XFetch 조기 갱신에 당첨된 값도 미스
+
+        Returns:
+            히트한 키만 담은 딕셔너리
+        """
+        hits = {}
+        for key, value in zip(keys, values):
+            if value:
+                try:
+                    entry = self._unwrap_entry(self.codec.decode(value))
+                    # 논리적으로 만료된 stale 값은 미스 (stale 재사용은 get_entry 경로만)
+                    if entry.is_stale:
+                        continue
+                    if xfetch_beta is not None and entry.should_refresh(xfetch_beta):
+                        self.stats['early_refreshes'] += 1
+                        continue
+                    hits[key] = entry.data
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self.logger.error("cache_decode_error", key=self._build_key(*key), error=str(e))
+        self.stats['hits'] += len(hits)
+        self.stats['misses'] += len(keys) - len(hits)
+        return hits
+
+    @staticmethod
+    def _wrap_entry(data: Any, ttl: int, delta: float) -> Dict[str, Any]:
+        """만료 메타데이터를 붙인 저장용 엔트리"""
+        return {
+            ENTRY_META_FIELD: {'expires_at': time.time() + ttl, 'delta': round(delta, 3)},
+            'data': data,
+        }
+
+    @staticmethod
+    def _unwrap_entry(value: Any) -> CacheEntry:
+        """저장된 값을 CacheEntry로 변환 (메타데이터 없는 이전 값 포함)"""
+        if isinstance(value, dict) and ENTRY_META_FIELD in value:
+            meta = value[ENTRY_META_FIELD]
+            return CacheEntry(value.get('data'), meta.get('expires_at'), meta.get('delta', 0.0))
+        return CacheEntry(value)
+
+    def _live_data(self, entry: Optional[CacheEntry]) -> Optional[Any]:
+        """
+        get/get_many용 값 (논리적으로 만료된 stale 값은 미스로 처리)
+
+        get_entry가 히트로 센 stale 값은 미스로 다시 셉니다.
+        """
+        if entry is None:
+            return None
+        if entry.is_stale:
+            self.stats['hits'] -= 1
+            self.stats['misses'] += 1
+            return None
+        return entry.data
+
+    def _entry_payloads(
+        self,
+        entries: Dict[CacheKey, Dict[str, Any]],
+        ttl: Optional[int],
+        deltas: Optional[Dict[CacheKey, float]] = None
+    ) -> List[Tuple[str, int, Any]]:
+        """
+        set_many용 (키, Redis TTL, 직렬화 값) 목록
+
+        set_entry와 같이 만료 메타데이터(키별 재계산 시간 포함)를 붙이고
+        CACHE_STALE_TTL만큼 더 보관합니다.
+        """
+        deltas = deltas or {}
+        payloads = []
+        for key, data in entries.items():
+            logical_ttl = ttl if ttl is not None else self._calculate_ttl(key[2])
+            payloads.append((
+                self._build_key(*key),
+                logical_ttl + CACHE_STALE_TTL,
+                self.codec.encode(self._wrap_entry(data, logical_ttl, deltas.get(key, 0.0)))
+            ))
+        return payloads
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"{key}:lock"
+
+    def reset_stats(self):
+        """통계 초기화"""
+        self.stats = self._empty_stats()
+        self.codec.reset_stats()
+        self.logger.info("cache_stats_reset")
+
+    def _request_stats(self) -> Dict[str, Any]:
+        """클라이언트 측 히트/미스 통계"""
+        total_requests = self.stats['hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'hits': self.stats['hits'],
+            'misses': self.stats['misses'],
+            'sets': self.stats['sets'],
+            'errors': self.stats['errors'],
+            'total_requests': total_requests,
+            'hit_rate_percent': round(hit_rate, 2),
+            'stale_hits': self.stats['stale_hits'],
+            'early_refreshes': self.stats['early_refreshes'],
+            'lock_waits': self.stats['lock_waits'],
+            'negative_sets': self.stats['negative_sets'],
+            'codec': self.codec.get_stats(),
+        }
+
+
+class RedisCache(BaseRedisCache):
+    """
+    Redis 기반 캐싱 클라이언트
+
+    Features:
+    - Adaptive TTL (최신 데이터 짧게, 과거 데이터 길게)
+    - 자동 직렬화/역직렬화
+    - 캐시 통계 추적
+    - CLI 관리 명령어
+
+    TTL 전략:
+    - 현재 월: 1시간 (자주 변경됨)
+    - 최근 3개월: 6시간 (간헐적 변경)
+    - 과거 데이터: 7일 (거의 변경 안 됨)
+    """
+
+    def __init__(self, url: str = REDIS_URL):
+        """
+        Args:
+            url: Redis 연결 URL
+        """
+        super().__init__(url)
+        self.client: Optional[Redis] = None
+
+        # Redis 연결 시도
+        self._connect()
+
+    def _connect(self):
+        """Redis 연결"""
+        try:
+            self.client = redis.from_url(
+                self.url,
+                encoding='utf-8',
+                decode_responses=False,
+                socket_connect_timeout=5,
+                socket_timeout=5
+            )
+            # 연결 테스트
+            self.client.ping()
+            self.logger.info("redis_connected", url=self.url)
+        except Exception as e:
+            self.logger.error("redis_connection_failed", error=str(e))
+            self.client = None
+
+    def is_connected(self) -> bool:
+        """Redis 연결 상태 확인"""
+        if not self.client:
+            return False
+        try:
+            self.client.ping()
+            return True
+        except:
+            return False
+
     def get(
         self,
         api_type: str,
@@ -171,7 +452,28 @@ class RedisCache:
             extra: 추가 식별자
 
         Returns:
-            캐시된 데이터 (없으면 None)
+            캐시된 데이터 (없거나 논리적으로 만료됐으면 None)
+        """
+        return self._live_data(self.get_entry(api_type, lawd_cd, deal_ymd, extra))
+
+    def get_entry(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        extra: Optional[str] = None
+    ) -> Optional[CacheEntry]:
+        """
+        캐시에서 데이터와 만료 메타데이터 조회
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            extra: 추가 식별자
+
+        Returns:
+            CacheEntry (없으면 None, 논리적으로 만료된 stale 값 포함)
         """
         if not self.is_connected():
             self.stats['errors'] += 1
@@ -191,7 +493,7 @@ class RedisCache:
                     key=key,
                     response_time=f"{elapsed*1000:.2f}ms"
                 )
-                return json.loads(data)
+                return self._unwrap_entry(self.codec.decode(data))
             else:
                 self.stats['misses'] += 1
                 self.logger.debug("cache_miss", key=key)
@@ -237,7 +539,7 @@ class RedisCache:
 
         try:
             start_time = time.time()
-            serialized = json.dumps(data, ensure_ascii=False)
+            serialized = self.codec.encode(data)
             self.client.setex(key, ttl, serialized)
             elapsed = time.time() - start_time
 
@@ -256,6 +558,243 @@ class RedisCache:
             self.logger.error("cache_set_error", key=key, error=str(e))
             return False
 
+    def set_entry(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        data: Dict[str, Any],
+        extra: Optional[str] = None,
+        ttl: Optional[int] = None,
+        delta: float = 0.0
+    ) -> bool:
+        """
+        만료 메타데이터와 함께 저장 (stampede 보호용)
+
+        논리적 TTL이 지나도 CACHE_STALE_TTL 동안은 값을 보관하여, 한 호출자가
+        재계산하는 동안 다른 호출자는 stale 값을 사용할 수 있습니다.
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            data: 저장할 데이터
+            extra: 추가 식별자
+            ttl: 논리적 TTL (None이면 자동 계산)
+            delta: 값 재계산에 걸린 시간 (초, XFetch 조기 갱신에 사용)
+
+        Returns:
+            성공 여부
+        """
+        if ttl is None:
+            ttl = self._calculate_ttl(deal_ymd)
+        return self.set(
+            api_type, lawd_cd, deal_ymd,
+            self._wrap_entry(data, ttl, delta),
+            extra=extra,
+            ttl=ttl + CACHE_STALE_TTL
+        )
+
+    def acquire_lock(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        extra: Optional[str] = None,
+        lock_ttl_ms: int = CACHE_LOCK_TTL_MS
+    ) -> Optional[str]:
+        """
+        재계산 락 획득 (SET NX PX)
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+            extra: 추가 식별자
+            lock_ttl_ms: 락 유효 시간 (재계산이 멈춰도 자동 해제)
+
+        Returns:
+            락 토큰 (다른 호출자가 보유 중이면 None). Redis 오류 시에는
+            재계산이 막히지 않도록 토큰을 반환합니다.
+        """
+        lock_key = self._lock_key(self._build_key(api_type, lawd_cd, deal_ymd, extra))
+        token = uuid.uuid4().hex
+        try:
+            if self.client.set(lock_key, token, nx=True, px=lock_ttl_ms):
+                return token
+            return None
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_lock_error", key=lock_key, error=str(e))
+            return token
+
+    def release_lock(
+        self,
+        api_type: str,
+        lawd_cd: str,
+        deal_ymd: str,
+        token: str,
+        extra: Optional[str] = None
+    ) -> bool:
+        """
+        재계산 락 해제 (토큰이 일치할 때만)
+
+        Returns:
+            해제 여부
+        """
+        lock_key = self._lock_key(self._build_key(api_type, lawd_cd, deal_ymd, extra))
+        try:
+            return bool(self.client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token))
+        except Exception as e:
+            self.logger.error("cache_unlock_error", key=lock_key, error=str(e))
+            return False
+
+    def get_many(
+        self,
+        keys: Iterable[CacheKey],
+        xfetch_beta: Optional[float] = None
+    ) -> Dict[CacheKey, Dict[str, Any]]:
+        """
+        여러 키를 MGET 한 번으로 조회
+
+        Args:
+            keys: (api_type, lawd_cd, deal_ymd) 목록
+            xfetch_beta: 지정하면 XFetch 조기 갱신에 당첨된 값도 미스로 돌려줌
+                (수집기가 만료 전에 나눠서 다시 받도록)
+
+        Returns:
+            히트한 키만 담은 딕셔너리 (Redis 오류 시 빈 딕셔너리)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        if not self.client:
+            self.stats['errors'] += 1
+            return {}
+
+        try:
+            start_time = time.time()
+            values = self.client.mget([self._build_key(*key) for key in keys])
+            elapsed = time.time() - start_time
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_get_many_error", keys=len(keys), error=str(e))
+            return {}
+
+        hits = self._collect_hits(keys, values, xfetch_beta)
+        self.logger.debug(
+            "cache_get_many",
+            keys=len(keys),
+            hits=len(hits),
+            response_time=f"{elapsed*1000:.2f}ms"
+        )
+        return hits
+
+    def set_many(
+        self,
+        entries: Dict[CacheKey, Dict[str, Any]],
+        ttl: Optional[int] = None,
+        deltas: Optional[Dict[CacheKey, float]] = None
+    ) -> int:
+        """
+        여러 키를 파이프라인 SETEX로 한 번에 저장 (키별 Adaptive TTL)
+
+        set_entry와 같은 만료 메타데이터로 저장하므로 논리적 TTL이 지나면
+        get/get_many에서는 미스, get_entry에서는 stale 값으로 보입니다.
+
+        Args:
+            entries: (api_type, lawd_cd, deal_ymd) -> 저장할 데이터
+            ttl: 모든 키에 적용할 논리적 TTL (None이면 키별 자동 계산)
+            deltas: 키별 재계산 시간 (초, XFetch 조기 갱신에 사용. 없으면 0)
+
+        Returns:
+            저장된 키 수
+        """
+        if not entries:
+            return 0
+        if not self.client:
+            self.stats['errors'] += 1
+            return 0
+
+        try:
+            start_time = time.time()
+            pipe = self.client.pipeline(transaction=False)
+            for key, expire, payload in self._entry_payloads(entries, ttl, deltas):
+                pipe.setex(key, expire, payload)
+            pipe.execute()
+            elapsed = time.time() - start_time
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_set_many_error", keys=len(entries), error=str(e))
+            return 0
+
+        self.stats['sets'] += len(entries)
+        self.logger.debug(
+            "cache_set_many",
+            keys=len(entries),
+            response_time=f"{elapsed*1000:.2f}ms"
+        )
+        return len(entries)
+
+    def mark_empty(self, api_type: str, lawd_cd: str, deal_ymds: Iterable[str]) -> int:
+        """
+        거래가 없는 월을 빈 월 맵에 기록 (월별 빈 결과 TTL 적용)
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymds: 빈 결과였던 계약년월 목록
+
+        Returns:
+            기록한 월 수
+        """
+        fields = self._empty_map_fields(deal_ymds)
+        if not fields or not self.client:
+            return 0
+
+        key = self._empty_map_key(api_type, lawd_cd)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, CACHE_NEGATIVE_TTL_HISTORICAL)
+            pipe.execute()
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_mark_empty_error", key=key, error=str(e))
+            return 0
+
+        self.stats['negative_sets'] += len(fields)
+        return len(fields)
+
+    def get_empty_months(self, pairs: Iterable[EmptyMapKey]) -> Dict[EmptyMapKey, Set[str]]:
+        """
+        (api_type, lawd_cd)별 빈 월 조회 (파이프라인 1회)
+
+        Args:
+            pairs: (api_type, lawd_cd) 목록
+
+        Returns:
+            (api_type, lawd_cd) -> 만료되지 않은 빈 월 집합 (Redis 오류 시 빈 딕셔너리)
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs or not self.client:
+            return {}
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for api_type, lawd_cd in pairs:
+                pipe.hgetall(self._empty_map_key(api_type, lawd_cd))
+            raw_maps = pipe.execute()
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error("cache_get_empty_months_error", pairs=len(pairs), error=str(e))
+            return {}
+
+        return {
+            pair: self._live_empty_months(raw)
+            for pair, raw in zip(pairs, raw_maps)
+        }
+
     def delete(
         self,
         api_type: str,
@@ -288,10 +827,51 @@ class RedisCache:
             self.logger.error("cache_delete_error", key=key, error=str(e))
             return False
 
-    def clear_all(self, pattern: str = 'apt_insights:*') -> int:
+    def iter_keys(self, pattern: str = CACHE_KEY_PATTERN) -> Iterator[str]:
+        """
+        패턴에 매칭되는 키를 SCAN 커서로 순회 (Redis를 블로킹하지 않음)
+
+        Args:
+            pattern: Redis 키 패턴
+
+        Yields:
+            키 문자열
+        """
+        for key in self.client.scan_iter(match=pattern, count=CACHE_SCAN_COUNT):
+            yield key.decode('utf-8') if isinstance(key, bytes) else key
+
+    @staticmethod
+    def build_pattern(
+        api_type: Optional[str] = None,
+        lawd_cd: Optional[str] = None,
+        deal_ymd: Optional[str] = None
+    ) -> str:
+        """
+        api_type / 지역 / 월 범위의 키 패턴 생성
+
+        지정하지 않은 항목은 와일드카드이며, extra 식별자와 재계산 락 키(':lock')까지 포함합니다.
+        api_type을 지정하지 않아도 API 응답 캐시 키(CACHE_KEY_PATTERN)로 한정합니다.
+
+        Args:
+            api_type: API 타입 (예: api_02)
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월 (YYYYMM, 'YYYY*'처럼 패턴도 가능)
+
+        Returns:
+            Redis 키 패턴
+        """
+        if not (api_type or lawd_cd or deal_ymd):
+            return CACHE_KEY_PATTERN
+        pattern = f"apt_insights:{api_type or 'api_*'}:{lawd_cd or '*'}:{deal_ymd or '*'}"
+        return pattern if pattern.endswith('*') else pattern + '*'
+
+    def clear_all(self, pattern: str = CACHE_KEY_PATTERN) -> int:
         """
         패턴에 매칭되는 모든 캐시 삭제
 
+        KEYS + 단일 DEL 대신 SCAN 커서와 배치 UNLINK(백그라운드 메모리 해제)를
+        사용하므로 키스페이스가 커도 Redis를 오래 블로킹하지 않습니다.
+
         Args:
             pattern: Redis 키 패턴
 
@@ -301,16 +881,144 @@ class RedisCache:
         if not self.is_connected():
             return 0
 
+        deleted = 0
+        batch: List[str] = []
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                deleted = self.client.delete(*keys)
-                self.logger.info("cache_cleared", pattern=pattern, deleted=deleted)
-                return deleted
-            return 0
+            for key in self.iter_keys(pattern):
+                batch.append(key)
+                if len(batch) >= CACHE_DELETE_BATCH:
+                    deleted += self._unlink(batch)
+                    batch = []
+            if batch:
+                deleted += self._unlink(batch)
+
+            self.logger.info("cache_cleared", pattern=pattern, deleted=deleted)
+            return deleted
         except Exception as e:
-            self.logger.error("cache_clear_error", pattern=pattern, error=str(e))
-            return 0
+            self.logger.error("cache_clear_error", pattern=pattern, deleted=deleted, error=str(e))
+            return deleted
+
+    def _unlink(self, keys: List[str]) -> int:
+        """키 배치 삭제 (UNLINK 미지원 서버는 DEL)"""
+        try:
+            return self.client.unlink(*keys)
+        except redis.ResponseError:
+            return self.client.delete(*keys)
+
+    def invalidate(
+        self,
+        api_type: Optional[str] = None,
+        lawd_cd: Optional[str] = None,
+        deal_ymd: Optional[str] = None
+    ) -> int:
+        """
+        api_type / 지역 / 월 범위의 캐시 무효화
+
+        Args:
+            api_type: API 타입
+            lawd_cd: 지역코드
+            deal_ymd: 계약년월
+
+        Returns:
+            삭제된 키 개수
+        """
+        deleted = self.clear_all(self.build_pattern(api_type, lawd_cd, deal_ymd))
+
+        # 빈 월 맵은 지역 단위 키이므로 해당 월 필드만 제거
+        if deal_ymd and '*' not in deal_ymd and self.client:
+            try:
+                empty_pattern = self._empty_map_key(api_type or 'api_*', lawd_cd or '*')
+                for key in self.iter_keys(empty_pattern):
+                    self.client.hdel(key, deal_ymd)
+            except Exception as e:
+                self.logger.error("cache_empty_map_invalidate_error", deal_ymd=deal_ymd, error=str(e))
+
+        return deleted
+
+    def inventory(self, pattern: str = CACHE_KEY_PATTERN, with_memory: bool = True) -> Dict[str, Any]:
+        """
+        키스페이스 현황 (api_type별 / 월별 키 수와 메모리)
+
+        메모리는 MEMORY USAGE로 측정하며, 지원하지 않는 서버에서는 값 크기(STRLEN)로
+        대체합니다. 빈 월 맵은 월 단위 키가 아니므로 월별 집계에서 빠지고
+        empty_map_keys로 따로 셉니다.
+
+        Args:
+            pattern: Redis 키 패턴
+            with_memory: 메모리 측정 여부 (키당 명령 1회 추가, 파이프라인)
+
+        Returns:
+            {'total_keys', 'total_bytes', 'lock_keys', 'empty_map_keys', 'memory_source',
+             'by_api_type', 'by_month'}
+        """
+        report: Dict[str, Any] = {
+            'pattern': pattern,
+            'total_keys': 0,
+            'total_bytes': 0,
+            'lock_keys': 0,
+            'empty_map_keys': 0,
+            'memory_source': None,
+            'by_api_type': {},
+            'by_month': {},
+        }
+        if not self.is_connected():
+            return report
+
+        def add(bucket: Dict[str, Dict[str, int]], name: str, size: int):
+            entry = bucket.setdefault(name, {'keys': 0, 'bytes': 0})
+            entry['keys'] += 1
+            entry['bytes'] += size
+
+        batch: List[str] = []
+
+        def flush():
+            sizes = self._key_sizes(batch, report) if with_memory else [0] * len(batch)
+            for key, size in zip(batch, sizes):
+                parts = key.split(':')
+                if parts[-1] == 'lock':
+                    report['lock_keys'] += 1
+                    continue
+                api_type = parts[1] if len(parts) > 1 else 'unknown'
+                report['total_keys'] += 1
+                report['total_bytes'] += size
+                add(report['by_api_type'], api_type, size)
+                if parts[-1] == 'empty':
+                    report['empty_map_keys'] += 1
+                    continue
+                month = parts[3] if len(parts) > 3 else 'unknown'
+                add(report['by_month'], month, size)
+            batch.clear()
+
+        try:
+            for key in self.iter_keys(pattern):
+                batch.append(key)
+                if len(batch) >= CACHE_DELETE_BATCH:
+                    flush()
+            if batch:
+                flush()
+        except Exception as e:
+            self.logger.error("cache_inventory_error", pattern=pattern, error=str(e))
+
+        report['by_month'] = dict(sorted(report['by_month'].items()))
+        return report
+
+    def _key_sizes(self, keys: List[str], report: Dict[str, Any]) -> List[int]:
+        """키별 메모리 (MEMORY USAGE, 미지원 시 STRLEN)"""
+        if report['memory_source'] != 'strlen':
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.memory_usage(key)
+                sizes = pipe.execute()
+                report['memory_source'] = 'memory_usage'
+                return [size or 0 for size in sizes]
+            except redis.ResponseError:
+                report['memory_source'] = 'strlen'
+
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.strlen(key)
+        return [size or 0 for size in pipe.execute()]
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -319,18 +1027,8 @@ class RedisCache:
         Returns:
             통계 정보
         """
-        total_requests = self.stats['hits'] + self.stats['misses']
-        hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
-
-        stats = {
-            'hits': self.stats['hits'],
-            'misses': self.stats['misses'],
-            'sets': self.stats['sets'],
-            'errors': self.stats['errors'],
-            'total_requests': total_requests,
-            'hit_rate_percent': round(hit_rate, 2),
-            'connected': self.is_connected(),
-        }
+        stats = self._request_stats()
+        stats['connected'] = self.is_connected()
 
         # Redis 서버 정보 추가
         if self.is_connected():
@@ -346,17 +1044,6 @@ class RedisCache:
 
         return stats
 
-    def reset_stats(self):
-        """통계 초기화"""
-        self.stats = {
-            'hits': 0,
-            'misses': 0,
-            'sets': 0,
-            'errors': 0,
-        }
-        self.logger.info("cache_stats_reset")
-
-
 # 싱글톤 인스턴스
 _redis_cache: Optional[RedisCache] = None
 
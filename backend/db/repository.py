@@ -2,15 +2,87 @@
 트랜잭션 데이터 저장소 (Repository Pattern)
 data_loader.py의 데이터베이스 버전
 """
-from typing import List, Dict, Optional, Tuple
+import io
+import csv
+from typing import List, Dict, Optional, Tuple, Iterator
 from datetime import datetime, date
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, text
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
 from .models import Transaction
 from .session import get_session
 
+# COPY로 적재하는 컬럼 (id, created_at은 기본값 사용)
+COPY_COLUMNS = [
+    c.name for c in Transaction.__table__.columns if c.name not in ('id', 'created_at')
+]
+
+# unique_transaction 제약 컬럼 / 병합 시 갱신 여부 비교에서 제외할 컬럼
+_CONFLICT_COLUMNS = ('transaction_type', 'apt_seq', 'deal_year', 'deal_month', 'deal_day', 'deal_amount')
+_COMPARE_EXCLUDED = _CONFLICT_COLUMNS + ('source_file',)
+
+# COPY CSV의 NULL 표기
+_COPY_NULL = '\\N'
+
+# 스테이징 -> transactions 병합
+# - 같은 배치 안의 중복은 remove_duplicates와 같은 키(aptSeq, 없으면 aptNm + umdNm
+#   + 거래일 + 거래금액)로 API 타입별 하나만 남김
+# - aptSeq가 있는 행은 unique_transaction 제약으로 충돌을 판단해 값이 바뀐 행만 갱신
+#   (해제 신고 등), aptSeq가 없는 행은 같은 키의 행이 없을 때만 추가
+_MERGE_SQL = """
+INSERT INTO transactions ({columns})
+SELECT DISTINCT ON (
+    s.transaction_type, COALESCE(s.apt_seq, s.apt_nm || '|' || s.umd_nm),
+    s.deal_year, s.deal_month, s.deal_day, s.deal_amount
+) {staged_columns}
+FROM transactions_staging s
+WHERE s.apt_seq IS NOT NULL OR NOT EXISTS (
+    SELECT 1 FROM transactions t
+    WHERE t.transaction_type = s.transaction_type
+      AND COALESCE(t.apt_seq, '') = ''
+      AND t.apt_nm = s.apt_nm AND t.umd_nm = s.umd_nm
+      AND t.deal_year = s.deal_year AND t.deal_month = s.deal_month
+      AND t.deal_day = s.deal_day AND t.deal_amount = s.deal_amount
+)
+ON CONFLICT ON CONSTRAINT unique_transaction DO UPDATE SET {updates}
+WHERE ({compare_current}) IS DISTINCT FROM ({compare_excluded})
+RETURNING (xmax = 0) AS inserted
+"""
+
+
+def build_copy_buffer(items: List[Dict]) -> Tuple[io.StringIO, int]:
+    """
+    거래 데이터를 COPY ... FROM STDIN (FORMAT csv) 입력으로 변환
+
+    정규화는 Transaction.from_dict와 같고, 빈 aptSeq는 NULL로 적재합니다
+    (aptSeq 없는 거래끼리 unique_transaction 제약에서 충돌하지 않도록).
+
+    Args:
+        items: 딕셔너리 형식의 거래 데이터 리스트 (_api_type, _source_file 포함)
+
+    Returns:
+        (CSV 버퍼, 행 수)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    for item in items:
+        transaction = Transaction.from_dict(item)
+        row = []
+        for column in COPY_COLUMNS:
+            value = getattr(transaction, column)
+            if value is None or (column == 'apt_seq' and value == ''):
+                row.append(_COPY_NULL)
+            elif isinstance(value, date):
+                row.append(value.isoformat())
+            else:
+                row.append(value)
+        writer.writerow(row)
+
+    buffer.seek(0)
+    return buffer, len(items)
+
 
 class TransactionRepository:
     """
@@ -152,6 +224,47 @@ class TransactionRepository:
         transactions = query.all()
         return [t.to_dict() for t in transactions]
 
+    def iter_transactions(
+        self,
+        transaction_type: Optional[str] = None,
+        region_name: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict]:
+        """
+        필터링된 거래 데이터를 배치 단위로 스트리밍 조회 (내보내기용)
+
+        전체 결과를 메모리에 올리지 않고 batch_size 단위로 가져옵니다.
+        세션이 열려 있는 동안에만 순회할 수 있습니다.
+
+        Args:
+            transaction_type: API 타입 (api_01, api_02, etc.)
+            region_name: 지역명 (부분 일치)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            batch_size: 한 번에 가져올 행 수
+
+        Yields:
+            딕셔너리 형식의 거래 데이터
+        """
+        query = self.session.query(Transaction)
+
+        # 필터 적용
+        if transaction_type:
+            query = query.filter(Transaction.transaction_type == transaction_type)
+        if region_name:
+            query = query.filter(Transaction._region_name.ilike(f'%{region_name}%'))
+        if start_date:
+            query = query.filter(Transaction._deal_date >= start_date)
+        if end_date:
+            query = query.filter(Transaction._deal_date <= end_date)
+
+        query = query.order_by(Transaction._deal_date, Transaction.id)
+
+        for transaction in query.yield_per(batch_size):
+            yield transaction.to_dict()
+
     def bulk_insert_transactions(
         self,
         items: List[Dict],
@@ -237,6 +350,64 @@ class TransactionRepository:
         self.session.commit()
         return stats
 
+    def copy_merge_transactions(self, items: List[Dict]) -> Dict[str, int]:
+        """
+        COPY로 스테이징 테이블에 적재한 뒤 한 번의 INSERT ... ON CONFLICT로 병합 (수집기 적재용)
+
+        행마다 INSERT하는 bulk_insert_transactions보다 왕복이 적고, 같은 거래를 다시 받으면
+        값이 바뀐 행만 갱신합니다. 커밋은 호출한 쪽(세션)이 합니다.
+
+        Args:
+            items: 딕셔너리 형식의 거래 데이터 리스트 (_api_type, _source_file 포함)
+
+        Returns:
+            {'staged': N, 'inserted': I, 'updated': U}
+        """
+        if not self.session:
+            with get_session() as session:
+                self.session = session
+                return self._copy_merge_internal(items)
+        else:
+            return self._copy_merge_internal(items)
+
+    def _copy_merge_internal(self, items: List[Dict]) -> Dict[str, int]:
+        """내부 구현"""
+        stats = {'staged': 0, 'inserted': 0, 'updated': 0}
+        if not items:
+            return stats
+
+        columns = ', '.join(COPY_COLUMNS)
+        compared = [c for c in COPY_COLUMNS if c not in _COMPARE_EXCLUDED]
+
+        # 트랜잭션이 끝나면 사라지는 스테이징 테이블 (제약/기본값 없이 컬럼만)
+        self.session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS transactions_staging ON COMMIT DROP AS "
+            f"SELECT {columns} FROM transactions WITH NO DATA"
+        ))
+
+        buffer, stats['staged'] = build_copy_buffer(items)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY transactions_staging ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+                buffer
+            )
+        finally:
+            cursor.close()
+
+        rows = self.session.execute(text(_MERGE_SQL.format(
+            columns=columns,
+            staged_columns=', '.join(f's.{c}' for c in COPY_COLUMNS),
+            updates=', '.join(f'{c} = EXCLUDED.{c}' for c in COPY_COLUMNS if c not in _CONFLICT_COLUMNS),
+            compare_current=', '.join(f'transactions.{c}' for c in compared),
+            compare_excluded=', '.join(f'EXCLUDED.{c}' for c in compared),
+        ))).fetchall()
+
+        stats['inserted'] = sum(1 for row in rows if row.inserted)
+        stats['updated'] = len(rows) - stats['inserted']
+        self.session.execute(text("TRUNCATE transactions_staging"))
+        return stats
+
     def _dict_to_insert_values(self, data: Dict) -> Dict:
         """딕셔너리를 INSERT VALUES로 변환"""
         return {
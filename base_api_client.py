@@ -4,12 +4,23 @@ Base API Client for 국토교통부 공공데이터 API
 """
 import requests
 import time
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
+from urllib.parse import urlparse
 
 from config import SERVICE_KEY
-from common import parse_xml_response, parse_api_response, API_TIMEOUT_SECONDS
+from common import (
+    parse_xml_response, parse_api_response, API_TIMEOUT_SECONDS,
+    API_PAGE_CONCURRENCY, get_total_count, remaining_page_numbers, merge_page_results
+)
 from logger import get_logger, APILogger
+from backend.cache.decorators import cache_api_response
+from rate_limiter import get_rate_limiter, TokenBucketLimiter, THROTTLE_STATUS_CODES
+from retry_policy import (
+    API_MAX_RETRIES, CIRCUIT_OPEN_ERROR_CODE, STATE_OPEN, CircuitBreaker,
+    backoff_delay, circuit_open_error, get_circuit_breaker, is_retryable_status
+)
 
 
 class BaseAPIClient(ABC):
@@ -21,7 +32,8 @@ class BaseAPIClient(ABC):
     - HTTP 요청 처리
     - XML/JSON 응답 파싱
     - 에러 핸들링
-    - 재시도 로직 (선택적)
+    - 재시도 로직 (지수 백오프 + Full Jitter, 엔드포인트별 회로 차단기)
+    - 호출 속도 제한 (같은 호스트의 클라이언트가 적응형 토큰 버킷 공유)
 
     서브클래스는 다음을 정의해야 합니다:
     - BASE_URL: API 기본 URL
@@ -53,6 +65,12 @@ class BaseAPIClient(ABC):
         self.api_logger = APILogger(api_name)
         self.logger = get_logger(self.__class__.__name__)
 
+        # 호스트별 공유 Rate Limiter (비활성화 시 None)
+        self.rate_limiter: Optional[TokenBucketLimiter] = get_rate_limiter(urlparse(self.BASE_URL).netloc)
+
+        # 엔드포인트별 공유 회로 차단기 (비활성화 시 None)
+        self.circuit_breaker: Optional[CircuitBreaker] = get_circuit_breaker(self.full_url)
+
     @property
     def full_url(self) -> str:
         """전체 API URL 반환"""
@@ -96,15 +114,18 @@ class BaseAPIClient(ABC):
         self,
         params: Dict,
         timeout: int = API_TIMEOUT_SECONDS,
-        max_retries: int = 3
+        max_retries: int = API_MAX_RETRIES
     ) -> Dict:
         """
         HTTP GET 요청 실행
 
+        타임아웃/연결 오류/429·5xx 응답은 지수 백오프(Full Jitter) 후 재시도하고,
+        엔드포인트 회로가 열려 있으면 요청 없이 즉시 실패를 반환합니다.
+
         Args:
             params: 요청 파라미터
             timeout: 타임아웃 (초)
-            max_retries: 최대 재시도 횟수
+            max_retries: 최대 시도 횟수
 
         Returns:
             파싱된 응답 데이터
@@ -112,111 +133,174 @@ class BaseAPIClient(ABC):
         url = self.full_url
         last_error = None
         start_time = time.time()
+        breaker = self.circuit_breaker
+
+        # 회로가 열려 있으면 요청하지 않음
+        if breaker and not breaker.allow_request():
+            self.api_logger.log_error("Circuit open", error_code=CIRCUIT_OPEN_ERROR_CODE)
+            return circuit_open_error(breaker)
 
         # 요청 로깅
         self.api_logger.log_request("GET", url, params)
 
-        for attempt in range(max_retries):
-            try:
-                self.logger.debug(
-                    "api_request_attempt",
-                    attempt=attempt + 1,
-                    max_retries=max_retries,
-                    url=url
-                )
-
-                response = requests.get(url, params=params, timeout=timeout)
-                response.raise_for_status()
-
-                # 응답 내용 확인
-                text_response = response.text.strip()
-
-                # 응답 성공 로깅
-                response_time = time.time() - start_time
-                self.api_logger.log_response(
-                    status_code=response.status_code,
-                    response_time=response_time,
-                    response_length=len(text_response)
-                )
-
-                # XML 응답 처리
-                if text_response.startswith('<?xml') or text_response.startswith('<'):
-                    return parse_xml_response(text_response)
-
-                # JSON 응답 처리
-                elif text_response.startswith('{') or text_response.startswith('['):
-                    return response.json()
-
-                # 예상치 못한 형식
-                else:
-                    self.logger.warning(
-                        "unexpected_response_format",
-                        format=text_response[:100]
+        # 회로 차단기에 기록할 결과 (엔드포인트가 정상 응답하면 False)
+        endpoint_failed = True
+
+        try:
+            for attempt in range(max_retries):
+                # 재시도 전 백오프 (그 사이 다른 요청으로 회로가 열렸으면 중단)
+                if attempt > 0:
+                    if breaker and breaker.state == STATE_OPEN:
+                        return circuit_open_error(breaker)
+                    time.sleep(backoff_delay(attempt - 1))
+
+                try:
+                    self.logger.debug(
+                        "api_request_attempt",
+                        attempt=attempt + 1,
+                        max_retries=max_retries,
+                        url=url
+                    )
+
+                    if self.rate_limiter:
+                        self.rate_limiter.acquire()
+
+                    response = requests.get(url, params=params, timeout=timeout)
+                    endpoint_failed = is_retryable_status(response.status_code)
+                    response.raise_for_status()
+
+                    if self.rate_limiter:
+                        self.rate_limiter.on_success()
+
+                    # 응답 내용 확인
+                    text_response = response.text.strip()
+
+                    # 응답 성공 로깅
+                    response_time = time.time() - start_time
+                    self.api_logger.log_response(
+                        status_code=response.status_code,
+                        response_time=response_time,
+                        response_length=len(text_response)
+                    )
+
+                    # XML 응답 처리
+                    if text_response.startswith('<?xml') or text_response.startswith('<'):
+                        return parse_xml_response(text_response)
+
+                    # JSON 응답 처리
+                    elif text_response.startswith('{') or text_response.startswith('['):
+                        return response.json()
+
+                    # 예상치 못한 형식
+                    else:
+                        self.logger.warning(
+                            "unexpected_response_format",
+                            format=text_response[:100]
+                        )
+                        return {
+                            'error': True,
+                            'message': '예상치 못한 응답 형식',
+                            'raw_response': text_response[:500]
+                        }
+
+                except requests.exceptions.Timeout as e:
+                    last_error = e
+                    if self.rate_limiter:
+                        self.rate_limiter.on_throttle('timeout')
+                    if attempt < max_retries - 1:
+                        self.api_logger.log_retry(
+                            attempt=attempt + 1,
+                            max_retries=max_retries,
+                            reason="Timeout"
+                        )
+                        continue
+                    else:
+                        self.api_logger.log_error(
+                            "Request timeout after retries",
+                            error_code="TIMEOUT"
+                        )
+
+                except requests.exceptions.HTTPError as e:
+                    last_error = e
+                    status_code = e.response.status_code
+                    if self.rate_limiter and status_code in THROTTLE_STATUS_CODES:
+                        self.rate_limiter.on_throttle(f'http_{status_code}')
+                    if is_retryable_status(status_code) and attempt < max_retries - 1:
+                        self.api_logger.log_retry(
+                            attempt=attempt + 1,
+                            max_retries=max_retries,
+                            reason=f"HTTP {status_code}"
+                        )
+                        continue
+                    self.api_logger.log_error(
+                        f"HTTP error: {status_code}",
+                        error_code="HTTP_ERROR"
                     )
                     return {
                         'error': True,
-                        'message': '예상치 못한 응답 형식',
-                        'raw_response': text_response[:500]
+                        'message': f'HTTP 에러: {status_code}',
+                        'detail': str(e)
                     }
 
-            except requests.exceptions.Timeout as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    self.api_logger.log_retry(
-                        attempt=attempt + 1,
-                        max_retries=max_retries,
-                        reason="Timeout"
-                    )
-                    continue
-                else:
+                except requests.exceptions.ConnectionError as e:
+                    # 연결 거부/리셋: 일시적 장애로 보고 재시도
+                    last_error = e
+                    if self.rate_limiter:
+                        self.rate_limiter.on_throttle('connection_error')
+                    if attempt < max_retries - 1:
+                        self.api_logger.log_retry(
+                            attempt=attempt + 1,
+                            max_retries=max_retries,
+                            reason="Connection error"
+                        )
+                        continue
+                    else:
+                        self.api_logger.log_error(
+                            "Connection failed after retries",
+                            error_code="CONNECTION_FAILED",
+                            detail=str(e)
+                        )
+
+                except requests.exceptions.RequestException as e:
+                    # 잘못된 요청 등 엔드포인트 장애가 아닌 오류는 재시도하지 않음
+                    last_error = e
+                    endpoint_failed = False
                     self.api_logger.log_error(
-                        "Request timeout after retries",
-                        error_code="TIMEOUT"
+                        "API request failed",
+                        error_code="REQUEST_FAILED",
+                        detail=str(e)
                     )
+                    return {
+                        'error': True,
+                        'message': f'API 요청 실패: {str(e)}'
+                    }
 
-            except requests.exceptions.HTTPError as e:
-                last_error = e
-                self.api_logger.log_error(
-                    f"HTTP error: {e.response.status_code}",
-                    error_code="HTTP_ERROR"
-                )
-                return {
-                    'error': True,
-                    'message': f'HTTP 에러: {e.response.status_code}',
-                    'detail': str(e)
-                }
-
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                self.api_logger.log_error(
-                    "API request failed",
-                    error_code="REQUEST_FAILED",
-                    detail=str(e)
-                )
-                return {
-                    'error': True,
-                    'message': f'API 요청 실패: {str(e)}'
-                }
-
-            except Exception as e:
-                last_error = e
-                self.logger.error(
-                    "response_processing_error",
-                    error=str(e),
-                    exc_info=True
-                )
-                return {
-                    'error': True,
-                    'message': f'응답 처리 실패: {str(e)}',
-                    'raw_response': response.text[:500] if 'response' in locals() else 'N/A'
-                }
-
-        # 최대 재시도 횟수 초과
-        return {
-            'error': True,
-            'message': f'최대 재시도 횟수 초과 ({max_retries}회)',
-            'detail': str(last_error)
-        }
+                except Exception as e:
+                    last_error = e
+                    self.logger.error(
+                        "response_processing_error",
+                        error=str(e),
+                        exc_info=True
+                    )
+                    return {
+                        'error': True,
+                        'message': f'응답 처리 실패: {str(e)}',
+                        'raw_response': response.text[:500] if 'response' in locals() else 'N/A'
+                    }
+
+            # 최대 재시도 횟수 초과
+            return {
+                'error': True,
+                'message': f'최대 재시도 횟수 초과 ({max_retries}회)',
+                'detail': str(last_error)
+            }
+
+        finally:
+            if breaker:
+                if endpoint_failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
 
     def get_trade_data(
         self,
@@ -291,32 +375,35 @@ class BaseAPIClient(ABC):
         )
         return self.parse_response(response)
 
+    @cache_api_response()
     def get_all_pages(
         self,
         lawd_cd: str,
         deal_ymd: str,
         num_of_rows: int = 100,
         max_pages: int = 10,
+        max_workers: int = API_PAGE_CONCURRENCY,
         **extra_params
     ) -> Dict:
         """
         모든 페이지 데이터 조회 (페이지네이션 자동 처리)
 
+        1페이지에서 전체 건수를 확인한 뒤 나머지 페이지는 스레드 풀로 동시에 조회하고,
+        페이지 순서대로 병합합니다 (페이지 간 중복 제거).
+        결과는 Redis에 캐싱됩니다 (cache_api_response, use_cache=False면 캐시 없이 조회).
+
         Args:
             lawd_cd: 지역코드
             deal_ymd: 계약년월
             num_of_rows: 페이지당 결과 수 (최대 100 권장)
             max_pages: 최대 페이지 수 (무한 루프 방지)
+            max_workers: 동시에 조회할 페이지 수
             **extra_params: API별 추가 파라미터
 
         Returns:
             모든 페이지 데이터를 합친 결과
         """
-        all_items = []
-        page_no = 1
-        total_count = 0
-
-        while page_no <= max_pages:
+        def fetch_page(page_no: int) -> Dict:
             self.logger.info(
                 "fetching_page",
                 page=page_no,
@@ -324,8 +411,7 @@ class BaseAPIClient(ABC):
                 lawd_cd=lawd_cd,
                 deal_ymd=deal_ymd
             )
-
-            result = self.get_trade_data_parsed(
+            return self.get_trade_data_parsed(
                 lawd_cd=lawd_cd,
                 deal_ymd=deal_ymd,
                 num_of_rows=num_of_rows,
@@ -333,66 +419,62 @@ class BaseAPIClient(ABC):
                 **extra_params
             )
 
-            # 에러 체크
-            if result.get('error'):
-                self.logger.error(
-                    "page_fetch_failed",
-                    page=page_no,
-                    error=result.get('message')
-                )
-                break
-
-            # 첫 페이지에서 전체 개수 확인
-            if page_no == 1:
-                total_count = result.get('totalCount', 0)
-                self.logger.info(
-                    "total_count_detected",
-                    total_count=total_count
-                )
-
-            # 아이템 추가
-            items = result.get('items', [])
-            if not items:
-                self.logger.info(
-                    "no_more_items",
-                    page=page_no
-                )
-                break
-
-            all_items.extend(items)
-            self.logger.info(
-                "page_collected",
-                page=page_no,
-                items_in_page=len(items),
-                total_collected=len(all_items)
-            )
+        result = fetch_page(1)
 
-            # 전체 데이터를 다 가져왔으면 종료
-            if len(all_items) >= total_count:
-                self.logger.info(
-                    "all_data_collected",
-                    total_items=len(all_items)
-                )
-                break
+        # 첫 페이지 실패는 빈 결과로 감추지 않고 에러를 그대로 반환
+        # (거래 없는 월로 캐싱/기록되지 않도록)
+        if result.get('error'):
+            self.logger.error(
+                "page_fetch_failed",
+                page=1,
+                error=result.get('message')
+            )
+            return {**result, 'totalCount': 0, 'items': []}
 
-            page_no += 1
+        self.logger.info(
+            "total_count_detected",
+            total_count=get_total_count(result)
+        )
 
-        return {
-            'totalCount': len(all_items),
-            'items': all_items,
-            'numOfRows': num_of_rows,
-            'pageNo': page_no,
-            'error': False
-        }
+        page_items = {1: result.get('items', [])}
+        failed_pages: List[int] = []
+        remaining = remaining_page_numbers(result, num_of_rows, max_pages)
+
+        # 나머지 페이지 동시 조회 (호출 속도는 Rate Limiter가 조절)
+        if remaining:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remaining)))) as executor:
+                for page_no, page in zip(remaining, executor.map(fetch_page, remaining)):
+                    if page.get('error'):
+                        self.logger.error(
+                            "page_fetch_failed",
+                            page=page_no,
+                            error=page.get('message')
+                        )
+                        failed_pages.append(page_no)
+                        continue
+                    page_items[page_no] = page.get('items', [])
+
+        merged = merge_page_results(page_items, failed_pages, get_total_count(result), num_of_rows)
+        self.logger.info(
+            "all_data_collected",
+            total_items=merged['totalCount'],
+            pages=len(page_items),
+            failed_pages=failed_pages
+        )
+        return merged
 
 
 class RateLimitedAPIClient(BaseAPIClient):
     """
-    Rate Limiting이 적용된 API 클라이언트
-    (Phase 1에서 사용 예정)
+    고정 속도 Rate Limiting이 적용된 API 클라이언트
+    (호스트 공유 버킷 대신 클라이언트 전용 버킷 사용, AIMD 상한 = calls_per_second)
     """
 
     def __init__(self, service_key: str = SERVICE_KEY, calls_per_second: int = 10):
         super().__init__(service_key)
         self.calls_per_second = calls_per_second
-        # TODO: Phase 1에서 Redis 기반 Rate Limiter 구현
+        self.rate_limiter = TokenBucketLimiter(
+            rate=calls_per_second,
+            burst=calls_per_second,
+            max_rate=calls_per_second
+        )
@@ -9,7 +9,7 @@ Dual-Mode Support:
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set, Tuple
 import json
 import time
 import os
@@ -31,12 +31,25 @@ try:
     from api_02.async_apt_trade import AsyncAptTradeAPI
     from api_03.async_apt_trade_dev import AsyncAptTradeDevAPI
     from api_04.async_apt_rent import AsyncAptRentAPI
+    from parse_executor import get_parse_executor
+    from collection_scheduler import (
+        CollectionScheduler, ResultSink, MemorySink, CacheSink, JournalSink, CatalogSink,
+        COLLECT_MAX_CONCURRENCY, COLLECT_PER_HOST_CONCURRENCY
+    )
     ASYNC_AVAILABLE = True
 except ImportError:
     ASYNC_AVAILABLE = False
     print("⚠️  비동기 모듈 로드 실패. 동기 모드만 사용 가능합니다.")
 
 from backend.data_loader import remove_duplicates
+from common import is_empty_result, is_complete_result
+from collection_journal import CollectionJournal
+from collection_planner import CollectionPlanner, PlanProgress, format_duration
+from freshness_catalog import FreshnessCatalog, get_freshness_catalog
+from region_codes import load_region_codes
+from retry_policy import CIRCUIT_OPEN_ERROR_CODE
+from backend.cache.redis_client import CacheKey, get_redis_cache, CACHE_XFETCH_BETA
+from backend.cache.async_redis_client import get_async_redis_cache
 
 
 class BatchCollector:
@@ -100,6 +113,8 @@ class BatchCollector:
         """
         Args:
             delay_seconds: API 호출 간 딜레이 시간 (초)
+                - 클라이언트에 Rate Limiter가 있으면 호출 간격은 토큰 버킷이 조절하고
+                  이 값은 재시도 대기에만 사용
         """
         self.delay_seconds = delay_seconds
         self.apis = {}
@@ -150,6 +165,183 @@ class BatchCollector:
         
         return date_range
     
+    @staticmethod
+    def _cache_keys(api_types: List[str], lawd_cds: List[str], date_range: List[str]) -> List[CacheKey]:
+        """수집 대상 전체의 캐시 키 목록 (api_type, lawd_cd, deal_ymd)"""
+        return [
+            (api_type, lawd_cd, deal_ymd)
+            for api_type in api_types
+            for lawd_cd in lawd_cds
+            for deal_ymd in date_range
+        ]
+
+    @staticmethod
+    def _empty_month_result() -> Dict:
+        """거래 없는 월로 기록된 월의 수집 결과 (API 호출 없이 생성)"""
+        return {
+            'error': False,
+            'result_code': '00',
+            'result_msg': 'NO DATA (cached)',
+            'total_count': 0,
+            'items': [],
+            'item_count': 0
+        }
+
+    @classmethod
+    def _merge_empty_months(
+        cls,
+        cached: Dict[CacheKey, Dict],
+        empty_months: Dict[Tuple[str, str], Set[str]],
+        keys: List[CacheKey]
+    ) -> int:
+        """
+        빈 월 맵에 있는 월을 빈 결과로 캐시 히트에 합침
+
+        Returns:
+            API 호출을 건너뛰게 된 월 수
+        """
+        skipped = 0
+        for key in keys:
+            if key not in cached and key[2] in empty_months.get(key[:2], ()):
+                cached[key] = cls._empty_month_result()
+                skipped += 1
+        return skipped
+
+    def _prefetch_cached(
+        self,
+        api_types: List[str],
+        lawd_cd: str,
+        date_range: List[str]
+    ) -> Dict[CacheKey, Dict]:
+        """
+        수집 전체 기간의 캐시 히트를 MGET 한 번으로 미리 조회
+
+        거래 없는 월로 기록된 월도 빈 결과로 포함하여 API 호출을 생략합니다.
+
+        Returns:
+            캐시 키 -> 캐시된 수집 결과 (Redis 비활성화 시 빈 딕셔너리)
+        """
+        cache = get_redis_cache()
+        if not cache:
+            return {}
+
+        keys = self._cache_keys(api_types, [lawd_cd], date_range)
+        cached = cache.get_many(keys)
+        empty_months = cache.get_empty_months((api_type, lawd_cd) for api_type in api_types)
+        skipped = self._merge_empty_months(cached, empty_months, keys)
+        print(f"💾 캐시 조회: {len(cached) - skipped}/{len(keys)}건 히트, 거래 없는 월 {skipped}건 건너뜀 (Redis 왕복 2회)")
+        return cached
+
+    async def _prefetch_cached_async(
+        self,
+        api_types: List[str],
+        lawd_cds: List[str],
+        date_range: List[str]
+    ) -> Dict[CacheKey, Dict]:
+        """
+        _prefetch_cached의 비동기 버전 (redis.asyncio, 여러 지역 동시 조회)
+
+        만료가 가까운 값은 XFetch 확률로 미스 처리해, 여러 수집기의 재수집이 TTL
+        경계에 몰리지 않고 미리 나뉘게 합니다 (재수집 중복은 CacheSink의 락이 막음).
+        """
+        cache = await get_async_redis_cache()
+        if not cache:
+            return {}
+
+        keys = self._cache_keys(api_types, lawd_cds, date_range)
+        cached = await cache.get_many(keys, xfetch_beta=CACHE_XFETCH_BETA)
+        empty_months = await cache.get_empty_months(
+            (api_type, lawd_cd) for api_type in api_types for lawd_cd in lawd_cds
+        )
+        skipped = self._merge_empty_months(cached, empty_months, keys)
+        print(f"💾 캐시 조회: {len(cached) - skipped}/{len(keys)}건 히트, 거래 없는 월 {skipped}건 건너뜀 (Redis 왕복 2회)")
+        return cached
+
+    def _journaled_results(
+        self,
+        journal: Optional[CollectionJournal],
+        api_types: List[str],
+        lawd_cds: List[str],
+        date_range: List[str]
+    ) -> Dict[CacheKey, Dict]:
+        """
+        저널에 완료로 기록된 작업 단위의 결과 (재개 시 API 호출 생략)
+
+        Returns:
+            캐시 키 -> 기록된 수집 결과 (저널이 없으면 빈 딕셔너리)
+        """
+        if journal is None:
+            return {}
+
+        keys = self._cache_keys(api_types, lawd_cds, date_range)
+        completed = journal.completed_results(keys)
+        print(f"📒 수집 저널: {len(completed)}/{len(keys)}건 완료 기록 ({journal.path})")
+        return completed
+
+    @staticmethod
+    def _split_new_results(to_cache: Dict[CacheKey, Dict]) -> Tuple[Dict[CacheKey, Dict], Dict[Tuple[str, str], List[str]]]:
+        """
+        새로 수집한 결과를 캐싱할 결과와 거래 없는 월로 분리
+
+        빈 결과는 캐시 값 대신 (api_type, lawd_cd)별 빈 월 맵에 기록합니다.
+        """
+        results = {}
+        empty: Dict[Tuple[str, str], List[str]] = {}
+        for key, result in to_cache.items():
+            if is_empty_result(result):
+                empty.setdefault(key[:2], []).append(key[2])
+            else:
+                results[key] = result
+        return results, empty
+
+    def _throttle(self, api_instance) -> None:
+        """
+        API 호출 간 대기
+
+        Rate Limiter가 있으면 다음 요청에서 토큰 버킷이 대기하므로 고정 딜레이 생략
+        """
+        if getattr(api_instance, 'rate_limiter', None) is None:
+            time.sleep(self.delay_seconds)
+
+    def _print_rate_limit_stats(self) -> None:
+        """API 호스트별 Rate Limiter 현황과 회로 차단 이력 출력 (같은 버킷은 한 번만)"""
+        limiters = {}
+        for api_instance in self.apis.values():
+            limiter = getattr(api_instance, 'rate_limiter', None)
+            if limiter is not None:
+                limiters[id(limiter)] = limiter
+
+        for limiter in limiters.values():
+            stats = limiter.get_stats()
+            print(
+                f"🚦 호출 속도: {stats['rate']} req/s ({stats['backend']}), "
+                f"대기 {stats['waits']}회/{stats['wait_seconds']}초, 감속 {stats['decreases']}회"
+            )
+
+        for api_instance in self.apis.values():
+            breaker = getattr(api_instance, 'circuit_breaker', None)
+            if breaker is not None and (breaker.stats['opens'] or breaker.stats['rejected']):
+                print(
+                    f"⛔ 회로 차단: {breaker.name} - {breaker.state}, "
+                    f"차단 {breaker.stats['opens']}회, 거부 {breaker.stats['rejected']}건"
+                )
+
+    @staticmethod
+    def _print_parse_stats(scheduler_stats: Dict) -> None:
+        """비동기 수집의 네트워크 수신 / 응답 파싱 시간 분해와 파싱 실행기 현황 출력"""
+        fetch_seconds = scheduler_stats.get('fetch_seconds', 0.0)
+        parse_seconds = scheduler_stats.get('parse_seconds', 0.0)
+        if not fetch_seconds and not parse_seconds:
+            return
+
+        stats = get_parse_executor().get_stats()
+        share = parse_seconds / (fetch_seconds + parse_seconds) * 100
+        print(
+            f"🧩 응답 파싱: 수신 {fetch_seconds}초 / 파싱 {parse_seconds}초 (파싱 {share:.0f}%), "
+            f"{stats['mode']} 워커 {stats['workers']}개, 누적 풀 {stats['offloaded']}건/바로 {stats['inline']}건, "
+            f"풀 대기 {stats['wait_seconds']}초, 최대 동시 {stats['peak_pending']}건"
+        )
+
     def collect_data(
         self,
         lawd_cd: str,
@@ -157,7 +349,9 @@ class BatchCollector:
         end_ym: str,
         api_types: Optional[List[str]] = None,
         max_retries: int = 3,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        journal: Optional[CollectionJournal] = None,
+        catalog: Optional[FreshnessCatalog] = None
     ) -> Dict:
         """
         배치 데이터 수집 실행
@@ -169,6 +363,9 @@ class BatchCollector:
             api_types: 수집할 API 타입 리스트 (None이면 모든 API)
             max_retries: 최대 재시도 횟수
             progress_callback: 진행 상황 콜백 함수 (선택사항)
+            journal: 수집 저널 (선택사항). 완료된 단위는 건너뛰고,
+                새로 수집한 단위는 끝나는 대로 기록
+            catalog: 신선도 카탈로그 (선택사항). 새로 수집한 단위의 내용 해시 기록
         
         Returns:
             수집 결과 요약 딕셔너리
@@ -197,6 +394,12 @@ class BatchCollector:
         print(f"API 타입: {', '.join([self.API_MAP[t]['name'] for t in api_types])}")
         print(f"{'='*60}\n")
         
+        # 캐시 히트를 미리 조회하고, 새로 수집한 결과는 마지막에 한 번에 저장
+        cached = self._prefetch_cached(api_types, lawd_cd, date_range)
+        journaled = self._journaled_results(journal, api_types, [lawd_cd], date_range)
+        cached.update(journaled)
+        to_cache: Dict[CacheKey, Dict] = {}
+        
         # 전체 수집 결과
         all_results = {}
         
@@ -247,51 +450,34 @@ class BatchCollector:
                 
                 print(f"  [{month_idx}/{len(date_range)}] {deal_ymd} 수집 중...", end=' ', flush=True)
                 
+                # 캐시 히트면 API 호출 생략
+                cache_key = (api_type, lawd_cd, deal_ymd)
+                result = cached.get(cache_key)
+                from_cache = result is not None
+                if from_cache:
+                    result.setdefault('item_count', len(result.get('items', [])))
+                
                 # API 호출 (재시도 로직 포함)
-                result = None
-                for attempt in range(max_retries):
+                for attempt in range(0 if from_cache else max_retries):
                     try:
-                        result = api_instance.get_trade_data_parsed(
+                        # 1페이지로 전체 건수 확인 후 나머지 페이지는 동시에 조회
+                        result = api_instance.get_all_pages(
                             lawd_cd=lawd_cd,
                             deal_ymd=deal_ymd,
                             num_of_rows=1000,  # 최대값으로 설정
-                            page_no=1
+                            use_cache=False  # 캐시는 수집 전후에 한 번에 조회/기록
                         )
+                        result['item_count'] = len(result.get('items', []))
                         
-                        # 페이지네이션 처리
-                        if not result.get('error') and result.get('total_count', 0) > result.get('num_of_rows', 0):
-                            # 전체 데이터 수집을 위해 여러 페이지 처리
-                            all_items = result.get('items', [])
-                            total_count = result.get('total_count', 0)
-                            num_of_rows = result.get('num_of_rows', 0)
-                            
-                            page_no = 2
-                            while len(all_items) < total_count:
-                                time.sleep(self.delay_seconds)
-                                page_result = api_instance.get_trade_data_parsed(
-                                    lawd_cd=lawd_cd,
-                                    deal_ymd=deal_ymd,
-                                    num_of_rows=1000,
-                                    page_no=page_no
-                                )
-                                
-                                if page_result.get('error'):
-                                    break
-                                
-                                page_items = page_result.get('items', [])
-                                if not page_items:
-                                    break
-                                
-                                all_items.extend(page_items)
-                                
-                                if len(page_items) < num_of_rows:
-                                    break
-                                
-                                page_no += 1
-                            
-                            # 전체 아이템으로 업데이트
-                            result['items'] = all_items
-                            result['item_count'] = len(all_items)
+                        # 회로 차단 중이면 시험 요청이 허용될 때까지 기다렸다가 다시 시도
+                        if result.get('error_code') == CIRCUIT_OPEN_ERROR_CODE and attempt < max_retries - 1:
+                            time.sleep(result.get('retry_after', self.delay_seconds))
+                            continue
+
+                        # 일부 페이지만 받았으면 작업 단위 전체를 다시 시도
+                        if result.get('partial') and attempt < max_retries - 1:
+                            time.sleep(self.delay_seconds * (attempt + 1))
+                            continue
                         
                         break  # 성공하면 재시도 루프 종료
                         
@@ -305,6 +491,10 @@ class BatchCollector:
                                 'message': f'API 호출 실패: {str(e)}'
                             }
                 
+                # NODATA 응답은 실패가 아닌 거래 없는 월
+                if result.get('error') and is_empty_result(result):
+                    result = self._empty_month_result()
+                
                 # 결과 저장
                 test_result = {
                     'test_name': f'{api_info["name"]} - {lawd_cd} {deal_ymd}',
@@ -320,6 +510,15 @@ class BatchCollector:
                 
                 api_results.append(test_result)
                 
+                # 모든 페이지를 받은 결과만 캐싱/기록 (일부만 받은 월은 다음 실행에서 다시 수집)
+                if not from_cache and is_complete_result(result):
+                    to_cache[cache_key] = result
+                    # 단위 완료 즉시 저널에 기록 (중단돼도 재개 시 다시 호출하지 않음)
+                    if journal is not None:
+                        journal.record(cache_key, result)
+                    if catalog is not None:
+                        catalog.record(cache_key, result)
+                
                 # 작업 완료 카운트 증가
                 completed_tasks += 1
                 
@@ -360,9 +559,9 @@ class BatchCollector:
                             status_message=f"{api_info['name']} - {deal_ymd} 완료: {item_count}건"
                         )
                 
-                # API 호출 간 딜레이
-                if month_idx < len(date_range):
-                    time.sleep(self.delay_seconds)
+                # API 호출 간 딜레이 (캐시 히트는 호출이 없으므로 생략)
+                if month_idx < len(date_range) and not from_cache:
+                    self._throttle(api_instance)
             
             # API별 결과 저장
             all_results[api_type] = {
@@ -391,6 +590,15 @@ class BatchCollector:
             print(f"  - 실패: {failed_count}건")
             print(f"  - 총 데이터: {total_items}건")
         
+        # 새로 수집한 결과를 파이프라인으로 한 번에 캐싱 (빈 결과는 빈 월 맵에 기록)
+        if to_cache:
+            cache = get_redis_cache()
+            if cache:
+                results, empty = self._split_new_results(to_cache)
+                cache.set_many(results)
+                for (api_type, region), months in empty.items():
+                    cache.mark_empty(api_type, region, months)
+        
         # 전체 요약
         print(f"\n{'='*60}")
         print(f"전체 수집 완료")
@@ -401,6 +609,7 @@ class BatchCollector:
         print(f"전체 성공: {total_successful}건")
         print(f"전체 실패: {total_failed}건")
         print(f"전체 데이터: {total_all_items}건")
+        self._print_rate_limit_stats()
         
         return {
             'lawd_cd': lawd_cd,
@@ -421,7 +630,9 @@ class BatchCollector:
         start_ym: str,
         end_ym: str,
         api_types: Optional[List[str]] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        journal: Optional[CollectionJournal] = None,
+        catalog: Optional[FreshnessCatalog] = None
     ) -> Dict:
         """
         비동기 배치 데이터 수집 (5-10x 빠름)
@@ -432,6 +643,8 @@ class BatchCollector:
             end_ym: 종료년월 (YYYYMM 형식)
             api_types: 수집할 API 타입 리스트 (None이면 모든 API)
             progress_callback: 진행 상황 콜백 함수 (선택사항)
+            journal: 수집 저널 (선택사항, collect_regions_async 참고)
+            catalog: 신선도 카탈로그 (선택사항, collect_regions_async 참고)
 
         Returns:
             수집 결과 요약 딕셔너리
@@ -443,7 +656,55 @@ class BatchCollector:
             ...     start_ym='202301',
             ...     end_ym='202312'
             ... )
-            >>> # 12개월 데이터를 병렬로 수집 (40초 → 4초)
+            >>> # 12개월 × 4개 API를 하나의 스케줄러로 병렬 수집 (40초 → 4초)
+        """
+        results = await self.collect_regions_async(
+            lawd_cds=[lawd_cd],
+            start_ym=start_ym,
+            end_ym=end_ym,
+            api_types=api_types,
+            progress_callback=progress_callback,
+            journal=journal,
+            catalog=catalog
+        )
+        return results[lawd_cd]
+
+    async def collect_regions_async(
+        self,
+        lawd_cds: List[str],
+        start_ym: str,
+        end_ym: str,
+        api_types: Optional[List[str]] = None,
+        progress_callback: Optional[Callable] = None,
+        sinks: Optional[List['ResultSink']] = None,
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        journal: Optional[CollectionJournal] = None,
+        catalog: Optional[FreshnessCatalog] = None
+    ) -> Dict[str, Dict]:
+        """
+        여러 지역 비동기 배치 수집
+
+        (API 타입 × 지역 × 월) 작업 전체를 CollectionScheduler 하나로 실행합니다.
+        모든 요청이 하나의 세션을 공유하고 전역/호스트별 동시 실행 수가 제한되며,
+        결과는 완료되는 대로 캐시(와 추가 sinks)에 기록됩니다.
+
+        Args:
+            lawd_cds: 법정동코드 리스트 (5자리)
+            start_ym: 시작년월 (YYYYMM 형식)
+            end_ym: 종료년월 (YYYYMM 형식)
+            api_types: 수집할 API 타입 리스트 (None이면 모든 API)
+            progress_callback: 진행 상황 콜백 함수 (선택사항)
+            sinks: 결과를 추가로 흘려보낼 저장소 (예: JsonLinesSink)
+            max_concurrency: 전역 동시 작업 수 (None이면 COLLECT_MAX_CONCURRENCY)
+            per_host_concurrency: API 호스트별 동시 작업 수 (None이면 COLLECT_PER_HOST_CONCURRENCY)
+            journal: 수집 저널 (선택사항). 완료된 단위는 스케줄하지 않고,
+                새로 수집한 단위는 추가 sinks가 기록한 뒤 저널에 기록
+            catalog: 신선도 카탈로그 (선택사항). 새로 수집한 단위의 내용 해시 기록.
+                카탈로그를 주면 추가 sinks에는 새로 받았거나 바뀐 단위만 넘김
+
+        Returns:
+            법정동코드 -> collect_data_async와 같은 형식의 수집 결과
         """
         if not ASYNC_AVAILABLE:
             raise RuntimeError(
@@ -451,9 +712,13 @@ class BatchCollector:
                 "aiohttp를 설치하세요: pip install aiohttp aiodns"
             )
 
+        max_concurrency = max_concurrency or COLLECT_MAX_CONCURRENCY
+        per_host_concurrency = per_host_concurrency or COLLECT_PER_HOST_CONCURRENCY
+
         # 법정동코드 검증
-        if not lawd_cd or len(lawd_cd) != 5 or not lawd_cd.isdigit():
-            raise ValueError(f"법정동코드는 5자리 숫자여야 합니다. (입력값: {lawd_cd})")
+        for lawd_cd in lawd_cds:
+            if not lawd_cd or len(lawd_cd) != 5 or not lawd_cd.isdigit():
+                raise ValueError(f"법정동코드는 5자리 숫자여야 합니다. (입력값: {lawd_cd})")
 
         # 기간 범위 생성
         date_range = self.generate_date_range(start_ym, end_ym)
@@ -466,162 +731,317 @@ class BatchCollector:
             if invalid_types:
                 raise ValueError(f"유효하지 않은 API 타입: {invalid_types}")
 
+        total_units = len(api_types) * len(lawd_cds) * len(date_range)
+
         print(f"\n{'='*60}")
         print(f"⚡ 비동기 배치 데이터 수집 시작")
         print(f"{'='*60}")
-        print(f"법정동코드: {lawd_cd}")
+        print(f"법정동코드: {', '.join(lawd_cds) if len(lawd_cds) <= 10 else f'{len(lawd_cds)}개 지역'}")
         print(f"기간: {start_ym} ~ {end_ym} ({len(date_range)}개월)")
         print(f"API 타입: {', '.join([self.ASYNC_API_MAP[t]['name'] for t in api_types])}")
-        print(f"병렬 처리: {len(date_range)}개월 × {len(api_types)}개 API = {len(date_range) * len(api_types)}개 동시 요청")
+        print(f"작업: {len(date_range)}개월 × {len(lawd_cds)}개 지역 × {len(api_types)}개 API = {total_units}개")
+        print(f"동시 실행: 전체 {max_concurrency}개, 호스트별 {per_host_concurrency}개 (공유 세션)")
         print(f"{'='*60}\n")
 
         overall_start_time = time.time()
-        all_results = {}
-
-        # 각 API 타입별로 수집
-        for api_idx, api_type in enumerate(api_types, 1):
-            api_info = self.ASYNC_API_MAP[api_type]
-            api_class = api_info['class']
 
-            print(f"\n[{api_info['name']}] 비동기 수집 시작...")
-            print("-" * 60)
+        # 캐시 히트를 미리 조회해 HTTP 요청은 미스에 대해서만 스케줄
+        cached = await self._prefetch_cached_async(api_types, lawd_cds, date_range)
+        cached.update(self._journaled_results(journal, api_types, lawd_cds, date_range))
+        units = [
+            key for key in self._cache_keys(api_types, lawd_cds, date_range)
+            if key not in cached
+        ]
 
-            api_start_time = time.time()
+        # 저널/카탈로그는 추가 sinks가 기록한 뒤에 기록
+        downstream = list(sinks or [])
+        if catalog is not None:
+            downstream = [CatalogSink(catalog, sinks=downstream)]
+        if journal is not None:
+            downstream = [JournalSink(journal, sinks=downstream)]
 
-            try:
-                # API 인스턴스 생성
-                api_instance = api_class()
+        memory = MemorySink()
+        scheduler = CollectionScheduler(
+            clients={api_type: self.ASYNC_API_MAP[api_type]['class']() for api_type in api_types},
+            sinks=[CacheSink(), memory, *downstream],
+            max_concurrency=max_concurrency,
+            per_host_concurrency=per_host_concurrency
+        )
 
-                # aiohttp 세션 생성
-                async with aiohttp.ClientSession() as session:
-                    # 모든 월의 데이터를 병렬로 요청
-                    tasks = [
-                        api_instance.get_all_pages_async(
-                            session=session,
-                            lawd_cd=lawd_cd,
-                            deal_ymd=deal_ymd,
-                            num_of_rows=1000
-                        )
-                        for deal_ymd in date_range
-                    ]
-
-                    print(f"  {len(tasks)}개 요청 병렬 실행 중...")
-
-                    # asyncio.gather로 병렬 실행
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                api_elapsed = time.time() - api_start_time
-
-                # 결과 처리
-                api_results = []
-                successful_count = 0
-                failed_count = 0
-                total_items = 0
-
-                for idx, (deal_ymd, result) in enumerate(zip(date_range, results)):
-                    if isinstance(result, Exception):
-                        # 예외 발생
-                        failed_count += 1
-                        test_result = {
-                            'test_name': f'{api_info["name"]} - {lawd_cd} {deal_ymd}',
-                            'description': f'{api_info["name"]} 데이터 수집',
-                            'lawd_cd': lawd_cd,
-                            'deal_ymd': deal_ymd,
-                            'start_time': datetime.now().isoformat(),
-                            'end_time': datetime.now().isoformat(),
-                            'duration_seconds': 0,
-                            'success': False,
-                            'result': {
-                                'error': True,
-                                'message': f'API 호출 실패: {str(result)}'
-                            }
-                        }
-                        print(f"  [{idx+1}/{len(date_range)}] {deal_ymd} ❌ 실패: {str(result)}")
-
-                    elif result.get('error'):
-                        # API 에러 응답
-                        failed_count += 1
-                        test_result = {
-                            'test_name': f'{api_info["name"]} - {lawd_cd} {deal_ymd}',
-                            'description': f'{api_info["name"]} 데이터 수집',
-                            'lawd_cd': lawd_cd,
-                            'deal_ymd': deal_ymd,
-                            'start_time': datetime.now().isoformat(),
-                            'end_time': datetime.now().isoformat(),
-                            'duration_seconds': 0,
-                            'success': False,
-                            'result': result
-                        }
-                        error_msg = result.get('message', 'Unknown error')
-                        print(f"  [{idx+1}/{len(date_range)}] {deal_ymd} ❌ 실패: {error_msg}")
-
-                    else:
-                        # 성공
-                        successful_count += 1
-                        item_count = len(result.get('items', []))
-                        total_items += item_count
-
-                        test_result = {
-                            'test_name': f'{api_info["name"]} - {lawd_cd} {deal_ymd}',
-                            'description': f'{api_info["name"]} 데이터 수집',
-                            'lawd_cd': lawd_cd,
-                            'deal_ymd': deal_ymd,
-                            'start_time': datetime.now().isoformat(),
-                            'end_time': datetime.now().isoformat(),
-                            'duration_seconds': 0,
-                            'success': True,
-                            'result': result
-                        }
-                        print(f"  [{idx+1}/{len(date_range)}] {deal_ymd} ✅ 성공: {item_count}건")
-
-                    api_results.append(test_result)
-
-                # API별 결과 저장
-                all_results[api_type] = {
-                    'api_name': api_info['name'],
-                    'results': api_results,
-                    'successful_count': successful_count,
-                    'failed_count': failed_count,
-                    'total_items': total_items
-                }
+        cached_units = total_units - len(units)
 
-                print(f"\n[{api_info['name']}] 수집 완료:")
-                print(f"  - 성공: {successful_count}건")
-                print(f"  - 실패: {failed_count}건")
-                print(f"  - 총 데이터: {total_items}건")
-                print(f"  - 소요 시간: {api_elapsed:.2f}초")
-                print(f"  - 평균 처리 시간: {api_elapsed / len(date_range):.2f}초/월")
-
-            except Exception as e:
-                print(f"\n❌ [{api_info['name']}] 수집 실패: {str(e)}")
-                import traceback
-                traceback.print_exc()
-
-                # 실패한 API 결과 저장
-                all_results[api_type] = {
-                    'api_name': api_info['name'],
-                    'results': [],
-                    'successful_count': 0,
-                    'failed_count': len(date_range),
-                    'total_items': 0,
-                    'error': str(e)
-                }
+        def on_progress(completed: int, total: int, unit: CacheKey, result: Dict):
+            if not progress_callback:
+                return
+            api_type, lawd_cd, deal_ymd = unit
+            status = '실패' if result.get('error') and not is_empty_result(result) else f"{len(result.get('items', []))}건"
+            progress_callback(
+                current_api=api_type,
+                api_index=api_types.index(api_type) + 1,
+                total_apis=len(api_types),
+                current_month=deal_ymd,
+                month_index=date_range.index(deal_ymd) + 1,
+                total_months=len(date_range),
+                overall_progress=(cached_units + completed) / total_units if total_units > 0 else 0.0,
+                status_message=f"{self.ASYNC_API_MAP[api_type]['name']} - {lawd_cd} {deal_ymd}: {status}"
+            )
 
+        print(f"  {len(units)}개 작업 실행 중... (캐시 히트 {cached_units}개)")
+        scheduler_stats = await scheduler.run(units, progress_callback=on_progress)
         overall_elapsed = time.time() - overall_start_time
 
+        # NODATA 응답은 실패가 아닌 거래 없는 월
+        fetched = {
+            key: self._empty_month_result() if result.get('error') and is_empty_result(result) else result
+            for key, result in memory.results.items()
+        }
+
+        verbose = len(lawd_cds) == 1
+        region_results = {
+            lawd_cd: self._summarize_region_async(
+                lawd_cd, start_ym, end_ym, date_range, api_types, fetched, cached, overall_elapsed, verbose
+            )
+            for lawd_cd in lawd_cds
+        }
+
         # 전체 요약
         print(f"\n{'='*60}")
         print(f"⚡ 전체 비동기 수집 완료")
         print(f"{'='*60}")
-        total_successful = sum(r['successful_count'] for r in all_results.values())
-        total_failed = sum(r['failed_count'] for r in all_results.values())
-        total_all_items = sum(r['total_items'] for r in all_results.values())
+        total_successful = sum(r['summary']['total_successful'] for r in region_results.values())
+        total_failed = sum(r['summary']['total_failed'] for r in region_results.values())
+        total_all_items = sum(r['summary']['total_items'] for r in region_results.values())
         print(f"전체 성공: {total_successful}건")
         print(f"전체 실패: {total_failed}건")
         print(f"전체 데이터: {total_all_items}건")
-        print(f"총 소요 시간: {overall_elapsed:.2f}초")
-        print(f"추정 동기 방식 시간: ~{len(date_range) * len(api_types) * 3:.0f}초")
-        print(f"⚡ 성능 향상: ~{(len(date_range) * len(api_types) * 3 / overall_elapsed):.1f}x 빠름")
+        print(f"총 소요 시간: {overall_elapsed:.2f}초 ({scheduler_stats['units_per_second']}작업/초)")
+        if overall_elapsed > 0:
+            print(f"추정 동기 방식 시간: ~{total_units * 3:.0f}초")
+            print(f"⚡ 성능 향상: ~{(total_units * 3 / overall_elapsed):.1f}x 빠름")
+        self._print_rate_limit_stats()
+        self._print_parse_stats(scheduler_stats)
+
+        return region_results
+
+    async def collect_nationwide_async(
+        self,
+        start_ym: str,
+        end_ym: str,
+        api_types: Optional[List[str]] = None,
+        sido: Optional[List[str]] = None,
+        resume: bool = False,
+        respect_quota: bool = False,
+        sinks: Optional[List['ResultSink']] = None,
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        journal_dir: Optional[Path] = None,
+        report_every: float = 10.0,
+        dry_run: bool = False,
+        incremental: bool = False,
+        recheck_months: Optional[int] = None
+    ) -> Dict:
+        """
+        전국(또는 시도 단위) 비동기 수집
+
+        지역 코드 표의 모든 시군구 × API × 기간을 CollectionPlanner로 우선순위를 매겨
+        CollectionScheduler 하나로 실행합니다. 결과는 지역별로 메모리에 모으지 않고
+        캐시와 수집 저널(과 추가 sinks)로만 흘려보냅니다.
+
+        모든 실행은 신선도 카탈로그에 내용 해시를 기록하고, 추가 sinks에는 새로 받았거나
+        내용이 바뀐 작업만 넘깁니다. DatabaseSink처럼 카탈로그가 따로 추적하는 저장소는
+        그 저장소에 없는 작업도 받습니다. incremental이면 카탈로그에 이미 있고 재확인 기간이
+        지난 월은 요청하지 않되, 추적 저장소에 없는 월은 다시 받습니다.
+
+        Args:
+            start_ym: 시작년월 (YYYYMM 형식)
+            end_ym: 종료년월 (YYYYMM 형식)
+            api_types: 수집할 API 타입 리스트 (None이면 모든 API)
+            sido: 시도 코드(앞 2자리) 리스트 (None이면 전국)
+            resume: 저널의 현재 실행에서 완료된 작업 건너뜀 (False면 새 실행 시작)
+            respect_quota: 오늘 남은 API별 호출 한도를 넘는 작업은 다음 실행으로 미룸
+            sinks: 결과를 추가로 흘려보낼 저장소 (예: JsonLinesSink, DatabaseSink)
+            max_concurrency: 전역 동시 작업 수 (None이면 COLLECT_MAX_CONCURRENCY)
+            per_host_concurrency: API 호스트별 동시 작업 수 (None이면 COLLECT_PER_HOST_CONCURRENCY)
+            journal_dir: 수집 저널 디렉토리 (None이면 COLLECT_JOURNAL_DIR)
+            report_every: 진행 상황 출력 간격 (초)
+            dry_run: 계획만 만들고 실행하지 않음
+            incremental: 카탈로그에 없는 작업과 최근 recheck_months개월만 수집
+            recheck_months: 증분 수집에서 다시 받을 최근 개월 수 (None이면 COLLECT_RECHECK_MONTHS)
+
+        Returns:
+            {'plan': 계획 요약, 'scheduler': 스케줄러 통계, 'progress': 마지막 진행 상황,
+             'catalog': 카탈로그 기록 결과별 작업 수}
+        """
+        if not ASYNC_AVAILABLE:
+            raise RuntimeError(
+                "비동기 모듈이 로드되지 않았습니다. "
+                "aiohttp를 설치하세요: pip install aiohttp aiodns"
+            )
+
+        date_range = self.generate_date_range(start_ym, end_ym)
+
+        if api_types is None:
+            api_types = list(self.ASYNC_API_MAP.keys())
+        else:
+            invalid_types = [t for t in api_types if t not in self.ASYNC_API_MAP]
+            if invalid_types:
+                raise ValueError(f"유효하지 않은 API 타입: {invalid_types}")
+
+        regions = load_region_codes(sido=sido)
+        if not regions:
+            raise ValueError(f"수집할 지역이 없습니다. (시도: {sido})")
+
+        # 수집 범위(전국 또는 시도 조합)와 기간별 저널
+        scope = f"sido-{'-'.join(sorted(sido))}" if sido else 'nationwide'
+        journal = CollectionJournal.for_run(scope, start_ym, end_ym, journal_dir=journal_dir)
+        if not resume and not dry_run:
+            journal.start_run()
+
+        catalog = get_freshness_catalog()
+        planner = CollectionPlanner(journal, catalog=catalog)
+        plan = planner.plan(
+            api_types,
+            list(regions),
+            date_range,
+            skip_completed=resume,
+            respect_quota=respect_quota,
+            incremental=incremental,
+            recheck_months=recheck_months,
+            tracked_sinks=[sink.catalog_name for sink in sinks or [] if sink.catalog_name]
+        )
+        plan_summary = {key: value for key, value in plan.items() if key not in ('units', 'requests')}
+
+        print(f"\n{'='*60}")
+        print(f"🗺️  전국 수집 계획")
+        print(f"{'='*60}")
+        print(f"지역: {len(regions)}개 시군구{f' (시도 {sido})' if sido else ''}")
+        print(f"기간: {start_ym} ~ {end_ym} ({len(date_range)}개월)")
+        print(f"API 타입: {', '.join([self.ASYNC_API_MAP[t]['name'] for t in api_types])}")
+        print(f"작업: {plan['total_units']}개, 예상 요청 {plan['total_requests']}회 (재개로 건너뜀 {plan['skipped']}개)")
+        if incremental:
+            print(f"증분 수집: 카탈로그에 있는 이전 월 {plan['fresh']}개 건너뜀")
+        for api_type, api in plan['by_api'].items():
+            deferred = f", 한도 초과로 미룸 {api['deferred']}개" if api['deferred'] else ''
+            over = ' ⚠️ 한도 초과' if api['used_today'] + api['requests'] > api['quota'] else ''
+            print(
+                f"  [{api_type}] {api['units']}개 작업, 예상 요청 {api['requests']}회 "
+                f"(오늘 사용 {api['used_today']}/{api['quota']}){deferred}{over}"
+            )
+        print(f"예상 소요 시간: {format_duration(plan['estimated_seconds'])}")
+        print(f"수집 저널: {journal.path}")
+        print(f"신선도 카탈로그: {catalog.path}")
+        print(f"{'='*60}\n")
+
+        if dry_run or not plan['units']:
+            return {'plan': plan_summary, 'scheduler': None, 'progress': None, 'catalog': None}
+
+        # 저널과 카탈로그는 추가 sinks가 기록(flush)한 뒤에 기록하므로, 중단돼도
+        # 저장소에 쓰지 못한 작업은 다음 실행에서 다시 수집
+        catalog_sink = CatalogSink(catalog, sinks=sinks)
+        scheduler = CollectionScheduler(
+            clients={api_type: self.ASYNC_API_MAP[api_type]['class']() for api_type in api_types},
+            sinks=[CacheSink(), JournalSink(journal, sinks=[catalog_sink])],
+            max_concurrency=max_concurrency or COLLECT_MAX_CONCURRENCY,
+            per_host_concurrency=per_host_concurrency or COLLECT_PER_HOST_CONCURRENCY
+        )
+        progress = PlanProgress(plan, report_every=report_every)
+
+        scheduler_stats = await scheduler.run(plan['units'], progress_callback=progress)
+        snapshot = progress.snapshot()
+
+        print(f"\n{'='*60}")
+        print(f"🗺️  전국 수집 완료")
+        print(f"{'='*60}")
+        print(f"작업: {scheduler_stats['completed']}/{scheduler_stats['units']}개, 실패 {scheduler_stats['failed']}개")
+        print(f"전체 데이터: {scheduler_stats['items']}건")
+        print(
+            f"소요 시간: {format_duration(scheduler_stats['elapsed_seconds'])} "
+            f"(예상 {format_duration(plan['estimated_seconds'])}, "
+            f"{snapshot['units_per_second']}작업/초, {snapshot['requests_per_second']}요청/초)"
+        )
+        for api_type, usage in snapshot['quota'].items():
+            print(f"  [{api_type}] 호출 한도 사용: {usage['used']}/{usage['limit']} ({usage['percent']}%)")
+        print(
+            f"카탈로그: 새 작업 {catalog_sink.counts.get('new', 0)}개, "
+            f"변경 {catalog_sink.counts.get('changed', 0)}개, "
+            f"변경 없음 {catalog_sink.counts.get('unchanged', 0)}개"
+        )
+        if scheduler_stats['failed']:
+            print(f"실패한 작업은 resume으로 다시 실행하면 해당 작업만 수집합니다.")
+        self._print_rate_limit_stats()
+        self._print_parse_stats(scheduler_stats)
+
+        return {
+            'plan': plan_summary,
+            'scheduler': scheduler_stats,
+            'progress': snapshot,
+            'catalog': dict(catalog_sink.counts),
+        }
+
+    def _summarize_region_async(
+        self,
+        lawd_cd: str,
+        start_ym: str,
+        end_ym: str,
+        date_range: List[str],
+        api_types: List[str],
+        fetched: Dict[CacheKey, Dict],
+        cached: Dict[CacheKey, Dict],
+        elapsed: float,
+        verbose: bool
+    ) -> Dict:
+        """한 지역의 수집 결과를 collect_data_async 반환 형식으로 정리"""
+        all_results = {}
+
+        for api_type in api_types:
+            api_info = self.ASYNC_API_MAP[api_type]
+            api_results = []
+            successful_count = 0
+            failed_count = 0
+            total_items = 0
+
+            if verbose:
+                print(f"\n[{api_info['name']}]")
+                print("-" * 60)
+
+            for idx, deal_ymd in enumerate(date_range):
+                key = (api_type, lawd_cd, deal_ymd)
+                result = fetched[key] if key in fetched else cached[key]
+                success = not result.get('error')
+
+                if success:
+                    successful_count += 1
+                    item_count = len(result.get('items', []))
+                    total_items += item_count
+                    message = f"✅ 성공: {item_count}건"
+                else:
+                    failed_count += 1
+                    message = f"❌ 실패: {result.get('message') or result.get('result_msg', 'Unknown error')}"
+
+                api_results.append({
+                    'test_name': f'{api_info["name"]} - {lawd_cd} {deal_ymd}',
+                    'description': f'{api_info["name"]} 데이터 수집',
+                    'lawd_cd': lawd_cd,
+                    'deal_ymd': deal_ymd,
+                    'start_time': datetime.now().isoformat(),
+                    'end_time': datetime.now().isoformat(),
+                    'duration_seconds': 0,
+                    'success': success,
+                    'result': result
+                })
+
+                if verbose:
+                    print(f"  [{idx+1}/{len(date_range)}] {deal_ymd} {message}")
+
+            all_results[api_type] = {
+                'api_name': api_info['name'],
+                'results': api_results,
+                'successful_count': successful_count,
+                'failed_count': failed_count,
+                'total_items': total_items
+            }
+
+            print(f"[{api_info['name']}] {lawd_cd} 수집 완료: 성공 {successful_count}건, 실패 {failed_count}건, 데이터 {total_items}건")
 
         return {
             'lawd_cd': lawd_cd,
@@ -630,10 +1050,10 @@ class BatchCollector:
             'date_range': date_range,
             'api_results': all_results,
             'summary': {
-                'total_successful': total_successful,
-                'total_failed': total_failed,
-                'total_items': total_all_items,
-                'total_duration': overall_elapsed,
+                'total_successful': sum(r['successful_count'] for r in all_results.values()),
+                'total_failed': sum(r['failed_count'] for r in all_results.values()),
+                'total_items': sum(r['total_items'] for r in all_results.values()),
+                'total_duration': elapsed,
                 'async_mode': True
             }
         }
@@ -3,7 +3,9 @@
 
 Usage:
     python benchmark_async_cache.py
+    python benchmark_async_cache.py --cache-only   # 캐시 동시성 벤치마크만 (API 호출 없음)
 """
+import sys
 import asyncio
 import time
 from datetime import datetime
@@ -20,6 +22,7 @@ from batch_collector import BatchCollector
 
 # Redis Cache
 from backend.cache.redis_client import get_redis_cache
+from backend.cache.async_redis_client import get_async_redis_cache
 
 
 def benchmark_sync(lawd_cd: str, date_range: List[str]) -> Dict:
@@ -149,9 +152,10 @@ async def benchmark_async_with_cache(lawd_cd: str, date_range: List[str]) -> Dic
     Returns:
         벤치마크 결과
     """
-    cache = get_redis_cache()
+    # 비동기 API는 redis.asyncio 캐시를 사용하므로 해당 통계를 확인
+    cache = await get_async_redis_cache()
 
-    if not cache or not cache.is_connected():
+    if not cache:
         print("\n⚠️  Redis가 연결되지 않았습니다. 캐시 없이 비동기 방식으로 실행합니다.")
         return await benchmark_async(lawd_cd, date_range)
 
@@ -211,6 +215,103 @@ async def benchmark_async_with_cache(lawd_cd: str, date_range: List[str]) -> Dic
     }
 
 
+async def _measure_loop_stall(stop: asyncio.Event, interval: float = 0.001) -> float:
+    """
+    이벤트 루프 지연 측정 (주기적으로 깨어나는 태스크의 최대 지연)
+
+    Args:
+        stop: 측정 종료 이벤트
+        interval: 깨어나는 주기 (초)
+
+    Returns:
+        최대 지연 (초)
+    """
+    max_stall = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        max_stall = max(max_stall, time.perf_counter() - expected)
+    return max_stall
+
+
+async def benchmark_cache_concurrency(num_requests: int = 500) -> Dict:
+    """
+    캐시 조회 동시성 벤치마크 (API 호출 없음)
+
+    같은 키들을 코루틴 num_requests개로 동시에 조회하면서
+    - 동기 RedisCache.get (이벤트 루프 블로킹)
+    - AsyncRedisCache.get (공유 커넥션 풀)
+    의 총 시간과 이벤트 루프 최대 지연을 비교합니다.
+
+    Args:
+        num_requests: 동시 조회 수
+
+    Returns:
+        벤치마크 결과
+    """
+    sync_cache = get_redis_cache()
+    async_cache = await get_async_redis_cache()
+
+    if not sync_cache or not async_cache:
+        print("\n⚠️  Redis가 연결되지 않았습니다. 캐시 동시성 벤치마크를 건너뜁니다.")
+        return {}
+
+    print(f"\n{'='*60}")
+    print(f"🔀 캐시 동시성 벤치마크")
+    print(f"{'='*60}")
+    print(f"동시 조회: {num_requests}개 코루틴")
+    print(f"{'='*60}\n")
+
+    # 조회 대상 키 준비 (절반은 히트, 절반은 미스)
+    keys = [(f"{11000 + i:05d}", '202301') for i in range(num_requests)]
+    for lawd_cd, deal_ymd in keys[::2]:
+        await async_cache.set('benchmark', lawd_cd, deal_ymd, {'items': [], 'total_count': 0})
+
+    async def sync_lookup(lawd_cd: str, deal_ymd: str):
+        return sync_cache.get('benchmark', lawd_cd, deal_ymd)
+
+    async def async_lookup(lawd_cd: str, deal_ymd: str):
+        return await async_cache.get('benchmark', lawd_cd, deal_ymd)
+
+    results = {}
+    for mode, lookup in (('sync', sync_lookup), ('async', async_lookup)):
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_measure_loop_stall(stop))
+        await asyncio.sleep(0)
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(lookup(lawd_cd, deal_ymd) for lawd_cd, deal_ymd in keys))
+        elapsed = time.perf_counter() - start_time
+
+        stop.set()
+        max_stall = await ticker
+        results[mode] = {'total_time': elapsed, 'max_loop_stall': max_stall}
+
+        label = '동기 RedisCache' if mode == 'sync' else '비동기 AsyncRedisCache'
+        print(f"{label}:")
+        print(f"  - 총 시간: {elapsed * 1000:.1f}ms")
+        print(f"  - 처리량: {num_requests / elapsed:.0f} req/s")
+        print(f"  - 이벤트 루프 최대 지연: {max_stall * 1000:.1f}ms")
+
+    # 벤치마크 키 정리
+    for lawd_cd, deal_ymd in keys[::2]:
+        await async_cache.delete('benchmark', lawd_cd, deal_ymd)
+
+    speedup = results['sync']['total_time'] / results['async']['total_time']
+    print(f"\n{'='*60}")
+    print(f"캐시 동시성 벤치마크 완료:")
+    print(f"  - 🚀 비동기 캐시: {speedup:.1f}x")
+    print(f"{'='*60}")
+
+    return {
+        'mode': 'cache_concurrency',
+        'num_requests': num_requests,
+        'sync': results['sync'],
+        'async': results['async'],
+        'speedup': speedup,
+    }
+
+
 def print_comparison(sync_result: Dict, async_result: Dict, cache_result: Dict):
     """
     벤치마크 결과 비교 출력
@@ -246,6 +347,10 @@ def print_comparison(sync_result: Dict, async_result: Dict, cache_result: Dict):
 
 async def main():
     """메인 벤치마크 함수"""
+    if '--cache-only' in sys.argv:
+        await benchmark_cache_concurrency()
+        return
+
     # 테스트 설정
     lawd_cd = '11680'  # 강남구
     date_range = ['202310', '202311', '202312']  # 3개월
@@ -269,6 +374,9 @@ async def main():
     # 4. 결과 비교
     print_comparison(sync_result, async_result, cache_result)
 
+    # 5. 캐시 조회 동시성 (동기 vs 비동기 Redis 클라이언트)
+    await benchmark_cache_concurrency()
+
 
 if __name__ == '__main__':
     asyncio.run(main())
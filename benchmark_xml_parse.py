@@ -0,0 +1,174 @@
+"""
+XML 응답 파싱 마이크로 벤치마크
+tests/fixtures/molit의 API 응답 fixture로 parse_xml_response를 입력 형식(str/bytes)과
+파서 백엔드(xml.etree/lxml)별로 측정합니다. 네트워크, Redis, 설정 파일이 필요 없습니다.
+
+fixture의 item을 반복해 수집기가 요청하는 페이지 크기(numOfRows=1000)로 늘려 측정합니다.
+
+Usage:
+    python benchmark_xml_parse.py
+    python benchmark_xml_parse.py --rows 100 --repeat 50
+"""
+import re
+import sys
+import time
+import argparse
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import common
+from common import parse_xml_response, LXML_AVAILABLE
+
+FIXTURE_DIR = Path(__file__).parent / 'tests' / 'fixtures' / 'molit'
+
+ITEM_PATTERN = re.compile(r'<item>.*?</item>', re.S)
+
+
+def load_page(path: Path, rows: int) -> str:
+    """
+    fixture 페이지를 rows개 아이템으로 확장
+
+    Args:
+        path: fixture 파일
+        rows: 페이지당 아이템 수
+
+    Returns:
+        XML 응답 텍스트
+    """
+    text = path.read_text(encoding='utf-8')
+    items = ITEM_PATTERN.findall(text)
+    if not items:
+        return text
+
+    body = ''.join(items[i % len(items)] for i in range(rows))
+    start = text.index('<items>') + len('<items>')
+    end = text.index('</items>')
+    text = text[:start] + body + text[end:]
+    return re.sub(r'<totalCount>\d+</totalCount>', f'<totalCount>{rows}</totalCount>', text)
+
+
+def parse_baseline(xml_text: str) -> Dict:
+    """
+    비교 기준: 응답 텍스트(str)로 트리 생성 후 item마다 findall/루프로 dict 구성 (GC 켜짐)
+
+    parse_xml_response의 이전 구현과 같은 방식입니다.
+    """
+    root = ET.fromstring(xml_text)
+    result = {'response': {'header': {}, 'body': {}}}
+
+    header = root.find('header')
+    if header is not None:
+        result['response']['header'] = {
+            'resultCode': header.findtext('resultCode', ''),
+            'resultMsg': header.findtext('resultMsg', '')
+        }
+
+    body = root.find('body')
+    if body is not None:
+        result['response']['body'] = {
+            'totalCount': int(body.findtext('totalCount', '0')),
+            'numOfRows': int(body.findtext('numOfRows', '0')),
+            'pageNo': int(body.findtext('pageNo', '0')),
+            'items': {'item': []}
+        }
+        items = body.find('items')
+        if items is not None:
+            item_list = []
+            for item in items.findall('item'):
+                item_dict = {}
+                for child in item:
+                    item_dict[child.tag] = child.text if child.text else ''
+                item_list.append(item_dict)
+            result['response']['body']['items']['item'] = item_list
+
+    return result
+
+
+def measure(fn: Callable[[], Dict], repeat: int) -> float:
+    """fn을 repeat번 실행하는 묶음을 5회 측정해 가장 빠른 1회 평균 시간(초)"""
+    fn()  # 워밍업
+    best = float('inf')
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - started) / repeat)
+    return best
+
+
+def benchmark_page(name: str, text: str, repeat: int) -> List[Dict]:
+    """
+    한 페이지를 입력 형식/백엔드별로 파싱해 측정
+
+    Returns:
+        케이스별 결과 (이름, 페이지당 시간, 처리량)
+    """
+    data = text.encode('utf-8')
+    expected = parse_baseline(text)
+    item_count = len(expected['response']['body']['items']['item'])
+
+    cases = [
+        ('기준 (이전 구현)', None, text),
+        ('str, xml.etree', 'stdlib', text),
+        ('bytes, xml.etree', 'stdlib', data),
+    ]
+    if LXML_AVAILABLE:
+        cases.append(('bytes, lxml', 'lxml', data))
+
+    results = []
+    for label, backend, payload in cases:
+        parse = parse_baseline if backend is None else parse_xml_response
+        common.XML_PARSER_BACKEND = backend or 'stdlib'
+        try:
+            if parse(payload) != expected:
+                raise AssertionError(f"{name} [{label}] 결과가 이전 구현과 다릅니다.")
+            seconds = measure(lambda: parse(payload), repeat)
+        finally:
+            common.XML_PARSER_BACKEND = 'stdlib'
+
+        results.append({
+            'label': label,
+            'ms': seconds * 1000,
+            'mb_per_s': len(data) / seconds / 1e6,
+            'items_per_s': item_count / seconds,
+        })
+
+    return results
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='MOLIT XML 응답 파싱 벤치마크')
+    parser.add_argument('--rows', type=int, default=1000, help='페이지당 아이템 수 (기본값: 1000)')
+    parser.add_argument('--repeat', type=int, default=20, help='측정 묶음당 반복 횟수 (기본값: 20)')
+    parser.add_argument('--fixtures', type=str, default=str(FIXTURE_DIR), help='fixture 디렉토리')
+    args = parser.parse_args()
+
+    pages = sorted(Path(args.fixtures).glob('api_*_page.xml'))
+    if not pages:
+        print(f"❌ fixture가 없습니다: {args.fixtures}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"\n{'='*72}")
+    print(f"📄 XML 파싱 벤치마크 (페이지당 {args.rows}건, lxml {'사용 가능' if LXML_AVAILABLE else '미설치'})")
+    print(f"{'='*72}")
+
+    for path in pages:
+        text = load_page(path, args.rows)
+        results = benchmark_page(path.stem, text, args.repeat)
+        baseline = results[0]['ms']
+
+        print(f"\n{path.stem} ({len(text.encode('utf-8')) / 1024:.0f}KB)")
+        for result in results:
+            print(
+                f"  {result['label']:<18} {result['ms']:8.2f}ms/페이지  "
+                f"{result['mb_per_s']:6.1f}MB/s  {result['items_per_s']:>9,.0f}건/s  "
+                f"x{baseline / result['ms']:.2f}"
+            )
+
+    print(f"\n{'='*72}\n")
+
+
+if __name__ == "__main__":
+    main()
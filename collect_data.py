@@ -11,6 +11,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from batch_collector import BatchCollector
+from collection_journal import CollectionJournal
+from freshness_catalog import get_freshness_catalog
 
 
 def main():
@@ -28,6 +30,9 @@ def main():
   
   # 사용자 지정 출력 디렉토리
   python collect_data.py 11680 202301 202312 --output-dir ./custom_output
+  
+  # 중단된 수집 이어서 실행 (저널에 완료로 기록된 월은 API 호출 없이 건너뜀)
+  python collect_data.py 11680 201501 202312 --resume
 
 법정동코드 예시:
   - 서울특별시 종로구: 11110
@@ -83,6 +88,18 @@ def main():
         help='API 호출 실패 시 최대 재시도 횟수 (기본값: 3)'
     )
     
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='같은 법정동코드/기간의 이전 수집을 이어서 실행 (저널에 완료로 기록된 월은 건너뜀)'
+    )
+    
+    parser.add_argument(
+        '--journal-dir',
+        type=str,
+        help='수집 저널 디렉토리 (선택하지 않으면 COLLECT_JOURNAL_DIR 또는 output/journal)'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -94,13 +111,25 @@ def main():
         if args.output_dir:
             output_dir = Path(args.output_dir)
         
+        # 수집 저널: 단위가 끝날 때마다 결과를 기록 (--resume이 아니면 새로 시작)
+        journal = CollectionJournal.for_run(
+            args.lawd_cd,
+            args.start_ym,
+            args.end_ym,
+            journal_dir=Path(args.journal_dir) if args.journal_dir else None
+        )
+        if not args.resume:
+            journal.start_run()
+        
         # 데이터 수집 실행
         result = collector.collect_data(
             lawd_cd=args.lawd_cd,
             start_ym=args.start_ym,
             end_ym=args.end_ym,
             api_types=args.api,
-            max_retries=args.max_retries
+            max_retries=args.max_retries,
+            journal=journal,
+            catalog=get_freshness_catalog()
         )
         
         # 결과 저장
@@ -138,11 +167,18 @@ def main():
         print(f"  - 전체 실패: {result['summary']['total_failed']}건")
         print(f"  - 전체 데이터: {result['summary']['total_items']}건")
         
+        journal_stats = journal.stats()
+        print(f"\n수집 저널: {journal_stats['path']}")
+        print(f"  - 완료 기록: {journal_stats['units']}건 ({journal_stats['pages']}페이지, {journal_stats['items']}건)")
+        if result['summary']['total_failed']:
+            print(f"  - 실패한 월은 --resume으로 다시 실행하면 해당 월만 수집합니다.")
+        
     except ValueError as e:
         print(f"❌ 오류: {e}", file=sys.stderr)
         sys.exit(1)
     except KeyboardInterrupt:
         print(f"\n\n⚠️ 사용자에 의해 중단되었습니다.", file=sys.stderr)
+        print(f"   완료된 월은 저장되었습니다. --resume 옵션으로 이어서 수집할 수 있습니다.", file=sys.stderr)
         sys.exit(130)
     except Exception as e:
         print(f"❌ 예상치 못한 오류 발생: {e}", file=sys.stderr)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+전국 데이터 수집 CLI 스크립트
+지역 코드 표의 모든 시군구에 대해 기간 범위의 데이터를 우선순위 순으로 수집합니다.
+"""
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_collector import BatchCollector, ASYNC_AVAILABLE
+from freshness_catalog import get_freshness_catalog
+from backend.data_loader import USE_DATABASE
+
+
+def import_existing():
+    """기존 출력 파일과 DB에 있는 (API, 지역, 월)을 신선도 카탈로그에 등록"""
+    catalog = get_freshness_catalog()
+
+    imported = catalog.import_output_files()
+    print(f"📚 출력 파일에서 {imported}개 작업을 카탈로그에 등록했습니다.")
+
+    if USE_DATABASE:
+        from backend.db.session import get_session
+
+        with get_session() as session:
+            imported = catalog.import_database(session)
+        print(f"📚 데이터베이스에서 {imported}개 작업을 카탈로그에 등록했습니다.")
+
+    stats = catalog.stats()
+    print(f"   카탈로그: {stats['units']}개 작업 ({stats['path']})")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description='전국 시군구의 아파트 실거래가 데이터를 우선순위 순으로 수집합니다.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 전국 2023년 전체 데이터 수집 (모든 API)
+  python collect_nationwide.py 202301 202312
+
+  # 서울, 경기만 매매/전월세 수집
+  python collect_nationwide.py 202301 202312 --sido 11 41 --api api_02 api_04
+
+  # 계획(작업 수, 예상 요청 수, 호출 한도, 예상 소요 시간)만 확인
+  python collect_nationwide.py 201501 202312 --dry-run
+
+  # 중단된 수집 이어서 실행, 오늘 남은 호출 한도 안에서만 수집
+  python collect_nationwide.py 201501 202312 --resume --respect-quota
+
+  # 매일 갱신: 카탈로그에 없는 월과 최근 3개월만 수집
+  python collect_nationwide.py 201501 202612 --incremental --recheck-months 3
+
+  # 기존 출력 파일/DB에 있는 월을 카탈로그에 먼저 등록하고 증분 수집
+  python collect_nationwide.py 201501 202612 --incremental --import-existing
+
+  # 새로 받았거나 바뀐 월을 PostgreSQL transactions 테이블에 바로 적재
+  python collect_nationwide.py 201501 202612 --incremental --to-db
+
+우선순위:
+  최근 월, 마지막 수집 후 오래된 작업, 거래량이 많은 지역 순으로 먼저 수집합니다.
+        """
+    )
+
+    parser.add_argument(
+        'start_ym',
+        type=str,
+        help='시작년월 (YYYYMM 형식, 예: 202301)'
+    )
+
+    parser.add_argument(
+        'end_ym',
+        type=str,
+        help='종료년월 (YYYYMM 형식, 예: 202312)'
+    )
+
+    parser.add_argument(
+        '--api',
+        nargs='+',
+        choices=['api_01', 'api_02', 'api_03', 'api_04'],
+        help='수집할 API 타입 선택 (선택하지 않으면 모든 API 수집)'
+    )
+
+    parser.add_argument(
+        '--sido',
+        nargs='+',
+        help='수집할 시도 코드 (앞 2자리, 예: 11 41). 선택하지 않으면 전국'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='이전 수집을 이어서 실행 (저널에 완료로 기록된 작업은 건너뜀)'
+    )
+
+    parser.add_argument(
+        '--respect-quota',
+        action='store_true',
+        help='오늘 남은 API별 호출 한도(API_DAILY_QUOTA)를 넘는 작업은 다음 실행으로 미룸'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='신선도 카탈로그에 없는 월과 최근 재확인 기간만 수집 (지연/해제 신고 반영)'
+    )
+
+    parser.add_argument(
+        '--recheck-months',
+        type=int,
+        help='증분 수집에서 다시 받을 최근 개월 수 (기본값: COLLECT_RECHECK_MONTHS)'
+    )
+
+    parser.add_argument(
+        '--import-existing',
+        action='store_true',
+        help='수집 전에 api_*/output 결과 파일과 DB(USE_DATABASE)에 있는 월을 카탈로그에 등록'
+    )
+
+    parser.add_argument(
+        '--to-db',
+        action='store_true',
+        help='새로 받았거나 바뀐 결과를 PostgreSQL(DATABASE_URL) transactions 테이블에 바로 적재 (COPY + 병합)'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='수집 계획만 출력하고 실행하지 않음'
+    )
+
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        help='전역 동시 작업 수 (기본값: COLLECT_MAX_CONCURRENCY)'
+    )
+
+    parser.add_argument(
+        '--per-host-concurrency',
+        type=int,
+        help='API 호스트별 동시 작업 수 (기본값: COLLECT_PER_HOST_CONCURRENCY)'
+    )
+
+    parser.add_argument(
+        '--report-every',
+        type=float,
+        default=10.0,
+        help='진행 상황 출력 간격(초) (기본값: 10)'
+    )
+
+    parser.add_argument(
+        '--journal-dir',
+        type=str,
+        help='수집 저널 디렉토리 (선택하지 않으면 COLLECT_JOURNAL_DIR 또는 output/journal)'
+    )
+
+    args = parser.parse_args()
+
+    if not ASYNC_AVAILABLE:
+        print(f"❌ 오류: 전국 수집에는 aiohttp가 필요합니다. (pip install aiohttp aiodns)", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        if args.import_existing:
+            import_existing()
+
+        collector = BatchCollector()
+        database_sink = None
+        if args.to_db and not args.dry_run:
+            from collection_scheduler import DatabaseSink
+            database_sink = DatabaseSink()
+
+        result = asyncio.run(collector.collect_nationwide_async(
+            start_ym=args.start_ym,
+            end_ym=args.end_ym,
+            api_types=args.api,
+            sido=args.sido,
+            resume=args.resume,
+            respect_quota=args.respect_quota,
+            max_concurrency=args.max_concurrency,
+            per_host_concurrency=args.per_host_concurrency,
+            journal_dir=Path(args.journal_dir) if args.journal_dir else None,
+            report_every=args.report_every,
+            dry_run=args.dry_run,
+            incremental=args.incremental,
+            recheck_months=args.recheck_months,
+            sinks=[database_sink] if database_sink else None
+        ))
+
+        if database_sink:
+            stats = database_sink.stats
+            print(
+                f"🐘 DB 적재: {stats['units']}개 작업, {stats['staged']}건 중 "
+                f"추가 {stats['inserted']}건, 갱신 {stats['updated']}건"
+            )
+
+        if result['scheduler'] and result['scheduler']['failed']:
+            sys.exit(2)
+
+    except ValueError as e:
+        print(f"❌ 오류: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print(f"\n\n⚠️ 사용자에 의해 중단되었습니다.", file=sys.stderr)
+        print(f"   완료된 작업은 저장되었습니다. --resume 옵션으로 이어서 수집할 수 있습니다.", file=sys.stderr)
+        sys.exit(130)
+    except Exception as e:
+        print(f"❌ 예상치 못한 오류 발생: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
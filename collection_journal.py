@@ -0,0 +1,298 @@
+"""
+수집 저널
+완료된 작업 단위 (api_type, lawd_cd, deal_ymd)와 그 결과를 SQLite 파일에 바로 기록해
+중단된 배치 수집을 이어서 실행(--resume)할 수 있게 합니다.
+
+- 작업 단위가 끝날 때마다 결과(전체 페이지 아이템)를 커밋하므로 프로세스가
+  죽어도 그때까지 수집한 데이터는 남고, 재개 시 같은 단위에 API를 다시 호출하지 않음
+- 실패한 단위와 일부 페이지만 받은 단위는 기록하지 않음 (재개 시 다시 수집)
+- 거래 없는 월도 완료로 기록 (빈 결과)
+- 실행 경계: start_run() 이후 완료된 단위만 재개 시 건너뛰고, 이전 실행의 기록은
+  수집 이력(완료 시각, 아이템 수, 페이지 수)으로 남아 수집 계획 우선순위에 사용
+- WAL 모드: 기록 중에도 다른 프로세스에서 진행 상황 조회 가능
+
+Usage:
+    journal = CollectionJournal.for_run('11680', '202301', '202312')
+    journal.start_run()                       # 새 실행 (재개면 생략)
+    done = journal.completed_results(keys)   # 재개 시 건너뛸 단위
+    journal.record(key, result)               # 단위 완료마다
+"""
+import os
+import json
+import sqlite3
+import asyncio
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from common import is_complete_result
+from backend.cache.redis_client import CacheKey
+
+# 저널 파일 기본 디렉토리
+COLLECT_JOURNAL_DIR = Path(os.getenv(
+    'COLLECT_JOURNAL_DIR',
+    str(Path(__file__).parent / 'output' / 'journal')
+))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS completed_units (
+    api_type TEXT NOT NULL,
+    lawd_cd TEXT NOT NULL,
+    deal_ymd TEXT NOT NULL,
+    pages INTEGER NOT NULL,
+    item_count INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (api_type, lawd_cd, deal_ymd)
+);
+CREATE TABLE IF NOT EXISTS journal_meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# SQLite 변수 개수 제한 아래로 키 조회를 나눔
+_LOOKUP_CHUNK = 300
+
+
+def _now() -> str:
+    """완료 시각 (문자열 비교가 시간 순서와 같도록 마이크로초까지 고정 형식)"""
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+def _page_count(result: Dict) -> int:
+    """결과를 만드는 데 받은 페이지 수 (get_all_pages의 마지막 페이지 번호)"""
+    try:
+        return max(1, int(result.get('pageNo') or 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+class CollectionJournal:
+    """
+    SQLite 수집 저널
+
+    동기 수집 루프와 비동기 스케줄러(JournalSink)가 같은 인스턴스를 쓸 수 있도록
+    하나의 커넥션을 락으로 보호합니다.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 저널 파일 경로 (없으면 생성)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        row = self._conn.execute(
+            "SELECT value FROM journal_meta WHERE name = 'run_started_at'"
+        ).fetchone()
+        self.run_started_at: Optional[str] = row[0] if row else None
+
+    @classmethod
+    def for_run(
+        cls,
+        lawd_cd: str,
+        start_ym: str,
+        end_ym: str,
+        journal_dir: Optional[Path] = None
+    ) -> 'CollectionJournal':
+        """
+        수집 범위별 저널 (같은 법정동코드/기간이면 같은 파일)
+
+        Args:
+            lawd_cd: 법정동코드 (여러 지역이면 대표 이름)
+            start_ym: 시작년월
+            end_ym: 종료년월
+            journal_dir: 저널 디렉토리 (None이면 COLLECT_JOURNAL_DIR)
+
+        Raises:
+            ValueError: 파일 이름에 쓸 수 없는 값
+        """
+        for value in (lawd_cd, start_ym, end_ym):
+            if not value or not value.replace('-', '').isalnum():
+                raise ValueError(f"저널 이름에 사용할 수 없는 값: {value}")
+
+        journal_dir = Path(journal_dir) if journal_dir else COLLECT_JOURNAL_DIR
+        return cls(journal_dir / f"collect_{lawd_cd}_{start_ym}_{end_ym}.sqlite3")
+
+    def record(self, key: CacheKey, result: Dict) -> bool:
+        """
+        작업 단위 완료 기록 (즉시 커밋)
+
+        Args:
+            key: (api_type, lawd_cd, deal_ymd)
+            result: 수집 결과 (에러 결과와 받은 아이템 수가 API 전체 건수보다 적은
+                결과는 기록하지 않음)
+
+        Returns:
+            기록 여부
+        """
+        if not is_complete_result(result):
+            return False
+
+        api_type, lawd_cd, deal_ymd = key
+        row = (
+            api_type,
+            lawd_cd,
+            deal_ymd,
+            _page_count(result),
+            len(result.get('items', [])),
+            json.dumps(result, ensure_ascii=False),
+            _now(),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completed_units VALUES (?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+            self._conn.commit()
+        return True
+
+    async def record_async(self, key: CacheKey, result: Dict) -> bool:
+        """record를 스레드에서 실행 (이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.record, key, result)
+
+    def start_run(self) -> str:
+        """
+        새 실행 시작 (이전 기록은 이력으로 남기고 재개 대상에서 제외)
+
+        Returns:
+            실행 시작 시각
+        """
+        started = _now()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO journal_meta VALUES ('run_started_at', ?)",
+                (started,)
+            )
+            self._conn.commit()
+        self.run_started_at = started
+        return started
+
+    def _select(self, columns: str, keys: Iterable[CacheKey], current_run: bool) -> list:
+        """키 목록의 기록 조회 (SQLite 변수 개수 제한 아래로 나눠서)"""
+        keys = list(keys)
+        since = self.run_started_at if current_run else None
+        rows = []
+
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                placeholders = ', '.join(['(?, ?, ?)'] * len(chunk))
+                params = [value for key in chunk for value in key]
+                query = (
+                    f"SELECT api_type, lawd_cd, deal_ymd, {columns} FROM completed_units "
+                    f"WHERE (api_type, lawd_cd, deal_ymd) IN (VALUES {placeholders})"
+                )
+                if since:
+                    query += " AND completed_at >= ?"
+                    params.append(since)
+                rows.extend(self._conn.execute(query, params).fetchall())
+
+        return rows
+
+    def completed_results(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, Dict]:
+        """
+        현재 실행에서 이미 완료된 작업 단위의 결과
+
+        Args:
+            keys: 조회할 (api_type, lawd_cd, deal_ymd) 목록
+
+        Returns:
+            완료된 키 -> 기록된 수집 결과
+        """
+        completed = {}
+        for api_type, lawd_cd, deal_ymd, result in self._select('result', keys, current_run=True):
+            result = json.loads(result)
+            # 완료 조건을 만족하지 않는 기록은 재개 시 다시 수집
+            if is_complete_result(result):
+                completed[(api_type, lawd_cd, deal_ymd)] = result
+        return completed
+
+    def completed_keys(self, keys: Iterable[CacheKey]) -> set:
+        """completed_results의 키만 (결과를 읽지 않으므로 전국 단위 계획에 사용)"""
+        return {
+            (api_type, lawd_cd, deal_ymd)
+            for api_type, lawd_cd, deal_ymd, _ in self._select('1', keys, current_run=True)
+        }
+
+    def pages_since(self, since: datetime) -> Dict[str, int]:
+        """
+        기준 시각 이후 API 타입별로 받은 페이지 수 (일일 호출 한도 사용량 추정)
+
+        Args:
+            since: 기준 시각 (보통 오늘 0시)
+
+        Returns:
+            API 타입 -> 페이지(요청) 수
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT api_type, SUM(pages) FROM completed_units WHERE completed_at >= ? GROUP BY api_type",
+                (since.isoformat(timespec='microseconds'),)
+            ).fetchall()
+        return {api_type: pages for api_type, pages in rows}
+
+    def history(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, Dict[str, Any]]:
+        """
+        이전 실행을 포함한 작업 단위별 마지막 수집 이력
+
+        Args:
+            keys: 조회할 (api_type, lawd_cd, deal_ymd) 목록
+
+        Returns:
+            키 -> {'completed_at': datetime, 'item_count': int, 'pages': int}
+        """
+        return {
+            (api_type, lawd_cd, deal_ymd): {
+                'completed_at': datetime.fromisoformat(completed_at),
+                'item_count': item_count,
+                'pages': pages,
+            }
+            for api_type, lawd_cd, deal_ymd, completed_at, item_count, pages in self._select(
+                'completed_at, item_count, pages', keys, current_run=False
+            )
+        }
+
+    def stats(self) -> Dict:
+        """
+        현재 실행의 저널 현황
+
+        Returns:
+            완료 단위 수, 페이지 수, 아이템 수, 마지막 완료 시각
+        """
+        with self._lock:
+            units, pages, items, last = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(pages), 0), COALESCE(SUM(item_count), 0), MAX(completed_at) "
+                "FROM completed_units WHERE completed_at >= ?",
+                (self.run_started_at or '',)
+            ).fetchone()
+        return {
+            'path': str(self.path),
+            'units': units,
+            'pages': pages,
+            'items': items,
+            'last_completed_at': last,
+        }
+
+    def reset(self):
+        """기록과 이력 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM completed_units")
+            self._conn.execute("DELETE FROM journal_meta")
+            self._conn.commit()
+        self.run_started_at = None
+
+    def close(self):
+        """커넥션 종료"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,322 @@
+"""
+전국 수집 계획
+지역 코드 표 × API × 기간의 작업 단위 (api_type, lawd_cd, deal_ymd) 전체를 만들고
+우선순위 순으로 정렬해 CollectionScheduler에 넘깁니다. 실행 중에는 진행률, 처리량,
+남은 시간(ETA), API별 일일 호출 한도 사용량을 보고합니다.
+
+우선순위 점수 (0~1, 높을수록 먼저):
+- 최근성: 최근 월일수록 높음 (COLLECT_RECENCY_HALF_LIFE_MONTHS개월마다 절반)
+- 경과 시간: 마지막 수집 후 오래될수록 높음 (COLLECT_STALE_HOURS 이상이거나 이력이 없으면 최대)
+- 거래량: 과거 월평균 아이템이 많은 지역일수록 높음 (페이지가 많은 작업을 먼저 시작해
+  실행 끝에 긴 작업이 몰리지 않도록)
+
+수집 이력(마지막 수집 시각, 아이템/페이지 수)은 수집 저널에서 읽습니다.
+증분 수집(incremental)이면 신선도 카탈로그에 이미 있고 재확인 기간(최근 월)을 지난
+작업은 계획에서 뺍니다. 단, 결과를 받을 저장소(tracked_sinks)에 아직 없는 작업은 남깁니다.
+
+Usage:
+    planner = CollectionPlanner(journal)
+    plan = planner.plan(api_types, list(load_region_codes()), date_range)
+    progress = PlanProgress(plan)
+    await scheduler.run(plan['units'], progress_callback=progress)
+"""
+import os
+import math
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from collection_journal import CollectionJournal
+from common import is_empty_result
+from rate_limiter import API_RATE_INITIAL, API_RATE_LIMIT_ENABLED
+from backend.cache.redis_client import CacheKey
+
+# 계획 설정
+COLLECT_RECENCY_HALF_LIFE_MONTHS = float(os.getenv('COLLECT_RECENCY_HALF_LIFE_MONTHS', '6'))
+COLLECT_STALE_HOURS = float(os.getenv('COLLECT_STALE_HOURS', '168'))        # 이 시간이 지나면 경과 점수 최대
+API_DAILY_QUOTA = int(os.getenv('API_DAILY_QUOTA', '10000'))                 # API별 일일 호출 한도 (공공데이터포털)
+
+# 우선순위 가중치 (최근성, 경과 시간, 거래량)
+DEFAULT_PRIORITY_WEIGHTS = (0.5, 0.3, 0.2)
+
+
+def months_between(deal_ymd: str, today: datetime) -> int:
+    """기준일의 월에서 거래 월까지 지난 개월 수 (미래 월은 0)"""
+    return max(0, (today.year - int(deal_ymd[:4])) * 12 + today.month - int(deal_ymd[4:6]))
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """초를 '1시간 2분', '3분 4초' 형식으로 (None이면 '알 수 없음')"""
+    if seconds is None:
+        return '알 수 없음'
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+
+class CollectionPlanner:
+    """
+    수집 계획 생성기
+
+    작업 단위마다 예상 요청 수(페이지 수)를 추정해 API별 일일 호출 한도와 예상 소요
+    시간을 계산하고, 한도를 넘는 작업은 우선순위가 낮은 것부터 다음 실행으로 미룰 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        journal: Optional[CollectionJournal] = None,
+        num_of_rows: int = 1000,
+        daily_quota: int = API_DAILY_QUOTA,
+        weights: Tuple[float, float, float] = DEFAULT_PRIORITY_WEIGHTS,
+        now: Optional[datetime] = None,
+        catalog=None
+    ):
+        """
+        Args:
+            journal: 수집 저널 (수집 이력, 재개, 오늘 사용한 호출 수)
+            num_of_rows: 페이지당 결과 수 (예상 페이지 수 계산용)
+            daily_quota: API별 일일 호출 한도
+            weights: 우선순위 가중치 (최근성, 경과 시간, 거래량)
+            now: 기준 시각 (None이면 현재)
+            catalog: 신선도 카탈로그 (FreshnessCatalog, 증분 수집)
+        """
+        self.journal = journal
+        self.catalog = catalog
+        self.num_of_rows = num_of_rows
+        self.daily_quota = daily_quota
+        self.weights = weights
+        self.now = now or datetime.now()
+
+    def _score(
+        self,
+        key: CacheKey,
+        last: Optional[Dict[str, Any]],
+        volume: float,
+        max_volume: float
+    ) -> float:
+        recency_weight, stale_weight, volume_weight = self.weights
+
+        recency = 0.5 ** (months_between(key[2], self.now) / COLLECT_RECENCY_HALF_LIFE_MONTHS)
+        if last is None:
+            staleness = 1.0
+        else:
+            age_hours = (self.now - last['completed_at']).total_seconds() / 3600
+            staleness = min(1.0, max(0.0, age_hours / COLLECT_STALE_HOURS))
+        weight = math.log1p(volume) / math.log1p(max_volume) if max_volume > 0 else 0.0
+
+        return recency_weight * recency + stale_weight * staleness + volume_weight * weight
+
+    def plan(
+        self,
+        api_types: List[str],
+        lawd_cds: List[str],
+        date_range: List[str],
+        skip_completed: bool = False,
+        respect_quota: bool = False,
+        incremental: bool = False,
+        recheck_months: Optional[int] = None,
+        tracked_sinks: Sequence[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        수집 계획 생성
+
+        Args:
+            api_types: API 타입 리스트
+            lawd_cds: 법정동코드 리스트
+            date_range: YYYYMM 월 리스트
+            skip_completed: 저널의 현재 실행에서 완료된 작업 제외 (재개)
+            respect_quota: 오늘 남은 API별 호출 한도를 넘는 작업은 제외 (다음 실행으로 미룸)
+            incremental: 카탈로그에 있고 재확인 기간이 지난 작업은 제외
+            recheck_months: 증분 수집에서 다시 받을 최근 개월 수 (None이면 COLLECT_RECHECK_MONTHS)
+            tracked_sinks: 내용을 따로 추적하는 저장소 이름 (증분 수집에서 이 저장소에
+                없는 작업은 제외하지 않음)
+
+        Returns:
+            {
+                'units': 우선순위 순 작업 목록,
+                'requests': 작업 -> 예상 요청 수,
+                'by_api': API 타입 -> {'units', 'requests', 'used_today', 'quota', 'deferred'},
+                'total_units', 'total_requests', 'skipped', 'fresh', 'deferred',
+                'estimated_seconds': 예상 소요 시간 (Rate Limiter 시작 속도 기준, 비활성화면 None)
+            }
+        """
+        keys = [
+            (api_type, lawd_cd, deal_ymd)
+            for api_type in api_types
+            for lawd_cd in lawd_cds
+            for deal_ymd in date_range
+        ]
+
+        fresh = 0
+        if incremental and self.catalog is not None:
+            keys, fresh_keys = self.catalog.split_due(
+                keys, recheck_months, today=self.now, sinks=tracked_sinks
+            )
+            fresh = len(fresh_keys)
+
+        skipped = 0
+        history: Dict[CacheKey, Dict[str, Any]] = {}
+        used_today: Dict[str, int] = {}
+        if self.journal is not None:
+            if skip_completed:
+                completed = self.journal.completed_keys(keys)
+                skipped = len(completed)
+                keys = [key for key in keys if key not in completed]
+            history = self.journal.history(keys)
+            used_today = self.journal.pages_since(self.now.replace(hour=0, minute=0, second=0, microsecond=0))
+
+        # (API, 지역)별 과거 월평균 아이템 수
+        totals: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0])
+        for key, last in history.items():
+            total = totals[key[:2]]
+            total[0] += last['item_count']
+            total[1] += 1
+        volumes = {pair: items / months for pair, (items, months) in totals.items()}
+        max_volume = max(volumes.values(), default=0.0)
+
+        scored = []
+        requests: Dict[CacheKey, int] = {}
+        for index, key in enumerate(keys):
+            last = history.get(key)
+            volume = volumes.get(key[:2], 0.0)
+            if last is not None:
+                requests[key] = last['pages']
+            else:
+                requests[key] = max(1, math.ceil(volume / self.num_of_rows))
+            scored.append((-self._score(key, last, volume, max_volume), index, key))
+        scored.sort()
+
+        by_api = {
+            api_type: {
+                'units': 0,
+                'requests': 0,
+                'used_today': used_today.get(api_type, 0),
+                'quota': self.daily_quota,
+                'deferred': 0,
+            }
+            for api_type in api_types
+        }
+
+        units = []
+        for _, _, key in scored:
+            api = by_api[key[0]]
+            if respect_quota and api['used_today'] + api['requests'] + requests[key] > api['quota']:
+                api['deferred'] += 1
+                del requests[key]
+                continue
+            api['units'] += 1
+            api['requests'] += requests[key]
+            units.append(key)
+
+        total_requests = sum(api['requests'] for api in by_api.values())
+        return {
+            'units': units,
+            'requests': requests,
+            'by_api': by_api,
+            'total_units': len(units),
+            'total_requests': total_requests,
+            'skipped': skipped,
+            'fresh': fresh,
+            'deferred': sum(api['deferred'] for api in by_api.values()),
+            'estimated_seconds': total_requests / API_RATE_INITIAL if API_RATE_LIMIT_ENABLED else None,
+        }
+
+
+class PlanProgress:
+    """
+    계획 실행 진행 보고 (CollectionScheduler의 progress_callback)
+
+    남은 시간은 완료한 작업의 예상 요청 수 대비 경과 시간으로 추정하므로
+    페이지가 많은 작업과 적은 작업이 섞여 있어도 크게 흔들리지 않습니다.
+    """
+
+    def __init__(
+        self,
+        plan: Dict[str, Any],
+        report_every: float = 10.0,
+        printer: Callable[[str], None] = print
+    ):
+        """
+        Args:
+            plan: CollectionPlanner.plan 결과
+            report_every: 진행 상황 출력 간격 (초, 0이면 출력하지 않음)
+            printer: 출력 함수
+        """
+        self.plan = plan
+        self.report_every = report_every
+        self.printer = printer
+
+        self.started = time.monotonic()
+        self._last_report = self.started
+        self.completed = 0
+        self.failed = 0
+        self.items = 0
+        self.planned_done = 0
+        self.requests: Dict[str, int] = defaultdict(int)
+
+    def __call__(self, completed: int, total: int, unit: CacheKey, result: Dict) -> None:
+        self.completed = completed
+        self.planned_done += self.plan['requests'].get(unit, 1)
+        self.requests[unit[0]] += max(1, int(result.get('pageNo') or 1))
+        if result.get('error') and not is_empty_result(result):
+            self.failed += 1
+        else:
+            self.items += len(result.get('items', []))
+
+        now = time.monotonic()
+        if self.report_every and (now - self._last_report >= self.report_every or completed == total):
+            self._last_report = now
+            self.printer(self.format_line())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 진행 상황
+
+        Returns:
+            완료/전체 작업, 처리량(작업/초, 요청/초), 남은 시간(초), API별 호출 한도 사용량
+        """
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        total = self.plan['total_units']
+        remaining_requests = max(0, self.plan['total_requests'] - self.planned_done)
+        request_rate = self.planned_done / elapsed
+
+        quota = {}
+        for api_type, api in self.plan['by_api'].items():
+            used = api['used_today'] + self.requests.get(api_type, 0)
+            quota[api_type] = {
+                'used': used,
+                'limit': api['quota'],
+                'percent': round(used / api['quota'] * 100, 1) if api['quota'] else 0.0,
+            }
+
+        return {
+            'completed': self.completed,
+            'total': total,
+            'percent': round(self.completed / total * 100, 1) if total else 100.0,
+            'failed': self.failed,
+            'items': self.items,
+            'elapsed_seconds': round(elapsed, 1),
+            'units_per_second': round(self.completed / elapsed, 2),
+            'requests_per_second': round(sum(self.requests.values()) / elapsed, 2),
+            'eta_seconds': round(remaining_requests / request_rate, 1) if request_rate > 0 else None,
+            'quota': quota,
+        }
+
+    def format_line(self) -> str:
+        """진행 상황 한 줄 요약"""
+        snap = self.snapshot()
+        quota = ', '.join(
+            f"{api_type} {usage['used']}/{usage['limit']}" for api_type, usage in snap['quota'].items()
+        )
+        return (
+            f"  📈 {snap['completed']}/{snap['total']} ({snap['percent']}%) "
+            f"| {snap['units_per_second']}작업/초, {snap['requests_per_second']}요청/초 "
+            f"| 남은 시간 {format_duration(snap['eta_seconds'])} "
+            f"| 실패 {snap['failed']} | 한도 {quota}"
+        )
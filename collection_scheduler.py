@@ -0,0 +1,764 @@
+"""
+수집 스케줄러
+(api_type × lawd_cd × deal_ymd) 작업 전체를 하나의 aiohttp 세션에서 전역 동시 실행 수와
+호스트별 동시 실행 수 제한 아래 처리하고, 완료되는 대로 결과를 저장소(Sink)로 흘려보냅니다.
+
+구성:
+- CollectionScheduler: API별 작업 레인 + 워커 풀 (워커 수 = 전역 동시 실행 수)
+- ResultSink: 완료된 결과를 받는 저장소 인터페이스
+  - MemorySink: 메모리에 보관 (BatchCollector 반환값 구성용)
+  - CacheSink: Redis 캐시에 배치 단위로 저장 (빈 결과는 빈 월 맵에 기록). 받기 전에
+    재계산 락을 잡아, 다른 수집기가 같은 작업을 받는 중이면 캐시 값(stale 포함)을 사용
+  - JsonLinesSink: 작업 단위별 결과를 JSON Lines 파일에 추가
+  - ForwardingSink: 다른 저장소를 감싸고, 감싼 저장소가 기록(flush)한 뒤에 자기 기록
+    - JournalSink: 완료된 작업 단위를 수집 저널(SQLite)에 기록 (재개용)
+    - CatalogSink: 신선도 카탈로그에 내용 해시를 기록하고, 새로 받았거나 바뀐 결과만
+      다음 저장소로 넘김 (증분 수집). 이름이 있는 저장소(catalog_name)는 그 저장소에
+      기록된 내용과 비교
+  - DatabaseSink: 정규화한 거래를 PostgreSQL transactions 테이블에 COPY + 병합으로 적재
+
+호출 속도는 클라이언트의 Rate Limiter가, 동시 연결 수는 이 스케줄러가 조절합니다.
+
+Usage:
+    scheduler = CollectionScheduler(clients, sinks=[CacheSink(), MemorySink()])
+    stats = await scheduler.run(units)
+"""
+import os
+import json
+import time
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+from async_api_client import AsyncAPIClient
+from collection_journal import CollectionJournal
+from common import API_PAGE_CONCURRENCY, content_hash, is_empty_result, is_complete_result
+from freshness_catalog import (
+    FreshnessCatalog, SINK_DATABASE, STATUS_CHANGED, STATUS_NEW, STATUS_UNCHANGED
+)
+from logger import get_logger
+from retry_policy import CIRCUIT_OPEN_ERROR_CODE
+from backend.cache.redis_client import CacheKey
+from backend.cache.async_redis_client import get_async_redis_cache
+
+logger = get_logger(__name__)
+
+# 스케줄러 설정
+COLLECT_MAX_CONCURRENCY = int(os.getenv('COLLECT_MAX_CONCURRENCY', '16'))        # 전역 동시 작업 수
+COLLECT_PER_HOST_CONCURRENCY = int(os.getenv('COLLECT_PER_HOST_CONCURRENCY', '8'))  # API 호스트별 동시 작업 수
+COLLECT_SINK_BATCH_SIZE = int(os.getenv('COLLECT_SINK_BATCH_SIZE', '100'))       # Sink 배치 쓰기 크기
+COLLECT_CIRCUIT_WAITS = int(os.getenv('COLLECT_CIRCUIT_WAITS', '3'))             # 회로 차단 시 작업당 대기 횟수
+
+# 진행 콜백: (완료 수, 전체 수, 작업 단위, 결과)
+ProgressCallback = Callable[[int, int, CacheKey, Dict], None]
+
+# 저장소가 실제로 기록한 작업 단위를 받는 콜백
+FlushListener = Callable[[List[CacheKey]], Awaitable[None]]
+
+
+class ResultSink(ABC):
+    """
+    수집 결과 저장소 인터페이스 (작업 단위가 완료될 때마다 write 호출)
+
+    모든 저장소는 받은 작업 단위를 실제로 기록한 뒤(버퍼링하면 flush 후, 기록하지 않는
+    결과는 바로) _flushed로 알립니다. ForwardingSink는 이 알림을 받은 뒤에 저널/카탈로그에
+    기록합니다. catalog_name이 있는 저장소는 신선도 카탈로그가 이 저장소에 기록된 내용을
+    따로 추적합니다 (CatalogSink).
+    """
+
+    catalog_name: Optional[str] = None
+
+    def __init__(self):
+        self._flush_listeners: List[FlushListener] = []
+
+    def add_flush_listener(self, listener: FlushListener) -> None:
+        """기록 완료 콜백 등록"""
+        self._flush_listeners.append(listener)
+
+    async def _flushed(self, units: List[CacheKey]) -> None:
+        if units:
+            for listener in self._flush_listeners:
+                await listener(units)
+
+    async def claim(self, unit: CacheKey) -> Optional[Dict]:
+        """
+        작업 단위를 받기 전에 호출
+
+        Returns:
+            API를 호출하지 않고 대신 쓸 결과 (다른 수집기가 받는 중일 때), 없으면 None
+        """
+        return None
+
+    @abstractmethod
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        """
+        작업 단위 결과 기록
+
+        Args:
+            unit: (api_type, lawd_cd, deal_ymd)
+            result: get_all_pages_async 결과 (실패 시 error=True)
+        """
+
+    async def close(self) -> None:
+        """남은 버퍼 기록 (스케줄러 종료 시 호출)"""
+
+
+class MemorySink(ResultSink):
+    """결과를 메모리에 보관 (성공/실패 모두)"""
+
+    def __init__(self):
+        super().__init__()
+        self.results: Dict[CacheKey, Dict] = {}
+
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        self.results[unit] = result
+        await self._flushed([unit])
+
+
+class CacheSink(ResultSink):
+    """
+    Redis 캐시 저장소
+
+    성공 결과는 batch_size개씩 파이프라인 SETEX로, 거래 없는 월은 빈 월 맵에 기록합니다.
+    실패 결과와 일부 페이지만 받은 결과는 캐싱하지 않습니다.
+
+    캐시 스탬피드 보호 (여러 수집기가 같은 작업을 동시에 받을 때):
+    - claim: 작업마다 재계산 락을 잡고, 다른 수집기가 락을 갖고 있으면 캐시 값을
+      (논리적으로 만료된 stale 값이라도) 대신 사용. 캐시 값이 없으면 그대로 받음
+    - 받은 결과는 재계산 시간(delta)과 함께 기록해 XFetch 조기 갱신에 쓰고,
+      기록한 뒤 락을 해제
+    """
+
+    def __init__(self, batch_size: int = COLLECT_SINK_BATCH_SIZE):
+        super().__init__()
+        self.batch_size = batch_size
+        self._results: Dict[CacheKey, Dict] = {}
+        self._empty: Dict[Tuple[str, str], List[str]] = {}
+        self._units: List[CacheKey] = []
+        # 작업 단위 -> (락 토큰, 락을 잡은 시각)
+        self._claims: Dict[CacheKey, Tuple[str, float]] = {}
+        self._deltas: Dict[CacheKey, float] = {}
+        # 캐시 값을 대신 사용한 작업 (다시 기록하지 않음)
+        self._served: Set[CacheKey] = set()
+        self.written = 0
+        self.served = 0
+
+    async def claim(self, unit: CacheKey) -> Optional[Dict]:
+        if unit in self._claims:
+            # 회로 차단으로 레인에 되돌린 작업: 이미 락을 갖고 있음
+            return None
+        cache = await get_async_redis_cache()
+        if not cache:
+            return None
+
+        token = await cache.acquire_lock(*unit)
+        if token is not None:
+            self._claims[unit] = (token, time.monotonic())
+            return None
+
+        # 다른 수집기가 받는 중: 기존 값 사용
+        entry = await cache.get_entry(*unit)
+        if entry is None:
+            return None
+        if entry.is_stale:
+            cache.stats['stale_hits'] += 1
+        self._served.add(unit)
+        self.served += 1
+        logger.debug("cache_sink_serve_cached", unit=unit, stale=entry.is_stale)
+        return entry.data
+
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        claimed = self._claims.get(unit)
+        if claimed is not None:
+            self._deltas[unit] = time.monotonic() - claimed[1]
+
+        if unit in self._served:
+            self._served.discard(unit)
+            await self._flushed([unit])
+            return
+        if is_empty_result(result):
+            self._empty.setdefault(unit[:2], []).append(unit[2])
+        elif is_complete_result(result):
+            self._results[unit] = result
+        else:
+            await self._release([unit])
+            await self._flushed([unit])
+            return
+
+        self._units.append(unit)
+        if len(self._units) >= self.batch_size:
+            await self.flush()
+
+    async def _release(self, units: List[CacheKey]) -> None:
+        claims = [(unit, self._claims.pop(unit)[0]) for unit in units if unit in self._claims]
+        for unit in units:
+            self._deltas.pop(unit, None)
+        if not claims:
+            return
+        cache = await get_async_redis_cache()
+        if cache:
+            for unit, token in claims:
+                await cache.release_lock(*unit, token)
+
+    async def flush(self) -> None:
+        """버퍼의 결과를 Redis에 기록"""
+        results, self._results = self._results, {}
+        empty, self._empty = self._empty, {}
+        units, self._units = self._units, []
+
+        cache = await get_async_redis_cache()
+        if cache:
+            if results:
+                deltas = {unit: self._deltas[unit] for unit in results if unit in self._deltas}
+                self.written += await cache.set_many(results, deltas=deltas)
+            for (api_type, lawd_cd), months in empty.items():
+                self.written += await cache.mark_empty(api_type, lawd_cd, months)
+        await self._release(units)
+        await self._flushed(units)
+
+    async def close(self) -> None:
+        await self.flush()
+        # 결과를 받지 못한 작업(중단)의 락
+        await self._release(list(self._claims))
+
+
+class JsonLinesSink(ResultSink):
+    """
+    JSON Lines 파일 저장소
+
+    작업 단위마다 한 줄({"api_type", "lawd_cd", "deal_ymd", "result"})을 추가합니다.
+    파일 쓰기는 batch_size줄씩 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, path: Path, batch_size: int = COLLECT_SINK_BATCH_SIZE):
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._lines: List[str] = []
+        self._units: List[CacheKey] = []
+
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        api_type, lawd_cd, deal_ymd = unit
+        self._units.append(unit)
+        self._lines.append(json.dumps({
+            'api_type': api_type,
+            'lawd_cd': lawd_cd,
+            'deal_ymd': deal_ymd,
+            'result': result,
+        }, ensure_ascii=False))
+        if len(self._lines) >= self.batch_size:
+            await self.flush()
+
+    def _append(self, lines: List[str]) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    async def flush(self) -> None:
+        """버퍼의 줄을 파일에 추가"""
+        lines, self._lines = self._lines, []
+        units, self._units = self._units, []
+        if lines:
+            await asyncio.to_thread(self._append, lines)
+        await self._flushed(units)
+
+    async def close(self) -> None:
+        await self.flush()
+
+
+class ForwardingSink(ResultSink):
+    """
+    다른 저장소를 감싸는 저장소 (JournalSink, CatalogSink)
+
+    작업 단위를 감싼 저장소로 넘기고, 넘긴 저장소가 모두 그 단위를 실제로 기록했다고
+    알린 뒤(flush)에 자기 기록을 합니다. 버퍼링하는 저장소(DB, JSON Lines)가 쓰기 전에
+    중단되면 저널/카탈로그에도 남지 않으므로 다음 실행에서 다시 수집됩니다.
+    """
+
+    def __init__(self, sinks: Optional[List[ResultSink]] = None):
+        super().__init__()
+        self.sinks = sinks or []
+        # 작업 단위 -> (기록을 기다리는 저장소, 모두 기록한 뒤 할 일)
+        self._waiting: Dict[CacheKey, Tuple[Set[ResultSink], Optional[Callable[[], Awaitable[None]]]]] = {}
+
+        for sink in self.sinks:
+            sink.add_flush_listener(self._listener(sink))
+
+    def _listener(self, sink: ResultSink) -> FlushListener:
+        async def on_flush(units: List[CacheKey]) -> None:
+            await self._sink_flushed(sink, units)
+            done = []
+            for unit in units:
+                entry = self._waiting.get(unit)
+                if entry is None or sink not in entry[0]:
+                    continue
+                entry[0].discard(sink)
+                if not entry[0]:
+                    del self._waiting[unit]
+                    if entry[1] is not None:
+                        await entry[1]()
+                    done.append(unit)
+            await self._flushed(done)
+        return on_flush
+
+    async def _sink_flushed(self, sink: ResultSink, units: List[CacheKey]) -> None:
+        """감싼 저장소 하나가 작업 단위를 기록했을 때 (하위 클래스용)"""
+
+    async def _forward(
+        self,
+        unit: CacheKey,
+        result: Dict,
+        targets: List[ResultSink],
+        on_flushed: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> None:
+        """targets에 결과를 넘기고, 모두 기록하면 on_flushed 실행 후 위로 알림"""
+        if not targets:
+            if on_flushed is not None:
+                await on_flushed()
+            await self._flushed([unit])
+            return
+
+        # 쓰는 도중 flush될 수 있으므로 대기 목록을 먼저 등록
+        self._waiting[unit] = (set(targets), on_flushed)
+        for sink in targets:
+            await sink.write(unit, result)
+
+    async def claim(self, unit: CacheKey) -> Optional[Dict]:
+        for sink in self.sinks:
+            result = await sink.claim(unit)
+            if result is not None:
+                return result
+        return None
+
+    async def close(self) -> None:
+        for sink in self.sinks:
+            await sink.close()
+
+
+class JournalSink(ForwardingSink):
+    """
+    수집 저널 저장소
+
+    모든 페이지를 받은 작업 단위(거래 없는 월 포함)를 저널에 커밋합니다. 감싼 저장소가
+    있으면 그 저장소들이 단위를 기록한 뒤에, 없으면 완료 즉시 커밋합니다.
+    실패와 일부 페이지만 받은 결과는 기록하지 않으므로 재개 시 다시 수집됩니다.
+    """
+
+    def __init__(self, journal: CollectionJournal, sinks: Optional[List[ResultSink]] = None):
+        """
+        Args:
+            journal: 수집 저널
+            sinks: 결과를 넘길 저장소 목록 (모두 기록한 뒤 저널에 커밋)
+        """
+        super().__init__(sinks)
+        self.journal = journal
+        self.recorded = 0
+
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        recorded = result
+        if result.get('error') and is_empty_result(result):
+            # NODATA 응답은 거래 없는 월로 기록
+            recorded = {**result, 'error': False, 'items': []}
+
+        async def commit() -> None:
+            if await self.journal.record_async(unit, recorded):
+                self.recorded += 1
+
+        await self._forward(unit, result, self.sinks, commit if is_complete_result(recorded) else None)
+
+
+class CatalogSink(ForwardingSink):
+    """
+    신선도 카탈로그 저장소
+
+    모든 페이지를 받은 작업 단위의 내용 해시를 카탈로그와 비교해, 감싼 저장소마다
+    쓸지 정합니다.
+    - catalog_name이 없는 저장소 (예: JsonLinesSink): 처음 받았거나 내용이 바뀐 결과와
+      실패 결과만 받음. 내용이 같으면 받은 시각만 갱신
+    - catalog_name이 있는 저장소 (예: DatabaseSink): 그 저장소에 기록된 해시와 다른
+      결과만 받음. 카탈로그는 모든 수집 실행이 기록하므로 전역 상태로는 이 저장소에
+      무엇이 있는지 알 수 없음. 저장소가 실제로 기록한 뒤(flush) 해시를 등록
+    카탈로그 기록도 결과를 넘긴 저장소가 모두 기록한 뒤에 합니다. 일부 페이지만 받은
+    결과는 카탈로그에 기록하지 않으므로 다음 증분 수집에서 다시 받습니다.
+    """
+
+    def __init__(self, catalog: FreshnessCatalog, sinks: Optional[List[ResultSink]] = None):
+        """
+        Args:
+            catalog: 신선도 카탈로그
+            sinks: 결과를 넘길 저장소 목록
+        """
+        super().__init__(sinks)
+        self.catalog = catalog
+        self.counts: Dict[str, int] = {}
+        # 저장소 이름 -> 기록을 기다리는 작업 단위 -> 내용 해시
+        self._unflushed: Dict[str, Dict[CacheKey, str]] = {
+            sink.catalog_name: {} for sink in self.sinks if sink.catalog_name
+        }
+
+    async def _sink_flushed(self, sink: ResultSink, units: List[CacheKey]) -> None:
+        pending = self._unflushed.get(sink.catalog_name)
+        if not pending:
+            return
+        entries = {unit: pending.pop(unit) for unit in units if unit in pending}
+        if entries:
+            await asyncio.to_thread(self.catalog.record_sink, sink.catalog_name, entries)
+
+    def _inspect(self, unit: CacheKey) -> Tuple[Optional[Dict[str, Any]], Dict[str, Optional[str]]]:
+        known = self.catalog.lookup([unit]).get(unit)
+        held = self.catalog.held_by_sinks(unit) if self._unflushed else {}
+        return known, held
+
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        recorded = result
+        if result.get('error') and is_empty_result(result):
+            # NODATA 응답은 거래 없는 월로 기록
+            recorded = {**result, 'error': False, 'items': []}
+
+        if not is_complete_result(recorded):
+            # 실패 결과는 기록하지 않고 그대로 전달
+            await self._forward(unit, result, self.sinks)
+            return
+
+        digest = content_hash(recorded.get('items', []))
+        known, held = await asyncio.to_thread(self._inspect, unit)
+        if known is None:
+            status = STATUS_NEW
+        elif known['content_hash'] == digest:
+            status = STATUS_UNCHANGED
+        else:
+            status = STATUS_CHANGED
+        self.counts[status] = self.counts.get(status, 0) + 1
+
+        targets = []
+        for sink in self.sinks:
+            name = sink.catalog_name
+            if name is None:
+                if status == STATUS_UNCHANGED:
+                    continue
+            else:
+                if held.get(name) == digest:
+                    continue
+                self._unflushed[name][unit] = digest
+            targets.append(sink)
+
+        async def commit() -> None:
+            await self.catalog.record_async(unit, recorded, digest=digest)
+
+        await self._forward(unit, result, targets, commit)
+
+
+class DatabaseSink(ResultSink):
+    """
+    PostgreSQL 저장소
+
+    성공한 작업 단위의 거래를 batch_size개 작업씩 모아 transactions 테이블에 적재합니다
+    (스테이징 테이블로 COPY 후 한 번에 병합, TransactionRepository.copy_merge_transactions).
+    수집한 월은 출력 JSON 파일과 migrate_json_to_postgres.py를 거치지 않고 바로 조회됩니다.
+    DB 쓰기는 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+
+    신선도 카탈로그는 이 저장소에 적재한 내용을 따로 추적하므로(SINK_DATABASE), 다른
+    수집 실행이 카탈로그에 기록한 월도 DB에 없으면 적재됩니다.
+
+    적재에 실패하면 예외를 그대로 올려 수집을 중단합니다.
+    """
+
+    catalog_name = SINK_DATABASE
+
+    def __init__(self, batch_size: int = COLLECT_SINK_BATCH_SIZE):
+        super().__init__()
+        # SQLAlchemy/psycopg2는 DB 적재를 쓸 때만 필요
+        from backend.db.session import get_session
+        from backend.db.repository import TransactionRepository
+
+        self._get_session = get_session
+        self._repository = TransactionRepository
+        self.batch_size = batch_size
+        self._items: List[Dict] = []
+        self._units: List[CacheKey] = []
+        self.stats: Dict[str, int] = {'units': 0, 'staged': 0, 'inserted': 0, 'updated': 0}
+
+    async def write(self, unit: CacheKey, result: Dict) -> None:
+        if result.get('error'):
+            if is_empty_result(result):
+                # 거래 없는 월: 적재할 거래는 없지만 DB 상태와 일치함을 알림
+                self._units.append(unit)
+            else:
+                await self._flushed([unit])
+            return
+
+        api_type, lawd_cd, deal_ymd = unit
+        source = f"api:{api_type}/{lawd_cd}/{deal_ymd}"
+        self._items.extend(
+            {**item, '_api_type': api_type, '_source_file': source}
+            for item in result.get('items', [])
+        )
+        self._units.append(unit)
+        self.stats['units'] += 1
+        if len(self._units) >= self.batch_size:
+            await self.flush()
+
+    def _copy(self, items: List[Dict]) -> Dict[str, int]:
+        with self._get_session() as session:
+            return self._repository(session).copy_merge_transactions(items)
+
+    async def flush(self) -> None:
+        """버퍼의 거래를 한 트랜잭션으로 적재"""
+        items, self._items = self._items, []
+        units, self._units = self._units, []
+
+        if items:
+            stats = await asyncio.to_thread(self._copy, items)
+            for key in ('staged', 'inserted', 'updated'):
+                self.stats[key] += stats[key]
+            logger.debug("database_sink_flush", **stats)
+        await self._flushed(units)
+
+    async def close(self) -> None:
+        await self.flush()
+
+
+class CollectionScheduler:
+    """
+    전역 동시 실행 제한 수집 스케줄러
+
+    - 작업 단위: (api_type, lawd_cd, deal_ymd), 한 단위 = 한 달치 전체 페이지
+    - 워커 max_concurrency개가 API 타입별 레인에서 작업을 가져가므로 작업 수와 무관하게
+      동시 실행 수가 고정되고, 코루틴을 작업 수만큼 한 번에 만들지 않음
+    - 작업은 입력 순서(우선순위)대로 실행. 워커는 모든 레인의 맨 앞 작업 중 가장
+      앞선 작업을 가져감
+    - 같은 API 호스트로 가는 작업은 per_host_concurrency개까지만 동시 실행
+    - 모든 요청이 하나의 ClientSession(커넥션 풀)을 공유
+    - API 회로가 열려 있으면 실패로 기록하지 않고 작업을 레인에 되돌린 뒤, 회로가
+      반쯤 열릴 때까지 그 API 레인을 건너뛰고 다른 API의 작업을 처리 (작업당 circuit_waits회)
+    """
+
+    def __init__(
+        self,
+        clients: Dict[str, AsyncAPIClient],
+        sinks: Optional[List[ResultSink]] = None,
+        max_concurrency: int = COLLECT_MAX_CONCURRENCY,
+        per_host_concurrency: int = COLLECT_PER_HOST_CONCURRENCY,
+        num_of_rows: int = 1000,
+        circuit_waits: int = COLLECT_CIRCUIT_WAITS
+    ):
+        """
+        Args:
+            clients: API 타입 -> 비동기 API 클라이언트
+            sinks: 결과 저장소 목록 (완료 순서대로 write 호출)
+            max_concurrency: 전역 동시 작업 수
+            per_host_concurrency: API 호스트별 동시 작업 수
+            num_of_rows: 페이지당 결과 수
+            circuit_waits: 회로 차단 응답 시 작업당 대기 후 재시도 횟수
+        """
+        self.clients = clients
+        self.sinks = sinks or []
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.num_of_rows = num_of_rows
+        self.circuit_waits = max(0, circuit_waits)
+        self.stats: Dict[str, Any] = {}
+
+        # 실행 상태: API 타입별 작업 레인 (순위, 작업), 레인 중지 시각, 작업별 회로 대기 수
+        self._lanes: Dict[str, Deque[Tuple[int, CacheKey]]] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._unit_waits: Dict[CacheKey, int] = {}
+
+    @staticmethod
+    def _host(client: AsyncAPIClient) -> str:
+        return urlparse(client.BASE_URL).netloc
+
+    def _connection_limit(self) -> int:
+        """작업 동시 실행 수 + 클라이언트별 페이지 팬아웃 여유분"""
+        return self.max_concurrency + API_PAGE_CONCURRENCY * len(self.clients)
+
+    async def _claim(self, unit: CacheKey) -> Optional[Dict]:
+        """저장소가 대신 쓸 결과를 주면 API를 호출하지 않음 (CacheSink 스탬피드 보호)"""
+        for sink in self.sinks:
+            result = await sink.claim(unit)
+            if result is not None:
+                return result
+        return None
+
+    async def _fetch(self, session: aiohttp.ClientSession, unit: CacheKey) -> Dict:
+        api_type, lawd_cd, deal_ymd = unit
+        try:
+            return await self.clients[api_type].get_all_pages_async(
+                session=session,
+                lawd_cd=lawd_cd,
+                deal_ymd=deal_ymd,
+                num_of_rows=self.num_of_rows,
+                # 캐시는 수집기가 한 번에 조회하고 CacheSink로 기록
+                use_cache=False
+            )
+        except Exception as e:
+            logger.error("collect_unit_failed", api_type=api_type, lawd_cd=lawd_cd, deal_ymd=deal_ymd, error=str(e))
+            return {
+                'error': True,
+                'message': f'API 호출 실패: {str(e)}'
+            }
+
+    def _timing_stats(self) -> Dict[str, Any]:
+        """클라이언트별 요청 시간 분해 합계 (네트워크 수신 / 응답 파싱)"""
+        fetch_seconds = parse_seconds = 0.0
+        for client in self.clients.values():
+            api_logger = getattr(client, 'api_logger', None)
+            if api_logger is not None and hasattr(api_logger, 'timing_stats'):
+                timing = api_logger.timing_stats()
+                fetch_seconds += timing['fetch_seconds']
+                parse_seconds += timing['parse_seconds']
+        return {'fetch_seconds': round(fetch_seconds, 3), 'parse_seconds': round(parse_seconds, 3)}
+
+    def _take(self) -> Tuple[Optional[Tuple[int, CacheKey]], float]:
+        """
+        다음 작업 선택
+
+        회로가 열려 일시 중지된 API를 건너뛰고, 나머지 API 레인의 맨 앞 작업 중
+        입력 순서(우선순위)가 가장 앞선 작업을 가져옵니다.
+
+        Returns:
+            ((순위, 작업), 0) 또는 (None, 중지된 레인이 재개될 때까지 대기 초).
+            남은 작업이 없으면 (None, 0)
+        """
+        now = time.monotonic()
+        best = None
+        resume_at = None
+
+        for api_type, lane in self._lanes.items():
+            if not lane:
+                continue
+            paused_until = self._paused_until.get(api_type, 0.0)
+            if paused_until > now:
+                resume_at = paused_until if resume_at is None else min(resume_at, paused_until)
+            elif best is None or lane[0][0] < self._lanes[best][0][0]:
+                best = api_type
+
+        if best is not None:
+            return self._lanes[best].popleft(), 0.0
+        return None, (resume_at - now) if resume_at is not None else 0.0
+
+    async def _worker(
+        self,
+        session: aiohttp.ClientSession,
+        host_limits: Dict[str, asyncio.Semaphore],
+        total: int,
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        while True:
+            entry, wait = self._take()
+            if entry is None:
+                if wait <= 0:
+                    return
+                # 남은 작업이 모두 회로 차단 중인 API: 가장 먼저 재개되는 레인까지 대기
+                await asyncio.sleep(wait)
+                continue
+
+            rank, unit = entry
+            api_type = unit[0]
+            result = await self._claim(unit)
+            if result is not None:
+                self.stats['served_cached'] += 1
+            else:
+                async with host_limits[self._host(self.clients[api_type])]:
+                    result = await self._fetch(session, unit)
+
+            if result.get('error_code') == CIRCUIT_OPEN_ERROR_CODE and self._unit_waits.get(unit, 0) < self.circuit_waits:
+                # 회로가 열려 있음: 작업을 레인 맨 앞으로 되돌리고 시험 요청 시점까지
+                # 이 API 레인을 중지 (그동안 워커는 다른 API의 작업을 처리)
+                self._unit_waits[unit] = self._unit_waits.get(unit, 0) + 1
+                self.stats['circuit_waits'] += 1
+                self._lanes[api_type].appendleft((rank, unit))
+                self._paused_until[api_type] = max(
+                    self._paused_until.get(api_type, 0.0),
+                    time.monotonic() + result.get('retry_after', 1)
+                )
+                continue
+
+            for sink in self.sinks:
+                await sink.write(unit, result)
+
+            self.stats['completed'] += 1
+            if result.get('error') and not is_empty_result(result):
+                self.stats['failed'] += 1
+            else:
+                self.stats['items'] += len(result.get('items', []))
+
+            if progress_callback:
+                progress_callback(self.stats['completed'], total, unit, result)
+
+    async def run(
+        self,
+        units: Iterable[CacheKey],
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        작업 전체 실행
+
+        Args:
+            units: (api_type, lawd_cd, deal_ymd) 작업 목록 (우선순위 순, 앞쪽부터 실행)
+            progress_callback: 작업 완료마다 호출 (완료 수, 전체 수, 작업, 결과)
+
+        Returns:
+            실행 통계 (작업/실패/아이템 수, 회로 대기 수, 소요 시간, 처리량, 수신/파싱 시간 합계)
+        """
+        self._lanes = {api_type: deque() for api_type in self.clients}
+        self._paused_until = {}
+        self._unit_waits = {}
+
+        total = 0
+        for rank, unit in enumerate(units):
+            if unit[0] not in self.clients:
+                raise ValueError(f"클라이언트가 없는 API 타입: {unit[0]}")
+            self._lanes[unit[0]].append((rank, unit))
+            total += 1
+
+        self.stats = {
+            'units': total, 'completed': 0, 'failed': 0, 'items': 0, 'circuit_waits': 0, 'served_cached': 0
+        }
+        started = time.perf_counter()
+
+        if total:
+            host_limits = {
+                self._host(client): asyncio.Semaphore(self.per_host_concurrency)
+                for client in self.clients.values()
+            }
+            workers = min(self.max_concurrency, total)
+
+            logger.info(
+                "collect_scheduler_start",
+                units=total,
+                workers=workers,
+                per_host_concurrency=self.per_host_concurrency
+            )
+
+            connector = aiohttp.TCPConnector(limit=self._connection_limit(), ttl_dns_cache=300)
+            try:
+                async with aiohttp.ClientSession(connector=connector) as session:
+                    tasks = [
+                        asyncio.create_task(self._worker(session, host_limits, total, progress_callback))
+                        for _ in range(workers)
+                    ]
+                    try:
+                        await asyncio.gather(*tasks)
+                    except BaseException:
+                        # 한 워커가 실패(또는 취소)하면 나머지 워커도 중단
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        raise
+            finally:
+                for sink in self.sinks:
+                    await sink.close()
+
+        elapsed = time.perf_counter() - started
+        self.stats['elapsed_seconds'] = round(elapsed, 3)
+        self.stats['units_per_second'] = round(self.stats['completed'] / elapsed, 2) if elapsed > 0 else 0.0
+        self.stats.update(self._timing_stats())
+
+        logger.info("collect_scheduler_complete", **self.stats)
+        return self.stats
@@ -2,80 +2,169 @@
 공통 유틸리티 모듈
 모든 API 모듈에서 공통으로 사용하는 기능
 """
+import os
+import gc
+import sys
+import json
+import math
+import hashlib
 import xml.etree.ElementTree as ET
-from typing import Dict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Union
+
+# lxml (선택사항): XML_PARSER_BACKEND=lxml일 때 파싱에 사용
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml_etree = None
+    LXML_AVAILABLE = False
 
 API_TIMEOUT_SECONDS = 10
 SUCCESS_CODES = ['00', '000']
+NO_DATA_CODES = ['03']
+
+# 일부 페이지만 받은 작업 단위의 에러 코드 (캐시/저널/카탈로그에 기록하지 않음)
+PARTIAL_PAGES_ERROR_CODE = 'PARTIAL_PAGES'
+
+# 한 클라이언트가 동시에 요청하는 페이지 수 (get_all_pages 팬아웃)
+API_PAGE_CONCURRENCY = int(os.getenv('API_PAGE_CONCURRENCY', '4'))
+
+# XML 파서 백엔드: stdlib (xml.etree C 구현) 또는 lxml
+XML_PARSER_BACKEND = os.getenv('XML_PARSER_BACKEND', 'stdlib').lower()
+
+XML_PARSE_ERRORS = (ET.ParseError, lxml_etree.XMLSyntaxError) if LXML_AVAILABLE else (ET.ParseError,)
+
+# intern된 아이템 필드 이름 (응답마다 같은 이름 문자열을 새로 만들지 않도록)
+_FIELD_NAMES: Dict[str, str] = {}
+_FIELD_NAMES_MAX = 1024
+
+
+def _field_name(tag: str) -> str:
+    """아이템 필드 이름 (같은 태그는 모든 아이템 dict가 같은 문자열 객체를 키로 공유)"""
+    name = _FIELD_NAMES.get(tag)
+    if name is None:
+        name = sys.intern(tag)
+        if len(_FIELD_NAMES) < _FIELD_NAMES_MAX:
+            _FIELD_NAMES[name] = name
+    return name
 
 
-def parse_xml_response(xml_text: str) -> Dict:
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    순환 GC 일시 중지
+
+    1000건 페이지 하나가 요소와 dict 수만 개를 만들어 파싱 도중 GC가 여러 번 돌지만,
+    요소 트리와 아이템 dict에는 순환 참조가 없어 회수할 것이 없습니다.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _parse_xml_root(xml_text: Union[str, bytes]):
+    """
+    XML 문서 파싱 (트리 생성은 C 구현에서)
+
+    lxml은 XML_PARSER_BACKEND=lxml이고 bytes 입력일 때만 사용합니다.
+    (lxml은 인코딩 선언이 있는 str을 받지 않음)
+    """
+    if XML_PARSER_BACKEND == 'lxml' and LXML_AVAILABLE and isinstance(xml_text, bytes):
+        return lxml_etree.fromstring(xml_text, parser=_lxml_parser())
+    return ET.fromstring(xml_text)
+
+
+def _lxml_parser():
+    """
+    결과가 xml.etree와 같도록 주석/처리 명령을 버리고 엔티티를 읽지 않는 lxml 파서
+
+    lxml 파서 객체는 스레드 간에 공유할 수 없으므로 호출마다 만듭니다.
+    """
+    return lxml_etree.XMLParser(
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+        no_network=True
+    )
+
+
+def _response_from_root(root) -> Dict:
+    """파싱된 XML 트리를 응답 dict로 변환"""
+    result = {
+        'response': {
+            'header': {},
+            'body': {}
+        }
+    }
+    
+    # header 파싱
+    header = root.find('header')
+    if header is not None:
+        result['response']['header'] = {
+            'resultCode': header.findtext('resultCode', ''),
+            'resultMsg': header.findtext('resultMsg', '')
+        }
+    
+    # body 파싱
+    body = root.find('body')
+    if body is not None:
+        item_list = []
+        
+        # items 파싱
+        items = body.find('items')
+        if items is not None:
+            if isinstance(root, ET.Element):
+                # xml.etree는 파서가 태그 문자열을 이미 공유
+                for item in items.iterfind('item'):
+                    item_list.append({child.tag: child.text or '' for child in item})
+            else:
+                # lxml은 태그를 읽을 때마다 새 문자열을 만들므로 intern
+                field_name = _field_name
+                for item in items.iterfind('item'):
+                    item_list.append({field_name(child.tag): child.text or '' for child in item})
+        
+        result['response']['body'] = {
+            'totalCount': int(body.findtext('totalCount', '0')),
+            'numOfRows': int(body.findtext('numOfRows', '0')),
+            'pageNo': int(body.findtext('pageNo', '0')),
+            'items': {'item': item_list}
+        }
+    
+    return result
+
+
+def parse_xml_response(xml_text: Union[str, bytes]) -> Dict:
     """
     XML 응답을 파싱하여 JSON 형식으로 변환
     
+    아이템은 각 item 요소의 자식을 한 번씩만 순회해 dict로 만들고, 모든 아이템이
+    같은 필드 이름 문자열을 키로 공유합니다. 파싱하는 동안 순환 GC를 멈춥니다.
+    응답 본문은 bytes로 넘기면 str 디코딩 없이 XML 선언의 인코딩으로 파싱합니다.
+    
     Args:
-        xml_text: XML 응답 텍스트
+        xml_text: XML 응답 텍스트 (str 또는 bytes)
     
     Returns:
         파싱된 데이터 (dict)
     """
-    try:
-        root = ET.fromstring(xml_text)
-        
-        # response 구조 파싱
-        result = {
-            'response': {
-                'header': {},
-                'body': {}
-            }
-        }
-        
-        # header 파싱
-        header = root.find('header')
-        if header is not None:
-            result['response']['header'] = {
-                'resultCode': header.findtext('resultCode', ''),
-                'resultMsg': header.findtext('resultMsg', '')
-            }
-        
-        # body 파싱
-        body = root.find('body')
-        if body is not None:
-            result['response']['body'] = {
-                'totalCount': int(body.findtext('totalCount', '0')),
-                'numOfRows': int(body.findtext('numOfRows', '0')),
-                'pageNo': int(body.findtext('pageNo', '0')),
-                'items': {'item': []}
+    with _gc_paused():
+        try:
+            root = _parse_xml_root(xml_text)
+        except XML_PARSE_ERRORS as e:
+            if isinstance(xml_text, bytes):
+                xml_text = xml_text[:2000].decode('utf-8', errors='replace')
+            return {
+                'error': True,
+                'message': f'XML 파싱 실패: {str(e)}',
+                'raw_response': xml_text[:500]
             }
-            
-            # items 파싱
-            items = body.find('items')
-            if items is not None:
-                item_list = []
-                # item이 여러 개인 경우
-                item_elements = items.findall('item')
-                if not item_elements:
-                    # item이 하나인 경우
-                    item_elem = items.find('item')
-                    if item_elem is not None:
-                        item_elements = [item_elem]
-                
-                for item in item_elements:
-                    item_dict = {}
-                    for child in item:
-                        tag_name = child.tag
-                        text_value = child.text if child.text else ''
-                        item_dict[tag_name] = text_value
-                    item_list.append(item_dict)
-                result['response']['body']['items']['item'] = item_list
         
-        return result
-    except ET.ParseError as e:
-        return {
-            'error': True,
-            'message': f'XML 파싱 실패: {str(e)}',
-            'raw_response': xml_text[:500]
-        }
+        return _response_from_root(root)
 
 
 def parse_api_response(response: Dict) -> Dict:
@@ -129,3 +218,188 @@ def parse_api_response(response: Dict) -> Dict:
             'message': f'응답 파싱 실패: {str(e)}',
             'raw_response': response
         }
+
+
+def is_empty_result(result: Dict) -> bool:
+    """
+    해당 지역/월에 거래가 없는 응답인지 확인
+
+    정상 응답이지만 아이템이 없는 경우와 NODATA 결과코드('03')를 빈 결과로
+    봅니다. 네트워크/인증 오류 등 다른 에러는 빈 결과가 아닙니다.
+
+    Args:
+        result: parse_api_response 또는 페이지 병합 결과
+
+    Returns:
+        빈 결과 여부
+    """
+    if result.get('error'):
+        return result.get('result_code') in NO_DATA_CODES
+    return not result.get('items')
+
+
+def get_total_count(result: Dict) -> int:
+    """
+    페이지 응답의 전체 건수
+
+    parse_api_response 결과('total_count')와 페이지 병합 결과('totalCount')를 모두 지원
+
+    Args:
+        result: 페이지 조회 결과
+
+    Returns:
+        전체 건수
+    """
+    return int(result.get('total_count', result.get('totalCount', 0)) or 0)
+
+
+def remaining_page_numbers(first_page: Dict, num_of_rows: int, max_pages: int) -> List[int]:
+    """
+    첫 페이지 응답으로 나머지 페이지 번호 계산
+
+    Args:
+        first_page: 1페이지 조회 결과
+        num_of_rows: 요청한 페이지당 결과 수
+        max_pages: 최대 페이지 수 (무한 루프 방지)
+
+    Returns:
+        2페이지부터 조회할 페이지 번호 리스트 (1페이지로 끝나면 빈 리스트)
+    """
+    items = first_page.get('items', [])
+    total_count = get_total_count(first_page)
+    if not items or len(items) >= total_count:
+        return []
+
+    # 서버가 요청보다 적은 행을 돌려주면 실제 페이지 크기 사용
+    page_size = int(first_page.get('num_of_rows') or num_of_rows) or len(items)
+    last_page = min(math.ceil(total_count / page_size), max_pages)
+    return list(range(2, last_page + 1))
+
+
+def _item_key(item) -> object:
+    """아이템 비교 키 (중첩 값이 있으면 문자열 표현 사용)"""
+    if isinstance(item, dict):
+        key = tuple(sorted(item.items()))
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+    return repr(item)
+
+
+def merge_pages(pages: List[List[Dict]]) -> List[Dict]:
+    """
+    페이지별 아이템을 페이지 순서대로 병합 (페이지 간 중복 제거)
+
+    수집 중 데이터가 추가되면 페이지 경계가 밀려 같은 거래가 다음 페이지에 다시
+    나올 수 있습니다. 앞 페이지에 이미 나온 아이템만 제거하고, 한 페이지 안의
+    동일한 아이템(같은 조건의 실제 거래)은 그대로 둡니다.
+
+    Args:
+        pages: 페이지 순서대로 정렬된 아이템 리스트들
+
+    Returns:
+        병합된 아이템 리스트
+    """
+    merged: List[Dict] = []
+    seen = set()
+    for items in pages:
+        keys = []
+        for item in items:
+            key = _item_key(item)
+            if key not in seen:
+                merged.append(item)
+            keys.append(key)
+        seen.update(keys)
+    return merged
+
+
+def merge_page_results(
+    page_items: Dict[int, List[Dict]],
+    failed_pages: List[int],
+    reported_count: int,
+    num_of_rows: int
+) -> Dict:
+    """
+    페이지별 조회 결과를 한 작업 단위 결과로 병합 (get_all_pages / get_all_pages_async)
+
+    실패한 페이지가 있거나 받은 아이템 수(페이지 간 중복 제거 전)가 1페이지의 전체 건수보다
+    적으면(max_pages 초과 등) 일부만 받은 결과로 보고 error=True, partial=True로 반환합니다.
+    짧은 월이 정상 결과로 캐싱/기록되어 빠진 거래를 다시 받지 않는 일을 막습니다.
+
+    Args:
+        page_items: 페이지 번호 -> 아이템 리스트 (성공한 페이지만)
+        failed_pages: 실패한 페이지 번호
+        reported_count: 1페이지의 전체 건수
+        num_of_rows: 페이지당 결과 수
+
+    Returns:
+        병합 결과 (reportedCount: API 전체 건수, fetchedCount: 받은 아이템 수)
+    """
+    all_items = merge_pages([page_items[page_no] for page_no in sorted(page_items)])
+    fetched_count = sum(len(items) for items in page_items.values())
+    result = {
+        'totalCount': len(all_items),
+        'items': all_items,
+        'numOfRows': num_of_rows,
+        'pageNo': max(page_items),
+        'reportedCount': reported_count,
+        'fetchedCount': fetched_count,
+        'error': False
+    }
+
+    if failed_pages or fetched_count < reported_count:
+        failed = sorted(failed_pages)
+        result.update({
+            'error': True,
+            'partial': True,
+            'error_code': PARTIAL_PAGES_ERROR_CODE,
+            'failed_pages': failed,
+            'message': (
+                f'일부 페이지만 수집됨: {fetched_count}/{reported_count}건'
+                + (f', 실패한 페이지 {failed}' if failed else '')
+            )
+        })
+    return result
+
+
+def is_complete_result(result: Dict) -> bool:
+    """
+    작업 단위의 모든 페이지를 받은 성공 결과인지 확인 (캐시/저널/카탈로그 기록 조건)
+
+    페이지 병합 결과는 받은 아이템 수가 API 전체 건수 이상이어야 합니다.
+    전체 건수 정보가 없는 결과(단일 페이지, 거래 없는 월)는 에러가 아니면 완료로 봅니다.
+
+    Args:
+        result: 작업 단위 수집 결과
+
+    Returns:
+        완료 여부
+    """
+    if result.get('error') or result.get('partial'):
+        return False
+    reported = result.get('reportedCount')
+    if reported is None:
+        return True
+    return result.get('fetchedCount', len(result.get('items', []))) >= reported
+
+
+def content_hash(items: List[Dict]) -> str:
+    """
+    아이템 목록의 내용 해시 (순서 무관)
+
+    API가 같은 거래를 다른 순서(페이지 경계)로 돌려줘도 같은 해시가 되도록
+    아이템별 정규화 JSON을 정렬해 SHA-256을 계산합니다.
+
+    Args:
+        items: 한 작업 단위(API, 지역, 월)의 아이템 리스트
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    for line in sorted(json.dumps(item, sort_keys=True, ensure_ascii=False, default=str) for item in items):
+        digest.update(line.encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
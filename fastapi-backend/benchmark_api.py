@@ -12,6 +12,9 @@ Usage:
 
     # Save results to file
     python benchmark_api.py --output benchmark_results.json
+
+    # Compare response serialization paths per endpoint (no server needed)
+    python benchmark_api.py --serialization --requests 20
 """
 import asyncio
 import argparse
@@ -209,6 +212,154 @@ class APIBenchmark:
         await self.client.aclose()
 
 
+# Analyzer service calls behind the heaviest list/detail endpoints
+SERIALIZATION_ENDPOINTS = [
+    {'name': 'Apartment Analysis', 'method': 'get_apartment_analysis', 'kwargs': {}},
+    {'name': 'Price Per Area', 'method': 'get_price_per_area', 'kwargs': {}},
+    {'name': 'Bargain Sales', 'method': 'get_bargain_sales', 'kwargs': {}},
+    {'name': 'Floor Premium', 'method': 'get_floor_premium', 'kwargs': {}},
+    {'name': 'Dealing Type', 'method': 'get_dealing_type', 'kwargs': {}},
+    # apt_name is resolved from the most traded apartment at runtime
+    {'name': 'Apartment Detail', 'method': 'get_apartment_detail', 'kwargs': None},
+]
+
+
+def benchmark_serialization(iterations: int = 20) -> Dict[str, Any]:
+    """
+    Compare response serialization paths per endpoint
+
+    Runs each analyzer call once, then times rendering the result through
+    the Pydantic StandardResponse + stdlib JSONResponse path against the
+    FastJSONResponse path (with and without re-validation).
+
+    Args:
+        iterations: Number of serializations per path
+
+    Returns:
+        Serialization benchmark results
+    """
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from schemas.responses import StandardResponse, MetaData
+    from schemas.fast_response import build_fast_response, ORJSON_AVAILABLE
+    from services.analyzer_service import get_analyzer_service
+
+    service = get_analyzer_service()
+    results = []
+
+    def _time_path(render) -> Dict[str, float]:
+        durations = []
+        size = 0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            size = len(render())
+            durations.append((time.perf_counter() - start) * 1000)
+        return {
+            'mean_ms': statistics.mean(durations),
+            'p95_ms': sorted(durations)[int(len(durations) * 0.95)],
+            'bytes': size,
+        }
+
+    apartments, _ = service.get_apartment_analysis()
+    top_apartment = max(
+        apartments.get('data', []),
+        key=lambda apt: apt.get('count', 0),
+        default={},
+    ).get('apartment', '')
+
+    for endpoint_info in SERIALIZATION_ENDPOINTS:
+        method = getattr(service, endpoint_info['method'])
+        kwargs = endpoint_info['kwargs']
+        if kwargs is None:
+            kwargs = {'apt_name': top_apartment}
+
+        analysis_start = time.perf_counter()
+        data, metadata = method(**kwargs)
+        analysis_ms = (time.perf_counter() - analysis_start) * 1000
+
+        def pydantic_path():
+            response = StandardResponse(
+                success=True,
+                data=data,
+                meta=MetaData(**metadata, processing_time_ms=analysis_ms),
+            )
+            return JSONResponse(content=jsonable_encoder(response)).body
+
+        def fast_path():
+            return build_fast_response(data, metadata, analysis_ms, validate=False).body
+
+        def fast_validated_path():
+            return build_fast_response(data, metadata, analysis_ms, validate=True).body
+
+        try:
+            paths = {
+                'pydantic_json': _time_path(pydantic_path),
+                'fast': _time_path(fast_path),
+                'fast_validated': _time_path(fast_validated_path),
+            }
+        except Exception as e:
+            logger.warning(
+                "serialization_benchmark_failed",
+                endpoint=endpoint_info['name'],
+                error=str(e),
+            )
+            results.append({'name': endpoint_info['name'], 'error': str(e)})
+            continue
+
+        baseline = paths['pydantic_json']['mean_ms']
+        results.append({
+            'name': endpoint_info['name'],
+            'analysis_ms': analysis_ms,
+            'paths': paths,
+            'speedup': baseline / paths['fast']['mean_ms'] if paths['fast']['mean_ms'] else 0,
+        })
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'iterations': iterations,
+        'orjson_available': ORJSON_AVAILABLE,
+        'results': results,
+    }
+
+
+def print_serialization_results(results: Dict[str, Any]):
+    """
+    Print serialization benchmark results
+
+    Args:
+        results: Serialization benchmark results dictionary
+    """
+    print("\n" + "="*80)
+    print("🧾 Response Serialization Benchmark")
+    print("="*80)
+    print(f"\nIterations: {results['iterations']}")
+    print(f"orjson available: {results['orjson_available']}")
+    print(
+        f"\n{'Endpoint':<24} {'Analysis':>10} {'Pydantic':>10} "
+        f"{'Fast':>10} {'Fast+Val':>10} {'Speedup':>8}"
+    )
+    print("-"*80)
+
+    for endpoint in results['results']:
+        name = endpoint['name'][:22]
+        if 'paths' not in endpoint:
+            print(f"{name:<24} {'ERROR'}")
+            continue
+
+        paths = endpoint['paths']
+        print(
+            f"{name:<24} "
+            f"{endpoint['analysis_ms']:>8.1f}ms "
+            f"{paths['pydantic_json']['mean_ms']:>8.1f}ms "
+            f"{paths['fast']['mean_ms']:>8.1f}ms "
+            f"{paths['fast_validated']['mean_ms']:>8.1f}ms "
+            f"{endpoint['speedup']:>7.1f}x"
+        )
+
+    print("="*80 + "\n")
+
+
 def print_benchmark_results(results: Dict[str, Any]):
     """
     Print benchmark results in a readable format
@@ -305,8 +456,25 @@ async def main():
         help='Save results to JSON file'
     )
 
+    parser.add_argument(
+        '--serialization',
+        action='store_true',
+        help='Benchmark response serialization paths in-process (no server needed)'
+    )
+
     args = parser.parse_args()
 
+    if args.serialization:
+        results = benchmark_serialization(iterations=args.requests)
+        print_serialization_results(results)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\n💾 Results saved to: {args.output}\n")
+
+        return 0
+
     # Run benchmark
     benchmark = APIBenchmark(base_url=args.url)
 
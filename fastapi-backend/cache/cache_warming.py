@@ -2,24 +2,33 @@
 Redis Cache Warming and Management
 
 Pre-populate cache with frequently accessed data to improve response times.
+Hot analysis queries are recomputed inside each API process by the
+usage-driven warmer (fastapi-backend/cache_warming.py); running this module
+reports Redis cache statistics and health.
 """
 
 import redis
 import json
 import structlog
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 import asyncio
+import itertools
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Repository root (backend package)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from core.config import settings
+from backend.cache.codec import CacheCodec
 
 logger = structlog.get_logger()
 
+# Keys per SCAN page / UNLINK call when clearing by pattern
+SCAN_BATCH_SIZE = 500
+
 
 class CacheWarmer:
     """Warm up Redis cache with popular queries"""
@@ -31,7 +40,9 @@ class CacheWarmer:
         Args:
             redis_url: Redis connection URL
         """
-        self.redis_client = redis.from_url(redis_url, decode_responses=True)
+        # Raw bytes: cached values are codec-encoded (compressed) payloads
+        self.redis_client = redis.from_url(redis_url, decode_responses=False)
+        self.codec = CacheCodec()
         self.cache_ttl = 3600  # 1 hour for warmed cache
 
     def get_cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
@@ -61,13 +72,13 @@ class CacheWarmer:
             True if successful
         """
         try:
-            value_json = json.dumps(value)
+            payload = self.codec.encode(value)
             self.redis_client.setex(
                 key,
                 ttl or self.cache_ttl,
-                value_json
+                payload
             )
-            logger.info("cache_set", key=key, ttl=ttl or self.cache_ttl)
+            logger.info("cache_set", key=key, ttl=ttl or self.cache_ttl, size=len(payload))
             return True
         except Exception as e:
             logger.error("cache_set_failed", key=key, error=str(e))
@@ -86,83 +97,12 @@ class CacheWarmer:
         try:
             value = self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return self.codec.decode(value)
             return None
         except Exception as e:
             logger.error("cache_get_failed", key=key, error=str(e))
             return None
 
-    def warm_popular_queries(self) -> int:
-        """
-        Warm cache with popular query patterns
-
-        Returns:
-            Number of queries warmed
-        """
-        # Popular regions
-        regions = ["강남구", "서초구", "송파구", "강동구", "마포구", "용산구"]
-
-        # Date ranges
-        now = datetime.now()
-        date_ranges = [
-            # Last month
-            {
-                "start_date": (now - timedelta(days=30)).strftime("%Y-%m-%d"),
-                "end_date": now.strftime("%Y-%m-%d")
-            },
-            # Last 3 months
-            {
-                "start_date": (now - timedelta(days=90)).strftime("%Y-%m-%d"),
-                "end_date": now.strftime("%Y-%m-%d")
-            },
-            # Last 6 months
-            {
-                "start_date": (now - timedelta(days=180)).strftime("%Y-%m-%d"),
-                "end_date": now.strftime("%Y-%m-%d")
-            },
-            # Last year
-            {
-                "start_date": (now - timedelta(days=365)).strftime("%Y-%m-%d"),
-                "end_date": now.strftime("%Y-%m-%d")
-            }
-        ]
-
-        # Popular endpoints
-        endpoints = [
-            "/api/v1/analysis/basic-stats",
-            "/api/v1/analysis/price-trend",
-            "/api/v1/analysis/regional",
-            "/api/v1/segmentation/by-area",
-            "/api/v1/investment/jeonse-ratio",
-            "/api/v1/market/signals"
-        ]
-
-        warmed_count = 0
-
-        # Generate cache keys for popular combinations
-        for region in regions:
-            for date_range in date_ranges:
-                for endpoint in endpoints:
-                    params = {
-                        "region_filter": region,
-                        **date_range
-                    }
-
-                    cache_key = self.get_cache_key(endpoint, params)
-
-                    # Mark as warmed (actual data will be populated on first request)
-                    # This is a placeholder strategy - in production, you'd fetch actual data
-                    self.redis_client.setex(
-                        f"warmed:{cache_key}",
-                        self.cache_ttl,
-                        "true"
-                    )
-
-                    warmed_count += 1
-
-        logger.info("cache_warmed", count=warmed_count)
-        return warmed_count
-
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics
@@ -193,6 +133,9 @@ class CacheWarmer:
             else:
                 stats["hit_rate"] = 0
 
+            # Payload size / (de)serialization time of this process
+            stats["codec"] = self.codec.get_stats()
+
             logger.info("cache_stats_retrieved", hit_rate=stats["hit_rate"])
             return stats
 
@@ -212,17 +155,23 @@ class CacheWarmer:
         """
         try:
             if pattern:
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    deleted = self.redis_client.delete(*keys)
+                # SCAN + batched UNLINK: never blocks Redis the way KEYS + DEL does
+                deleted = 0
+                batch = []
+                for key in self.redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        deleted += self.redis_client.unlink(*batch)
+                        batch = []
+                if batch:
+                    deleted += self.redis_client.unlink(*batch)
+                if deleted:
                     logger.info("cache_cleared_by_pattern", pattern=pattern, count=deleted)
-                    return deleted
+                return deleted
             else:
-                self.redis_client.flushdb()
+                self.redis_client.flushdb(asynchronous=True)
                 logger.info("cache_cleared_all")
                 return -1  # All keys deleted
-
-            return 0
         except Exception as e:
             logger.error("cache_clear_failed", pattern=pattern, error=str(e))
             return 0
@@ -301,16 +250,19 @@ class CacheWarmer:
             List of top keys with access counts
         """
         try:
-            # Get all keys (for small datasets)
-            all_keys = self.redis_client.keys("cache:*")
+            # Sample keys with SCAN (KEYS blocks Redis on large keyspaces)
+            sampled_keys = itertools.islice(
+                self.redis_client.scan_iter(match="cache:*", count=SCAN_BATCH_SIZE),
+                1000
+            )
 
             key_stats = []
-            for key in all_keys[:1000]:  # Limit to first 1000 keys
+            for key in sampled_keys:  # Limit to first 1000 keys
                 ttl = self.redis_client.ttl(key)
                 memory = self.redis_client.memory_usage(key) if hasattr(self.redis_client, 'memory_usage') else 0
 
                 key_stats.append({
-                    "key": key,
+                    "key": key.decode("utf-8"),
                     "ttl": ttl,
                     "memory_bytes": memory
                 })
@@ -325,43 +277,22 @@ class CacheWarmer:
             return []
 
 
-async def run_cache_warming():
+async def run_cache_report():
     """
-    Run cache warming process asynchronously
+    Print Redis cache statistics and health
     """
-    try:
-        redis_url = settings.REDIS_URL
-    except:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
     warmer = CacheWarmer(redis_url)
 
-    logger.info("starting_cache_warming")
-
-    # Get initial stats
-    initial_stats = warmer.get_cache_stats()
-    print("\n" + "="*60)
-    print("INITIAL CACHE STATS")
-    print("="*60)
-    print(f"Total Keys: {initial_stats.get('total_keys', 0)}")
-    print(f"Memory Used: {initial_stats.get('memory_used_human', 'N/A')}")
-    print(f"Hit Rate: {initial_stats.get('hit_rate', 0):.2f}%")
-
-    # Warm popular queries
+    # Get stats
+    stats = warmer.get_cache_stats()
     print("\n" + "="*60)
-    print("WARMING CACHE WITH POPULAR QUERIES")
+    print("CACHE STATS")
     print("="*60)
-    warmed_count = warmer.warm_popular_queries()
-    print(f"Warmed {warmed_count} query patterns")
-
-    # Get updated stats
-    updated_stats = warmer.get_cache_stats()
-    print("\n" + "="*60)
-    print("UPDATED CACHE STATS")
-    print("="*60)
-    print(f"Total Keys: {updated_stats.get('total_keys', 0)}")
-    print(f"Memory Used: {updated_stats.get('memory_used_human', 'N/A')}")
-    print(f"Hit Rate: {updated_stats.get('hit_rate', 0):.2f}%")
+    print(f"Total Keys: {stats.get('total_keys', 0)}")
+    print(f"Memory Used: {stats.get('memory_used_human', 'N/A')}")
+    print(f"Hit Rate: {stats.get('hit_rate', 0):.2f}%")
 
     # Check health
     health = warmer.monitor_cache_health()
@@ -377,8 +308,6 @@ async def run_cache_warming():
     else:
         print("No warnings")
 
-    logger.info("cache_warming_complete", warmed_count=warmed_count)
-
 
 if __name__ == "__main__":
-    asyncio.run(run_cache_warming())
+    asyncio.run(run_cache_report())
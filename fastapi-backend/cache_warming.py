@@ -1,139 +1,247 @@
 """
-Redis Cache Warming Script
+Usage-Driven Cache Warming
 
-Pre-populates Redis cache with frequently accessed data on application startup
-or on-demand via CLI.
+Recomputes the most requested analysis queries into the analyzer service's
+result cache, so traffic after a dataset reload is served from warm entries.
+
+Hot queries come from the recorded query statistics (a Redis sorted set per
+endpoint shared by all API processes, or this process's counters), or from
+the "analysis_query" events of a JSON application log. The top-N queries of
+every endpoint are recomputed in parallel with a concurrency limit.
+
+Result caches live inside each API process, so warming only happens in the
+server: every process warms itself after each dataset version bump when
+WARM_CACHE_ON_STARTUP=true. The command line only reports what the server
+warms (the hot query plan) and how well it works (warm coverage); it does
+not compute queries.
 
 Usage:
-    # Warm cache on startup
+    # Hot query plan of the critical endpoints
     python cache_warming.py --startup
 
-    # Warm specific endpoints
+    # Hot query plan of every endpoint
+    python cache_warming.py --full
+
+    # Hot query plan of specific endpoints
     python cache_warming.py --endpoints basic-stats price-trend
 
-    # Full cache warming
-    python cache_warming.py --full
+    # Plan from a request log instead of the recorded statistics
+    python cache_warming.py --full --from-log logs/app.log
+
+    # Show warm coverage only
+    python cache_warming.py --coverage
 """
+import os
 import sys
+import time
+import inspect
 import asyncio
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import structlog
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.analyzer_service import AnalyzerService
-from backend.cache.redis_client import get_redis_cache
+from services.analyzer_service import AnalyzerService, get_analyzer_service
+from services.query_stats import (
+    QueryStats,
+    get_query_stats,
+    load_queries_from_log,
+    parse_signature,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Configuration
+HOT_QUERY_TOP_N = int(os.getenv("HOT_QUERY_TOP_N", "10"))
+WARM_CONCURRENCY = int(os.getenv("WARM_CACHE_CONCURRENCY", "4"))
 
-class CacheWarmer:
-    """Cache warming utility for frequently accessed data"""
+# CLI endpoint names -> analyzer service methods
+ENDPOINT_METHODS = {
+    'basic-stats': 'get_basic_stats',
+    'price-trend': 'get_price_trend',
+    'regional': 'get_regional_analysis',
+    'regional-comparison': 'get_regional_analysis',
+    'apartments': 'get_apartment_analysis',
+    'price-per-area': 'get_price_per_area',
+    'jeonse-ratio': 'get_jeonse_ratio',
+    'bargain-sales': 'get_bargain_sales',
+    'market-signals': 'get_market_signals',
+}
 
-    def __init__(self):
-        """Initialize cache warmer"""
-        self.analyzer = AnalyzerService()
-        self.cache = get_redis_cache()
 
-    async def warm_basic_stats(self) -> bool:
+class CacheWarmer:
+    """Usage-driven warmer for the analyzer service's result cache"""
+
+    def __init__(
+        self,
+        service: Optional[AnalyzerService] = None,
+        stats: Optional[QueryStats] = None,
+        top_n: int = HOT_QUERY_TOP_N,
+        concurrency: int = WARM_CONCURRENCY,
+    ):
         """
-        Warm cache for basic statistics endpoint
+        Initialize cache warmer
 
-        Returns:
-            True if successful
+        Args:
+            service: Analyzer service to warm (defaults to the shared singleton)
+            stats: Hot query statistics (defaults to the shared singleton)
+            top_n: Queries warmed per endpoint
+            concurrency: Queries computed at the same time
         """
-        try:
-            logger.info("warming_basic_stats")
-
-            # Load and cache basic statistics
-            result = self.analyzer.get_basic_stats()
-
-            logger.info(
-                "basic_stats_warmed",
-                total_count=result.get('stats', {}).get('total_count', 0)
-            )
-            return True
-        except Exception as e:
-            logger.error("basic_stats_warming_failed", error=str(e))
-            return False
-
-    async def warm_price_trend(self) -> bool:
+        self.analyzer = service or get_analyzer_service()
+        self.stats = stats or get_query_stats()
+        self.top_n = top_n
+        self.concurrency = max(1, concurrency)
+        self._running = threading.Lock()
+        self._requested_version: Optional[int] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    def _resolve_methods(self, endpoints: Optional[List[str]]) -> List[str]:
+        """Map CLI endpoint names (or method names) to cached service methods"""
+        cached = self.analyzer.cached_query_names()
+        if not endpoints:
+            return cached
+
+        methods = []
+        for endpoint in endpoints:
+            method = ENDPOINT_METHODS.get(endpoint, endpoint)
+            if method in cached:
+                methods.append(method)
+            else:
+                logger.warning("unknown_endpoint", endpoint=endpoint)
+        return list(dict.fromkeys(methods))
+
+    def _has_defaults(self, method: str) -> bool:
+        """Whether a service method can be called without arguments"""
+        signature = inspect.signature(getattr(self.analyzer, method))
+        return all(param.default is not param.empty for param in signature.parameters.values())
+
+    def plan(
+        self,
+        endpoints: Optional[List[str]] = None,
+        log_path: Optional[Path] = None,
+        include_defaults: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Warm cache for price trend endpoint
+        Pick the top-N hot queries per endpoint
 
-        Returns:
-            True if successful
-        """
-        try:
-            logger.info("warming_price_trend")
-
-            # Load and cache price trend data
-            result = self.analyzer.get_price_trend()
-
-            logger.info(
-                "price_trend_warmed",
-                data_points=len(result.get('trend_data', []))
-            )
-            return True
-        except Exception as e:
-            logger.error("price_trend_warming_failed", error=str(e))
-            return False
-
-    async def warm_regional_comparison(self) -> bool:
-        """
-        Warm cache for regional comparison endpoint
+        Args:
+            endpoints: Endpoint or method names (None = every cached method)
+            log_path: Mine this application log instead of the statistics
+            include_defaults: Warm the default-filter query of endpoints
+                without recorded traffic
 
         Returns:
-            True if successful
+            Service method -> list of call parameters, hottest first
         """
-        try:
-            logger.info("warming_regional_comparison")
+        methods = self._resolve_methods(endpoints)
+        logged = load_queries_from_log(log_path, methods) if log_path else None
 
-            # Load and cache regional comparison data
-            result = self.analyzer.get_regional_comparison()
+        plan = {}
+        for method in methods:
+            if logged is not None:
+                ranked = logged[method].most_common(self.top_n) if method in logged else []
+            else:
+                ranked = self.stats.top_queries(method, self.top_n)
 
-            logger.info(
-                "regional_comparison_warmed",
-                regions=len(result.get('comparison', {}).get('regions', []))
-            )
-            return True
-        except Exception as e:
-            logger.error("regional_comparison_warming_failed", error=str(e))
-            return False
+            queries = [parse_signature(signature) for signature, _ in ranked]
+            if not queries and include_defaults and self._has_defaults(method):
+                queries = [{}]
+            if queries:
+                plan[method] = queries
+        return plan
 
-    async def warm_all(self) -> dict:
+    def warm(self, plan: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
-        Warm all frequently accessed endpoints
+        Recompute planned queries in parallel
+
+        Args:
+            plan: Service method -> list of call parameters
 
         Returns:
-            Dictionary with warming results
+            Warming summary with per-endpoint results
         """
-        logger.info("starting_full_cache_warming")
-
-        results = {
-            'basic_stats': await self.warm_basic_stats(),
-            'price_trend': await self.warm_price_trend(),
-            'regional_comparison': await self.warm_regional_comparison(),
+        started = time.time()
+        version = self.analyzer.dataset_version
+        by_endpoint = {method: {"warmed": 0, "failed": 0} for method in plan}
+
+        def run(method: str, params: Dict[str, Any]):
+            return self.analyzer.warm_query(method, params)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="cache-warm") as pool:
+            futures = {
+                pool.submit(run, method, params): method
+                for method, queries in plan.items()
+                for params in queries
+            }
+            for future in as_completed(futures):
+                method = futures[future]
+                try:
+                    future.result()
+                    by_endpoint[method]["warmed"] += 1
+                except Exception as e:
+                    by_endpoint[method]["failed"] += 1
+                    logger.warning("cache_warm_query_failed", endpoint=method, error=str(e))
+
+        result = {
+            "dataset_version": version,
+            "queries": len(futures),
+            "warmed": sum(r["warmed"] for r in by_endpoint.values()),
+            "failed": sum(r["failed"] for r in by_endpoint.values()),
+            "duration_ms": round((time.time() - started) * 1000, 2),
+            "concurrency": self.concurrency,
+            "by_endpoint": by_endpoint,
         }
-
-        success_count = sum(1 for v in results.values() if v)
-        total_count = len(results)
+        self.last_result = result
 
         logger.info(
             "cache_warming_completed",
-            success=success_count,
-            total=total_count,
-            success_rate=f"{(success_count/total_count)*100:.1f}%"
+            dataset_version=version,
+            queries=result["queries"],
+            warmed=result["warmed"],
+            failed=result["failed"],
+            duration_ms=result["duration_ms"],
         )
+        return result
+
+    def warm_hot_queries(
+        self,
+        endpoints: Optional[List[str]] = None,
+        log_path: Optional[Path] = None,
+        include_defaults: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Plan and warm the hot queries (blocking)
 
-        return results
+        Args:
+            endpoints: Endpoint or method names (None = every cached method)
+            log_path: Mine this application log instead of the statistics
+            include_defaults: Warm the default-filter query of endpoints
+                without recorded traffic
+
+        Returns:
+            Warming summary
+        """
+        return self.warm(self.plan(endpoints, log_path, include_defaults))
+
+    async def warm_all(self) -> dict:
+        """
+        Warm the hot queries of every endpoint
+
+        Returns:
+            Dictionary with warming results per endpoint
+        """
+        result = await asyncio.to_thread(self.warm_hot_queries)
+        return {method: r["failed"] == 0 for method, r in result["by_endpoint"].items()}
 
     async def warm_specific(self, endpoints: List[str]) -> dict:
         """
-        Warm specific endpoints
+        Warm the hot queries of specific endpoints
 
         Args:
             endpoints: List of endpoint names to warm
@@ -143,98 +251,186 @@ class CacheWarmer:
         """
         logger.info("warming_specific_endpoints", endpoints=endpoints)
 
-        endpoint_map = {
-            'basic-stats': self.warm_basic_stats,
-            'price-trend': self.warm_price_trend,
-            'regional-comparison': self.warm_regional_comparison,
-        }
+        result = await asyncio.to_thread(self.warm_hot_queries, endpoints)
 
         results = {}
         for endpoint in endpoints:
-            if endpoint in endpoint_map:
-                results[endpoint] = await endpoint_map[endpoint]()
-            else:
-                logger.warning("unknown_endpoint", endpoint=endpoint)
-                results[endpoint] = False
-
+            method = ENDPOINT_METHODS.get(endpoint, endpoint)
+            endpoint_result = result["by_endpoint"].get(method)
+            results[endpoint] = bool(endpoint_result) and endpoint_result["failed"] == 0
         return results
 
+    def enable_auto_warming(self):
+        """Warm hot queries in the background after every dataset version bump"""
+        self.analyzer.add_reload_listener(self._on_dataset_reload)
+        logger.info("cache_auto_warming_enabled", top_n=self.top_n, concurrency=self.concurrency)
+
+    def _on_dataset_reload(self, version: int):
+        """Reload listener: one background warming run at a time, rerun for newer versions"""
+        self._requested_version = version
+        if not self._running.acquire(blocking=False):
+            logger.info("cache_warming_queued", dataset_version=version)
+            return
+
+        def run():
+            warmed_version = None
+            try:
+                while warmed_version != self._requested_version:
+                    warmed_version = self._requested_version
+                    try:
+                        self.warm_hot_queries()
+                    except Exception as e:
+                        logger.warning("cache_warming_failed", error=str(e))
+            finally:
+                self._running.release()
+            # A bump between the last check and the release would be lost otherwise
+            if self._requested_version != warmed_version:
+                self._on_dataset_reload(self._requested_version)
+
+        threading.Thread(target=run, name="cache-warmer", daemon=True).start()
+
+    def coverage(self) -> Dict[str, Any]:
+        """
+        Warm coverage: fraction of recorded requests served from warm entries
+
+        Returns:
+            Coverage totals and per-endpoint breakdown
+        """
+        return {
+            **self.stats.coverage(),
+            "result_cache": self.analyzer.get_result_cache_stats(),
+        }
+
+
+# Singleton instance (shared by the API process's reload listener and health checks)
+_cache_warmer: Optional[CacheWarmer] = None
+
+
+def get_cache_warmer() -> CacheWarmer:
+    """
+    Get cache warmer singleton
+
+    Returns:
+        CacheWarmer instance
+    """
+    global _cache_warmer
+    if _cache_warmer is None:
+        _cache_warmer = CacheWarmer()
+    return _cache_warmer
+
+
+def print_plan(plan: Dict[str, List[Dict[str, Any]]]):
+    """Print the hot query plan"""
+    print("\n" + "="*60)
+    print("📊 Hot Query Plan (warmed by the API server after each reload)")
+    print("="*60)
+    if not plan:
+        print("No recorded queries")
+    for method, queries in plan.items():
+        print(f"{method}: {len(queries)} queries")
+        for params in queries:
+            print(f"  - {params or '(default filters)'}")
+    print("="*60 + "\n")
+
+
+def print_coverage(coverage: Dict[str, Any]):
+    """Print warm coverage report"""
+    print("\n" + "="*60)
+    print(f"🔥 Warm Coverage ({coverage['backend']})")
+    print("="*60)
+    print(f"Requests: {coverage['requests']}")
+    print(f"Warm coverage: {coverage['warm_coverage']*100:.1f}%")
+    print(f"Hit rate: {coverage['hit_rate']*100:.1f}%")
+    for endpoint, counts in coverage["by_endpoint"].items():
+        print(
+            f"  {endpoint:<28} {counts['requests']:>7} req  "
+            f"warm {counts['warm_coverage']*100:5.1f}%  hit {counts['hit_rate']*100:5.1f}%"
+        )
+    print("="*60 + "\n")
+
 
 async def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
-        description='Redis cache warming utility',
+        description='Hot query plan and warm coverage of the analysis cache',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  # Startup warming (critical endpoints only)
+  # Critical endpoints only
   python cache_warming.py --startup
 
-  # Full cache warming
+  # Hot queries of every endpoint
   python cache_warming.py --full
 
   # Specific endpoints
   python cache_warming.py --endpoints basic-stats price-trend
+
+  # Plan from the application log
+  python cache_warming.py --full --from-log logs/app.log
+
+  # Warm coverage report
+  python cache_warming.py --coverage
         """
     )
 
     parser.add_argument(
         '--startup',
         action='store_true',
-        help='Warm critical endpoints for startup'
+        help='Plan the critical endpoints only'
     )
 
     parser.add_argument(
         '--full',
         action='store_true',
-        help='Warm all endpoints'
+        help='Plan the hot queries of all endpoints'
     )
 
     parser.add_argument(
         '--endpoints',
         nargs='+',
-        help='Specific endpoints to warm'
+        help='Specific endpoints to plan'
+    )
+
+    parser.add_argument(
+        '--from-log',
+        type=Path,
+        help='Pick hot queries from a JSON application log'
+    )
+
+    parser.add_argument(
+        '--top-n',
+        type=int,
+        default=HOT_QUERY_TOP_N,
+        help=f'Queries warmed per endpoint (default: {HOT_QUERY_TOP_N})'
+    )
+
+    parser.add_argument(
+        '--coverage',
+        action='store_true',
+        help='Only print the warm coverage report'
     )
 
     args = parser.parse_args()
 
     # Initialize warmer
-    warmer = CacheWarmer()
-
-    # Check Redis connection
-    if not warmer.cache or not warmer.cache.is_connected():
-        logger.error("redis_not_available")
-        print("\n❌ Redis cache is not available")
-        print("   - Ensure Redis server is running")
-        print("   - Check USE_REDIS=true in .env")
-        return 1
-
-    # Execute warming based on arguments
-    if args.startup:
-        logger.info("startup_warming_mode")
-        # Warm only critical endpoints for fast startup
-        results = await warmer.warm_specific(['basic-stats'])
-    elif args.full:
-        logger.info("full_warming_mode")
-        results = await warmer.warm_all()
-    elif args.endpoints:
-        results = await warmer.warm_specific(args.endpoints)
-    else:
-        # Default: startup mode
-        results = await warmer.warm_specific(['basic-stats'])
-
-    # Print results
-    print("\n" + "="*60)
-    print("📊 Cache Warming Results")
-    print("="*60)
+    warmer = CacheWarmer(top_n=args.top_n)
 
-    for endpoint, success in results.items():
-        status = "✅" if success else "❌"
-        print(f"{status} {endpoint}")
+    if args.coverage:
+        print_coverage(warmer.stats.coverage())
+        return 0
 
-    print("="*60 + "\n")
+    if args.full:
+        endpoints = None
+    elif args.endpoints:
+        endpoints = args.endpoints
+    else:
+        # Default: critical endpoints only
+        endpoints = ['basic-stats']
 
-    return 0 if all(results.values()) else 1
+    plan = await asyncio.to_thread(warmer.plan, endpoints, args.from_log, True)
+    print_plan(plan)
+    print_coverage(warmer.stats.coverage())
+    return 0
 
 
 if __name__ == '__main__':
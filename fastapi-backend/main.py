@@ -6,6 +6,7 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from datetime import datetime
 import structlog
+import asyncio
 import os
 
 # Import monitoring configuration
@@ -13,7 +14,7 @@ from config.sentry import init_sentry
 from config.logging import setup_logging
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from middleware import setup_cors, setup_compression, setup_rate_limiting
+from middleware import setup_cors, setup_compression, setup_rate_limiting, setup_admission_control
 from middleware.logging import setup_logging_middleware
 from routers import (
     analysis_router,
@@ -28,6 +29,8 @@ from routers import (
 from routers.health import router as health_router
 from routers.metrics import router as metrics_router
 from auth import auth_router
+from services.warmup import run_startup_warmup
+from services.export_jobs import get_export_job_manager
 
 # Initialize logging first
 setup_logging()
@@ -63,6 +66,7 @@ app = FastAPI(
 
 # Setup middleware
 setup_compression(app)  # Apply compression first
+setup_admission_control(app)  # Inside CORS so 503 sheds still carry CORS headers
 setup_cors(app)
 setup_logging_middleware(app)
 setup_rate_limiting(app)
@@ -192,16 +196,22 @@ async def startup_event():
     # Expose metrics endpoint
     instrumentator.expose(app, endpoint="/api/metrics", include_in_schema=False)
 
-    # Warm cache on startup (optional, controlled by env var)
+    # Recompute hot queries after every dataset version bump, starting with
+    # the startup preload (optional, controlled by env var)
     if os.getenv("WARM_CACHE_ON_STARTUP", "false").lower() == "true":
         try:
-            from cache_warming import CacheWarmer
-            warmer = CacheWarmer()
-            await warmer.warm_specific(['basic-stats'])
-            logger.info("cache_warming_completed")
+            from cache_warming import get_cache_warmer
+            get_cache_warmer().enable_auto_warming()
         except Exception as e:
             logger.warning("cache_warming_failed", error=str(e))
 
+    # Preload dataset and run warmup queries in the background;
+    # /api/health/ready returns 503 until this finishes
+    app.state.warmup_task = asyncio.create_task(run_startup_warmup())
+
+    # Background worker pool for export jobs (PDF reports, large exports)
+    get_export_job_manager().start()
+
 
 # Shutdown event
 @app.on_event("shutdown")
@@ -214,6 +224,8 @@ async def shutdown_event():
         service="apartment-transaction-analysis-api",
     )
 
+    get_export_job_manager().stop()
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -2,12 +2,19 @@
 Middleware components
 """
 from .cors import setup_cors
-from .logging import setup_logging
+from .logging import setup_logging_middleware
 from .compression import setup_compression
+from .admission import setup_admission_control
 
 try:
     from .rate_limiter import setup_rate_limiting
 except ImportError:
     from .rate_limit import setup_rate_limiting
 
-__all__ = ["setup_cors", "setup_logging", "setup_compression", "setup_rate_limiting"]
+__all__ = [
+    "setup_cors",
+    "setup_logging_middleware",
+    "setup_compression",
+    "setup_rate_limiting",
+    "setup_admission_control",
+]
@@ -0,0 +1,256 @@
+"""
+Admission control middleware (load shedding per endpoint class)
+
+Each endpoint class (cheap, heavy, export) gets its own concurrency budget
+and a short bounded wait queue. Requests beyond the budget are rejected
+immediately with 503 + Retry-After instead of queueing indefinitely, so a
+spike in heavy analysis traffic cannot starve health checks and cheap
+queries.
+"""
+import os
+import asyncio
+import math
+import time
+from typing import Dict, Optional, Tuple
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Configuration
+ADMISSION_CONTROL_ENABLED = os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() == "true"
+ADMISSION_QUEUE_TIMEOUT_MS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "500"))
+
+# Class -> (max concurrent, max queued)
+ADMISSION_BUDGETS: Dict[str, Tuple[int, int]] = {
+    "cheap": (
+        int(os.getenv("ADMISSION_CHEAP_LIMIT", "64")),
+        int(os.getenv("ADMISSION_CHEAP_QUEUE", "128")),
+    ),
+    "heavy": (
+        int(os.getenv("ADMISSION_HEAVY_LIMIT", "8")),
+        int(os.getenv("ADMISSION_HEAVY_QUEUE", "16")),
+    ),
+    "export": (
+        int(os.getenv("ADMISSION_EXPORT_LIMIT", "2")),
+        int(os.getenv("ADMISSION_EXPORT_QUEUE", "2")),
+    ),
+}
+
+# Path prefixes per class. Every analyzer endpoint scans the loaded
+# dataset, so all analysis routers are "heavy"; "cheap" is left to health,
+# metrics/stats, auth, subscriptions and export job polling
+HEAVY_PATH_PREFIXES = (
+    "/api/v1/analysis/",
+    "/api/v1/premium/",
+    "/api/v1/investment/",
+    "/api/v1/market/",
+)
+
+EXPORT_PATH_PREFIXES = (
+    "/api/v1/export/csv",
+    "/api/v1/export/parquet",
+    "/api/v1/export/arrow",
+)
+
+# Never shed: scraping and liveness must keep working under overload
+EXEMPT_PATHS = ("/api/metrics", "/api/health/live")
+
+MAX_RETRY_AFTER_SECONDS = 60
+
+
+def classify_path(path: str, method: str = "GET") -> Optional[str]:
+    """
+    Map a request to its endpoint class
+
+    Args:
+        path: Request path
+        method: HTTP method (CORS preflights are never shed)
+
+    Returns:
+        "cheap", "heavy", "export", or None for exempt requests
+    """
+    if method == "OPTIONS" or path in EXEMPT_PATHS:
+        return None
+    if path.startswith(EXPORT_PATH_PREFIXES):
+        return "export"
+    if path.startswith(HEAVY_PATH_PREFIXES):
+        return "heavy"
+    return "cheap"
+
+
+class ConcurrencyLimiter:
+    """
+    Concurrency budget with a bounded, time-limited wait queue
+
+    Also keeps a moving average of request duration, used to suggest a
+    Retry-After value when shedding.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.avg_duration = 0.0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> Optional[str]:
+        """
+        Try to take a slot
+
+        Returns:
+            None when admitted, otherwise the reject reason
+            ("queue_full" or "queue_timeout")
+        """
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                return "queue_full"
+
+            self.waiting += 1
+            self._report()
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                return "queue_timeout"
+            finally:
+                self.waiting -= 1
+                _record_queue_wait(self.name, time.perf_counter() - started)
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        self._report()
+        return None
+
+    def release(self, duration: float):
+        """Free a slot and fold the request duration into the average"""
+        self.in_flight -= 1
+        self._semaphore.release()
+        self.avg_duration = duration if self.avg_duration == 0 else (
+            0.9 * self.avg_duration + 0.1 * duration
+        )
+        self._report()
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog should have drained"""
+        backlog = self.in_flight + self.waiting
+        estimate = self.avg_duration * backlog / max(self.limit, 1)
+        return max(1, min(MAX_RETRY_AFTER_SECONDS, math.ceil(estimate)))
+
+    def snapshot(self) -> Dict:
+        return {
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "avg_duration_ms": round(self.avg_duration * 1000, 2),
+        }
+
+    def _report(self):
+        try:
+            from routers.metrics import update_admission_state
+            update_admission_state(self.name, self.in_flight, self.waiting)
+        except Exception:
+            pass
+
+
+def _record_queue_wait(endpoint_class: str, seconds: float):
+    try:
+        from routers.metrics import record_admission_queue_wait
+        record_admission_queue_wait(endpoint_class, seconds)
+    except Exception:
+        pass
+
+
+def _record_reject(endpoint_class: str, reason: str):
+    try:
+        from routers.metrics import record_admission_reject
+        record_admission_reject(endpoint_class, reason)
+    except Exception as e:
+        logger.warning("admission_metrics_failed", error=str(e))
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware enforcing per-class concurrency budgets
+
+    Implemented as plain ASGI (not BaseHTTPMiddleware) so a slot is held
+    until the response body has been fully sent, which matters for
+    streaming exports.
+    """
+
+    def __init__(self, app, budgets: Optional[Dict[str, Tuple[int, int]]] = None,
+                 queue_timeout_ms: float = ADMISSION_QUEUE_TIMEOUT_MS):
+        self.app = app
+        self.limiters = {
+            name: ConcurrencyLimiter(name, limit, max_queue, queue_timeout_ms / 1000)
+            for name, (limit, max_queue) in (budgets or ADMISSION_BUDGETS).items()
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        endpoint_class = classify_path(scope["path"], scope.get("method", "GET"))
+        limiter = self.limiters.get(endpoint_class) if endpoint_class else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        reason = await limiter.acquire()
+        if reason is not None:
+            retry_after = limiter.retry_after()
+            _record_reject(endpoint_class, reason)
+            logger.warning(
+                "admission_rejected",
+                path=scope["path"],
+                endpoint_class=endpoint_class,
+                reason=reason,
+                in_flight=limiter.in_flight,
+                waiting=limiter.waiting,
+                retry_after=retry_after,
+            )
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "detail": {
+                        "error": "Service overloaded",
+                        "message": "요청이 많아 잠시 후 다시 시도해주세요",
+                        "endpoint_class": endpoint_class,
+                    }
+                },
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started)
+
+
+def setup_admission_control(app: FastAPI) -> None:
+    """
+    Add admission control middleware (disabled with ADMISSION_CONTROL_ENABLED=false)
+
+    Args:
+        app: FastAPI application
+    """
+    if not ADMISSION_CONTROL_ENABLED:
+        logger.info("admission_control_disabled")
+        return
+
+    app.add_middleware(AdmissionControlMiddleware)
+    logger.info(
+        "admission_control_configured",
+        budgets={name: {"limit": limit, "queue": queue} for name, (limit, queue) in ADMISSION_BUDGETS.items()},
+        queue_timeout_ms=ADMISSION_QUEUE_TIMEOUT_MS,
+    )
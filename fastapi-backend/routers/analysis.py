@@ -6,7 +6,7 @@ import time
 from datetime import datetime
 from typing import Dict, Any
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Request
 
 from schemas.requests import (
     BasicStatsRequest,
@@ -25,7 +25,8 @@ from schemas.responses import (
     MonthlyTrendData,
     RegionData,
 )
-from services.analyzer_service import AnalyzerService
+from services.analyzer_service import get_analyzer_service
+from services.request_deadline import run_analysis
 
 logger = structlog.get_logger(__name__)
 
@@ -40,7 +41,7 @@ router = APIRouter(
 )
 
 # Initialize analyzer service (singleton)
-analyzer_service = AnalyzerService()
+analyzer_service = get_analyzer_service()
 
 
 @router.post(
@@ -59,12 +60,14 @@ analyzer_service = AnalyzerService()
 )
 async def calculate_basic_stats(
     request: BasicStatsRequest,
+    http_request: Request,
 ) -> BasicStatsResponse:
     """
     Calculate basic statistics for apartment transactions
 
     Args:
         request: BasicStatsRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         BasicStatsResponse with statistics data
@@ -80,7 +83,10 @@ async def calculate_basic_stats(
         )
 
         # Call analyzer service
-        stats, metadata = analyzer_service.get_basic_stats(
+        stats, metadata = await run_analysis(
+            http_request,
+            "basic_stats",
+            analyzer_service.get_basic_stats,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -102,6 +108,8 @@ async def calculate_basic_stats(
             meta=response_meta,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "basic_stats_error",
@@ -131,12 +139,14 @@ async def calculate_basic_stats(
 )
 async def calculate_price_trend(
     request: PriceTrendRequest,
+    http_request: Request,
 ) -> PriceTrendResponse:
     """
     Calculate price trend analysis
 
     Args:
         request: PriceTrendRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         PriceTrendResponse with trend data
@@ -153,7 +163,10 @@ async def calculate_price_trend(
         )
 
         # Call analyzer service
-        trend, metadata = analyzer_service.get_price_trend(
+        trend, metadata = await run_analysis(
+            http_request,
+            "price_trend",
+            analyzer_service.get_price_trend,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -212,6 +225,8 @@ async def calculate_price_trend(
             meta=response_meta,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "price_trend_error",
@@ -241,12 +256,14 @@ async def calculate_price_trend(
 )
 async def analyze_regional(
     request: RegionalAnalysisRequest,
+    http_request: Request,
 ) -> RegionalAnalysisResponse:
     """
     Analyze transactions by region
 
     Args:
         request: RegionalAnalysisRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         RegionalAnalysisResponse with regional data
@@ -263,7 +280,10 @@ async def analyze_regional(
         )
 
         # Call analyzer service
-        regional_data, metadata = analyzer_service.get_regional_analysis(
+        regional_data, metadata = await run_analysis(
+            http_request,
+            "regional_analysis",
+            analyzer_service.get_regional_analysis,
             regions=request.regions,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -275,10 +295,10 @@ async def analyze_regional(
 
         # Transform regional data to match response schema
         regions_list = []
-        for region_data in regional_data.get('regions', []):
+        for region_data in regional_data.get('data', []):
             regions_list.append(
                 RegionData(
-                    region_name=region_data.get('region_name', ''),
+                    region_name=region_data.get('region', ''),
                     count=region_data.get('count', 0),
                     avg_price=region_data.get('avg_price', 0.0),
                     max_price=region_data.get('max_price', 0.0),
@@ -309,6 +329,8 @@ async def analyze_regional(
             meta=response_meta,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "regional_analysis_error",
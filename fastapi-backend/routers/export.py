@@ -1,18 +1,41 @@
 """
-Data export API endpoints (CSV, PDF)
+Data export API endpoints (CSV, Parquet, Arrow, PDF)
 Premium feature only
+
+/csv, /parquet and /arrow stream the file in the request; /jobs runs the
+same exports (and PDF reports) on the background export worker pool.
 """
-import csv
-import io
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Header
-from fastapi.responses import StreamingResponse
-from typing import Optional, List, Dict, Any
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import ValidationError
+from typing import List, Optional, Tuple
 import structlog
 
-from schemas.subscription import ExportRequest, ExportResponse
+from schemas.subscription import (
+    ExportRequest,
+    ExportResponse,
+    ExportFilters,
+    ExportJobResponse,
+    ExportJobListResponse,
+)
 from services.subscription_service import get_subscription_service
-from services.analyzer_service import AnalyzerService
+from services.field_selection import InvalidFieldsError
+from services.export_service import (
+    FILE_EXTENSIONS,
+    MEDIA_TYPES,
+    PYARROW_AVAILABLE,
+    resolve_columns,
+    stream_export,
+)
+from services.export_jobs import (
+    JOB_FORMATS,
+    STATUS_SUCCEEDED,
+    ExportJob,
+    ExportJobLimitError,
+    get_export_job_manager,
+)
+from services.report_service import REPORTLAB_AVAILABLE
 
 logger = structlog.get_logger(__name__)
 
@@ -28,7 +51,6 @@ router = APIRouter(
 
 # Services
 subscription_service = get_subscription_service()
-analyzer_service = AnalyzerService()
 
 
 def check_premium_access(user_id: str):
@@ -52,59 +74,100 @@ def check_premium_access(user_id: str):
         )
 
 
-def format_csv_data(data: List[Dict[str, Any]]) -> str:
+def _parse_export_request(
+    export_format: str,
+    request: ExportRequest,
+) -> Tuple[ExportFilters, List[str]]:
+    """
+    Validate export filters/fields and format availability
+
+    Args:
+        export_format: "csv", "arrow", "parquet" or "pdf"
+        request: Export request with filters and fields
+
+    Returns:
+        Tuple of (filters, columns)
+
+    Raises:
+        HTTPException: 400 for invalid filters/fields, 501 if the format's
+            optional dependency is missing
+    """
+    try:
+        filters = ExportFilters(**(request.filters or {}))
+        columns = resolve_columns(request.fields)
+    except (ValidationError, InvalidFieldsError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if export_format in ("arrow", "parquet") and not PYARROW_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="pyarrow is not installed; Arrow/Parquet export is unavailable",
+        )
+    if export_format == "pdf" and not REPORTLAB_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="reportlab is not installed; PDF reports are unavailable",
+        )
+
+    return filters, columns
+
+
+def _stream_export(
+    export_format: str,
+    request: ExportRequest,
+    user_id: Optional[str],
+) -> StreamingResponse:
     """
-    Format data as CSV string
+    Validate an export request and stream the filtered transactions
 
     Args:
-        data: List of transaction records
+        export_format: "csv", "arrow" or "parquet"
+        request: Export request with filters and fields
+        user_id: User ID from header
 
     Returns:
-        CSV formatted string
-    """
-    if not data:
-        return ""
-
-    # Create CSV in memory
-    output = io.StringIO()
-
-    # Define field order for CSV
-    fieldnames = [
-        "지역명",
-        "아파트명",
-        "거래금액",
-        "전용면적",
-        "계약년월",
-        "계약일",
-        "층",
-        "건축년도",
-        "도로명",
-    ]
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for record in data:
-        row = {
-            "지역명": record.get("_region_name", ""),
-            "아파트명": record.get("아파트", ""),
-            "거래금액": record.get("_deal_amount_numeric", ""),
-            "전용면적": record.get("전용면적", ""),
-            "계약년월": record.get("_year_month", ""),
-            "계약일": record.get("_deal_day", ""),
-            "층": record.get("층", ""),
-            "건축년도": record.get("건축년도", ""),
-            "도로명": record.get("도로명", ""),
-        }
-        writer.writerow(row)
-
-    return output.getvalue()
+        Streaming response producing the export file
+    """
+    user_id = user_id or "demo_user"
+
+    # Check premium access
+    check_premium_access(user_id)
+
+    filters, columns = _parse_export_request(export_format, request)
+
+    logger.info(
+        f"{export_format}_export_requested",
+        user_id=user_id,
+        filters=filters.model_dump(exclude_none=True),
+        columns=len(columns),
+    )
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"apartment_data_{timestamp}.{FILE_EXTENSIONS[export_format]}"
+
+    return StreamingResponse(
+        stream_export(export_format, filters, columns),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+        },
+    )
 
 
 @router.post(
     "/csv",
     summary="Export data to CSV",
-    description="Export transaction data to CSV format (Premium only)",
+    description="""
+    Export filtered transaction data to CSV (Premium only).
+
+    filters: start_date, end_date (YYYY-MM-DD), region (partial match),
+    api_type (api_01 ~ api_04). fields: subset of export columns.
+    Rows are streamed in chunks, so memory use does not grow with the
+    export size.
+    """,
 )
 async def export_csv(
     request: ExportRequest,
@@ -121,96 +184,309 @@ async def export_csv(
         CSV file as streaming response
     """
     try:
-        user_id = user_id or "demo_user"
+        return _stream_export("csv", request, user_id)
 
-        # Check premium access
-        check_premium_access(user_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("csv_export_error", user_id=user_id, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to export CSV: {str(e)}",
+        )
 
-        logger.info("csv_export_requested", user_id=user_id, filters=request.filters)
-
-        # Get data from analyzer
-        # For now, use basic stats data as sample
-        result, metadata = analyzer_service.get_basic_stats()
-
-        # In production, this would fetch filtered transaction data
-        # For now, create sample data
-        sample_data = [
-            {
-                "_region_name": "강남구",
-                "아파트": "래미안대치팰리스",
-                "_deal_amount_numeric": 250000,
-                "전용면적": 84.9,
-                "_year_month": "2023-12",
-                "_deal_day": "15",
-                "층": "10",
-                "건축년도": "2010",
-                "도로명": "대치동",
-            },
-            {
-                "_region_name": "송파구",
-                "아파트": "헬리오시티",
-                "_deal_amount_numeric": 180000,
-                "전용면적": 74.5,
-                "_year_month": "2023-12",
-                "_deal_day": "20",
-                "층": "15",
-                "건축년도": "2019",
-                "도로명": "위례성대로",
-            },
-        ]
 
-        # Generate CSV
-        csv_content = format_csv_data(sample_data)
+@router.post(
+    "/parquet",
+    summary="Export data to Parquet",
+    description="""
+    Export filtered transaction data to Parquet (Premium only).
+    Accepts the same filters/fields as /csv; each batch of rows is
+    written as one row group.
+    """,
+)
+async def export_parquet(
+    request: ExportRequest,
+    user_id: str = Header(None, alias="X-User-Id"),
+):
+    """
+    Export data to Parquet
+
+    Args:
+        request: Export request with filters
+        user_id: User ID from header
+
+    Returns:
+        Parquet file as streaming response
+    """
+    try:
+        return _stream_export("parquet", request, user_id)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("parquet_export_error", user_id=user_id, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to export Parquet: {str(e)}",
+        )
+
+
+@router.post(
+    "/arrow",
+    summary="Export data to Arrow IPC stream",
+    description="""
+    Export filtered transaction data as an Arrow IPC stream (Premium only).
+    Accepts the same filters/fields as /csv; read with
+    pyarrow.ipc.open_stream.
+    """,
+)
+async def export_arrow(
+    request: ExportRequest,
+    user_id: str = Header(None, alias="X-User-Id"),
+):
+    """
+    Export data to Arrow IPC stream
+
+    Args:
+        request: Export request with filters
+        user_id: User ID from header
+
+    Returns:
+        Arrow IPC stream as streaming response
+    """
+    try:
+        return _stream_export("arrow", request, user_id)
 
-        # Create filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"apartment_data_{timestamp}.csv"
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("arrow_export_error", user_id=user_id, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to export Arrow: {str(e)}",
+        )
 
-        logger.info(
-            "csv_export_completed",
+
+def _submit_job(
+    export_format: str,
+    request: ExportRequest,
+    user_id: str,
+) -> ExportJob:
+    """
+    Validate an export request and queue it on the export worker pool
+
+    Args:
+        export_format: One of JOB_FORMATS
+        request: Export request with filters and fields
+        user_id: User ID
+
+    Returns:
+        The queued job
+    """
+    if export_format not in JOB_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown export_type: {export_format} (available: {', '.join(JOB_FORMATS)})",
+        )
+
+    filters, _ = _parse_export_request(export_format, request)
+
+    try:
+        return get_export_job_manager().submit(
             user_id=user_id,
-            filename=filename,
-            rows=len(sample_data),
+            export_format=export_format,
+            filters=filters,
+            fields=request.fields,
+        )
+    except ExportJobLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
         )
 
-        # Return as streaming response
-        return StreamingResponse(
-            io.StringIO(csv_content),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-            },
+
+def _job_payload(job: ExportJob) -> dict:
+    """Job status with status/download links"""
+    payload = job.to_dict()
+    payload["status_url"] = f"{router.prefix}/jobs/{job.job_id}"
+    payload["download_url"] = (
+        f"{router.prefix}/jobs/{job.job_id}/download"
+        if job.status == STATUS_SUCCEEDED else None
+    )
+    return payload
+
+
+def _get_user_job(job_id: str, user_id: str) -> ExportJob:
+    job = get_export_job_manager().get_job(job_id, user_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export job not found: {job_id}",
         )
+    return job
+
+
+@router.post(
+    "/jobs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a background export job",
+    description="""
+    Queue an export (csv, parquet, arrow or pdf) on the background export
+    worker pool (Premium only). Poll GET /jobs/{job_id} and download the
+    file from GET /jobs/{job_id}/download once status is "succeeded".
+
+    Each user may have at most EXPORT_JOB_MAX_PER_USER queued or running
+    jobs; further submissions return 429.
+    """,
+)
+async def submit_export_job(
+    request: ExportRequest,
+    user_id: str = Header(None, alias="X-User-Id"),
+) -> ExportJobResponse:
+    """
+    Submit an export job
+
+    Args:
+        request: Export request (export_type selects the format)
+        user_id: User ID from header
+
+    Returns:
+        Queued job status
+    """
+    try:
+        user_id = user_id or "demo_user"
+
+        # Check premium access
+        check_premium_access(user_id)
+
+        job = _submit_job(request.export_type, request, user_id)
+        return ExportJobResponse(success=True, data=_job_payload(job))
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("csv_export_error", user_id=user_id, error=str(e))
+        logger.error("export_job_submit_error", user_id=user_id, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to export CSV: {str(e)}",
+            detail=f"Failed to submit export job: {str(e)}",
         )
 
 
+@router.get(
+    "/jobs",
+    response_model=ExportJobListResponse,
+    summary="List export jobs",
+    description="List the current user's export jobs, newest first",
+)
+async def list_export_jobs(
+    user_id: str = Header(None, alias="X-User-Id"),
+) -> ExportJobListResponse:
+    """
+    List export jobs
+
+    Args:
+        user_id: User ID from header
+
+    Returns:
+        User's export jobs
+    """
+    user_id = user_id or "demo_user"
+    jobs = get_export_job_manager().list_jobs(user_id)
+    return ExportJobListResponse(success=True, data=[_job_payload(job) for job in jobs])
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ExportJobResponse,
+    summary="Get export job status",
+    responses={404: {"description": "Job not found"}},
+)
+async def get_export_job(
+    job_id: str,
+    user_id: str = Header(None, alias="X-User-Id"),
+) -> ExportJobResponse:
+    """
+    Get export job status
+
+    Args:
+        job_id: Export job ID
+        user_id: User ID from header
+
+    Returns:
+        Job status, timing and download link when finished
+    """
+    job = _get_user_job(job_id, user_id or "demo_user")
+    return ExportJobResponse(success=True, data=_job_payload(job))
+
+
+@router.get(
+    "/jobs/{job_id}/download",
+    summary="Download export job result",
+    responses={
+        404: {"description": "Job not found"},
+        409: {"description": "Job has not succeeded"},
+        410: {"description": "Result file expired"},
+    },
+)
+async def download_export_job(
+    job_id: str,
+    user_id: str = Header(None, alias="X-User-Id"),
+):
+    """
+    Download the file produced by a finished export job
+
+    Args:
+        job_id: Export job ID
+        user_id: User ID from header
+
+    Returns:
+        Result file
+    """
+    job = _get_user_job(job_id, user_id or "demo_user")
+
+    if job.status != STATUS_SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export job is {job.status}" + (f": {job.error}" if job.error else ""),
+        )
+
+    path = get_export_job_manager().result_path(job)
+    if not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export result has expired",
+        )
+
+    media_type = "application/pdf" if job.export_format == "pdf" else MEDIA_TYPES[job.export_format]
+    return FileResponse(path, media_type=media_type, filename=job.filename)
+
+
 @router.post(
     "/pdf",
     response_model=ExportResponse,
-    summary="Export data to PDF",
-    description="Export analysis report to PDF format (Premium only, mock for now)",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Export analysis report to PDF",
+    description="""
+    Queue a PDF analysis report (summary statistics, monthly trend and
+    regional comparison) on the background export worker pool
+    (Premium only). Equivalent to POST /jobs with export_type "pdf".
+    """,
 )
 async def export_pdf(
     request: ExportRequest,
     user_id: str = Header(None, alias="X-User-Id"),
 ) -> ExportResponse:
     """
-    Export data to PDF (mock implementation)
+    Export analysis report to PDF
 
     Args:
         request: Export request with filters
         user_id: User ID from header
 
     Returns:
-        Export response with mock data
+        Export response with the job ID and download URL
     """
     try:
         user_id = user_id or "demo_user"
@@ -220,21 +496,14 @@ async def export_pdf(
 
         logger.info("pdf_export_requested", user_id=user_id, filters=request.filters)
 
-        # Mock PDF generation
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"analysis_report_{timestamp}.pdf"
-
-        logger.info(
-            "pdf_export_mock_completed",
-            user_id=user_id,
-            filename=filename,
-        )
+        job = _submit_job("pdf", request, user_id)
 
         return ExportResponse(
             success=True,
-            download_url=None,
-            filename=filename,
-            message="PDF 생성 중입니다. 실제 PDF 생성 기능은 추후 구현됩니다.",
+            download_url=f"{router.prefix}/jobs/{job.job_id}/download",
+            filename=job.filename,
+            message="PDF 리포트 생성 작업이 등록되었습니다. 작업 상태를 확인한 후 다운로드하세요.",
+            job_id=job.job_id,
         )
 
     except HTTPException:
@@ -8,12 +8,20 @@ from typing import Dict, Optional
 from datetime import datetime
 import structlog
 import os
+import json
 import asyncio
 
-from backend.db.session import get_db_session
-from backend.cache.redis_client import get_redis_client
+from sqlalchemy import text
+from backend.db.session import get_session_direct
+from services.warmup import get_warmup_state
 import requests
 
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["health"])
@@ -48,6 +56,38 @@ class DetailedHealthStatus(BaseModel):
 # Track application start time
 APP_START_TIME = datetime.now()
 
+# Redis hash where the collectors publish MOLIT API circuit breaker state
+# (one field per endpoint and process, see retry_policy.CIRCUIT_STATE_KEY)
+CIRCUIT_STATE_KEY = "apt_insights:circuit_breakers"
+
+# An entry is current for its breaker's reset window (entries published
+# before reset_timeout was included fall back to this); entries untouched
+# for CIRCUIT_STATE_PRUNE_SECONDS are dead processes and get removed
+CIRCUIT_BREAKER_RESET_SECONDS = float(os.getenv("CIRCUIT_BREAKER_RESET_SECONDS", "30"))
+CIRCUIT_STATE_PRUNE_SECONDS = 3600
+
+_redis_client = None
+
+
+def get_redis_client():
+    """
+    Redis client for health checks
+
+    Returns:
+        Redis client, or None when Redis is disabled
+    """
+    global _redis_client
+    if not (REDIS_AVAILABLE and os.getenv('USE_REDIS', 'False').lower() == 'true'):
+        return None
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _redis_client
+
 
 @router.get("/health", response_model=HealthStatus)
 async def health_check():
@@ -74,6 +114,7 @@ async def detailed_health_check():
     - Database connectivity
     - Redis connectivity
     - External API availability (Korean Ministry of Land)
+    - MOLIT API circuit breakers reported by the data collectors
 
     Returns:
         200: All dependencies healthy
@@ -85,6 +126,7 @@ async def detailed_health_check():
         "database": await check_database(),
         "redis": await check_redis(),
         "external_api": await check_external_api(),
+        "api_circuit_breakers": await check_circuit_breakers(),
     }
 
     # Determine overall status
@@ -122,9 +164,9 @@ async def check_database() -> DependencyStatus:
     start_time = datetime.now()
 
     try:
-        db = next(get_db_session())
+        db = get_session_direct()
         # Simple query to check connection
-        db.execute("SELECT 1")
+        db.execute(text("SELECT 1"))
         db.close()
 
         latency = (datetime.now() - start_time).total_seconds() * 1000
@@ -219,15 +261,104 @@ async def check_external_api() -> DependencyStatus:
         )
 
 
+async def check_circuit_breakers() -> DependencyStatus:
+    """
+    Check MOLIT API circuit breakers
+
+    The collectors (sync/async API clients) publish each breaker state change
+    to Redis, so this reflects every collector process, not just this one.
+    Each entry only counts for its breaker's reset window: an open breaker
+    moves on by then, so an older entry no longer describes the process.
+    """
+    redis_client = get_redis_client()
+
+    if not redis_client:
+        return DependencyStatus(
+            status="disabled",
+            details={"message": "Redis not configured (breaker state is shared through Redis)"},
+        )
+
+    try:
+        raw = await asyncio.to_thread(redis_client.hgetall, CIRCUIT_STATE_KEY)
+
+        now = datetime.now()
+        breakers = {}
+        stale = 0
+        expired = []
+        for field, value in raw.items():
+            state = json.loads(value)
+            try:
+                age = (now - datetime.fromisoformat(state["updated_at"])).total_seconds()
+            except (KeyError, TypeError, ValueError):
+                age = float("inf")
+            if age > CIRCUIT_STATE_PRUNE_SECONDS:
+                expired.append(field)
+            if age > state.get("reset_timeout", CIRCUIT_BREAKER_RESET_SECONDS):
+                stale += 1
+                continue
+            breakers[field] = {
+                "endpoint": state.get("endpoint"),
+                "process": state.get("process"),
+                "state": state.get("state"),
+                "consecutive_failures": state.get("consecutive_failures"),
+                "retry_after_seconds": state.get("retry_after_seconds"),
+                "opens": state.get("opens"),
+                "rejected": state.get("rejected"),
+                "updated_at": state.get("updated_at"),
+            }
+
+        if expired:
+            await asyncio.to_thread(redis_client.hdel, CIRCUIT_STATE_KEY, *expired)
+
+        not_closed = [name for name, state in breakers.items() if state["state"] != "closed"]
+
+        return DependencyStatus(
+            status="degraded" if not_closed else "healthy",
+            details={
+                "open": len(not_closed),
+                "stale": stale,
+                "breakers": breakers,
+            },
+        )
+    except Exception as e:
+        logger.warning("circuit_breaker_health_check_failed", error=str(e))
+        return DependencyStatus(
+            status="degraded",
+            error=str(e),
+            details={"message": "Circuit breaker state unavailable"},
+        )
+
+
 @router.get("/health/ready")
 async def readiness_check():
     """
     Readiness probe for Kubernetes/load balancers
 
+    Reports ready only after the startup warmup (dataset preload,
+    index build, warmup queries) has finished.
+
     Returns:
         200: Service is ready to receive traffic
         503: Service is not ready
     """
+    # Block traffic until the worker is warm
+    warmup_state = get_warmup_state()
+    if not warmup_state.is_ready:
+        if warmup_state.status != "failed":
+            reason = "warming_up"
+        elif warmup_state.next_retry_at:
+            reason = "warmup_retrying"
+        else:
+            reason = "warmup_failed"
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "not_ready",
+                "reason": reason,
+                "warmup": warmup_state.to_dict(),
+            },
+        )
+
     # Check critical dependencies
     db_status = await check_database()
 
@@ -237,7 +368,12 @@ async def readiness_check():
             detail={"status": "not_ready", "reason": "database_unavailable"},
         )
 
-    return {"status": "ready", "timestamp": datetime.now().isoformat()}
+    return {
+        "status": "ready",
+        "timestamp": datetime.now().isoformat(),
+        "warmup_duration_ms": warmup_state.duration_ms,
+        "warmup_retries": warmup_state.retries,
+    }
 
 
 @router.get("/health/live")
@@ -5,15 +5,30 @@ Provides jeonse ratio, gap investment, and bargain sales detection
 import time
 from datetime import datetime
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, status, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from schemas.requests import (
     JeonseRatioRequest,
     GapInvestmentRequest,
     BargainSalesRequest,
+    BargainSalesPageRequest,
+)
+from schemas.responses import StandardResponse
+from schemas.fast_response import build_fast_response
+from services.analyzer_service import get_analyzer_service
+from services.request_deadline import run_analysis
+from services.field_selection import InvalidFieldsError, parse_fields_param
+from services.pagination import (
+    NDJSON_MEDIA_TYPE,
+    BARGAIN_CURSOR,
+    InvalidCursorError,
+    build_page,
+    decode_cursor,
+    iter_ndjson,
 )
-from schemas.responses import StandardResponse, MetaData
-from services.analyzer_service import AnalyzerService
 
 logger = structlog.get_logger(__name__)
 
@@ -28,7 +43,7 @@ router = APIRouter(
 )
 
 # Initialize analyzer service (singleton)
-analyzer_service = AnalyzerService()
+analyzer_service = get_analyzer_service()
 
 
 @router.post(
@@ -50,12 +65,16 @@ analyzer_service = AnalyzerService()
     Low ratio (<60%) suggests weak rental market.
     """,
 )
-async def calculate_jeonse_ratio(request: JeonseRatioRequest) -> StandardResponse:
+async def calculate_jeonse_ratio(
+    request: JeonseRatioRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Calculate jeonse ratio statistics
 
     Args:
         request: JeonseRatioRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with jeonse ratio data
@@ -71,7 +90,10 @@ async def calculate_jeonse_ratio(request: JeonseRatioRequest) -> StandardRespons
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_jeonse_ratio(
+        result, metadata = await run_analysis(
+            http_request,
+            "jeonse_ratio",
+            analyzer_service.get_jeonse_ratio,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -80,18 +102,11 @@ async def calculate_jeonse_ratio(request: JeonseRatioRequest) -> StandardRespons
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "jeonse_ratio_error",
@@ -127,12 +142,16 @@ async def calculate_jeonse_ratio(request: JeonseRatioRequest) -> StandardRespons
     Typical good gap ratio: 70-80% (jeonse ratio)
     """,
 )
-async def analyze_gap_investment(request: GapInvestmentRequest) -> StandardResponse:
+async def analyze_gap_investment(
+    request: GapInvestmentRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze gap investment opportunities
 
     Args:
         request: GapInvestmentRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with gap investment data
@@ -149,7 +168,10 @@ async def analyze_gap_investment(request: GapInvestmentRequest) -> StandardRespo
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_gap_investment(
+        result, metadata = await run_analysis(
+            http_request,
+            "gap_investment",
+            analyzer_service.get_gap_investment,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -159,18 +181,11 @@ async def analyze_gap_investment(request: GapInvestmentRequest) -> StandardRespo
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "gap_investment_error",
@@ -206,12 +221,21 @@ async def analyze_gap_investment(request: GapInvestmentRequest) -> StandardRespo
     Note: Low price may indicate issues (defects, disputes, etc.)
     """,
 )
-async def detect_bargain_sales(request: BargainSalesRequest) -> StandardResponse:
+async def detect_bargain_sales(
+    request: BargainSalesRequest,
+    http_request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to compute (stats, by_region, bargain_items, recent_bargains); all when omitted",
+    ),
+) -> StandardResponse:
     """
     Detect bargain sales opportunities
 
     Args:
         request: BargainSalesRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
+        fields: Comma-separated response sections to compute
 
     Returns:
         StandardResponse with bargain sales data
@@ -225,31 +249,34 @@ async def detect_bargain_sales(request: BargainSalesRequest) -> StandardResponse
             start_date=request.start_date,
             end_date=request.end_date,
             threshold_pct=request.threshold_pct,
+            fields=fields,
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_bargain_sales(
+        result, metadata = await run_analysis(
+            http_request,
+            "bargain_sales",
+            analyzer_service.get_bargain_sales,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
             threshold_pct=request.threshold_pct,
+            fields=parse_fields_param(fields),
         )
 
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
+    except HTTPException:
+        raise
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
-
     except Exception as e:
         logger.error(
             "bargain_sales_error",
@@ -260,3 +287,138 @@ async def detect_bargain_sales(request: BargainSalesRequest) -> StandardResponse
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to detect bargain sales: {str(e)}",
         )
+
+
+@router.post(
+    "/bargain-sales/page",
+    response_model=StandardResponse,
+    summary="Detect bargain sales (cursor paginated)",
+    description="""
+    Cursor-paginated variant of /bargain-sales.
+    Rows are returned in a stable sort order; pass the returned
+    next_cursor back as cursor to fetch the following page.
+    Only the requested page is materialized per request.
+    """,
+)
+async def detect_bargain_sales_page(
+    request: BargainSalesPageRequest,
+    http_request: Request,
+) -> StandardResponse:
+    """
+    Fetch one cursor page of bargain sales
+
+    Args:
+        request: BargainSalesPageRequest with filters, cursor and limit
+        http_request: Raw request (deadline header, disconnect detection)
+
+    Returns:
+        StandardResponse with items, next_cursor and has_more
+    """
+    start_time = time.time()
+
+    try:
+        logger.info(
+            "detect_bargain_sales_page_request",
+            region_filter=request.region_filter,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            cursor=request.cursor,
+            limit=request.limit,
+        )
+
+        after = decode_cursor(request.cursor, BARGAIN_CURSOR)
+
+        # Fetch one extra row to detect whether another page exists
+        def fetch_page():
+            rows, metadata = analyzer_service.iter_bargain_sales(
+                region_filter=request.region_filter,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                threshold_pct=request.threshold_pct,
+                after=after,
+                limit=request.limit + 1,
+            )
+            return build_page(rows, request.limit), metadata
+
+        page, metadata = await run_analysis(http_request, "bargain_sales_page", fetch_page)
+
+        # Calculate processing time
+        processing_time = (time.time() - start_time) * 1000
+
+        return build_fast_response(page, metadata, processing_time)
+
+    except HTTPException:
+        raise
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(
+            "detect_bargain_sales_page_error",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to paginate bargain sales: {str(e)}",
+        )
+
+
+@router.post(
+    "/bargain-sales/stream",
+    summary="Detect bargain sales (NDJSON stream)",
+    description="""
+    Streaming variant of /bargain-sales.
+    Returns every row as application/x-ndjson (one JSON object per line),
+    in the same order as the paginated variant. Rows are serialized as
+    they are produced, so the full list is never built in memory.
+    """,
+    response_class=StreamingResponse,
+)
+async def detect_bargain_sales_stream(request: BargainSalesRequest) -> StreamingResponse:
+    """
+    Stream all bargain sales as NDJSON
+
+    Args:
+        request: BargainSalesRequest with optional filters
+
+    Returns:
+        StreamingResponse of newline-delimited JSON rows
+    """
+    try:
+        logger.info(
+            "detect_bargain_sales_stream_request",
+            region_filter=request.region_filter,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+
+        rows, metadata = await run_in_threadpool(
+            analyzer_service.iter_bargain_sales,
+            region_filter=request.region_filter,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            threshold_pct=request.threshold_pct,
+        )
+
+        return StreamingResponse(
+            iter_ndjson(rows),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={
+                "X-Total-Records": str(metadata["total_records"]),
+                "X-Filtered-Records": str(metadata["filtered_records"]),
+            },
+        )
+
+    except Exception as e:
+        logger.error(
+            "detect_bargain_sales_stream_error",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream bargain sales: {str(e)}",
+        )
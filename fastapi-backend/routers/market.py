@@ -5,7 +5,7 @@ Provides market signals, trend analysis, and period comparisons
 import time
 from datetime import datetime
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Request
 
 from schemas.requests import (
     RentVsJeonseRequest,
@@ -17,8 +17,10 @@ from schemas.requests import (
     ComparePeriodRequest,
     MarketSignalsRequest,
 )
-from schemas.responses import StandardResponse, MetaData
-from services.analyzer_service import AnalyzerService
+from schemas.responses import StandardResponse
+from schemas.fast_response import build_fast_response
+from services.analyzer_service import get_analyzer_service
+from services.request_deadline import run_analysis
 
 logger = structlog.get_logger(__name__)
 
@@ -33,7 +35,7 @@ router = APIRouter(
 )
 
 # Initialize analyzer service (singleton)
-analyzer_service = AnalyzerService()
+analyzer_service = get_analyzer_service()
 
 
 @router.post(
@@ -55,12 +57,16 @@ analyzer_service = AnalyzerService()
     - Investor caution
     """,
 )
-async def analyze_rent_vs_jeonse(request: RentVsJeonseRequest) -> StandardResponse:
+async def analyze_rent_vs_jeonse(
+    request: RentVsJeonseRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze rent vs jeonse distribution
 
     Args:
         request: RentVsJeonseRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with rent vs jeonse data
@@ -76,7 +82,10 @@ async def analyze_rent_vs_jeonse(request: RentVsJeonseRequest) -> StandardRespon
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_rent_vs_jeonse(
+        result, metadata = await run_analysis(
+            http_request,
+            "rent_vs_jeonse",
+            analyzer_service.get_rent_vs_jeonse,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -85,18 +94,11 @@ async def analyze_rent_vs_jeonse(request: RentVsJeonseRequest) -> StandardRespon
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "rent_vs_jeonse_error",
@@ -124,12 +126,16 @@ async def analyze_rent_vs_jeonse(request: RentVsJeonseRequest) -> StandardRespon
     Returns distribution and trends.
     """,
 )
-async def analyze_dealing_type(request: DealingTypeRequest) -> StandardResponse:
+async def analyze_dealing_type(
+    request: DealingTypeRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze dealing type distribution
 
     Args:
         request: DealingTypeRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with dealing type data
@@ -145,7 +151,10 @@ async def analyze_dealing_type(request: DealingTypeRequest) -> StandardResponse:
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_dealing_type(
+        result, metadata = await run_analysis(
+            http_request,
+            "dealing_type",
+            analyzer_service.get_dealing_type,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -154,18 +163,11 @@ async def analyze_dealing_type(request: DealingTypeRequest) -> StandardResponse:
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "dealing_type_error",
@@ -194,12 +196,16 @@ async def analyze_dealing_type(request: DealingTypeRequest) -> StandardResponse:
     Returns distribution by transaction type.
     """,
 )
-async def analyze_buyer_seller_type(request: BuyerSellerTypeRequest) -> StandardResponse:
+async def analyze_buyer_seller_type(
+    request: BuyerSellerTypeRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze buyer and seller type distribution
 
     Args:
         request: BuyerSellerTypeRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with buyer/seller type data
@@ -215,7 +221,10 @@ async def analyze_buyer_seller_type(request: BuyerSellerTypeRequest) -> Standard
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_buyer_seller_type(
+        result, metadata = await run_analysis(
+            http_request,
+            "buyer_seller_type",
+            analyzer_service.get_buyer_seller_type,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -224,18 +233,11 @@ async def analyze_buyer_seller_type(request: BuyerSellerTypeRequest) -> Standard
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "buyer_seller_type_error",
@@ -267,12 +269,16 @@ async def analyze_buyer_seller_type(request: BuyerSellerTypeRequest) -> Standard
     - Price disputes
     """,
 )
-async def analyze_cancelled_deals(request: CancelledDealsRequest) -> StandardResponse:
+async def analyze_cancelled_deals(
+    request: CancelledDealsRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze cancelled deals
 
     Args:
         request: CancelledDealsRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with cancelled deals data
@@ -288,7 +294,10 @@ async def analyze_cancelled_deals(request: CancelledDealsRequest) -> StandardRes
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_cancelled_deals(
+        result, metadata = await run_analysis(
+            http_request,
+            "cancelled_deals",
+            analyzer_service.get_cancelled_deals,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -297,18 +306,11 @@ async def analyze_cancelled_deals(request: CancelledDealsRequest) -> StandardRes
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "cancelled_deals_error",
@@ -338,12 +340,16 @@ async def analyze_cancelled_deals(request: CancelledDealsRequest) -> StandardRes
     Useful for monthly/quarterly reports.
     """,
 )
-async def summarize_period(request: PeriodSummaryRequest) -> StandardResponse:
+async def summarize_period(
+    request: PeriodSummaryRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Generate period summary
 
     Args:
         request: PeriodSummaryRequest with date range
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with period summary data
@@ -359,7 +365,10 @@ async def summarize_period(request: PeriodSummaryRequest) -> StandardResponse:
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_period_summary(
+        result, metadata = await run_analysis(
+            http_request,
+            "period_summary",
+            analyzer_service.get_period_summary,
             start_date=request.start_date,
             end_date=request.end_date,
             region_filter=request.region_filter,
@@ -368,18 +377,11 @@ async def summarize_period(request: PeriodSummaryRequest) -> StandardResponse:
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "period_summary_error",
@@ -405,12 +407,16 @@ async def summarize_period(request: PeriodSummaryRequest) -> StandardResponse:
     Useful for period-over-period comparisons.
     """,
 )
-async def build_baseline_summary(request: BaselineSummaryRequest) -> StandardResponse:
+async def build_baseline_summary(
+    request: BaselineSummaryRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Build baseline summary from previous period
 
     Args:
         request: BaselineSummaryRequest with date range
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with baseline summary data
@@ -426,7 +432,10 @@ async def build_baseline_summary(request: BaselineSummaryRequest) -> StandardRes
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_baseline_summary(
+        result, metadata = await run_analysis(
+            http_request,
+            "baseline_summary",
+            analyzer_service.get_baseline_summary,
             start_date=request.start_date,
             end_date=request.end_date,
             region_filter=request.region_filter,
@@ -435,18 +444,11 @@ async def build_baseline_summary(request: BaselineSummaryRequest) -> StandardRes
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "baseline_summary_error",
@@ -478,12 +480,16 @@ async def build_baseline_summary(request: BaselineSummaryRequest) -> StandardRes
     - Seasonal trend detection
     """,
 )
-async def compare_periods(request: ComparePeriodRequest) -> StandardResponse:
+async def compare_periods(
+    request: ComparePeriodRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Compare two time periods
 
     Args:
         request: ComparePeriodRequest with two date ranges
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with period comparison data
@@ -501,7 +507,10 @@ async def compare_periods(request: ComparePeriodRequest) -> StandardResponse:
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_period_comparison(
+        result, metadata = await run_analysis(
+            http_request,
+            "period_comparison",
+            analyzer_service.get_period_comparison,
             current_start_date=request.current_start_date,
             current_end_date=request.current_end_date,
             previous_start_date=request.previous_start_date,
@@ -514,18 +523,11 @@ async def compare_periods(request: ComparePeriodRequest) -> StandardResponse:
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "compare_periods_error",
@@ -560,12 +562,16 @@ async def compare_periods(request: ComparePeriodRequest) -> StandardResponse:
     - High jeonse ratio (>85%)
     """,
 )
-async def detect_market_signals(request: MarketSignalsRequest) -> StandardResponse:
+async def detect_market_signals(
+    request: MarketSignalsRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Detect market signals
 
     Args:
         request: MarketSignalsRequest with date range
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with market signals data
@@ -581,7 +587,10 @@ async def detect_market_signals(request: MarketSignalsRequest) -> StandardRespon
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_market_signals(
+        result, metadata = await run_analysis(
+            http_request,
+            "market_signals",
+            analyzer_service.get_market_signals,
             start_date=request.start_date,
             end_date=request.end_date,
             region_filter=request.region_filter,
@@ -590,18 +599,11 @@ async def detect_market_signals(request: MarketSignalsRequest) -> StandardRespon
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "market_signals_error",
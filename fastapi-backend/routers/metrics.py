@@ -63,6 +63,20 @@ analysis_duration_seconds = Histogram(
     registry=registry,
 )
 
+analysis_cancelled_total = Counter(
+    "analysis_cancelled_total",
+    "Analyses aborted at a cancellation checkpoint",
+    ["analysis_type", "reason"],
+    registry=registry,
+)
+
+analysis_work_avoided_seconds_total = Counter(
+    "analysis_work_avoided_seconds_total",
+    "Estimated analysis time saved by cancellation (average duration minus elapsed)",
+    ["analysis_type"],
+    registry=registry,
+)
+
 cache_hits_total = Counter(
     "cache_hits_total",
     "Total cache hits",
@@ -105,6 +119,81 @@ external_api_duration_seconds = Histogram(
     registry=registry,
 )
 
+export_rows_total = Counter(
+    "export_rows_total",
+    "Total rows written by data exports",
+    ["format"],
+    registry=registry,
+)
+
+export_duration_seconds = Histogram(
+    "export_duration_seconds",
+    "Time spent streaming data exports",
+    ["format"],
+    registry=registry,
+)
+
+export_rows_per_second = Histogram(
+    "export_rows_per_second",
+    "Export throughput in rows per second",
+    ["format"],
+    buckets=(1000, 5000, 10000, 25000, 50000, 100000, 250000, 500000, 1000000),
+    registry=registry,
+)
+
+export_jobs_total = Counter(
+    "export_jobs_total",
+    "Export jobs by format and outcome",
+    ["format", "status"],
+    registry=registry,
+)
+
+export_job_queue_wait_seconds = Histogram(
+    "export_job_queue_wait_seconds",
+    "Time export jobs spend queued before a worker picks them up",
+    ["format"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+    registry=registry,
+)
+
+export_job_run_seconds = Histogram(
+    "export_job_run_seconds",
+    "Time workers spend rendering export jobs",
+    ["format"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800),
+    registry=registry,
+)
+
+# Admission control (load shedding per endpoint class)
+admission_in_flight = Gauge(
+    "admission_in_flight",
+    "Requests currently admitted per endpoint class",
+    ["endpoint_class"],
+    registry=registry,
+)
+
+admission_queue_depth = Gauge(
+    "admission_queue_depth",
+    "Requests waiting for an admission slot per endpoint class",
+    ["endpoint_class"],
+    registry=registry,
+)
+
+admission_queue_wait_seconds = Histogram(
+    "admission_queue_wait_seconds",
+    "Time requests waited for an admission slot",
+    ["endpoint_class"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+    registry=registry,
+)
+
+admission_rejected_total = Counter(
+    "admission_rejected_total",
+    "Requests shed with 503 by admission control",
+    ["endpoint_class", "reason"],
+    registry=registry,
+)
+
 # Active connections/sessions
 active_connections = Gauge(
     "active_connections",
@@ -182,6 +271,12 @@ def record_analysis_duration(analysis_type: str, duration_seconds: float):
     analysis_duration_seconds.labels(analysis_type=analysis_type).observe(duration_seconds)
 
 
+def record_analysis_cancelled(analysis_type: str, reason: str, avoided_seconds: float):
+    """Record a cancelled analysis and the work it avoided"""
+    analysis_cancelled_total.labels(analysis_type=analysis_type, reason=reason).inc()
+    analysis_work_avoided_seconds_total.labels(analysis_type=analysis_type).inc(avoided_seconds)
+
+
 def record_cache_hit(cache_type: str = "redis"):
     """Record a cache hit"""
     cache_hits_total.labels(cache_type=cache_type).inc()
@@ -204,6 +299,44 @@ def record_external_api_request(api_name: str, status: str, duration_seconds: fl
     external_api_duration_seconds.labels(api_name=api_name).observe(duration_seconds)
 
 
+def record_export(export_format: str, rows: int, duration_seconds: float):
+    """Record a completed data export"""
+    export_rows_total.labels(format=export_format).inc(rows)
+    export_duration_seconds.labels(format=export_format).observe(duration_seconds)
+    if duration_seconds > 0:
+        export_rows_per_second.labels(format=export_format).observe(rows / duration_seconds)
+
+
+def record_export_job(
+    export_format: str,
+    status: str,
+    queue_wait_seconds: float = None,
+    run_seconds: float = None,
+):
+    """Record an export job state change (submitted, rejected, succeeded, failed)"""
+    export_jobs_total.labels(format=export_format, status=status).inc()
+    if queue_wait_seconds is not None:
+        export_job_queue_wait_seconds.labels(format=export_format).observe(queue_wait_seconds)
+    if run_seconds is not None:
+        export_job_run_seconds.labels(format=export_format).observe(run_seconds)
+
+
+def update_admission_state(endpoint_class: str, in_flight: int, waiting: int):
+    """Update admission control in-flight / queue depth gauges"""
+    admission_in_flight.labels(endpoint_class=endpoint_class).set(in_flight)
+    admission_queue_depth.labels(endpoint_class=endpoint_class).set(waiting)
+
+
+def record_admission_queue_wait(endpoint_class: str, seconds: float):
+    """Record time spent waiting for an admission slot"""
+    admission_queue_wait_seconds.labels(endpoint_class=endpoint_class).observe(seconds)
+
+
+def record_admission_reject(endpoint_class: str, reason: str):
+    """Record a request shed by admission control"""
+    admission_rejected_total.labels(endpoint_class=endpoint_class, reason=reason).inc()
+
+
 def record_error(error_type: str, severity: str = "error"):
     """Record an error"""
     errors_total.labels(error_type=error_type, severity=severity).inc()
@@ -5,7 +5,8 @@ Provides price per area and premium analysis endpoints
 import time
 from datetime import datetime
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, status, Request
 
 from schemas.requests import (
     PricePerAreaRequest,
@@ -13,8 +14,11 @@ from schemas.requests import (
     FloorPremiumRequest,
     BuildingAgePremiumRequest,
 )
-from schemas.responses import StandardResponse, MetaData
-from services.analyzer_service import AnalyzerService
+from schemas.responses import StandardResponse
+from schemas.fast_response import build_fast_response
+from services.analyzer_service import get_analyzer_service
+from services.request_deadline import run_analysis
+from services.field_selection import InvalidFieldsError, parse_fields_param
 
 logger = structlog.get_logger(__name__)
 
@@ -29,7 +33,7 @@ router = APIRouter(
 )
 
 # Initialize analyzer service (singleton)
-analyzer_service = AnalyzerService()
+analyzer_service = get_analyzer_service()
 
 
 @router.post(
@@ -46,12 +50,21 @@ analyzer_service = AnalyzerService()
     Price per area = Total price / Exclusive area
     """,
 )
-async def calculate_price_per_area(request: PricePerAreaRequest) -> StandardResponse:
+async def calculate_price_per_area(
+    request: PricePerAreaRequest,
+    http_request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to compute (stats, by_region, by_area_range, by_build_year, top_expensive, top_affordable); all when omitted",
+    ),
+) -> StandardResponse:
     """
     Calculate price per area statistics
 
     Args:
         request: PricePerAreaRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
+        fields: Comma-separated response sections to compute
 
     Returns:
         StandardResponse with price per area data
@@ -64,30 +77,33 @@ async def calculate_price_per_area(request: PricePerAreaRequest) -> StandardResp
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
+            fields=fields,
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_price_per_area(
+        result, metadata = await run_analysis(
+            http_request,
+            "price_per_area",
+            analyzer_service.get_price_per_area,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
+            fields=parse_fields_param(fields),
         )
 
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
+    except HTTPException:
+        raise
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
-
     except Exception as e:
         logger.error(
             "price_per_area_error",
@@ -115,12 +131,16 @@ async def calculate_price_per_area(request: PricePerAreaRequest) -> StandardResp
     Useful for tracking market premium changes.
     """,
 )
-async def analyze_price_per_area_trend(request: PricePerAreaTrendRequest) -> StandardResponse:
+async def analyze_price_per_area_trend(
+    request: PricePerAreaTrendRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze price per area trend over time
 
     Args:
         request: PricePerAreaTrendRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with price per area trend data
@@ -136,7 +156,10 @@ async def analyze_price_per_area_trend(request: PricePerAreaTrendRequest) -> Sta
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_price_per_area_trend(
+        result, metadata = await run_analysis(
+            http_request,
+            "price_per_area_trend",
+            analyzer_service.get_price_per_area_trend,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -145,18 +168,11 @@ async def analyze_price_per_area_trend(request: PricePerAreaTrendRequest) -> Sta
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "price_per_area_trend_error",
@@ -183,12 +199,21 @@ async def analyze_price_per_area_trend(request: PricePerAreaTrendRequest) -> Sta
     Returns premium percentage and absolute price differences.
     """,
 )
-async def analyze_floor_premium(request: FloorPremiumRequest) -> StandardResponse:
+async def analyze_floor_premium(
+    request: FloorPremiumRequest,
+    http_request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to compute (stats, by_floor_category, by_individual_floor, royal_floor_info); all when omitted",
+    ),
+) -> StandardResponse:
     """
     Analyze floor premium
 
     Args:
         request: FloorPremiumRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
+        fields: Comma-separated response sections to compute
 
     Returns:
         StandardResponse with floor premium data
@@ -201,30 +226,33 @@ async def analyze_floor_premium(request: FloorPremiumRequest) -> StandardRespons
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
+            fields=fields,
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_floor_premium(
+        result, metadata = await run_analysis(
+            http_request,
+            "floor_premium",
+            analyzer_service.get_floor_premium,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
+            fields=parse_fields_param(fields),
         )
 
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
+    except HTTPException:
+        raise
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
-
     except Exception as e:
         logger.error(
             "floor_premium_error",
@@ -251,12 +279,21 @@ async def analyze_floor_premium(request: FloorPremiumRequest) -> StandardRespons
     Returns premium percentage relative to average.
     """,
 )
-async def analyze_building_age_premium(request: BuildingAgePremiumRequest) -> StandardResponse:
+async def analyze_building_age_premium(
+    request: BuildingAgePremiumRequest,
+    http_request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to compute (stats, by_age_range, by_build_year, rebuild_candidates); all when omitted",
+    ),
+) -> StandardResponse:
     """
     Analyze building age premium
 
     Args:
         request: BuildingAgePremiumRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
+        fields: Comma-separated response sections to compute
 
     Returns:
         StandardResponse with building age premium data
@@ -269,30 +306,33 @@ async def analyze_building_age_premium(request: BuildingAgePremiumRequest) -> St
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
+            fields=fields,
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_building_age_premium(
+        result, metadata = await run_analysis(
+            http_request,
+            "building_age_premium",
+            analyzer_service.get_building_age_premium,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
+            fields=parse_fields_param(fields),
         )
 
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
+    except HTTPException:
+        raise
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
-
     except Exception as e:
         logger.error(
             "building_age_premium_error",
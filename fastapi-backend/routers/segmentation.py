@@ -5,17 +5,30 @@ Provides apartment transaction segmentation by area, floor, build year, and apar
 import time
 from datetime import datetime
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from schemas.requests import (
     AreaAnalysisRequest,
     FloorAnalysisRequest,
     BuildYearAnalysisRequest,
     ApartmentAnalysisRequest,
+    ApartmentAnalysisPageRequest,
     ApartmentDetailRequest,
 )
-from schemas.responses import StandardResponse, MetaData
-from services.analyzer_service import AnalyzerService
+from schemas.responses import StandardResponse
+from schemas.fast_response import build_fast_response
+from services.analyzer_service import get_analyzer_service
+from services.request_deadline import run_analysis
+from services.pagination import (
+    NDJSON_MEDIA_TYPE,
+    APARTMENT_CURSOR,
+    InvalidCursorError,
+    build_page,
+    decode_cursor,
+    iter_ndjson,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -30,7 +43,7 @@ router = APIRouter(
 )
 
 # Initialize analyzer service (singleton)
-analyzer_service = AnalyzerService()
+analyzer_service = get_analyzer_service()
 
 
 @router.post(
@@ -47,12 +60,16 @@ analyzer_service = AnalyzerService()
     Supports custom area bins or automatic binning.
     """,
 )
-async def analyze_by_area(request: AreaAnalysisRequest) -> StandardResponse:
+async def analyze_by_area(
+    request: AreaAnalysisRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze transactions by area
 
     Args:
         request: AreaAnalysisRequest with optional filters and bins
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with area analysis data
@@ -69,7 +86,10 @@ async def analyze_by_area(request: AreaAnalysisRequest) -> StandardResponse:
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_area_analysis(
+        result, metadata = await run_analysis(
+            http_request,
+            "area_analysis",
+            analyzer_service.get_area_analysis,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -79,18 +99,11 @@ async def analyze_by_area(request: AreaAnalysisRequest) -> StandardResponse:
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "area_analysis_error",
@@ -117,12 +130,16 @@ async def analyze_by_area(request: AreaAnalysisRequest) -> StandardResponse:
     Includes price premium analysis by floor.
     """,
 )
-async def analyze_by_floor(request: FloorAnalysisRequest) -> StandardResponse:
+async def analyze_by_floor(
+    request: FloorAnalysisRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze transactions by floor
 
     Args:
         request: FloorAnalysisRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with floor analysis data
@@ -138,7 +155,10 @@ async def analyze_by_floor(request: FloorAnalysisRequest) -> StandardResponse:
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_floor_analysis(
+        result, metadata = await run_analysis(
+            http_request,
+            "floor_analysis",
+            analyzer_service.get_floor_analysis,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -147,18 +167,11 @@ async def analyze_by_floor(request: FloorAnalysisRequest) -> StandardResponse:
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "floor_analysis_error",
@@ -185,12 +198,16 @@ async def analyze_by_floor(request: FloorAnalysisRequest) -> StandardResponse:
     Groups buildings by construction year.
     """,
 )
-async def analyze_by_build_year(request: BuildYearAnalysisRequest) -> StandardResponse:
+async def analyze_by_build_year(
+    request: BuildYearAnalysisRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze transactions by building construction year
 
     Args:
         request: BuildYearAnalysisRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with build year analysis data
@@ -206,7 +223,10 @@ async def analyze_by_build_year(request: BuildYearAnalysisRequest) -> StandardRe
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_build_year_analysis(
+        result, metadata = await run_analysis(
+            http_request,
+            "build_year_analysis",
+            analyzer_service.get_build_year_analysis,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -215,18 +235,11 @@ async def analyze_by_build_year(request: BuildYearAnalysisRequest) -> StandardRe
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "build_year_analysis_error",
@@ -254,12 +267,16 @@ async def analyze_by_build_year(request: BuildYearAnalysisRequest) -> StandardRe
     Only includes apartments with minimum transaction count.
     """,
 )
-async def analyze_by_apartment(request: ApartmentAnalysisRequest) -> StandardResponse:
+async def analyze_by_apartment(
+    request: ApartmentAnalysisRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Analyze transactions by apartment complex
 
     Args:
         request: ApartmentAnalysisRequest with optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with apartment analysis data
@@ -276,7 +293,10 @@ async def analyze_by_apartment(request: ApartmentAnalysisRequest) -> StandardRes
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_apartment_analysis(
+        result, metadata = await run_analysis(
+            http_request,
+            "apartment_analysis",
+            analyzer_service.get_apartment_analysis,
             region_filter=request.region_filter,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -286,27 +306,155 @@ async def analyze_by_apartment(request: ApartmentAnalysisRequest) -> StandardRes
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            "apartment_analysis_error",
+            error=str(e),
+            error_type=type(e).__name__,
         )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to analyze by apartment: {str(e)}",
+        )
+
 
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
+@router.post(
+    "/by-apartment/page",
+    response_model=StandardResponse,
+    summary="Analyze by apartment (cursor paginated)",
+    description="""
+    Cursor-paginated variant of /by-apartment.
+    Rows are returned in a stable sort order; pass the returned
+    next_cursor back as cursor to fetch the following page.
+    Only the requested page is materialized per request.
+    """,
+)
+async def analyze_by_apartment_page(
+    request: ApartmentAnalysisPageRequest,
+    http_request: Request,
+) -> StandardResponse:
+    """
+    Fetch one cursor page of apartment analysis
+
+    Args:
+        request: ApartmentAnalysisPageRequest with filters, cursor and limit
+        http_request: Raw request (deadline header, disconnect detection)
+
+    Returns:
+        StandardResponse with items, next_cursor and has_more
+    """
+    start_time = time.time()
+
+    try:
+        logger.info(
+            "analyze_by_apartment_page_request",
+            region_filter=request.region_filter,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            cursor=request.cursor,
+            limit=request.limit,
         )
 
+        after = decode_cursor(request.cursor, APARTMENT_CURSOR)
+
+        # Fetch one extra row to detect whether another page exists
+        def fetch_page():
+            rows, metadata = analyzer_service.iter_apartment_analysis(
+                region_filter=request.region_filter,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                min_count=request.min_count,
+                after=after,
+                limit=request.limit + 1,
+            )
+            return build_page(rows, request.limit), metadata
+
+        page, metadata = await run_analysis(http_request, "apartment_analysis_page", fetch_page)
+
+        # Calculate processing time
+        processing_time = (time.time() - start_time) * 1000
+
+        return build_fast_response(page, metadata, processing_time)
+
+    except HTTPException:
+        raise
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(
-            "apartment_analysis_error",
+            "analyze_by_apartment_page_error",
             error=str(e),
             error_type=type(e).__name__,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to analyze by apartment: {str(e)}",
+            detail=f"Failed to paginate apartment analysis: {str(e)}",
+        )
+
+
+@router.post(
+    "/by-apartment/stream",
+    summary="Analyze by apartment (NDJSON stream)",
+    description="""
+    Streaming variant of /by-apartment.
+    Returns every row as application/x-ndjson (one JSON object per line),
+    in the same order as the paginated variant. Rows are serialized as
+    they are produced, so the full list is never built in memory.
+    """,
+    response_class=StreamingResponse,
+)
+async def analyze_by_apartment_stream(request: ApartmentAnalysisRequest) -> StreamingResponse:
+    """
+    Stream all apartment analysis as NDJSON
+
+    Args:
+        request: ApartmentAnalysisRequest with optional filters
+
+    Returns:
+        StreamingResponse of newline-delimited JSON rows
+    """
+    try:
+        logger.info(
+            "analyze_by_apartment_stream_request",
+            region_filter=request.region_filter,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+
+        rows, metadata = await run_in_threadpool(
+            analyzer_service.iter_apartment_analysis,
+            region_filter=request.region_filter,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            min_count=request.min_count,
+        )
+
+        return StreamingResponse(
+            iter_ndjson(rows),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={
+                "X-Total-Records": str(metadata["total_records"]),
+                "X-Filtered-Records": str(metadata["filtered_records"]),
+            },
+        )
+
+    except Exception as e:
+        logger.error(
+            "analyze_by_apartment_stream_error",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream apartment analysis: {str(e)}",
         )
 
 
@@ -326,12 +474,16 @@ async def analyze_by_apartment(request: ApartmentAnalysisRequest) -> StandardRes
     Use region filter to distinguish apartments with same name.
     """,
 )
-async def get_apartment_detail(request: ApartmentDetailRequest) -> StandardResponse:
+async def get_apartment_detail(
+    request: ApartmentDetailRequest,
+    http_request: Request,
+) -> StandardResponse:
     """
     Get detailed information for a specific apartment
 
     Args:
         request: ApartmentDetailRequest with apartment name and optional filters
+        http_request: Raw request (deadline header, disconnect detection)
 
     Returns:
         StandardResponse with apartment detail data
@@ -348,7 +500,10 @@ async def get_apartment_detail(request: ApartmentDetailRequest) -> StandardRespo
         )
 
         # Call analyzer service
-        result, metadata = analyzer_service.get_apartment_detail(
+        result, metadata = await run_analysis(
+            http_request,
+            "apartment_detail",
+            analyzer_service.get_apartment_detail,
             apt_name=request.apt_name,
             region_filter=request.region_filter,
             start_date=request.start_date,
@@ -358,18 +513,11 @@ async def get_apartment_detail(request: ApartmentDetailRequest) -> StandardRespo
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
 
-        # Build response
-        response_meta = MetaData(
-            **metadata,
-            processing_time_ms=round(processing_time, 2),
-        )
-
-        return StandardResponse(
-            success=True,
-            data=result,
-            meta=response_meta,
-        )
+        # Build response (fast path: analyzer output is not re-validated)
+        return build_fast_response(result, metadata, processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "apartment_detail_error",
@@ -0,0 +1,150 @@
+"""
+Fast JSON response path for large analysis payloads
+
+Analyzer output is already plain dicts/lists, so re-validating it through
+StandardResponse and encoding it with the stdlib json encoder is pure
+overhead on large responses (apartment lists, raw deal rows).
+FastJSONResponse serializes with orjson when available, handling datetime,
+date, NumPy scalars/arrays and Decimal natively.
+"""
+import os
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse
+
+from schemas.responses import StandardResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """
+    Fallback encoder for types not handled natively by the serializer
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        JSON-compatible value
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if NUMPY_AVAILABLE:
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.bool_):
+            return bool(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to UTF-8 JSON bytes
+
+    Args:
+        content: JSON-compatible content (datetime/NumPy values allowed)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (stdlib json fallback)
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def response_validation_enabled() -> bool:
+    """Whether fast responses are re-validated against StandardResponse"""
+    return os.getenv("RESPONSE_VALIDATION", "false").lower() == "true"
+
+
+def build_fast_response(
+    data: Any,
+    metadata: Dict[str, Any],
+    processing_time: float,
+    validate: Optional[bool] = None,
+) -> FastJSONResponse:
+    """
+    Build a StandardResponse-shaped payload without Pydantic re-validation
+
+    Returning a Response instance bypasses FastAPI's response_model
+    validation and jsonable_encoder pass; the route's response_model is
+    still used for the OpenAPI schema.
+
+    Args:
+        data: Analyzer result payload
+        metadata: Analyzer service metadata
+        processing_time: Processing time in milliseconds
+        validate: Validate through StandardResponse first
+            (defaults to RESPONSE_VALIDATION env)
+
+    Returns:
+        FastJSONResponse with success/data/error/meta envelope
+    """
+    meta = {
+        "total_records": metadata.get("total_records"),
+        "filtered_records": metadata.get("filtered_records"),
+        "data_source": metadata.get("data_source"),
+        "timestamp": metadata.get("timestamp"),
+        "processing_time_ms": round(processing_time, 2),
+    }
+
+    if validate is None:
+        validate = response_validation_enabled()
+
+    if validate:
+        validated = StandardResponse(success=True, data=data, meta=meta)
+        return FastJSONResponse(content=validated.model_dump(mode="python"))
+
+    return FastJSONResponse(
+        content={
+            "success": True,
+            "data": data,
+            "error": None,
+            "meta": meta,
+        }
+    )
@@ -263,6 +263,23 @@ class ApartmentAnalysisRequest(BaseModel):
             raise ValueError('Date must be in YYYY-MM-DD format')
 
 
+class ApartmentAnalysisPageRequest(ApartmentAnalysisRequest):
+    """
+    Request for cursor-paginated apartment-based analysis
+    """
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor from the previous page's next_cursor",
+    )
+    limit: int = Field(
+        100,
+        description="Page size",
+        ge=1,
+        le=1000,
+        examples=[100]
+    )
+
+
 class ApartmentDetailRequest(BaseModel):
     """
     Request for specific apartment detail
@@ -542,6 +559,23 @@ class BargainSalesRequest(BaseModel):
             raise ValueError('Date must be in YYYY-MM-DD format')
 
 
+class BargainSalesPageRequest(BargainSalesRequest):
+    """
+    Request for cursor-paginated bargain sales detection
+    """
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor from the previous page's next_cursor",
+    )
+    limit: int = Field(
+        100,
+        description="Page size",
+        ge=1,
+        le=1000,
+        examples=[100]
+    )
+
+
 # ========== Market Requests ==========
 
 class RentVsJeonseRequest(BaseModel):
@@ -3,7 +3,7 @@ Subscription-related request and response schemas
 """
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from models.subscription import SubscriptionTier
 
@@ -62,14 +62,50 @@ class UsageStatsResponse(BaseModel):
 
 class ExportRequest(BaseModel):
     """Request for data export"""
-    export_type: str = Field(..., description="Export type: csv or pdf")
+    export_type: str = Field(..., description="Export type: csv, parquet, arrow or pdf")
     filters: Optional[dict] = Field(None, description="Data filters")
     fields: Optional[List[str]] = Field(None, description="Fields to include")
 
 
+class ExportFilters(BaseModel):
+    """Filters applied to transaction exports (ExportRequest.filters)"""
+    start_date: Optional[str] = Field(None, description="Start date (YYYY-MM-DD)")
+    end_date: Optional[str] = Field(None, description="End date (YYYY-MM-DD)")
+    region: Optional[str] = Field(None, description="Region name (partial match)")
+    api_type: Optional[str] = Field(
+        None,
+        description="API type: api_01 ~ api_04",
+        pattern=r"^api_0[1-4]$",
+    )
+
+    @field_validator('start_date', 'end_date')
+    @classmethod
+    def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
+        try:
+            datetime.strptime(v, '%Y-%m-%d')
+            return v
+        except ValueError:
+            raise ValueError('Date must be in YYYY-MM-DD format')
+
+
 class ExportResponse(BaseModel):
     """Response for export request"""
     success: bool = Field(..., description="Export success")
     download_url: Optional[str] = Field(None, description="Download URL")
     filename: str = Field(..., description="Generated filename")
     message: Optional[str] = Field(None, description="Status message")
+    job_id: Optional[str] = Field(None, description="Export job ID (background exports)")
+
+
+class ExportJobResponse(BaseModel):
+    """Response for export job submission / status"""
+    success: bool = Field(default=True, description="Success flag")
+    data: dict = Field(..., description="Export job status")
+
+
+class ExportJobListResponse(BaseModel):
+    """Response for listing a user's export jobs"""
+    success: bool = Field(default=True, description="Success flag")
+    data: List[dict] = Field(..., description="Export jobs, newest first")
@@ -1,6 +1,6 @@
 """
 Service layer for business logic
 """
-from .analyzer_service import AnalyzerService
+from .analyzer_service import AnalyzerService, get_analyzer_service
 
-__all__ = ["AnalyzerService"]
+__all__ = ["AnalyzerService", "get_analyzer_service"]
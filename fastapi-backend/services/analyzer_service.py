@@ -1,10 +1,24 @@
 """
 Analyzer Service
 Wraps backend.analyzer functions and provides API-friendly data processing
+
+Analysis results are cached per dataset version: a reload whose content
+fingerprint differs (or a forced reload) bumps the version, which invalidates every
+cached result and notifies the reload listeners (the usage-driven cache
+warmer recomputes hot queries).
 """
+import os
 import sys
+import copy
+import json
+import hashlib
+import bisect
+import inspect
+import functools
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple, Iterator, Iterable
 from datetime import datetime
 import structlog
 
@@ -15,9 +29,57 @@ if str(backend_path) not in sys.path:
 
 from backend.data_loader import load_all_json_data
 from backend import analyzer
+from backend.analyzer.segmentation import group_apartments, iter_apartment_rows
+from backend.analyzer.investment import (
+    find_bargain_trades,
+    iter_bargain_rows,
+    BARGAIN_SALES_SECTIONS,
+)
+from backend.analyzer.premium_analysis import (
+    PRICE_PER_AREA_SECTIONS,
+    FLOOR_PREMIUM_SECTIONS,
+    BUILDING_AGE_PREMIUM_SECTIONS,
+)
+
+from services.field_selection import validate_fields
+from services.query_stats import (
+    get_query_stats,
+    query_signature,
+    OUTCOME_WARM_HIT,
+    OUTCOME_HIT,
+    OUTCOME_MISS,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Maximum cached analysis results (LRU, 0 disables the result cache)
+ANALYSIS_RESULT_CACHE_SIZE = int(os.getenv("ANALYSIS_RESULT_CACHE_SIZE", "512"))
+
+# Grouped rows shared by the cursor pages of a query (LRU, 0 disables)
+ANALYSIS_ROW_CACHE_SIZE = int(os.getenv("ANALYSIS_ROW_CACHE_SIZE", "16"))
+
+
+def cached_query(func: Callable) -> Callable:
+    """
+    Cache an analyzer service method's result for the current dataset version
+
+    Calls are keyed by method name and the canonical signature of their
+    bound arguments (defaults applied), and recorded in the hot query
+    statistics. Hits return a deep copy so callers may mutate results.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        params.pop('self')
+        return self._run_cached_query(func.__name__, params, lambda: func(self, *args, **kwargs))
+
+    wrapper.cached_query = True
+    return wrapper
+
 
 class AnalyzerService:
     """
@@ -30,6 +92,18 @@ class AnalyzerService:
         self._data_cache: Optional[List[Dict]] = None
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl_seconds = 300  # 5 minutes cache TTL
+        self._date_index: Optional[List[Tuple[datetime, int]]] = None
+        # Heavy endpoints and export workers call the service from threads
+        self._load_lock = threading.Lock()
+        # Bumped when a (re)load changes the dataset; results of older versions are stale
+        self._dataset_version = 0
+        self._dataset_fingerprint: Optional[Tuple] = None
+        self._reload_listeners: List[Callable[[int], None]] = []
+        # (method, signature) -> (dataset version, result, warmed)
+        self._result_cache: "OrderedDict[Tuple[str, str], Tuple[int, Any, bool]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # (grouping, filter signature) -> (dataset version, grouped rows, counts)
+        self._row_cache: "OrderedDict[Tuple[str, str], Tuple[int, Any, Dict]]" = OrderedDict()
 
     def _load_data(self, force_reload: bool = False) -> Tuple[List[Dict], Dict]:
         """
@@ -41,41 +115,329 @@ class AnalyzerService:
         Returns:
             Tuple of (data items, debug info)
         """
-        now = datetime.now()
-
-        # Check if cache is valid
-        if (not force_reload and
-            self._data_cache is not None and
-            self._cache_timestamp is not None):
-            age_seconds = (now - self._cache_timestamp).total_seconds()
-            if age_seconds < self._cache_ttl_seconds:
-                logger.info(
-                    "data_cache_hit",
-                    cache_age_seconds=age_seconds,
-                    record_count=len(self._data_cache)
-                )
-                return self._data_cache, {
-                    'data_source': 'cache',
-                    'cache_age_seconds': age_seconds,
-                    'total_items': len(self._data_cache)
-                }
-
-        # Load fresh data
-        logger.info("loading_data", force_reload=force_reload)
-        items, debug_info = load_all_json_data(base_path=backend_path, debug=True)
-
-        # Update cache
-        self._data_cache = items
-        self._cache_timestamp = now
+        if not force_reload:
+            cached = self._cached_data()
+            if cached is not None:
+                return cached
+
+        with self._load_lock:
+            # Another thread may have reloaded while we waited
+            if not force_reload:
+                cached = self._cached_data()
+                if cached is not None:
+                    return cached
+
+            # Load fresh data
+            logger.info("loading_data", force_reload=force_reload)
+            items, debug_info = load_all_json_data(base_path=backend_path, debug=True)
+            date_index = self._build_date_index(items)
+
+            # Update cache; the index is cleared first so readers never
+            # pair the new items with the old index
+            self._date_index = None
+            self._data_cache = items
+            self._date_index = date_index
+            self._cache_timestamp = datetime.now()
+
+            # TTL reloads of unchanged data keep the cached results
+            fingerprint = self._fingerprint(items, debug_info)
+            changed = force_reload or fingerprint != self._dataset_fingerprint
+            if changed:
+                self._dataset_fingerprint = fingerprint
+                self._dataset_version += 1
+            version = self._dataset_version
 
         logger.info(
             "data_loaded",
             record_count=len(items),
-            data_source=debug_info.get('data_source', 'unknown')
+            data_source=debug_info.get('data_source', 'unknown'),
+            dataset_version=version
         )
 
+        if changed:
+            with self._result_cache_lock:
+                self._result_cache.clear()
+                self._row_cache.clear()
+            for listener in list(self._reload_listeners):
+                try:
+                    listener(version)
+                except Exception as e:
+                    logger.warning("reload_listener_failed", error=str(e))
+
         return items, debug_info
 
+    @staticmethod
+    def _fingerprint(items: List[Dict], debug_info: Dict) -> Tuple:
+        """
+        Dataset identity: source, record count and a digest of every record
+
+        The digest covers field values, so corrected or cancelled deals
+        change the version even when the record count stays the same.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for item in items:
+            digest.update(json.dumps(item, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+            digest.update(b'\n')
+        return debug_info.get('data_source'), len(items), digest.hexdigest()
+
+    @property
+    def dataset_version(self) -> int:
+        """Version of the loaded dataset (0 before the first load)"""
+        return self._dataset_version
+
+    def add_reload_listener(self, listener: Callable[[int], None]):
+        """
+        Call listener(dataset_version) after every dataset version bump
+
+        Listeners run on the loading thread and should hand off long work.
+        """
+        self._reload_listeners.append(listener)
+
+    def _is_data_fresh(self) -> bool:
+        """Whether the loaded dataset is within its TTL (no logging)"""
+        cache_timestamp = self._cache_timestamp
+        if self._data_cache is None or cache_timestamp is None:
+            return False
+        return (datetime.now() - cache_timestamp).total_seconds() < self._cache_ttl_seconds
+
+    def _run_cached_query(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Any],
+        warming: bool = False,
+    ) -> Any:
+        """
+        Serve a query from the result cache or compute and store it
+
+        Args:
+            name: Service method name
+            params: Bound call arguments
+            compute: Runs the uncached method
+            warming: Called by the cache warmer (not counted as traffic,
+                stored entries are marked warm)
+
+        Returns:
+            Method result
+        """
+        stats = get_query_stats()
+        signature = query_signature(params)
+        if not warming:
+            stats.record_query(name, signature)
+
+        if ANALYSIS_RESULT_CACHE_SIZE <= 0:
+            return compute()
+
+        # Reload an expired dataset first so the version below is current
+        if not self._is_data_fresh():
+            self._load_data()
+        version = self._dataset_version
+        key = (name, signature)
+
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is not None and entry[0] == version:
+                self._result_cache.move_to_end(key)
+                if warming:
+                    self._result_cache[key] = (version, entry[1], True)
+
+        if entry is not None and entry[0] == version:
+            if not warming:
+                stats.record_outcome(name, OUTCOME_WARM_HIT if entry[2] else OUTCOME_HIT)
+            return copy.deepcopy(entry[1])
+
+        if not warming:
+            stats.record_outcome(name, OUTCOME_MISS)
+
+        result = compute()
+        stored = copy.deepcopy(result)
+
+        with self._result_cache_lock:
+            # A reload while computing makes this result stale
+            if version == self._dataset_version:
+                self._result_cache[key] = (version, stored, warming)
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > ANALYSIS_RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        return result
+
+    def _cached_rows(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        group: Callable[[List[Dict]], Any],
+    ) -> Tuple[Any, Dict]:
+        """
+        Group the filtered dataset once per dataset version and filter set
+
+        Cursor pages of the same query reuse the grouped rows instead of
+        regrouping the whole dataset on every page. Rows are shared, not
+        copied; callers must treat them as read-only.
+
+        Args:
+            name: Grouping name
+            params: Filters (region_filter, start_date, end_date, ...)
+            group: Builds the grouped rows from the filtered items
+
+        Returns:
+            Tuple of (grouped rows, record counts for the metadata)
+        """
+        def compute():
+            items, debug_info = self._load_data()
+            original_count = len(items)
+            items = self._filter_by_date_range(items, params.get('start_date'), params.get('end_date'))
+            items = self._filter_by_region(items, params.get('region_filter'))
+            counts = {
+                'total_records': original_count,
+                'filtered_records': len(items),
+                'data_source': debug_info.get('data_source', 'unknown'),
+            }
+            return group(items), counts
+
+        if ANALYSIS_ROW_CACHE_SIZE <= 0:
+            return compute()
+
+        # Reload an expired dataset first so the version below is current
+        if not self._is_data_fresh():
+            self._load_data()
+        version = self._dataset_version
+        key = (name, query_signature(params))
+
+        with self._result_cache_lock:
+            entry = self._row_cache.get(key)
+            if entry is not None and entry[0] == version:
+                self._row_cache.move_to_end(key)
+                return entry[1], entry[2]
+
+        rows, counts = compute()
+
+        with self._result_cache_lock:
+            # A reload while grouping makes these rows stale
+            if version == self._dataset_version:
+                self._row_cache[key] = (version, rows, counts)
+                self._row_cache.move_to_end(key)
+                while len(self._row_cache) > ANALYSIS_ROW_CACHE_SIZE:
+                    self._row_cache.popitem(last=False)
+
+        return rows, counts
+
+    def cached_query_names(self) -> List[str]:
+        """Names of the service methods served through the result cache"""
+        return [
+            name for name, member in inspect.getmembers(type(self), inspect.isfunction)
+            if getattr(member, 'cached_query', False)
+        ]
+
+    def warm_query(self, name: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Compute a query into the result cache as a warm entry
+
+        Args:
+            name: Cached service method name
+            params: Call arguments, or a query signature's parsed parameters
+
+        Returns:
+            True if the result is cached and warm
+
+        Raises:
+            ValueError: name is not a cached service method
+        """
+        method = getattr(type(self), name, None)
+        if not getattr(method, 'cached_query', False):
+            raise ValueError(f"Not a cached analysis query: {name}")
+
+        params = params or {}
+        self._run_cached_query(name, params, lambda: method.__wrapped__(self, **params), warming=True)
+        return True
+
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """
+        Result cache size and warm entries of the current dataset version
+
+        Returns:
+            Result cache statistics
+        """
+        with self._result_cache_lock:
+            entries = list(self._result_cache.values())
+        current = [entry for entry in entries if entry[0] == self._dataset_version]
+        return {
+            'dataset_version': self._dataset_version,
+            'max_entries': ANALYSIS_RESULT_CACHE_SIZE,
+            'entries': len(current),
+            'warm_entries': sum(1 for entry in current if entry[2]),
+        }
+
+    def _cached_data(self) -> Optional[Tuple[List[Dict], Dict]]:
+        """Return cached data if still within TTL"""
+        items = self._data_cache
+        cache_timestamp = self._cache_timestamp
+        if items is None or cache_timestamp is None:
+            return None
+
+        age_seconds = (datetime.now() - cache_timestamp).total_seconds()
+        if age_seconds >= self._cache_ttl_seconds:
+            return None
+
+        logger.info(
+            "data_cache_hit",
+            cache_age_seconds=age_seconds,
+            record_count=len(items)
+        )
+        return items, {
+            'data_source': 'cache',
+            'cache_age_seconds': age_seconds,
+            'total_items': len(items)
+        }
+
+    @staticmethod
+    def _parse_deal_date(deal_date) -> Optional[datetime]:
+        """
+        Convert an item's _deal_date to datetime
+
+        Args:
+            deal_date: datetime, ISO format string or None
+
+        Returns:
+            Parsed datetime, or None if missing or unparseable
+        """
+        if isinstance(deal_date, str):
+            try:
+                return datetime.fromisoformat(deal_date)
+            except (ValueError, TypeError):
+                return None
+        return deal_date
+
+    def _build_date_index(self, items: List[Dict]) -> Optional[List[Tuple[datetime, int]]]:
+        """
+        Build a date-sorted index over the cached items
+
+        Date range filters bisect this index instead of parsing
+        every item's deal date on each request.
+
+        Args:
+            items: Transaction data items
+
+        Returns:
+            Sorted list of (deal date, position in items), or None if
+            the deal dates are not mutually comparable
+        """
+        index = []
+        for position, item in enumerate(items):
+            deal_date = self._parse_deal_date(item.get('_deal_date'))
+            if deal_date is not None:
+                index.append((deal_date, position))
+
+        try:
+            index.sort()
+        except TypeError as e:
+            logger.warning("date_index_build_failed", error=str(e))
+            return None
+
+        logger.info("date_index_built", indexed_count=len(index), record_count=len(items))
+
+        return index
+
     def _filter_by_date_range(
         self,
         items: List[Dict],
@@ -96,29 +458,33 @@ class AnalyzerService:
         if not start_date and not end_date:
             return items
 
-        filtered = []
         start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
         end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
 
-        for item in items:
-            deal_date = item.get('_deal_date')
-            if deal_date is None:
-                continue
-
-            # Convert string to datetime if needed
-            if isinstance(deal_date, str):
-                try:
-                    deal_date = datetime.fromisoformat(deal_date)
-                except (ValueError, TypeError):
+        date_index = self._date_index
+        if date_index is not None and items is self._data_cache:
+            # Use the prebuilt index, keeping the original item order
+            lo = bisect.bisect_left(date_index, (start_dt,)) if start_dt else 0
+            hi = (
+                bisect.bisect_right(date_index, (end_dt, len(items)))
+                if end_dt else len(date_index)
+            )
+            positions = sorted(position for _, position in date_index[lo:hi])
+            filtered = [items[position] for position in positions]
+        else:
+            filtered = []
+            for item in items:
+                deal_date = self._parse_deal_date(item.get('_deal_date'))
+                if deal_date is None:
                     continue
 
-            # Apply date filters
-            if start_dt and deal_date < start_dt:
-                continue
-            if end_dt and deal_date > end_dt:
-                continue
+                # Apply date filters
+                if start_dt and deal_date < start_dt:
+                    continue
+                if end_dt and deal_date > end_dt:
+                    continue
 
-            filtered.append(item)
+                filtered.append(item)
 
         logger.info(
             "date_filter_applied",
@@ -130,6 +496,69 @@ class AnalyzerService:
 
         return filtered
 
+    def iter_items(
+        self,
+        region_filter: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        api_type: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate filtered transaction items (for exports)
+
+        No filtered copy of the dataset is built. With a date range and a
+        date index, only the matching index range is visited (deal-date
+        order); otherwise items are scanned in dataset order.
+
+        Args:
+            region_filter: Region name to filter by
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            api_type: API type to filter by (api_01 ~ api_04)
+
+        Yields:
+            Matching transaction items
+        """
+        items, _ = self._load_data()
+        date_index = self._date_index
+        if items is not self._data_cache:
+            date_index = None
+
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+        region_lower = region_filter.lower() if region_filter else None
+
+        def matches(item: Dict) -> bool:
+            if api_type and item.get('_api_type') != api_type:
+                return False
+            if region_lower and region_lower not in (item.get('_region_name') or '').lower():
+                return False
+            return True
+
+        if (start_dt or end_dt) and date_index is not None:
+            lo = bisect.bisect_left(date_index, (start_dt,)) if start_dt else 0
+            hi = (
+                bisect.bisect_right(date_index, (end_dt, len(items)))
+                if end_dt else len(date_index)
+            )
+            for index_pos in range(lo, hi):
+                item = items[date_index[index_pos][1]]
+                if matches(item):
+                    yield item
+            return
+
+        for item in items:
+            if start_dt or end_dt:
+                deal_date = self._parse_deal_date(item.get('_deal_date'))
+                if deal_date is None:
+                    continue
+                if start_dt and deal_date < start_dt:
+                    continue
+                if end_dt and deal_date > end_dt:
+                    continue
+            if matches(item):
+                yield item
+
     def _filter_by_region(
         self,
         items: List[Dict],
@@ -163,6 +592,7 @@ class AnalyzerService:
 
         return filtered
 
+    @cached_query
     def get_basic_stats(
         self,
         region_filter: Optional[str] = None,
@@ -201,6 +631,7 @@ class AnalyzerService:
 
         return stats, metadata
 
+    @cached_query
     def get_price_trend(
         self,
         region_filter: Optional[str] = None,
@@ -239,6 +670,7 @@ class AnalyzerService:
 
         return trend, metadata
 
+    @cached_query
     def get_regional_analysis(
         self,
         regions: Optional[List[str]] = None,
@@ -275,10 +707,13 @@ class AnalyzerService:
         # Calculate regional analysis
         regional_stats = analyzer.analyze_by_region(items)
 
-        # Limit to top_n regions if specified
-        if 'regions' in regional_stats and top_n > 0:
-            regions_list = regional_stats['regions'][:top_n]
-            regional_stats['regions'] = regions_list
+        # Keep the busiest top_n regions (analyze_by_region sorts by name)
+        if top_n > 0:
+            regional_stats['data'] = sorted(
+                regional_stats.get('data', []),
+                key=lambda row: row['count'],
+                reverse=True,
+            )[:top_n]
 
         # Prepare metadata
         metadata = {
@@ -291,13 +726,18 @@ class AnalyzerService:
         return regional_stats, metadata
 
     def clear_cache(self):
-        """Clear the data cache"""
+        """Clear the data cache and cached analysis results"""
         self._data_cache = None
         self._cache_timestamp = None
+        self._date_index = None
+        with self._result_cache_lock:
+            self._result_cache.clear()
+            self._row_cache.clear()
         logger.info("cache_cleared")
 
     # ========== Segmentation Methods ==========
 
+    @cached_query
     def get_area_analysis(
         self,
         region_filter: Optional[str] = None,
@@ -323,6 +763,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_floor_analysis(
         self,
         region_filter: Optional[str] = None,
@@ -347,6 +788,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_build_year_analysis(
         self,
         region_filter: Optional[str] = None,
@@ -371,6 +813,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_apartment_analysis(
         self,
         region_filter: Optional[str] = None,
@@ -396,6 +839,31 @@ class AnalyzerService:
 
         return result, metadata
 
+    def iter_apartment_analysis(
+        self,
+        region_filter: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        min_count: int = 1,
+        after: Optional[Tuple] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[Iterator[Tuple[Tuple, Dict]], Dict]:
+        """Iterate apartment rows in apartment-name order (cursor/stream)"""
+        groups, counts = self._cached_rows(
+            'apartment_groups',
+            {'region_filter': region_filter, 'start_date': start_date, 'end_date': end_date},
+            group_apartments,
+        )
+
+        rows = iter_apartment_rows(
+            [], after=after, limit=limit, min_count=min_count, groups=groups
+        )
+
+        metadata = {**counts, 'timestamp': datetime.now().isoformat()}
+
+        return rows, metadata
+
+    @cached_query
     def get_apartment_detail(
         self,
         apt_name: str,
@@ -422,20 +890,23 @@ class AnalyzerService:
 
     # ========== Premium Methods ==========
 
+    @cached_query
     def get_price_per_area(
         self,
         region_filter: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
     ) -> Tuple[Dict, Dict]:
         """Get price per area statistics"""
+        fields = validate_fields(fields, PRICE_PER_AREA_SECTIONS)
         items, debug_info = self._load_data()
         original_count = len(items)
 
         items = self._filter_by_date_range(items, start_date, end_date)
         items = self._filter_by_region(items, region_filter)
 
-        result = analyzer.calculate_price_per_area(items)
+        result = analyzer.calculate_price_per_area(items, fields=fields)
 
         metadata = {
             'total_records': original_count,
@@ -446,6 +917,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_price_per_area_trend(
         self,
         region_filter: Optional[str] = None,
@@ -470,20 +942,23 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_floor_premium(
         self,
         region_filter: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
     ) -> Tuple[Dict, Dict]:
         """Get floor premium analysis"""
+        fields = validate_fields(fields, FLOOR_PREMIUM_SECTIONS)
         items, debug_info = self._load_data()
         original_count = len(items)
 
         items = self._filter_by_date_range(items, start_date, end_date)
         items = self._filter_by_region(items, region_filter)
 
-        result = analyzer.analyze_floor_premium(items)
+        result = analyzer.analyze_floor_premium(items, fields=fields)
 
         metadata = {
             'total_records': original_count,
@@ -494,20 +969,23 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_building_age_premium(
         self,
         region_filter: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
     ) -> Tuple[Dict, Dict]:
         """Get building age premium analysis"""
+        fields = validate_fields(fields, BUILDING_AGE_PREMIUM_SECTIONS)
         items, debug_info = self._load_data()
         original_count = len(items)
 
         items = self._filter_by_date_range(items, start_date, end_date)
         items = self._filter_by_region(items, region_filter)
 
-        result = analyzer.analyze_building_age_premium(items)
+        result = analyzer.analyze_building_age_premium(items, fields=fields)
 
         metadata = {
             'total_records': original_count,
@@ -520,6 +998,7 @@ class AnalyzerService:
 
     # ========== Investment Methods ==========
 
+    @cached_query
     def get_jeonse_ratio(
         self,
         region_filter: Optional[str] = None,
@@ -544,6 +1023,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_gap_investment(
         self,
         region_filter: Optional[str] = None,
@@ -569,21 +1049,26 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_bargain_sales(
         self,
         region_filter: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        threshold_pct: float = 10.0
+        threshold_pct: float = 10.0,
+        fields: Optional[Iterable[str]] = None
     ) -> Tuple[Dict, Dict]:
         """Get bargain sales detection"""
+        fields = validate_fields(fields, BARGAIN_SALES_SECTIONS)
         items, debug_info = self._load_data()
         original_count = len(items)
 
         items = self._filter_by_date_range(items, start_date, end_date)
         items = self._filter_by_region(items, region_filter)
 
-        result = analyzer.detect_bargain_sales(items, threshold_pct=threshold_pct)
+        result = analyzer.detect_bargain_sales(
+            items, threshold_pct=threshold_pct, fields=fields
+        )
 
         metadata = {
             'total_records': original_count,
@@ -594,8 +1079,38 @@ class AnalyzerService:
 
         return result, metadata
 
+    def iter_bargain_sales(
+        self,
+        region_filter: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        threshold_pct: float = 10.0,
+        after: Optional[Tuple] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[Iterator[Tuple[Tuple, Dict]], Dict]:
+        """Iterate bargain sales by discount, highest first (cursor/stream)"""
+        bargains, counts = self._cached_rows(
+            'bargain_trades',
+            {
+                'region_filter': region_filter,
+                'start_date': start_date,
+                'end_date': end_date,
+                'threshold_pct': threshold_pct,
+            },
+            lambda items: find_bargain_trades(items, threshold_pct),
+        )
+
+        rows = iter_bargain_rows(
+            [], threshold_pct=threshold_pct, after=after, limit=limit, bargains=bargains
+        )
+
+        metadata = {**counts, 'timestamp': datetime.now().isoformat()}
+
+        return rows, metadata
+
     # ========== Market Methods ==========
 
+    @cached_query
     def get_rent_vs_jeonse(
         self,
         region_filter: Optional[str] = None,
@@ -620,6 +1135,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_dealing_type(
         self,
         region_filter: Optional[str] = None,
@@ -644,6 +1160,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_buyer_seller_type(
         self,
         region_filter: Optional[str] = None,
@@ -668,6 +1185,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_cancelled_deals(
         self,
         region_filter: Optional[str] = None,
@@ -692,6 +1210,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_period_summary(
         self,
         start_date: str,
@@ -719,6 +1238,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_baseline_summary(
         self,
         start_date: str,
@@ -746,6 +1266,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_period_comparison(
         self,
         current_start_date: str,
@@ -790,6 +1311,7 @@ class AnalyzerService:
 
         return result, metadata
 
+    @cached_query
     def get_market_signals(
         self,
         start_date: str,
@@ -833,3 +1355,23 @@ class AnalyzerService:
         }
 
         return result, metadata
+
+
+# Singleton instance
+_analyzer_service: Optional[AnalyzerService] = None
+
+
+def get_analyzer_service() -> AnalyzerService:
+    """
+    Get analyzer service singleton
+
+    All routers share one instance so the dataset is loaded
+    (and warmed up) once per worker.
+
+    Returns:
+        AnalyzerService instance
+    """
+    global _analyzer_service
+    if _analyzer_service is None:
+        _analyzer_service = AnalyzerService()
+    return _analyzer_service
@@ -0,0 +1,759 @@
+"""
+Export Job Queue
+Runs heavy exports (large CSV/Parquet/Arrow files, PDF reports) on a
+background worker pool instead of inside the request. Clients submit a
+job, poll its status and download the result file once it succeeds.
+
+Backends (EXPORT_JOB_BACKEND, redis by default when USE_REDIS=true):
+- file: job records as JSON files, in-process queue per API process
+- redis: job records and queue in Redis, shared by all API processes
+
+A worker claims a job before running it (O_EXCL claim file / SET NX), so
+with several processes on one job directory each job runs once. Claims
+record the owner's host and PID plus a lease; on startup only jobs whose
+owner process has exited or whose lease has run out are recovered.
+
+Result files are always written under EXPORT_JOB_DIR, so with the redis
+backend every process must see the same directory.
+"""
+import os
+import json
+import queue
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import structlog
+
+from schemas.subscription import ExportFilters
+from services.export_service import FILE_EXTENSIONS, ExportStats, resolve_columns, stream_export
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+# Configuration
+USE_REDIS = os.getenv("USE_REDIS", "False").lower() == "true"
+EXPORT_JOB_BACKEND = os.getenv("EXPORT_JOB_BACKEND", "redis" if USE_REDIS else "file").lower()
+EXPORT_JOB_DIR = os.getenv("EXPORT_JOB_DIR", "/tmp/apt_insights_exports")
+EXPORT_JOB_WORKERS = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+EXPORT_JOB_MAX_PER_USER = int(os.getenv("EXPORT_JOB_MAX_PER_USER", "2"))
+EXPORT_JOB_RETENTION_HOURS = float(os.getenv("EXPORT_JOB_RETENTION_HOURS", "24"))
+EXPORT_JOB_LEASE_SECONDS = float(os.getenv("EXPORT_JOB_LEASE_SECONDS", "3600"))
+# Redis key namespace, kept apart from the apt_insights:* API response cache
+EXPORT_JOB_KEY_PREFIX = os.getenv("EXPORT_JOB_KEY_PREFIX", "export_jobs")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+JOB_FORMATS = ("csv", "parquet", "arrow", "pdf")
+
+JOB_EXTENSIONS = {**FILE_EXTENSIONS, "pdf": "pdf"}
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+
+class ExportJobLimitError(Exception):
+    """Raised when a user already has the maximum number of active jobs"""
+
+
+def new_claim(lease_seconds: float) -> Dict:
+    """Claim record for a job run by this process"""
+    return {
+        "host": socket.gethostname(),
+        "pid": os.getpid(),
+        "expires_at": time.time() + lease_seconds,
+    }
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def claim_expired(claim: Optional[Dict]) -> bool:
+    """
+    Whether a job claim no longer protects the job
+
+    Args:
+        claim: Claim record (None when the job is not claimed)
+
+    Returns:
+        True if there is no claim, its lease has run out, or its owner
+        process on this host has exited
+    """
+    if not claim:
+        return True
+    if time.time() >= claim.get("expires_at", 0):
+        return True
+    if claim.get("host") == socket.gethostname():
+        return not _pid_alive(claim.get("pid"))
+    return False
+
+
+class ExportJob:
+    """State of a single export job"""
+
+    def __init__(
+        self,
+        user_id: str,
+        export_format: str,
+        filters: Optional[Dict] = None,
+        fields: Optional[List[str]] = None,
+        job_id: Optional[str] = None,
+        status: str = STATUS_QUEUED,
+        created_at: Optional[float] = None,
+        started_at: Optional[float] = None,
+        finished_at: Optional[float] = None,
+        rows: int = 0,
+        bytes: int = 0,
+        error: Optional[str] = None,
+    ):
+        self.job_id = job_id or uuid.uuid4().hex
+        self.user_id = user_id
+        self.export_format = export_format
+        self.filters = filters or {}
+        self.fields = fields
+        self.status = status
+        self.created_at = created_at or time.time()
+        self.started_at = started_at
+        self.finished_at = finished_at
+        self.rows = rows
+        self.bytes = bytes
+        self.error = error
+
+    @property
+    def filename(self) -> str:
+        prefix = "analysis_report" if self.export_format == "pdf" else "apartment_data"
+        timestamp = datetime.fromtimestamp(self.created_at).strftime("%Y%m%d_%H%M%S")
+        return f"{prefix}_{timestamp}.{JOB_EXTENSIONS[self.export_format]}"
+
+    @property
+    def queue_wait_ms(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return round((self.started_at - self.created_at) * 1000, 2)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return round((self.finished_at - self.started_at) * 1000, 2)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def to_record(self) -> Dict:
+        """Serialize for the job store"""
+        return {
+            "job_id": self.job_id,
+            "user_id": self.user_id,
+            "export_format": self.export_format,
+            "filters": self.filters,
+            "fields": self.fields,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "ExportJob":
+        return cls(**record)
+
+    def to_dict(self) -> Dict:
+        """Public job status payload"""
+
+        def iso(ts: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+        return {
+            "job_id": self.job_id,
+            "format": self.export_format,
+            "status": self.status,
+            "filters": self.filters,
+            "fields": self.fields,
+            "filename": self.filename,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "error": self.error,
+            "created_at": iso(self.created_at),
+            "started_at": iso(self.started_at),
+            "finished_at": iso(self.finished_at),
+            "queue_wait_ms": self.queue_wait_ms,
+            "duration_ms": self.duration_ms,
+        }
+
+
+class FileJobStore:
+    """Job records stored as one JSON file per job, claims as {job_id}.claim files"""
+
+    def __init__(self, base_dir: str, lease_seconds: float = EXPORT_JOB_LEASE_SECONDS):
+        self.jobs_dir = Path(base_dir) / "jobs"
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+    def _path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _claim_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.claim"
+
+    def _read_claim(self, path: Path) -> Optional[Dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Claim file created but not written yet: live until the lease would end
+            try:
+                return {"expires_at": path.stat().st_mtime + self.lease_seconds}
+            except FileNotFoundError:
+                return None
+
+    def claim(self, job_id: str) -> bool:
+        """
+        Take the job for this process (O_EXCL create of the claim file)
+
+        Returns:
+            True if claimed, False if another live process holds it
+        """
+        path = self._claim_path(job_id)
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not self.break_expired_claim(job_id):
+                    return False
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(new_claim(self.lease_seconds), f)
+            return True
+        return False
+
+    def break_expired_claim(self, job_id: str) -> bool:
+        """
+        Remove the job's claim if its owner is gone
+
+        The claim file is renamed away first, so when several processes find
+        the same expired claim only one of them removes it.
+
+        Returns:
+            True if the job is now unclaimed
+        """
+        path = self._claim_path(job_id)
+        if not claim_expired(self._read_claim(path)):
+            return False
+
+        stale_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}")
+        try:
+            os.rename(path, stale_path)
+        except FileNotFoundError:
+            return True
+
+        if not claim_expired(self._read_claim(stale_path)):
+            # Moved a claim taken after the check above: put it back
+            try:
+                os.link(stale_path, path)
+            except FileExistsError:
+                pass
+            stale_path.unlink(missing_ok=True)
+            return False
+
+        stale_path.unlink(missing_ok=True)
+        return True
+
+    def release(self, job_id: str):
+        self._claim_path(job_id).unlink(missing_ok=True)
+
+    def save(self, job: ExportJob):
+        path = self._path(job.job_id)
+        tmp_path = path.with_suffix(".tmp")
+        with self._lock:
+            tmp_path.write_text(json.dumps(job.to_record(), ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        try:
+            record = json.loads(self._path(job_id).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        return ExportJob.from_record(record)
+
+    def list_jobs(self, user_id: Optional[str] = None) -> List[ExportJob]:
+        jobs = []
+        for path in self.jobs_dir.glob("*.json"):
+            job = self.get(path.stem)
+            if job and (user_id is None or job.user_id == user_id):
+                jobs.append(job)
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def delete(self, job_id: str):
+        self._path(job_id).unlink(missing_ok=True)
+        self.release(job_id)
+
+
+class RedisJobStore:
+    """Job records stored in Redis with a per-user index and claim keys"""
+
+    KEY_PREFIX = f"{EXPORT_JOB_KEY_PREFIX}:job"
+
+    def __init__(self, client, retention_seconds: int, lease_seconds: float = EXPORT_JOB_LEASE_SECONDS):
+        self.client = client
+        self.retention_seconds = retention_seconds
+        self.lease_seconds = lease_seconds
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{job_id}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{EXPORT_JOB_KEY_PREFIX}:user:{user_id}"
+
+    def _claim_key(self, job_id: str) -> str:
+        return f"{EXPORT_JOB_KEY_PREFIX}:claim:{job_id}"
+
+    def claim(self, job_id: str) -> bool:
+        """
+        Take the job for this process (SET NX, expires with the lease)
+
+        Returns:
+            True if claimed, False if another live process holds it
+        """
+        for _ in range(2):
+            claimed = self.client.set(
+                self._claim_key(job_id),
+                json.dumps(new_claim(self.lease_seconds)),
+                nx=True,
+                ex=max(1, int(self.lease_seconds)),
+            )
+            if claimed:
+                return True
+            if not self.break_expired_claim(job_id):
+                return False
+        return False
+
+    def break_expired_claim(self, job_id: str) -> bool:
+        """
+        Remove the job's claim if its owner is gone (WATCH, so a claim taken
+        meanwhile is left alone)
+
+        Returns:
+            True if the job is now unclaimed
+        """
+        key = self._claim_key(job_id)
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                raw = pipe.get(key)
+                if not claim_expired(json.loads(raw) if raw else None):
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.delete(key)
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                return False
+
+    def release(self, job_id: str):
+        self.client.delete(self._claim_key(job_id))
+
+    def save(self, job: ExportJob):
+        pipe = self.client.pipeline()
+        pipe.setex(self._key(job.job_id), self.retention_seconds, json.dumps(job.to_record()))
+        pipe.sadd(self._user_key(job.user_id), job.job_id)
+        pipe.expire(self._user_key(job.user_id), self.retention_seconds)
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        raw = self.client.get(self._key(job_id))
+        return ExportJob.from_record(json.loads(raw)) if raw else None
+
+    def list_jobs(self, user_id: Optional[str] = None) -> List[ExportJob]:
+        if user_id is None:
+            keys = list(self.client.scan_iter(match=f"{self.KEY_PREFIX}:*"))
+        else:
+            job_ids = self.client.smembers(self._user_key(user_id))
+            keys = [self._key(job_id) for job_id in job_ids]
+
+        jobs = [
+            ExportJob.from_record(json.loads(raw))
+            for raw in (self.client.mget(keys) if keys else [])
+            if raw
+        ]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def delete(self, job_id: str):
+        job = self.get(job_id)
+        self.client.delete(self._key(job_id), self._claim_key(job_id))
+        if job:
+            self.client.srem(self._user_key(job.user_id), job_id)
+
+
+class LocalJobQueue:
+    """In-process FIFO of job IDs"""
+
+    def __init__(self):
+        self._queue: "queue.Queue[str]" = queue.Queue()
+
+    def put(self, job_id: str):
+        self._queue.put(job_id)
+
+    def get(self, timeout: float) -> Optional[str]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class RedisJobQueue:
+    """Redis list of job IDs shared by all API processes"""
+
+    KEY = f"{EXPORT_JOB_KEY_PREFIX}:queue"
+
+    def __init__(self, client):
+        self.client = client
+
+    def put(self, job_id: str):
+        self.client.lpush(self.KEY, job_id)
+
+    def get(self, timeout: float) -> Optional[str]:
+        result = self.client.brpop(self.KEY, timeout=max(1, int(timeout)))
+        return result[1] if result else None
+
+
+class ExportJobManager:
+    """
+    Export job submission and background worker pool
+
+    Features:
+    - Per-user limit on queued + running jobs
+    - Fixed-size worker pool, so heavy exports never run on request workers
+    - Queue wait / run time metrics per format
+    - Result files removed after EXPORT_JOB_RETENTION_HOURS
+    """
+
+    def __init__(
+        self,
+        store,
+        job_queue,
+        result_dir: str = EXPORT_JOB_DIR,
+        workers: int = EXPORT_JOB_WORKERS,
+        max_per_user: int = EXPORT_JOB_MAX_PER_USER,
+        retention_hours: float = EXPORT_JOB_RETENTION_HOURS,
+    ):
+        self.store = store
+        self.queue = job_queue
+        self.result_dir = Path(result_dir) / "results"
+        self.result_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.max_per_user = max_per_user
+        self.retention_hours = retention_hours
+
+        self._submit_lock = threading.Lock()
+        self._purge_lock = threading.Lock()
+        self._last_purge = 0.0
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    # ========== Submission / lookup ==========
+
+    def submit(
+        self,
+        user_id: str,
+        export_format: str,
+        filters: ExportFilters,
+        fields: Optional[List[str]] = None,
+    ) -> ExportJob:
+        """
+        Queue an export job
+
+        Args:
+            user_id: Owner of the job
+            export_format: One of JOB_FORMATS
+            filters: Validated export filters
+            fields: Export columns (ignored for PDF reports)
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If the format is unknown
+            ExportJobLimitError: If the user has too many active jobs
+        """
+        if export_format not in JOB_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}")
+
+        with self._submit_lock:
+            active = sum(1 for job in self.store.list_jobs(user_id) if job.is_active)
+            if active >= self.max_per_user:
+                self._record(export_format, "rejected")
+                raise ExportJobLimitError(
+                    f"User already has {active} active export jobs "
+                    f"(limit {self.max_per_user})"
+                )
+
+            job = ExportJob(
+                user_id=user_id,
+                export_format=export_format,
+                filters=filters.model_dump(exclude_none=True),
+                fields=fields,
+            )
+            self.store.save(job)
+
+        self.queue.put(job.job_id)
+        self._record(export_format, "submitted")
+
+        logger.info(
+            "export_job_submitted",
+            job_id=job.job_id,
+            user_id=user_id,
+            format=export_format,
+            active_jobs=active + 1,
+        )
+        return job
+
+    def get_job(self, job_id: str, user_id: str) -> Optional[ExportJob]:
+        """Return the job if it exists and belongs to user_id"""
+        job = self.store.get(job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+    def list_jobs(self, user_id: str) -> List[ExportJob]:
+        return self.store.list_jobs(user_id)
+
+    def result_path(self, job: ExportJob) -> Path:
+        return self.result_dir / f"{job.job_id}.{JOB_EXTENSIONS[job.export_format]}"
+
+    # ========== Worker pool ==========
+
+    def start(self):
+        """Recover interrupted jobs, purge expired ones and start workers"""
+        if self._threads:
+            return
+
+        self._stop_event.clear()
+        self._recover_jobs()
+        self.purge_expired()
+
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name=f"export-job-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        logger.info("export_job_workers_started", workers=self.workers)
+
+    def stop(self, timeout: float = 5.0):
+        """Signal workers to stop after their current job"""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        logger.info("export_job_workers_stopped")
+
+    def _recover_jobs(self):
+        """
+        Recover active jobs whose claim has expired (owner exited or lease ran out)
+
+        Jobs running in another live process are left alone. Interrupted
+        running jobs are failed; queued jobs are re-queued on the local queue
+        (the Redis queue still holds them). Another process may queue the
+        same job too; the claim in run_job makes sure it runs once.
+        """
+        for listed in self.store.list_jobs():
+            if not listed.is_active or not self.store.claim(listed.job_id):
+                continue
+
+            requeue = False
+            try:
+                job = self.store.get(listed.job_id)
+                if job is None:
+                    continue
+                if job.status == STATUS_RUNNING:
+                    job.status = STATUS_FAILED
+                    job.error = "Interrupted by server restart"
+                    job.finished_at = time.time()
+                    self.store.save(job)
+                    logger.warning("export_job_interrupted", job_id=job.job_id)
+                elif job.status == STATUS_QUEUED:
+                    requeue = isinstance(self.queue, LocalJobQueue)
+            finally:
+                self.store.release(listed.job_id)
+
+            if requeue:
+                self.queue.put(listed.job_id)
+
+    def purge_expired(self) -> int:
+        """
+        Delete finished jobs (and their files) older than the retention period
+
+        Returns:
+            Number of jobs removed
+        """
+        self._last_purge = time.time()
+        cutoff = self._last_purge - self.retention_hours * 3600
+        removed = 0
+        for job in self.store.list_jobs():
+            if not job.is_active and (job.finished_at or job.created_at) < cutoff:
+                self.result_path(job).unlink(missing_ok=True)
+                self.store.delete(job.job_id)
+                removed += 1
+
+        # Files whose job record already expired (redis backend TTL)
+        for path in self.result_dir.iterdir():
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+
+        if removed:
+            logger.info("export_jobs_purged", removed=removed)
+        return removed
+
+    def _worker_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                job_id = self.queue.get(timeout=1.0)
+            except Exception as e:
+                logger.error("export_job_queue_error", error=str(e))
+                self._stop_event.wait(1.0)
+                continue
+
+            if job_id is not None:
+                self.run_job(job_id)
+            elif time.time() - self._last_purge > 3600 and self._purge_lock.acquire(blocking=False):
+                try:
+                    self.purge_expired()
+                except Exception as e:
+                    logger.warning("export_job_purge_failed", error=str(e))
+                finally:
+                    self._purge_lock.release()
+
+    def run_job(self, job_id: str):
+        """Claim a queued job, render it and record its outcome"""
+        if not self.store.claim(job_id):
+            return
+
+        try:
+            job = self.store.get(job_id)
+            if job is not None and job.status == STATUS_QUEUED:
+                self._run_claimed(job)
+        finally:
+            self.store.release(job_id)
+
+    def _run_claimed(self, job: ExportJob):
+        job.status = STATUS_RUNNING
+        job.started_at = time.time()
+        self.store.save(job)
+
+        path = self.result_path(job)
+        tmp_path = path.with_name(path.name + ".part")
+
+        try:
+            job.rows = self._render(job, str(tmp_path))
+            os.replace(tmp_path, path)
+            job.bytes = path.stat().st_size
+            job.status = STATUS_SUCCEEDED
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            job.status = STATUS_FAILED
+            job.error = str(e)
+            logger.error("export_job_failed", job_id=job.job_id, error=str(e))
+        finally:
+            job.finished_at = time.time()
+            self.store.save(job)
+
+        self._record(
+            job.export_format,
+            job.status,
+            queue_wait_seconds=job.queue_wait_ms / 1000,
+            run_seconds=job.duration_ms / 1000,
+        )
+
+        logger.info(
+            "export_job_finished",
+            job_id=job.job_id,
+            format=job.export_format,
+            status=job.status,
+            rows=job.rows,
+            bytes=job.bytes,
+            queue_wait_ms=job.queue_wait_ms,
+            duration_ms=job.duration_ms,
+        )
+
+    def _render(self, job: ExportJob, path: str) -> int:
+        """Write the job's output file and return the row count"""
+        filters = ExportFilters(**job.filters)
+
+        if job.export_format == "pdf":
+            from services.report_service import write_pdf_report
+            return write_pdf_report(filters, path)
+
+        stats = ExportStats(job.export_format)
+        columns = resolve_columns(job.fields)
+        with open(path, "wb") as f:
+            for chunk in stream_export(job.export_format, filters, columns, stats=stats):
+                f.write(chunk)
+        return stats.rows
+
+    @staticmethod
+    def _record(export_format: str, status: str, **kwargs):
+        try:
+            from routers.metrics import record_export_job
+            record_export_job(export_format, status, **kwargs)
+        except Exception as e:
+            logger.warning("export_job_metrics_failed", error=str(e))
+
+
+# Global manager instance
+_export_job_manager: Optional[ExportJobManager] = None
+
+
+def get_export_job_manager() -> ExportJobManager:
+    """
+    Get global export job manager instance
+
+    Returns:
+        ExportJobManager instance
+    """
+    global _export_job_manager
+
+    if _export_job_manager is None:
+        if EXPORT_JOB_BACKEND == "redis" and REDIS_AVAILABLE:
+            client = redis.from_url(REDIS_URL, decode_responses=True)
+            store = RedisJobStore(client, int(EXPORT_JOB_RETENTION_HOURS * 3600))
+            job_queue = RedisJobQueue(client)
+        else:
+            if EXPORT_JOB_BACKEND == "redis":
+                logger.warning("export_job_redis_unavailable", fallback="file")
+            store = FileJobStore(EXPORT_JOB_DIR)
+            job_queue = LocalJobQueue()
+
+        _export_job_manager = ExportJobManager(store, job_queue)
+
+    return _export_job_manager
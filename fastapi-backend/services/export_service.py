@@ -0,0 +1,362 @@
+"""
+Export Service
+Streams filtered transactions as CSV, Arrow IPC or Parquet chunks so
+memory use stays flat regardless of export size
+"""
+import os
+import csv
+import io
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import structlog
+
+from schemas.subscription import ExportFilters
+from services.analyzer_service import get_analyzer_service
+from services.field_selection import validate_fields
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+# Rows per CSV chunk / Arrow record batch / Parquet row group
+EXPORT_BATCH_ROWS = int(os.getenv("EXPORT_BATCH_ROWS", "5000"))
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+FILE_EXTENSIONS = {
+    "csv": "csv",
+    "arrow": "arrows",
+    "parquet": "parquet",
+}
+
+
+def _first(item: Dict, *keys: str) -> Any:
+    """Return the first non-empty value among keys (JSON / DB field names)"""
+    for key in keys:
+        value = item.get(key)
+        if value is not None and value != "":
+            return value
+    return None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(str(value).strip()) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _as_str(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _year_month(item: Dict) -> Optional[str]:
+    value = _first(item, "_deal_year_month", "_year_month")
+    if value is None:
+        deal_date = _first(item, "_deal_date_str", "_deal_date")
+        if deal_date is not None:
+            value = str(deal_date)[:7]
+    return _as_str(value)
+
+
+# Column name -> (extractor, arrow type name), in output order
+EXPORT_COLUMNS: Dict[str, tuple] = {
+    "지역명": (lambda item: _as_str(item.get("_region_name")), "string"),
+    "아파트명": (lambda item: _as_str(_first(item, "aptNm", "아파트")), "string"),
+    "거래금액": (lambda item: item.get("_deal_amount_numeric"), "float64"),
+    "전용면적": (lambda item: item.get("_area_numeric"), "float64"),
+    "계약년월": (_year_month, "string"),
+    "계약일": (lambda item: _as_str(_first(item, "dealDay", "일", "_deal_day")), "string"),
+    "층": (lambda item: _as_int(_first(item, "_floor_numeric", "_floor", "floor", "층")), "int64"),
+    "건축년도": (
+        lambda item: _as_int(_first(item, "_build_year_numeric", "_build_year", "buildYear", "건축년도")),
+        "int64",
+    ),
+    "도로명": (lambda item: _as_str(_first(item, "roadNm", "도로명")), "string"),
+    "API타입": (lambda item: _as_str(item.get("_api_type")), "string"),
+}
+
+
+def resolve_columns(fields: Optional[Iterable[str]]) -> List[str]:
+    """
+    Resolve requested export columns, preserving EXPORT_COLUMNS order
+
+    Args:
+        fields: Requested column names (None for all columns)
+
+    Returns:
+        Ordered column names
+
+    Raises:
+        InvalidFieldsError: If an unknown column is requested
+    """
+    selected = validate_fields(fields, list(EXPORT_COLUMNS))
+    return [name for name in EXPORT_COLUMNS if selected is None or name in selected]
+
+
+class ExportStats:
+    """Row count and throughput of a single export"""
+
+    def __init__(self, export_format: str):
+        self.export_format = export_format
+        self.rows = 0
+        self.bytes = 0
+        self.started_at = time.perf_counter()
+        self.duration_seconds: Optional[float] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.duration_seconds
+        if elapsed is None:
+            elapsed = time.perf_counter() - self.started_at
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def finish(self):
+        """Mark the export as finished and report throughput"""
+        self.duration_seconds = time.perf_counter() - self.started_at
+
+        logger.info(
+            "export_completed",
+            format=self.export_format,
+            rows=self.rows,
+            bytes=self.bytes,
+            duration_ms=round(self.duration_seconds * 1000, 2),
+            rows_per_second=round(self.rows_per_second, 1),
+        )
+
+        try:
+            from routers.metrics import record_export
+            record_export(self.export_format, self.rows, self.duration_seconds)
+        except Exception as e:
+            logger.warning("export_metrics_failed", error=str(e))
+
+
+def iter_export_records(filters: ExportFilters) -> Iterator[Dict]:
+    """
+    Iterate filtered transactions from the database or the cached dataset
+
+    Args:
+        filters: Export filters
+
+    Yields:
+        Transaction items
+    """
+    if os.getenv("USE_DATABASE", "false").lower() == "true":
+        from backend.db.session import get_session
+        from backend.db.repository import TransactionRepository
+
+        with get_session() as session:
+            repository = TransactionRepository(session)
+            yield from repository.iter_transactions(
+                transaction_type=filters.api_type,
+                region_name=filters.region,
+                start_date=(
+                    datetime.strptime(filters.start_date, "%Y-%m-%d").date()
+                    if filters.start_date else None
+                ),
+                end_date=(
+                    datetime.strptime(filters.end_date, "%Y-%m-%d").date()
+                    if filters.end_date else None
+                ),
+                batch_size=EXPORT_BATCH_ROWS,
+            )
+        return
+
+    yield from get_analyzer_service().iter_items(
+        region_filter=filters.region,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+        api_type=filters.api_type,
+    )
+
+
+def _iter_batches(
+    records: Iterable[Dict],
+    columns: List[str],
+    batch_rows: int,
+) -> Iterator[List[List[Any]]]:
+    """Group extracted rows into batches of batch_rows"""
+    extractors: List[Callable] = [EXPORT_COLUMNS[name][0] for name in columns]
+    batch = []
+    for record in records:
+        batch.append([extract(record) for extract in extractors])
+        if len(batch) >= batch_rows:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_csv(
+    records: Iterable[Dict],
+    columns: List[str],
+    stats: ExportStats,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> Iterator[bytes]:
+    """
+    Stream records as CSV chunks
+
+    Args:
+        records: Transaction items
+        columns: Column names to write
+        stats: Export stats to update
+        batch_rows: Rows per chunk
+
+    Yields:
+        UTF-8 encoded CSV chunks (header first)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    header = buffer.getvalue().encode("utf-8")
+    stats.bytes += len(header)
+    yield header
+
+    for batch in _iter_batches(records, columns, batch_rows):
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerows(
+            ["" if value is None else value for value in row] for row in batch
+        )
+        chunk = buffer.getvalue().encode("utf-8")
+        stats.rows += len(batch)
+        stats.bytes += len(chunk)
+        yield chunk
+
+    stats.finish()
+
+
+class _ChunkSink:
+    """Write-only file object that buffers bytes until drained"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(columns: List[str]):
+    return pa.schema([(name, getattr(pa, EXPORT_COLUMNS[name][1])()) for name in columns])
+
+
+def _arrow_batch(schema, batch: List[List[Any]]):
+    arrays = [
+        pa.array([row[i] for row in batch], type=field.type)
+        for i, field in enumerate(schema)
+    ]
+    return pa.record_batch(arrays, schema=schema)
+
+
+def iter_arrow(
+    records: Iterable[Dict],
+    columns: List[str],
+    stats: ExportStats,
+    export_format: str = "arrow",
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> Iterator[bytes]:
+    """
+    Stream records as Arrow IPC stream or Parquet bytes
+
+    Each batch becomes one Arrow record batch (IPC) or one Parquet row
+    group, so only a single batch is held in memory at a time.
+
+    Args:
+        records: Transaction items
+        columns: Column names to write
+        stats: Export stats to update
+        export_format: "arrow" (IPC stream) or "parquet"
+        batch_rows: Rows per record batch / row group
+
+    Yields:
+        Encoded byte chunks
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for Arrow/Parquet exports")
+
+    schema = _arrow_schema(columns)
+    sink = _ChunkSink()
+
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    for batch in _iter_batches(records, columns, batch_rows):
+        record_batch = _arrow_batch(schema, batch)
+        if export_format == "parquet":
+            writer.write_table(pa.Table.from_batches([record_batch]))
+        else:
+            writer.write_batch(record_batch)
+        stats.rows += len(batch)
+        chunk = sink.drain()
+        if chunk:
+            stats.bytes += len(chunk)
+            yield chunk
+
+    writer.close()
+    chunk = sink.drain()
+    if chunk:
+        stats.bytes += len(chunk)
+        yield chunk
+
+    stats.finish()
+
+
+def stream_export(
+    export_format: str,
+    filters: ExportFilters,
+    columns: List[str],
+    stats: Optional[ExportStats] = None,
+) -> Iterator[bytes]:
+    """
+    Build the byte stream for an export
+
+    Args:
+        export_format: "csv", "arrow" or "parquet"
+        filters: Export filters
+        columns: Column names to write
+        stats: Export stats to update (created when omitted)
+
+    Returns:
+        Iterator of encoded chunks
+    """
+    stats = stats or ExportStats(export_format)
+    records = iter_export_records(filters)
+
+    if export_format == "csv":
+        return iter_csv(records, columns, stats)
+    return iter_arrow(records, columns, stats, export_format=export_format)
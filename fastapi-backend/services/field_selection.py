@@ -0,0 +1,56 @@
+"""
+Sparse Field Selection
+Parses the `fields=` selector and validates it against the sections an
+analyzer can compute, so unrequested sections are skipped in the analyzer
+"""
+from typing import FrozenSet, Iterable, List, Optional, Sequence
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a fields selector names an unknown section"""
+
+
+def parse_fields_param(raw: Optional[str]) -> Optional[List[str]]:
+    """
+    Split a comma-separated fields query parameter
+
+    Args:
+        raw: Raw query value, e.g. "stats,by_region"
+
+    Returns:
+        Section names, or None when no selector was given
+    """
+    if raw is None:
+        return None
+    fields = [name.strip() for name in raw.split(",") if name.strip()]
+    return fields or None
+
+
+def validate_fields(
+    fields: Optional[Iterable[str]],
+    allowed: Sequence[str],
+) -> Optional[FrozenSet[str]]:
+    """
+    Validate requested sections against an analyzer's section list
+
+    Args:
+        fields: Requested section names (None means all sections)
+        allowed: Sections the analyzer can compute
+
+    Returns:
+        Frozen set of requested sections, or None for all sections
+
+    Raises:
+        InvalidFieldsError: If an unknown section is requested
+    """
+    if fields is None:
+        return None
+
+    selected = frozenset(fields)
+    unknown = selected - set(allowed)
+    if unknown:
+        raise InvalidFieldsError(
+            f"Unknown fields: {', '.join(sorted(unknown))} "
+            f"(available: {', '.join(allowed)})"
+        )
+    return selected
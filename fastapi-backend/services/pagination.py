@@ -0,0 +1,120 @@
+"""
+Cursor Pagination and NDJSON Streaming Helpers
+Turns analyzer row iterators (sort key, row) into cursor pages or
+newline-delimited JSON streams
+"""
+import base64
+import json
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, Union
+
+from schemas.fast_response import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Cursor part types per endpoint sort key (numbers may decode as int or float)
+NUMBER = (int, float)
+APARTMENT_CURSOR: Tuple = (str,)                # (apartment name,)
+BARGAIN_CURSOR: Tuple = (NUMBER, int)           # (-discount %, comparison seq)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(sort_key: Tuple) -> str:
+    """
+    Encode a sort key as an opaque cursor
+
+    Args:
+        sort_key: Sort key of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(list(sort_key), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: Optional[str],
+    part_types: Tuple[Union[Type, Tuple[Type, ...]], ...],
+) -> Optional[Tuple]:
+    """
+    Decode an opaque cursor back into a sort key
+
+    The key is checked against the endpoint's sort key shape, so a crafted
+    cursor is rejected here instead of failing the comparison in the analyzer.
+
+    Args:
+        cursor: Cursor from a previous page (None for the first page)
+        part_types: Expected type of each sort key part (e.g. APARTMENT_CURSOR)
+
+    Returns:
+        Sort key tuple or None
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or of another endpoint
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(sort_key, list) or len(sort_key) != len(part_types) or not all(
+        isinstance(part, expected) and not isinstance(part, bool)
+        for part, expected in zip(sort_key, part_types)
+    ):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+    return tuple(sort_key)
+
+
+def build_page(rows: Iterator[Tuple[Tuple, Dict]], limit: int) -> Dict[str, Any]:
+    """
+    Collect one cursor page from a row iterator
+
+    The iterator should yield at most limit + 1 rows; the extra row only
+    signals that another page exists.
+
+    Args:
+        rows: Iterator of (sort key, row)
+        limit: Page size
+
+    Returns:
+        Page payload with items, next_cursor and has_more
+    """
+    page_items = []
+    last_key = None
+    has_more = False
+
+    for sort_key, row in rows:
+        if len(page_items) == limit:
+            has_more = True
+            break
+        page_items.append(row)
+        last_key = sort_key
+
+    return {
+        "items": page_items,
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(last_key) if has_more else None,
+    }
+
+
+def iter_ndjson(rows: Iterator[Tuple[Tuple, Dict]]) -> Iterator[bytes]:
+    """
+    Serialize rows as newline-delimited JSON
+
+    Args:
+        rows: Iterator of (sort key, row)
+
+    Yields:
+        One encoded JSON line per row
+    """
+    for _, row in rows:
+        yield dumps(row) + b"\n"
@@ -0,0 +1,327 @@
+"""
+Hot Query Statistics
+Records which analysis queries are requested so the cache warmer can
+recompute the most popular ones after each dataset reload, and tracks how
+much traffic is served from warmed results (warm coverage)
+
+Storage:
+- redis: one sorted set per endpoint (query signature -> request count) and
+  a coverage hash, shared by all API processes. Counts are buffered in
+  process and flushed every HOT_QUERY_FLUSH_SECONDS so requests never wait
+  on Redis
+- memory: in-process counters (single worker, or Redis disabled)
+
+Every recorded query is also logged as an "analysis_query" event, so the
+application log can be mined when Redis is not available.
+"""
+import os
+import json
+import time
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import structlog
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+# Configuration
+USE_REDIS = os.getenv('USE_REDIS', 'False').lower() == 'true'
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+HOT_QUERY_FLUSH_SECONDS = float(os.getenv('HOT_QUERY_FLUSH_SECONDS', '10'))
+HOT_QUERY_WINDOW_SECONDS = int(os.getenv('HOT_QUERY_WINDOW_SECONDS', '604800'))  # 7 days
+
+KEY_PREFIX = "apt_insights:hot_queries"
+COVERAGE_KEY = f"{KEY_PREFIX}:coverage"
+
+# Signatures kept per endpoint when counting in memory
+MAX_MEMORY_SIGNATURES = 5000
+
+# Result cache outcomes
+OUTCOME_WARM_HIT = "warm_hit"
+OUTCOME_HIT = "hit"
+OUTCOME_MISS = "miss"
+OUTCOMES = (OUTCOME_WARM_HIT, OUTCOME_HIT, OUTCOME_MISS)
+
+
+def _normalize(value: Any) -> Any:
+    """Make parameter values JSON-stable (sets are unordered)"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def query_signature(params: Dict[str, Any]) -> str:
+    """
+    Canonical signature of a query's parameters
+
+    Args:
+        params: Keyword arguments of the analyzer service call
+
+    Returns:
+        Compact JSON with sorted keys
+    """
+    normalized = {name: _normalize(value) for name, value in params.items()}
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def parse_signature(signature: str) -> Dict[str, Any]:
+    """Inverse of query_signature"""
+    return json.loads(signature)
+
+
+def load_queries_from_log(
+    log_path: Path,
+    endpoints: Optional[Iterable[str]] = None,
+) -> Dict[str, Counter]:
+    """
+    Count recorded queries in a JSON application log
+
+    Args:
+        log_path: Log file with one JSON event per line (logs/app.log)
+        endpoints: Only count these endpoints (None = all)
+
+    Returns:
+        Endpoint -> Counter of query signatures
+    """
+    wanted = set(endpoints) if endpoints else None
+    counts: Dict[str, Counter] = defaultdict(Counter)
+
+    with open(log_path, encoding='utf-8') as f:
+        for line in f:
+            if '"analysis_query"' not in line:
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            endpoint = event.get('endpoint')
+            signature = event.get('signature')
+            if event.get('event') != 'analysis_query' or not endpoint or signature is None:
+                continue
+            if wanted is None or endpoint in wanted:
+                counts[endpoint][signature] += 1
+
+    return counts
+
+
+class QueryStats:
+    """
+    Hot query and warm coverage statistics
+
+    Features:
+    - Top-N query signatures per endpoint (request count)
+    - Result cache outcomes per endpoint (warm hit / hit / miss)
+    - Buffered Redis writes shared across API processes
+    """
+
+    def __init__(self, redis_url: str = REDIS_URL):
+        """
+        Initialize query statistics
+
+        Args:
+            redis_url: Redis connection URL
+        """
+        self.logger = logger
+        self.client = None
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
+        self._outcomes: Dict[str, Counter] = defaultdict(Counter)
+        self._pending_counts: Dict[str, Counter] = defaultdict(Counter)
+        self._pending_outcomes: Dict[str, Counter] = defaultdict(Counter)
+        self._last_flush = time.monotonic()
+
+        if USE_REDIS and REDIS_AVAILABLE:
+            try:
+                self.client = redis.from_url(
+                    redis_url,
+                    encoding='utf-8',
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
+                self.client.ping()
+            except Exception as e:
+                self.logger.warning("query_stats_redis_unavailable", error=str(e))
+                self.client = None
+
+    @property
+    def backend(self) -> str:
+        """Storage backend name"""
+        return "redis" if self.client else "memory"
+
+    def record_query(self, endpoint: str, signature: str):
+        """
+        Record one request for a query
+
+        Args:
+            endpoint: Analyzer service method name
+            signature: query_signature of the call parameters
+        """
+        self.logger.info("analysis_query", endpoint=endpoint, signature=signature)
+
+        with self._lock:
+            if self.client:
+                self._pending_counts[endpoint][signature] += 1
+            else:
+                counts = self._counts[endpoint]
+                counts[signature] += 1
+                if len(counts) > MAX_MEMORY_SIGNATURES:
+                    self._counts[endpoint] = Counter(dict(counts.most_common(MAX_MEMORY_SIGNATURES // 2)))
+        self._maybe_flush()
+
+    def record_outcome(self, endpoint: str, outcome: str):
+        """
+        Record how a query was served by the result cache
+
+        Args:
+            endpoint: Analyzer service method name
+            outcome: warm_hit, hit or miss
+        """
+        with self._lock:
+            self._outcomes[endpoint][outcome] += 1
+            if self.client:
+                self._pending_outcomes[endpoint][outcome] += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if self.client and time.monotonic() - self._last_flush >= HOT_QUERY_FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """Write buffered counts to Redis in one pipeline"""
+        if not self.client:
+            return
+
+        with self._lock:
+            pending_counts, self._pending_counts = self._pending_counts, defaultdict(Counter)
+            pending_outcomes, self._pending_outcomes = self._pending_outcomes, defaultdict(Counter)
+            self._last_flush = time.monotonic()
+
+        if not pending_counts and not pending_outcomes:
+            return
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for endpoint, counts in pending_counts.items():
+                key = f"{KEY_PREFIX}:{endpoint}"
+                for signature, count in counts.items():
+                    pipe.zincrby(key, count, signature)
+                pipe.expire(key, HOT_QUERY_WINDOW_SECONDS)
+            for endpoint, outcomes in pending_outcomes.items():
+                for outcome, count in outcomes.items():
+                    pipe.hincrby(COVERAGE_KEY, f"{endpoint}:{outcome}", count)
+            pipe.execute()
+        except Exception as e:
+            self.logger.warning("query_stats_flush_failed", error=str(e))
+
+    def top_queries(self, endpoint: str, limit: int = 20) -> List[Tuple[str, int]]:
+        """
+        Most requested query signatures for an endpoint
+
+        Args:
+            endpoint: Analyzer service method name
+            limit: Number of signatures to return
+
+        Returns:
+            (signature, request count) pairs, most requested first
+        """
+        if self.client:
+            self.flush()
+            try:
+                ranked = self.client.zrevrange(f"{KEY_PREFIX}:{endpoint}", 0, limit - 1, withscores=True)
+                return [(signature, int(score)) for signature, score in ranked]
+            except Exception as e:
+                self.logger.warning("query_stats_read_failed", endpoint=endpoint, error=str(e))
+                return []
+
+        with self._lock:
+            return self._counts[endpoint].most_common(limit)
+
+    def coverage(self, shared: bool = True) -> Dict[str, Any]:
+        """
+        Fraction of requests served from warmed results
+
+        Args:
+            shared: Read totals of all processes from Redis when available
+                (otherwise this process only)
+
+        Returns:
+            Totals and per-endpoint outcome counts with warm_coverage ratios
+        """
+        outcomes: Dict[str, Counter] = defaultdict(Counter)
+
+        if shared and self.client:
+            self.flush()
+            try:
+                for field, count in self.client.hgetall(COVERAGE_KEY).items():
+                    endpoint, _, outcome = field.rpartition(':')
+                    outcomes[endpoint][outcome] += int(count)
+            except Exception as e:
+                self.logger.warning("query_stats_read_failed", error=str(e))
+                shared = False
+
+        if not (shared and self.client):
+            with self._lock:
+                for endpoint, counts in self._outcomes.items():
+                    outcomes[endpoint].update(counts)
+
+        def summarize(counts: Counter) -> Dict[str, Any]:
+            total = sum(counts[outcome] for outcome in OUTCOMES)
+            return {
+                **{outcome: counts[outcome] for outcome in OUTCOMES},
+                "requests": total,
+                "warm_coverage": round(counts[OUTCOME_WARM_HIT] / total, 4) if total else 0.0,
+                "hit_rate": round((counts[OUTCOME_WARM_HIT] + counts[OUTCOME_HIT]) / total, 4) if total else 0.0,
+            }
+
+        overall = Counter()
+        for counts in outcomes.values():
+            overall.update(counts)
+
+        return {
+            "backend": self.backend if shared else "memory",
+            **summarize(overall),
+            "by_endpoint": {endpoint: summarize(counts) for endpoint, counts in sorted(outcomes.items())},
+        }
+
+    def reset(self):
+        """Clear all statistics (tests, or after changing the endpoint set)"""
+        with self._lock:
+            self._counts.clear()
+            self._outcomes.clear()
+            self._pending_counts.clear()
+            self._pending_outcomes.clear()
+
+        if self.client:
+            try:
+                keys = list(self.client.scan_iter(match=f"{KEY_PREFIX}:*", count=500))
+                if keys:
+                    self.client.delete(*keys)
+            except Exception as e:
+                self.logger.warning("query_stats_reset_failed", error=str(e))
+
+
+# Singleton instance
+_query_stats: Optional[QueryStats] = None
+
+
+def get_query_stats() -> QueryStats:
+    """
+    Get query statistics singleton
+
+    Returns:
+        QueryStats instance
+    """
+    global _query_stats
+    if _query_stats is None:
+        _query_stats = QueryStats()
+    return _query_stats
@@ -0,0 +1,182 @@
+"""
+Report Service
+Renders the PDF analysis report (summary statistics, monthly trend and
+regional comparison) for export jobs
+"""
+from datetime import datetime
+from typing import Dict, List
+import structlog
+
+from schemas.subscription import ExportFilters
+from services.analyzer_service import get_analyzer_service
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+# Built-in CID font with Hangul glyphs (no font file needed)
+REPORT_FONT = "HYSMyeongJo-Medium"
+
+# Rows shown in the monthly trend / regional tables
+REPORT_MAX_MONTHS = 24
+REPORT_TOP_REGIONS = 15
+
+
+def _won(value) -> str:
+    """Format a 만원 amount for display"""
+    return f"{value:,.0f}만원" if value else "-"
+
+
+def build_report_sections(filters: ExportFilters) -> Dict:
+    """
+    Run the analyses included in the PDF report
+
+    Args:
+        filters: Export filters
+
+    Returns:
+        Dict with basic_stats, price_trend, regional and metadata
+    """
+    service = get_analyzer_service()
+
+    basic_stats, metadata = service.get_basic_stats(
+        region_filter=filters.region,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+    )
+    price_trend, _ = service.get_price_trend(
+        region_filter=filters.region,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+    )
+    regional, _ = service.get_regional_analysis(
+        regions=[filters.region] if filters.region else None,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+        top_n=REPORT_TOP_REGIONS,
+    )
+
+    return {
+        "basic_stats": basic_stats,
+        "price_trend": price_trend,
+        "regional": regional,
+        "metadata": metadata,
+    }
+
+
+def _table(rows: List[List[str]]):
+    table = Table(rows, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (-1, -1), REPORT_FONT),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+    ]))
+    return table
+
+
+def write_pdf_report(filters: ExportFilters, path: str) -> int:
+    """
+    Render the analysis report to a PDF file
+
+    Args:
+        filters: Export filters
+        path: Output file path
+
+    Returns:
+        Number of transactions covered by the report
+
+    Raises:
+        RuntimeError: If reportlab is not installed
+    """
+    if not REPORTLAB_AVAILABLE:
+        raise RuntimeError("reportlab is required for PDF reports")
+
+    if REPORT_FONT not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(REPORT_FONT))
+
+    sections = build_report_sections(filters)
+    stats = sections["basic_stats"]
+    metadata = sections["metadata"]
+
+    styles = getSampleStyleSheet()
+    for name in ("Title", "Heading2", "Normal"):
+        styles[name].fontName = REPORT_FONT
+
+    scope = ", ".join(
+        f"{key}={value}" for key, value in filters.model_dump(exclude_none=True).items()
+    ) or "전체"
+
+    story = [
+        Paragraph("아파트 실거래가 분석 리포트", styles["Title"]),
+        Paragraph(f"조건: {scope}", styles["Normal"]),
+        Paragraph(f"생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles["Normal"]),
+        Spacer(1, 12),
+        Paragraph("기본 통계", styles["Heading2"]),
+        _table([
+            ["항목", "값"],
+            ["거래 건수", f"{stats.get('total_count', 0):,}건"],
+            ["평균 거래금액", _won(stats.get("avg_price"))],
+            ["중위 거래금액", _won(stats.get("median_price"))],
+            ["최고 거래금액", _won(stats.get("max_price"))],
+            ["최저 거래금액", _won(stats.get("min_price"))],
+            ["평균 전용면적", f"{stats.get('avg_area', 0):.1f}㎡"],
+        ]),
+        Spacer(1, 12),
+    ]
+
+    monthly = sections["price_trend"].get("monthly_trend", {})
+    if monthly:
+        months = sorted(monthly)[-REPORT_MAX_MONTHS:]
+        story += [
+            Paragraph("월별 가격 추이", styles["Heading2"]),
+            _table([["계약년월", "거래 건수", "평균", "중위"]] + [
+                [
+                    month,
+                    f"{monthly[month]['count']:,}",
+                    _won(monthly[month]["avg_price"]),
+                    _won(monthly[month]["median_price"]),
+                ]
+                for month in months
+            ]),
+            Spacer(1, 12),
+        ]
+
+    regions = sorted(
+        sections["regional"].get("data", []),
+        key=lambda row: row["count"],
+        reverse=True,
+    )[:REPORT_TOP_REGIONS]
+    if regions:
+        story += [
+            Paragraph("지역별 비교", styles["Heading2"]),
+            _table([["지역", "거래 건수", "평균", "중위"]] + [
+                [
+                    region["region"],
+                    f"{region['count']:,}",
+                    _won(region["avg_price"]),
+                    _won(region["median_price"]),
+                ]
+                for region in regions
+            ]),
+        ]
+
+    SimpleDocTemplate(path, pagesize=A4, title="아파트 실거래가 분석 리포트").build(story)
+
+    logger.info(
+        "pdf_report_rendered",
+        path=path,
+        filtered_records=metadata.get("filtered_records"),
+    )
+
+    return metadata.get("filtered_records") or 0
@@ -0,0 +1,187 @@
+"""
+Request Deadlines and Cancellation
+Runs analyzer calls in the threadpool under a cancellation token, so work
+is abandoned at the next analyzer checkpoint once the client disconnects
+or the request deadline passes
+
+Deadline per request:
+- Route deadline from REQUEST_DEADLINES_MS ("path=ms,path=ms"), falling
+  back to DEFAULT_REQUEST_DEADLINE_MS
+- Clients may shorten it with the X-Request-Deadline-Ms header (never
+  extend it past the route deadline)
+"""
+import os
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import structlog
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+# Add parent directory to sys.path to import backend modules
+backend_path = Path(__file__).parent.parent.parent
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
+
+from backend.analyzer.utils import AnalysisCancelled, CancellationToken, cancellation_scope
+
+logger = structlog.get_logger(__name__)
+
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+
+# 499: client closed request (nginx convention); the response is never read
+STATUS_CLIENT_CLOSED_REQUEST = 499
+
+# Configuration
+DEFAULT_REQUEST_DEADLINE_MS = float(os.getenv("DEFAULT_REQUEST_DEADLINE_MS", "30000"))
+DISCONNECT_POLL_MS = float(os.getenv("DISCONNECT_POLL_MS", "100"))
+
+DEFAULT_ROUTE_DEADLINES_MS: Dict[str, float] = {
+    "/api/v1/analysis/by-apartment": 15000,
+    "/api/v1/analysis/by-apartment/page": 10000,
+    "/api/v1/analysis/apartment-detail": 10000,
+    "/api/v1/investment/gap-investment": 15000,
+    "/api/v1/investment/bargain-sales": 15000,
+    "/api/v1/investment/bargain-sales/page": 10000,
+    "/api/v1/market/compare-periods": 20000,
+    "/api/v1/market/signals": 20000,
+}
+
+
+def _parse_route_deadlines(raw: Optional[str]) -> Dict[str, float]:
+    """Parse "path=ms,path=ms" into a dict"""
+    deadlines = {}
+    for entry in (raw or "").split(","):
+        path, _, value = entry.partition("=")
+        if path.strip() and value.strip():
+            try:
+                deadlines[path.strip()] = float(value)
+            except ValueError:
+                logger.warning("invalid_route_deadline", entry=entry)
+    return deadlines
+
+
+ROUTE_DEADLINES_MS: Dict[str, float] = {
+    **DEFAULT_ROUTE_DEADLINES_MS,
+    **_parse_route_deadlines(os.getenv("REQUEST_DEADLINES_MS")),
+}
+
+# Moving average of completed analysis durations (seconds), used to
+# estimate how much work a cancellation avoided
+_avg_duration: Dict[str, float] = {}
+
+
+def resolve_deadline_ms(request: Request) -> Optional[float]:
+    """
+    Deadline budget for a request
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Deadline in milliseconds, or None when unlimited
+    """
+    route_ms = ROUTE_DEADLINES_MS.get(request.url.path, DEFAULT_REQUEST_DEADLINE_MS)
+    deadline_ms = route_ms if route_ms > 0 else None
+
+    header = request.headers.get(DEADLINE_HEADER)
+    if header:
+        try:
+            header_ms = float(header)
+        except ValueError:
+            header_ms = 0
+        if header_ms > 0:
+            deadline_ms = min(deadline_ms, header_ms) if deadline_ms else header_ms
+
+    return deadline_ms
+
+
+def _record_cancelled(analysis_type: str, reason: str, elapsed: float):
+    """Log and record a cancelled analysis with its estimated avoided work"""
+    avoided = max(0.0, _avg_duration.get(analysis_type, 0.0) - elapsed)
+
+    logger.warning(
+        "analysis_cancelled",
+        analysis_type=analysis_type,
+        reason=reason,
+        elapsed_ms=round(elapsed * 1000, 2),
+        estimated_avoided_ms=round(avoided * 1000, 2),
+    )
+
+    try:
+        from routers.metrics import record_analysis_cancelled
+        record_analysis_cancelled(analysis_type, reason, avoided)
+    except Exception as e:
+        logger.warning("cancellation_metrics_failed", error=str(e))
+
+
+async def run_analysis(
+    request: Request,
+    analysis_type: str,
+    func: Callable,
+    *args,
+    **kwargs,
+) -> Any:
+    """
+    Run an analyzer call in the threadpool with deadline and disconnect
+    cancellation
+
+    Args:
+        request: Incoming request (deadline header, disconnect detection)
+        analysis_type: Label for logs and metrics
+        func: Blocking analyzer service call
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        func's return value
+
+    Raises:
+        HTTPException: 504 when the deadline passes, 499 when the client
+            disconnected
+    """
+    deadline_ms = resolve_deadline_ms(request)
+    token = CancellationToken(
+        deadline=time.monotonic() + deadline_ms / 1000 if deadline_ms else None
+    )
+    started = time.perf_counter()
+
+    def run():
+        with cancellation_scope(token):
+            # Deadline may already have passed while queued for a thread
+            token.check()
+            return func(*args, **kwargs)
+
+    task = asyncio.ensure_future(run_in_threadpool(run))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_MS / 1000)
+            if done:
+                break
+            if await request.is_disconnected():
+                token.cancel("client_disconnected")
+        result = task.result()
+
+    except AnalysisCancelled as e:
+        _record_cancelled(analysis_type, e.reason, time.perf_counter() - started)
+        if e.reason == "client_disconnected":
+            raise HTTPException(
+                status_code=STATUS_CLIENT_CLOSED_REQUEST,
+                detail="Client closed request",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Analysis exceeded its {deadline_ms:.0f}ms deadline",
+        )
+
+    except asyncio.CancelledError:
+        # Request task itself cancelled (server shutdown): stop the thread too
+        token.cancel("request_cancelled")
+        raise
+
+    elapsed = time.perf_counter() - started
+    previous = _avg_duration.get(analysis_type)
+    _avg_duration[analysis_type] = elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+
+    return result
@@ -0,0 +1,227 @@
+"""
+Startup Warmup Service
+Preloads the dataset and runs warmup analysis queries before the
+readiness probe reports the worker as ready
+"""
+import os
+import time
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import structlog
+
+from services.analyzer_service import AnalyzerService, get_analyzer_service
+
+logger = structlog.get_logger(__name__)
+
+# Analyzer service methods run during warmup (comma-separated in WARMUP_QUERIES)
+DEFAULT_WARMUP_QUERIES = [
+    "get_basic_stats",
+    "get_price_trend",
+    "get_regional_analysis",
+    "get_apartment_analysis",
+    "get_price_per_area",
+    "get_bargain_sales",
+]
+
+# Retry a failed dataset load with exponential backoff (0 = retry until it succeeds)
+WARMUP_MAX_RETRIES = int(os.getenv("WARMUP_MAX_RETRIES", "0"))
+WARMUP_RETRY_BASE_SECONDS = float(os.getenv("WARMUP_RETRY_BASE_SECONDS", "5"))
+WARMUP_RETRY_MAX_SECONDS = float(os.getenv("WARMUP_RETRY_MAX_SECONDS", "300"))
+
+
+class WarmupState:
+    """
+    Tracks the startup warmup phase
+
+    States:
+    - pending: warmup has not started
+    - running: dataset load / warmup queries in progress
+    - ready: warmup finished, worker can receive traffic
+    - failed: dataset could not be loaded (retried after next_retry_at
+      unless WARMUP_MAX_RETRIES is exhausted)
+    """
+
+    def __init__(self):
+        self.status = "pending"
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.duration_ms: Optional[float] = None
+        self.record_count = 0
+        self.queries: Dict[str, Dict] = {}
+        self.error: Optional[str] = None
+        self.retries = 0
+        self.next_retry_at: Optional[str] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the worker finished warming up"""
+        return self.status == "ready"
+
+    def to_dict(self) -> Dict:
+        """Serialize state for health endpoints"""
+        return {
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_ms": self.duration_ms,
+            "record_count": self.record_count,
+            "queries": self.queries,
+            "error": self.error,
+            "retries": self.retries,
+            "next_retry_at": self.next_retry_at,
+        }
+
+
+# Singleton instance
+_warmup_state: Optional[WarmupState] = None
+
+
+def get_warmup_state() -> WarmupState:
+    """
+    Get warmup state singleton
+
+    Returns:
+        WarmupState instance
+    """
+    global _warmup_state
+    if _warmup_state is None:
+        _warmup_state = WarmupState()
+    return _warmup_state
+
+
+def get_warmup_queries() -> List[str]:
+    """
+    Read the configured warmup query list
+
+    Returns:
+        Analyzer service method names to run during warmup
+    """
+    configured = os.getenv("WARMUP_QUERIES")
+    if not configured:
+        return list(DEFAULT_WARMUP_QUERIES)
+    return [name.strip() for name in configured.split(",") if name.strip()]
+
+
+def retry_delay(retries: int) -> float:
+    """
+    Backoff before the next warmup attempt
+
+    Args:
+        retries: Retries already made
+
+    Returns:
+        Seconds to wait (doubles per retry, capped at WARMUP_RETRY_MAX_SECONDS)
+    """
+    return min(WARMUP_RETRY_MAX_SECONDS, WARMUP_RETRY_BASE_SECONDS * (2 ** retries))
+
+
+def run_warmup(
+    service: Optional[AnalyzerService] = None,
+    queries: Optional[List[str]] = None,
+) -> WarmupState:
+    """
+    Load the dataset, build indexes and run warmup queries
+
+    Runs synchronously; call from a worker thread at startup.
+    Individual query failures are recorded but do not block readiness.
+
+    Args:
+        service: Analyzer service to warm (defaults to the shared singleton)
+        queries: Analyzer service method names (defaults to WARMUP_QUERIES)
+
+    Returns:
+        Final warmup state
+    """
+    state = get_warmup_state()
+    service = service or get_analyzer_service()
+    queries = queries if queries is not None else get_warmup_queries()
+
+    state.status = "running"
+    state.started_at = datetime.now().isoformat()
+    state.queries = {}
+    state.error = None
+    start_time = time.time()
+
+    logger.info("warmup_started", queries=queries)
+
+    # Dataset load builds the date index as part of _load_data
+    try:
+        items, _ = service._load_data(force_reload=True)
+        state.record_count = len(items)
+    except Exception as e:
+        state.status = "failed"
+        state.error = str(e)
+        state.finished_at = datetime.now().isoformat()
+        logger.error("warmup_dataset_load_failed", error=str(e))
+        return state
+
+    for name in queries:
+        method = getattr(service, name, None)
+        if method is None:
+            logger.warning("warmup_unknown_query", query=name)
+            state.queries[name] = {"success": False, "error": "unknown query"}
+            continue
+
+        query_start = time.time()
+        try:
+            if getattr(method, 'cached_query', False):
+                # Stored in the result cache as a warm entry for default-filter requests
+                service.warm_query(name)
+            else:
+                method()
+            state.queries[name] = {
+                "success": True,
+                "duration_ms": round((time.time() - query_start) * 1000, 2),
+            }
+        except Exception as e:
+            logger.warning("warmup_query_failed", query=name, error=str(e))
+            state.queries[name] = {"success": False, "error": str(e)}
+
+    state.duration_ms = round((time.time() - start_time) * 1000, 2)
+    state.finished_at = datetime.now().isoformat()
+    state.status = "ready"
+
+    logger.info(
+        "warmup_completed",
+        duration_ms=state.duration_ms,
+        record_count=state.record_count,
+        queries=len(queries),
+    )
+
+    return state
+
+
+async def run_startup_warmup() -> WarmupState:
+    """
+    Run warmup off the event loop at application startup
+
+    Controlled by WARMUP_ON_STARTUP (default: true). When disabled the
+    worker is marked ready immediately. A failed dataset load (e.g. the
+    database is not reachable yet) is retried with exponential backoff, so
+    the worker becomes ready once the data source recovers.
+
+    Returns:
+        Final warmup state
+    """
+    state = get_warmup_state()
+
+    if os.getenv("WARMUP_ON_STARTUP", "true").lower() != "true":
+        state.status = "ready"
+        logger.info("warmup_skipped")
+        return state
+
+    state = await asyncio.to_thread(run_warmup)
+    while state.status == "failed" and (
+        WARMUP_MAX_RETRIES <= 0 or state.retries < WARMUP_MAX_RETRIES
+    ):
+        delay = retry_delay(state.retries)
+        state.next_retry_at = (datetime.now() + timedelta(seconds=delay)).isoformat()
+        logger.warning("warmup_retry_scheduled", retries=state.retries, delay_seconds=delay)
+
+        await asyncio.sleep(delay)
+        state.retries += 1
+        state.next_retry_at = None
+        state = await asyncio.to_thread(run_warmup)
+
+    return state
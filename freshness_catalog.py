@@ -0,0 +1,409 @@
+"""
+수집 신선도 카탈로그
+작업 단위 (api_type, lawd_cd, deal_ymd)별로 어디에 있는지(API 수집, 출력 JSON 파일,
+데이터베이스), 언제 마지막으로 받았는지, 내용이 언제 바뀌었는지, 내용 해시를 기록합니다.
+
+증분 수집:
+- 카탈로그에 없는 단위와 최근 COLLECT_RECHECK_MONTHS개월(지연 신고, 해제 신고가
+  들어오는 기간)만 다시 수집하고, 그 이전 월은 건너뜀
+- 다시 받은 결과의 내용 해시가 같으면 받은 시각만 갱신하고, 파일 저장소로는
+  흘려보내지 않음 (CatalogSink)
+- 이름이 있는 저장소(DatabaseSink 등)는 저장소별로 기록한 내용 해시를 따로 추적해,
+  그 저장소에 없거나 다른 내용인 단위만 씀. 증분 수집도 이런 저장소에 없는 단위는
+  다시 수집
+
+수집 저널이 실행 단위(재개용) 기록이라면, 카탈로그는 모든 실행이 공유하는
+전역 기록입니다. 결과 자체는 저장하지 않습니다.
+
+Usage:
+    catalog = get_freshness_catalog()
+    due, fresh = catalog.split_due(keys)       # 증분 수집 대상
+    status = catalog.record(key, result)       # 'new' | 'changed' | 'unchanged'
+    catalog.record_sink('database', {key: digest})  # 저장소에 기록한 내용
+"""
+import os
+import json
+import sqlite3
+import asyncio
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from collection_journal import COLLECT_JOURNAL_DIR
+from collection_planner import months_between
+from common import content_hash, is_complete_result
+from backend.cache.redis_client import CacheKey
+
+# 카탈로그 파일 / 증분 수집 재확인 기간
+COLLECT_CATALOG_PATH = Path(os.getenv(
+    'COLLECT_CATALOG_PATH',
+    str(COLLECT_JOURNAL_DIR / 'freshness_catalog.sqlite3')
+))
+COLLECT_RECHECK_MONTHS = int(os.getenv('COLLECT_RECHECK_MONTHS', '3'))
+
+# 기록 출처
+SOURCE_API = 'api'
+SOURCE_FILE = 'file'
+SOURCE_DATABASE = 'database'
+
+# 내용을 따로 추적하는 저장소 이름
+SINK_DATABASE = 'database'
+
+# record 결과
+STATUS_NEW = 'new'
+STATUS_CHANGED = 'changed'
+STATUS_UNCHANGED = 'unchanged'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    api_type TEXT NOT NULL,
+    lawd_cd TEXT NOT NULL,
+    deal_ymd TEXT NOT NULL,
+    content_hash TEXT,
+    item_count INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    changed_at TEXT NOT NULL,
+    PRIMARY KEY (api_type, lawd_cd, deal_ymd)
+);
+CREATE TABLE IF NOT EXISTS sink_units (
+    sink TEXT NOT NULL,
+    api_type TEXT NOT NULL,
+    lawd_cd TEXT NOT NULL,
+    deal_ymd TEXT NOT NULL,
+    content_hash TEXT,
+    written_at TEXT NOT NULL,
+    PRIMARY KEY (sink, api_type, lawd_cd, deal_ymd)
+);
+"""
+
+# SQLite 변수 개수 제한 아래로 키 조회를 나눔
+_LOOKUP_CHUNK = 300
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+class FreshnessCatalog:
+    """
+    SQLite 신선도 카탈로그
+
+    여러 스레드(동기 수집, CatalogSink의 to_thread)가 쓰도록 커넥션을 락으로 보호합니다.
+    """
+
+    def __init__(self, path: Path = COLLECT_CATALOG_PATH):
+        """
+        Args:
+            path: 카탈로그 파일 경로 (없으면 생성)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def record(
+        self,
+        key: CacheKey,
+        result: Dict,
+        source: str = SOURCE_API,
+        digest: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        작업 단위 결과 기록
+
+        Args:
+            key: (api_type, lawd_cd, deal_ymd)
+            result: 수집 결과 (에러 결과와 일부 페이지만 받은 결과는 기록하지 않음)
+            source: 기록 출처
+            digest: 이미 계산한 아이템 내용 해시 (None이면 계산)
+
+        Returns:
+            'new' (처음 기록), 'changed' (내용 변경), 'unchanged' (내용 동일, 받은 시각만 갱신),
+            기록하지 않았으면 None
+        """
+        if not is_complete_result(result):
+            return None
+
+        items = result.get('items', [])
+        digest = digest or content_hash(items)
+        now = _now()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM units WHERE api_type = ? AND lawd_cd = ? AND deal_ymd = ?",
+                key
+            ).fetchone()
+
+            if row is not None and row[0] == digest:
+                self._conn.execute(
+                    "UPDATE units SET fetched_at = ?, source = ? WHERE api_type = ? AND lawd_cd = ? AND deal_ymd = ?",
+                    (now, source, *key)
+                )
+                status = STATUS_UNCHANGED
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO units VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*key, digest, len(items), source, now, now)
+                )
+                status = STATUS_NEW if row is None else STATUS_CHANGED
+            self._conn.commit()
+
+        return status
+
+    async def record_async(
+        self,
+        key: CacheKey,
+        result: Dict,
+        source: str = SOURCE_API,
+        digest: Optional[str] = None
+    ) -> Optional[str]:
+        """record를 스레드에서 실행 (이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.record, key, result, source, digest)
+
+    def held_by_sinks(self, key: CacheKey) -> Dict[str, Optional[str]]:
+        """
+        작업 단위를 기록한 저장소와 그때의 내용 해시
+
+        Args:
+            key: (api_type, lawd_cd, deal_ymd)
+
+        Returns:
+            저장소 이름 -> 내용 해시 (DB에서 가져와 해시를 모르면 None)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT sink, content_hash FROM sink_units WHERE api_type = ? AND lawd_cd = ? AND deal_ymd = ?",
+                key
+            ).fetchall()
+        return dict(rows)
+
+    def record_sink(self, sink: str, entries: Dict[CacheKey, Optional[str]]) -> None:
+        """
+        저장소에 기록한 작업 단위 등록 (저장소가 실제로 쓴 뒤 호출)
+
+        Args:
+            sink: 저장소 이름 (예: SINK_DATABASE)
+            entries: 작업 단위 -> 기록한 내용 해시
+        """
+        now = _now()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sink_units VALUES (?, ?, ?, ?, ?, ?)",
+                [(sink, *key, digest, now) for key, digest in entries.items()]
+            )
+            self._conn.commit()
+
+    def _sink_hashes(self, sink: str, keys: List[CacheKey]) -> Dict[CacheKey, Optional[str]]:
+        held: Dict[CacheKey, Optional[str]] = {}
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                placeholders = ', '.join(['(?, ?, ?)'] * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT api_type, lawd_cd, deal_ymd, content_hash FROM sink_units "
+                    f"WHERE sink = ? AND (api_type, lawd_cd, deal_ymd) IN (VALUES {placeholders})",
+                    [sink, *(value for key in chunk for value in key)]
+                ).fetchall()
+                for api_type, lawd_cd, deal_ymd, digest in rows:
+                    held[(api_type, lawd_cd, deal_ymd)] = digest
+        return held
+
+    def lookup(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, Dict[str, Any]]:
+        """
+        작업 단위별 카탈로그 기록
+
+        Args:
+            keys: 조회할 (api_type, lawd_cd, deal_ymd) 목록
+
+        Returns:
+            기록이 있는 키 -> {'content_hash', 'item_count', 'source', 'fetched_at', 'changed_at'}
+        """
+        keys = list(keys)
+        entries: Dict[CacheKey, Dict[str, Any]] = {}
+
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                placeholders = ', '.join(['(?, ?, ?)'] * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT api_type, lawd_cd, deal_ymd, content_hash, item_count, source, fetched_at, changed_at "
+                    f"FROM units WHERE (api_type, lawd_cd, deal_ymd) IN (VALUES {placeholders})",
+                    [value for key in chunk for value in key]
+                ).fetchall()
+                for api_type, lawd_cd, deal_ymd, digest, item_count, source, fetched_at, changed_at in rows:
+                    entries[(api_type, lawd_cd, deal_ymd)] = {
+                        'content_hash': digest,
+                        'item_count': item_count,
+                        'source': source,
+                        'fetched_at': datetime.fromisoformat(fetched_at),
+                        'changed_at': datetime.fromisoformat(changed_at),
+                    }
+
+        return entries
+
+    def split_due(
+        self,
+        keys: Iterable[CacheKey],
+        recheck_months: Optional[int] = None,
+        today: Optional[datetime] = None,
+        sinks: Sequence[str] = ()
+    ) -> Tuple[List[CacheKey], List[CacheKey]]:
+        """
+        증분 수집 대상 분리
+
+        Args:
+            keys: 요청 범위의 작업 단위
+            recheck_months: 기록이 있어도 다시 받을 최근 개월 수, 이번 달 포함
+                (None이면 COLLECT_RECHECK_MONTHS)
+            today: 기준일 (None이면 오늘)
+            sinks: 결과를 받을 저장소 이름. 이 저장소들이 카탈로그와 같은 내용을
+                갖고 있지 않은 단위도 수집
+
+        Returns:
+            (수집할 단위: 카탈로그에 없거나 재확인 기간이거나 저장소에 없음, 건너뛸 단위),
+            입력 순서 유지
+        """
+        keys = list(keys)
+        if recheck_months is None:
+            recheck_months = COLLECT_RECHECK_MONTHS
+        today = today or datetime.now()
+        known = self.lookup(keys)
+        held = [self._sink_hashes(sink, keys) for sink in sinks]
+
+        due, fresh = [], []
+        for key in keys:
+            if (
+                key not in known
+                or months_between(key[2], today) < recheck_months
+                or any(key not in hashes or hashes[key] != known[key]['content_hash'] for hashes in held)
+            ):
+                due.append(key)
+            else:
+                fresh.append(key)
+        return due, fresh
+
+    def import_output_files(self, base_path: Optional[Path] = None) -> int:
+        """
+        api_*/output의 수집 결과 JSON 파일을 카탈로그에 등록 (기록이 없는 단위만)
+
+        Args:
+            base_path: 프로젝트 루트 (None이면 이 파일 위치)
+
+        Returns:
+            새로 등록한 단위 수
+        """
+        base_path = Path(base_path) if base_path else Path(__file__).parent
+        rows = []
+
+        for json_file in sorted(base_path.glob('api_*/output/*test_results*.json')):
+            api_type = json_file.parent.parent.name
+            fetched_at = datetime.fromtimestamp(json_file.stat().st_mtime).isoformat(timespec='microseconds')
+            try:
+                with open(json_file, encoding='utf-8') as f:
+                    test_results = json.load(f).get('test_results', [])
+            except (OSError, ValueError):
+                continue
+
+            for test_result in test_results:
+                result = test_result.get('result') or {}
+                lawd_cd, deal_ymd = test_result.get('lawd_cd'), test_result.get('deal_ymd')
+                if not is_complete_result(result) or not lawd_cd or not deal_ymd:
+                    continue
+                items = result.get('items', [])
+                rows.append((
+                    api_type, lawd_cd, deal_ymd, content_hash(items), len(items),
+                    SOURCE_FILE, fetched_at, fetched_at
+                ))
+
+        return self._insert_missing(rows)
+
+    def import_database(self, session) -> int:
+        """
+        transactions 테이블에 있는 (API, 지역, 월)을 카탈로그에 등록 (기록이 없는 단위만)
+
+        DB 행은 정규화된 형태라 API 결과와 같은 해시를 만들 수 없으므로 해시 없이
+        등록합니다. 다음 수집에서 받은 결과는 'changed'로 기록됩니다. DB 저장소
+        기록(SINK_DATABASE)도 해시 없이 등록하므로, API에서 받은 해시가 이미 있는
+        단위는 다음 DB 적재 때 다시 병합됩니다.
+
+        Args:
+            session: SQLAlchemy 세션
+
+        Returns:
+            새로 등록한 단위 수
+        """
+        from sqlalchemy import text
+
+        result = session.execute(text(
+            "SELECT transaction_type, sgg_cd, _year_month, COUNT(*), MAX(created_at) "
+            "FROM transactions "
+            "WHERE sgg_cd IS NOT NULL AND _year_month IS NOT NULL "
+            "GROUP BY transaction_type, sgg_cd, _year_month"
+        ))
+        rows = []
+        for api_type, lawd_cd, deal_ymd, count, created_at in result:
+            fetched_at = (created_at or datetime.now()).isoformat(timespec='microseconds')
+            rows.append((api_type, lawd_cd, deal_ymd, None, count, SOURCE_DATABASE, fetched_at, fetched_at))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sink_units VALUES (?, ?, ?, ?, NULL, ?)",
+                [(SINK_DATABASE, *row[:3], row[6]) for row in rows]
+            )
+        return self._insert_missing(rows)
+
+    def _insert_missing(self, rows: List[tuple]) -> int:
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO units VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        카탈로그 현황
+
+        Returns:
+            전체 단위 수, 출처별 단위 수, 아이템 수
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, COUNT(*), COALESCE(SUM(item_count), 0) FROM units GROUP BY source"
+            ).fetchall()
+        return {
+            'path': str(self.path),
+            'units': sum(count for _, count, _ in rows),
+            'items': sum(items for _, _, items in rows),
+            'by_source': {source: count for source, count, _ in rows},
+        }
+
+    def close(self):
+        """커넥션 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤 인스턴스
+_catalog: Optional[FreshnessCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_freshness_catalog() -> FreshnessCatalog:
+    """
+    공유 신선도 카탈로그 (COLLECT_CATALOG_PATH)
+
+    Returns:
+        FreshnessCatalog 인스턴스
+    """
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = FreshnessCatalog()
+        return _catalog
@@ -215,6 +215,9 @@ class APILogger:
         """
         self.logger = get_logger(f"api.{api_name}")
         self.api_name = api_name
+        self._timed_requests = 0
+        self._fetch_seconds = 0.0
+        self._parse_seconds = 0.0
 
     def log_request(
         self,
@@ -312,6 +315,46 @@ class APILogger:
             reason=reason
         )
 
+    def log_timing(
+        self,
+        fetch_time: float,
+        parse_time: float,
+        **extra
+    ) -> None:
+        """
+        요청 시간 분해 로깅 (네트워크 수신 / 파싱) 및 누적
+
+        Args:
+            fetch_time: 요청 시작부터 응답 본문 수신까지 (초)
+            parse_time: 응답 파싱 시간, 파싱 실행기 대기 포함 (초)
+            **extra: 추가 메트릭
+        """
+        self._timed_requests += 1
+        self._fetch_seconds += fetch_time
+        self._parse_seconds += parse_time
+        self.logger.debug(
+            "api_timing",
+            api=self.api_name,
+            fetch_time=round(fetch_time, 4),
+            parse_time=round(parse_time, 4),
+            **extra
+        )
+
+    def timing_stats(self) -> Dict[str, Any]:
+        """
+        누적 요청 시간 분해
+
+        Returns:
+            요청 수, 수신 시간 합계, 파싱 시간 합계, 파싱 비중
+        """
+        total = self._fetch_seconds + self._parse_seconds
+        return {
+            'requests': self._timed_requests,
+            'fetch_seconds': round(self._fetch_seconds, 3),
+            'parse_seconds': round(self._parse_seconds, 3),
+            'parse_share': round(self._parse_seconds / total, 3) if total else 0.0,
+        }
+
 
 # 성능 메트릭 로깅
 class PerformanceLogger:
@@ -0,0 +1,203 @@
+"""
+응답 파싱 실행기
+비동기 클라이언트(AsyncAPIClient)가 받은 XML 응답을 이벤트 루프 밖에서 파싱합니다.
+
+1000건 페이지 하나의 파싱에 수십 ms가 걸리므로 이벤트 루프에서 파싱하면 그동안 다른
+요청의 송수신이 모두 멈춥니다. 실행 방식 (API_PARSE_EXECUTOR):
+- inline: 이벤트 루프에서 바로 파싱 (이전 동작)
+- thread: 스레드 풀에서 파싱. 파싱 중에도 루프가 I/O를 처리하지만 GIL 때문에 CPU는 1개
+- process: 프로세스 풀에서 파싱. 코어 수만큼 병렬로 파싱하고 루프는 결과 역직렬화만 수행
+
+- 작은 응답(API_PARSE_INLINE_BYTES 미만, 에러/빈 결과 등)은 풀로 넘기는 비용이 더 커서 바로 파싱
+- 백프레셔: 풀에 넘긴 파싱이 API_PARSE_MAX_PENDING개면 다음 파싱은 자리가 날 때까지 대기
+  (그동안 해당 작업은 다음 요청을 보내지 않으므로 수신이 파싱을 앞지르지 않음)
+
+Usage:
+    executor = get_parse_executor()
+    result, parse_time = await executor.parse_xml(body)
+"""
+import os
+import time
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple, Union
+
+from common import parse_xml_response
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# 실행 방식
+MODE_INLINE = 'inline'
+MODE_THREAD = 'thread'
+MODE_PROCESS = 'process'
+PARSE_MODES = (MODE_INLINE, MODE_THREAD, MODE_PROCESS)
+
+# 파싱 실행기 설정
+API_PARSE_EXECUTOR = os.getenv('API_PARSE_EXECUTOR', MODE_THREAD).lower()
+API_PARSE_WORKERS = int(os.getenv('API_PARSE_WORKERS', str(min(4, os.cpu_count() or 1))))
+API_PARSE_MAX_PENDING = int(os.getenv('API_PARSE_MAX_PENDING', '0'))          # 0이면 워커 수 × 2
+API_PARSE_INLINE_BYTES = int(os.getenv('API_PARSE_INLINE_BYTES', '65536'))    # 이보다 작은 응답은 바로 파싱
+
+
+def _parse_timed(body: Union[str, bytes]) -> Tuple[Dict, float]:
+    """워커에서 파싱하고 파싱에 쓴 시간(초)을 함께 반환 (대기 시간과 구분)"""
+    started = time.perf_counter()
+    result = parse_xml_response(body)
+    return result, time.perf_counter() - started
+
+
+class ParseExecutor:
+    """
+    XML 응답 파싱 실행기
+
+    풀은 처음 넘길 때 만들고, 백프레셔 세마포어는 이벤트 루프별로 만듭니다.
+    process 모드는 fork 대신 spawn으로 워커를 만들어 부모의 스레드/이벤트 루프 상태를
+    물려받지 않습니다.
+    """
+
+    def __init__(
+        self,
+        mode: str = API_PARSE_EXECUTOR,
+        workers: int = API_PARSE_WORKERS,
+        max_pending: int = API_PARSE_MAX_PENDING,
+        inline_bytes: int = API_PARSE_INLINE_BYTES
+    ):
+        """
+        Args:
+            mode: 'inline' | 'thread' | 'process'
+            workers: 풀 워커 수
+            max_pending: 풀에 동시에 넘길 수 있는 파싱 수 (0이면 워커 수 × 2)
+            inline_bytes: 이보다 작은 응답은 이벤트 루프에서 바로 파싱
+
+        Raises:
+            ValueError: 알 수 없는 실행 방식
+        """
+        if mode not in PARSE_MODES:
+            raise ValueError(f"API_PARSE_EXECUTOR는 {', '.join(PARSE_MODES)} 중 하나여야 합니다. (입력값: {mode})")
+
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.max_pending = max_pending if max_pending > 0 else self.workers * 2
+        self.inline_bytes = inline_bytes
+
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending = 0
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """통계 초기화"""
+        self.stats: Dict[str, Any] = {
+            'inline': 0,
+            'offloaded': 0,
+            'parse_seconds': 0.0,
+            'wait_seconds': 0.0,
+            'peak_pending': 0,
+        }
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.mode == MODE_PROCESS:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('spawn')
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix='api-parse'
+                    )
+                logger.info("api_parse_executor_created", mode=self.mode, workers=self.workers)
+            return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 백프레셔 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+    async def parse_xml(self, body: Union[str, bytes]) -> Tuple[Dict, float]:
+        """
+        XML 응답 파싱 (parse_xml_response와 같은 결과)
+
+        Args:
+            body: 응답 본문
+
+        Returns:
+            (파싱 결과, 파싱 시간(초): 풀 자리 대기와 풀 큐 대기 포함)
+        """
+        started = time.perf_counter()
+
+        if self.mode == MODE_INLINE or len(body) < self.inline_bytes:
+            result = parse_xml_response(body)
+            elapsed = time.perf_counter() - started
+            self.stats['inline'] += 1
+            self.stats['parse_seconds'] += elapsed
+            return result, elapsed
+
+        async with self._get_slots():
+            self._pending += 1
+            self.stats['peak_pending'] = max(self.stats['peak_pending'], self._pending)
+            try:
+                loop = asyncio.get_running_loop()
+                result, parse_seconds = await loop.run_in_executor(self._get_executor(), _parse_timed, body)
+            finally:
+                self._pending -= 1
+
+        elapsed = time.perf_counter() - started
+        self.stats['offloaded'] += 1
+        self.stats['parse_seconds'] += parse_seconds
+        self.stats['wait_seconds'] += max(0.0, elapsed - parse_seconds)
+        return result, elapsed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        파싱 현황
+
+        Returns:
+            실행 방식, 워커 수, 바로/풀에서 파싱한 수, 파싱 시간 합계, 대기 시간 합계, 최대 동시 파싱 수
+        """
+        return {
+            'mode': self.mode,
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'inline': self.stats['inline'],
+            'offloaded': self.stats['offloaded'],
+            'parse_seconds': round(self.stats['parse_seconds'], 3),
+            'wait_seconds': round(self.stats['wait_seconds'], 3),
+            'peak_pending': self.stats['peak_pending'],
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀 종료 (다음 파싱 때 다시 생성)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# 공유 인스턴스
+_parse_executor: Optional[ParseExecutor] = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> ParseExecutor:
+    """
+    프로세스 공유 파싱 실행기 (모든 비동기 클라이언트가 같은 풀을 사용)
+
+    Returns:
+        ParseExecutor 인스턴스
+    """
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ParseExecutor()
+        return _parse_executor
@@ -0,0 +1,349 @@
+"""
+적응형 토큰 버킷 Rate Limiter
+국토교통부 API 호출 속도를 동기(BaseAPIClient)/비동기(AsyncAPIClient) 클라이언트가 공유
+
+동작:
+- 토큰 버킷: 초당 rate개씩 토큰이 충전되고 최대 burst개까지 쌓임. 요청마다 1개 소비,
+  토큰이 없으면 다음 토큰이 충전될 때까지 대기
+- AIMD: 성공 응답마다 rate를 조금씩 올리고 (초당 약 API_RATE_INCREASE req/s),
+  타임아웃/429/5xx 응답을 보면 API_RATE_DECREASE 배로 즉시 낮춤
+  (같은 순간 몰린 실패로 여러 번 낮추지 않도록 API_RATE_COOLDOWN_SECONDS 동안 1회만)
+- Redis 모드 (API_RATE_LIMIT_BACKEND=redis): 여러 수집 프로세스가 같은 버킷과 rate를
+  공유 (Lua 스크립트로 원자적 처리, Redis 시간 기준). Redis 연결 실패 시 프로세스 내 버킷 사용
+
+Usage:
+    limiter = get_rate_limiter('apis.data.go.kr')
+    limiter.acquire()               # 또는 await limiter.acquire_async()
+    ...
+    limiter.on_success()            # 또는 limiter.on_throttle('timeout')
+"""
+import os
+import time
+import asyncio
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rate Limiter 설정
+API_RATE_LIMIT_ENABLED = os.getenv('API_RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+API_RATE_LIMIT_BACKEND = os.getenv('API_RATE_LIMIT_BACKEND', 'memory').lower()   # memory | redis
+API_RATE_INITIAL = float(os.getenv('API_RATE_INITIAL', '10'))        # 시작 속도 (req/s)
+API_RATE_MIN = float(os.getenv('API_RATE_MIN', '1'))                 # 하한 (req/s)
+API_RATE_MAX = float(os.getenv('API_RATE_MAX', '30'))                # 상한 (req/s)
+API_RATE_BURST = float(os.getenv('API_RATE_BURST', '10'))            # 버킷 크기 (연속 요청 수)
+API_RATE_INCREASE = float(os.getenv('API_RATE_INCREASE', '0.5'))     # 가산 증가 (초당 req/s)
+API_RATE_DECREASE = float(os.getenv('API_RATE_DECREASE', '0.5'))     # 승산 감소 배율
+API_RATE_COOLDOWN_SECONDS = float(os.getenv('API_RATE_COOLDOWN_SECONDS', '1'))
+
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# 속도 조절이 필요한 HTTP 상태 코드 (429 Too Many Requests, 5xx)
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Redis 버킷 상태 키 유지 시간 (초)
+REDIS_STATE_TTL = 3600
+
+# 토큰 1개 예약 후 대기 시간(초)을 반환 (토큰이 음수면 앞선 예약이 끝날 때까지 대기)
+RESERVE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local burst = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'rate')
+local rate = tonumber(state[3]) or tonumber(ARGV[2])
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now), 'rate', tostring(rate))
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+# AIMD 조정 후 rate 반환 (ARGV[1]: 'increase' | 'decrease')
+ADJUST_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate = tonumber(redis.call('HGET', KEYS[1], 'rate')) or tonumber(ARGV[2])
+if ARGV[1] == 'decrease' then
+    local last = tonumber(redis.call('HGET', KEYS[1], 'decreased_at')) or 0
+    if now - last < tonumber(ARGV[7]) then
+        return tostring(rate)
+    end
+    rate = math.max(tonumber(ARGV[5]), rate * tonumber(ARGV[4]))
+    redis.call('HSET', KEYS[1], 'decreased_at', tostring(now))
+else
+    rate = math.min(tonumber(ARGV[6]), rate + tonumber(ARGV[3]) / rate)
+end
+redis.call('HSET', KEYS[1], 'rate', tostring(rate))
+redis.call('EXPIRE', KEYS[1], ARGV[8])
+return tostring(rate)
+"""
+
+
+class TokenBucketLimiter:
+    """
+    프로세스 내 적응형 토큰 버킷
+
+    스레드(동기 클라이언트)와 코루틴(비동기 클라이언트)에서 함께 사용할 수 있도록
+    토큰은 락 안에서 예약만 하고, 대기는 락 밖에서 합니다.
+    """
+
+    def __init__(
+        self,
+        rate: float = API_RATE_INITIAL,
+        burst: float = API_RATE_BURST,
+        min_rate: float = API_RATE_MIN,
+        max_rate: float = API_RATE_MAX,
+        increase: float = API_RATE_INCREASE,
+        decrease: float = API_RATE_DECREASE,
+        cooldown: float = API_RATE_COOLDOWN_SECONDS
+    ):
+        """
+        Args:
+            rate: 시작 속도 (req/s)
+            burst: 버킷 크기 (대기 없이 연속으로 보낼 수 있는 요청 수)
+            min_rate: AIMD 하한 (req/s)
+            max_rate: AIMD 상한 (req/s)
+            increase: 성공 시 가산 증가량 (rate 기준 초당 req/s)
+            decrease: 실패 시 승산 감소 배율 (0~1)
+            cooldown: 연속 감소 방지 시간 (초)
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(burst, 1.0)
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._decreased_at = 0.0
+        self.reset_stats()
+
+    @property
+    def backend(self) -> str:
+        """버킷 저장소 이름"""
+        return 'memory'
+
+    def _reserve(self) -> float:
+        """
+        토큰 1개 예약
+
+        Returns:
+            예약한 토큰을 쓸 수 있을 때까지 대기할 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _record_wait(self, wait: float):
+        self.stats['requests'] += 1
+        if wait > 0:
+            self.stats['waits'] += 1
+            self.stats['wait_seconds'] += wait
+
+    def acquire(self) -> float:
+        """
+        요청 전 토큰 획득 (필요하면 스레드 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = self._reserve()
+        self._record_wait(wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        acquire의 비동기 버전 (이벤트 루프를 블로킹하지 않음)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = self._reserve()
+        self._record_wait(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _adjust(self, decrease: bool) -> float:
+        """AIMD rate 조정 후 새 rate 반환"""
+        with self._lock:
+            if decrease:
+                now = time.monotonic()
+                if now - self._decreased_at < self.cooldown:
+                    return self.rate
+                self._decreased_at = now
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+            return self.rate
+
+    def on_success(self):
+        """정상 응답: rate 가산 증가"""
+        self._adjust(decrease=False)
+
+    def on_throttle(self, reason: str):
+        """
+        타임아웃/429/5xx 응답: rate 승산 감소
+
+        Args:
+            reason: 로그용 원인 (예: 'timeout', 'http_429')
+        """
+        previous = self.rate
+        rate = self._adjust(decrease=True)
+        self.stats['throttles'] += 1
+        if rate < previous:
+            self.stats['decreases'] += 1
+            logger.warning(
+                "api_rate_decreased",
+                reason=reason,
+                previous_rate=round(previous, 2),
+                rate=round(rate, 2)
+            )
+
+    def reset_stats(self):
+        """통계 초기화"""
+        self.stats = {
+            'requests': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'throttles': 0,
+            'decreases': 0,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Rate Limiter 통계
+
+        Returns:
+            현재 rate, 대기 횟수/시간, 감속 횟수
+        """
+        return {
+            'backend': self.backend,
+            'rate': round(self.rate, 2),
+            'min_rate': self.min_rate,
+            'max_rate': self.max_rate,
+            'burst': self.burst,
+            'requests': self.stats['requests'],
+            'waits': self.stats['waits'],
+            'wait_seconds': round(self.stats['wait_seconds'], 3),
+            'throttles': self.stats['throttles'],
+            'decreases': self.stats['decreases'],
+        }
+
+
+class RedisTokenBucketLimiter(TokenBucketLimiter):
+    """
+    Redis 공유 적응형 토큰 버킷
+
+    버킷(토큰, 갱신 시각)과 rate를 Redis 해시에 두어 여러 수집 프로세스가 같은
+    속도 한도를 나눠 씁니다. Redis 호출이 실패하면 프로세스 내 버킷으로 동작합니다.
+    """
+
+    def __init__(self, name: str, url: str = REDIS_URL, **kwargs):
+        """
+        Args:
+            name: 버킷 이름 (보통 API 호스트)
+            url: Redis 연결 URL
+            **kwargs: TokenBucketLimiter 설정
+        """
+        super().__init__(**kwargs)
+        self.key = f"apt_insights:ratelimit:{name}"
+        self.client = redis.from_url(
+            url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5
+        )
+        self.client.ping()
+        self._reserve_script = self.client.register_script(RESERVE_SCRIPT)
+        self._adjust_script = self.client.register_script(ADJUST_SCRIPT)
+
+    @property
+    def backend(self) -> str:
+        return 'redis'
+
+    def _reserve(self) -> float:
+        try:
+            return float(self._reserve_script(
+                keys=[self.key],
+                args=[self.burst, self.rate, REDIS_STATE_TTL]
+            ))
+        except Exception as e:
+            logger.warning("api_rate_limiter_redis_error", error=str(e))
+            return super()._reserve()
+
+    async def acquire_async(self) -> float:
+        # 동기 Redis 호출은 스레드에서 실행해 이벤트 루프를 막지 않음
+        wait = await asyncio.to_thread(self._reserve)
+        self._record_wait(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _adjust(self, decrease: bool) -> float:
+        try:
+            rate = float(self._adjust_script(
+                keys=[self.key],
+                args=[
+                    'decrease' if decrease else 'increase',
+                    self.rate, self.increase, self.decrease,
+                    self.min_rate, self.max_rate, self.cooldown, REDIS_STATE_TTL
+                ]
+            ))
+        except Exception as e:
+            logger.warning("api_rate_limiter_redis_error", error=str(e))
+            return super()._adjust(decrease)
+        self.rate = rate
+        return rate
+
+
+# 이름(API 호스트)별 공유 인스턴스
+_rate_limiters: Dict[str, TokenBucketLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> Optional[TokenBucketLimiter]:
+    """
+    이름별 Rate Limiter 싱글톤 (같은 호스트를 쓰는 API 클라이언트가 공유)
+
+    Args:
+        name: 버킷 이름 (보통 API 호스트, 예: 'apis.data.go.kr')
+
+    Returns:
+        TokenBucketLimiter 인스턴스 (API_RATE_LIMIT_ENABLED=false면 None)
+    """
+    if not API_RATE_LIMIT_ENABLED:
+        return None
+
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(name)
+        if limiter is None:
+            if API_RATE_LIMIT_BACKEND == 'redis' and REDIS_AVAILABLE:
+                try:
+                    limiter = RedisTokenBucketLimiter(name)
+                except Exception as e:
+                    logger.warning("api_rate_limiter_redis_unavailable", name=name, error=str(e))
+            if limiter is None:
+                limiter = TokenBucketLimiter()
+            _rate_limiters[name] = limiter
+            logger.info("api_rate_limiter_created", name=name, backend=limiter.backend, rate=limiter.rate)
+        return limiter
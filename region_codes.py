@@ -0,0 +1,187 @@
+"""
+시군구 법정동코드 표
+국토교통부 실거래가 API의 LAWD_CD(법정동코드 앞 5자리) 전체 목록
+
+- 일반구가 있는 시는 구 단위 코드를 사용 (예: 수원시 → 41111, 41113, 41115, 41117)
+- 강원특별자치도(51), 전북특별자치도(52), 대구 군위군(27720)은 개편 후 코드
+- 행정구역이 바뀌면 COLLECT_REGION_CODES_FILE(CSV: lawd_cd,name)로 표 전체를 교체
+
+Usage:
+    regions = load_region_codes()                 # 전국
+    regions = load_region_codes(sido=['11', '41'])  # 서울, 경기
+"""
+import os
+import csv
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# 시도 코드(앞 2자리) -> 시도 이름
+SIDO_NAMES: Dict[str, str] = {
+    '11': '서울특별시',
+    '26': '부산광역시',
+    '27': '대구광역시',
+    '28': '인천광역시',
+    '29': '광주광역시',
+    '30': '대전광역시',
+    '31': '울산광역시',
+    '36': '세종특별자치시',
+    '41': '경기도',
+    '43': '충청북도',
+    '44': '충청남도',
+    '46': '전라남도',
+    '47': '경상북도',
+    '48': '경상남도',
+    '50': '제주특별자치도',
+    '51': '강원특별자치도',
+    '52': '전북특별자치도',
+}
+
+# 법정동코드 -> 시군구 이름
+REGION_CODES: Dict[str, str] = {
+    # 서울특별시
+    '11110': '종로구', '11140': '중구', '11170': '용산구', '11200': '성동구',
+    '11215': '광진구', '11230': '동대문구', '11260': '중랑구', '11290': '성북구',
+    '11305': '강북구', '11320': '도봉구', '11350': '노원구', '11380': '은평구',
+    '11410': '서대문구', '11440': '마포구', '11470': '양천구', '11500': '강서구',
+    '11530': '구로구', '11545': '금천구', '11560': '영등포구', '11590': '동작구',
+    '11620': '관악구', '11650': '서초구', '11680': '강남구', '11710': '송파구',
+    '11740': '강동구',
+    # 부산광역시
+    '26110': '중구', '26140': '서구', '26170': '동구', '26200': '영도구',
+    '26230': '부산진구', '26260': '동래구', '26290': '남구', '26320': '북구',
+    '26350': '해운대구', '26380': '사하구', '26410': '금정구', '26440': '강서구',
+    '26470': '연제구', '26500': '수영구', '26530': '사상구', '26710': '기장군',
+    # 대구광역시
+    '27110': '중구', '27140': '동구', '27170': '서구', '27200': '남구',
+    '27230': '북구', '27260': '수성구', '27290': '달서구', '27710': '달성군',
+    '27720': '군위군',
+    # 인천광역시
+    '28110': '중구', '28140': '동구', '28177': '미추홀구', '28185': '연수구',
+    '28200': '남동구', '28237': '부평구', '28245': '계양구', '28260': '서구',
+    '28710': '강화군', '28720': '옹진군',
+    # 광주광역시
+    '29110': '동구', '29140': '서구', '29155': '남구', '29170': '북구',
+    '29200': '광산구',
+    # 대전광역시
+    '30110': '동구', '30140': '중구', '30170': '서구', '30200': '유성구',
+    '30230': '대덕구',
+    # 울산광역시
+    '31110': '중구', '31140': '남구', '31170': '동구', '31200': '북구',
+    '31710': '울주군',
+    # 세종특별자치시
+    '36110': '세종특별자치시',
+    # 경기도
+    '41111': '수원시 장안구', '41113': '수원시 권선구', '41115': '수원시 팔달구',
+    '41117': '수원시 영통구', '41131': '성남시 수정구', '41133': '성남시 중원구',
+    '41135': '성남시 분당구', '41150': '의정부시', '41171': '안양시 만안구',
+    '41173': '안양시 동안구', '41190': '부천시', '41210': '광명시',
+    '41220': '평택시', '41250': '동두천시', '41271': '안산시 상록구',
+    '41273': '안산시 단원구', '41281': '고양시 덕양구', '41285': '고양시 일산동구',
+    '41287': '고양시 일산서구', '41290': '과천시', '41310': '구리시',
+    '41360': '남양주시', '41370': '오산시', '41390': '시흥시', '41410': '군포시',
+    '41430': '의왕시', '41450': '하남시', '41461': '용인시 처인구',
+    '41463': '용인시 기흥구', '41465': '용인시 수지구', '41480': '파주시',
+    '41500': '이천시', '41550': '안성시', '41570': '김포시', '41590': '화성시',
+    '41610': '광주시', '41630': '양주시', '41650': '포천시', '41670': '여주시',
+    '41800': '연천군', '41820': '가평군', '41830': '양평군',
+    # 충청북도
+    '43111': '청주시 상당구', '43112': '청주시 서원구', '43113': '청주시 흥덕구',
+    '43114': '청주시 청원구', '43130': '충주시', '43150': '제천시',
+    '43720': '보은군', '43730': '옥천군', '43740': '영동군', '43745': '증평군',
+    '43750': '진천군', '43760': '괴산군', '43770': '음성군', '43800': '단양군',
+    # 충청남도
+    '44131': '천안시 동남구', '44133': '천안시 서북구', '44150': '공주시',
+    '44180': '보령시', '44200': '아산시', '44210': '서산시', '44230': '논산시',
+    '44250': '계룡시', '44270': '당진시', '44710': '금산군', '44760': '부여군',
+    '44770': '서천군', '44790': '청양군', '44800': '홍성군', '44810': '예산군',
+    '44825': '태안군',
+    # 전라남도
+    '46110': '목포시', '46130': '여수시', '46150': '순천시', '46170': '나주시',
+    '46230': '광양시', '46710': '담양군', '46720': '곡성군', '46730': '구례군',
+    '46770': '고흥군', '46780': '보성군', '46790': '화순군', '46800': '장흥군',
+    '46810': '강진군', '46820': '해남군', '46830': '영암군', '46840': '무안군',
+    '46860': '함평군', '46870': '영광군', '46880': '장성군', '46890': '완도군',
+    '46900': '진도군', '46910': '신안군',
+    # 경상북도
+    '47111': '포항시 남구', '47113': '포항시 북구', '47130': '경주시',
+    '47150': '김천시', '47170': '안동시', '47190': '구미시', '47210': '영주시',
+    '47230': '영천시', '47250': '상주시', '47280': '문경시', '47290': '경산시',
+    '47730': '의성군', '47750': '청송군', '47760': '영양군', '47770': '영덕군',
+    '47820': '청도군', '47830': '고령군', '47840': '성주군', '47850': '칠곡군',
+    '47900': '예천군', '47920': '봉화군', '47930': '울진군', '47940': '울릉군',
+    # 경상남도
+    '48121': '창원시 의창구', '48123': '창원시 성산구', '48125': '창원시 마산합포구',
+    '48127': '창원시 마산회원구', '48129': '창원시 진해구', '48170': '진주시',
+    '48220': '통영시', '48240': '사천시', '48250': '김해시', '48270': '밀양시',
+    '48310': '거제시', '48330': '양산시', '48720': '의령군', '48730': '함안군',
+    '48740': '창녕군', '48820': '고성군', '48840': '남해군', '48850': '하동군',
+    '48860': '산청군', '48870': '함양군', '48880': '거창군', '48890': '합천군',
+    # 제주특별자치도
+    '50110': '제주시', '50130': '서귀포시',
+    # 강원특별자치도
+    '51110': '춘천시', '51130': '원주시', '51150': '강릉시', '51170': '동해시',
+    '51190': '태백시', '51210': '속초시', '51230': '삼척시', '51720': '홍천군',
+    '51730': '횡성군', '51750': '영월군', '51760': '평창군', '51770': '정선군',
+    '51780': '철원군', '51790': '화천군', '51800': '양구군', '51810': '인제군',
+    '51820': '고성군', '51830': '양양군',
+    # 전북특별자치도
+    '52111': '전주시 완산구', '52113': '전주시 덕진구', '52130': '군산시',
+    '52140': '익산시', '52180': '정읍시', '52190': '남원시', '52210': '김제시',
+    '52710': '완주군', '52720': '진안군', '52730': '무주군', '52740': '장수군',
+    '52750': '임실군', '52770': '순창군', '52790': '고창군', '52800': '부안군',
+}
+
+# 지역 코드 표 교체용 CSV (헤더: lawd_cd,name)
+COLLECT_REGION_CODES_FILE = os.getenv('COLLECT_REGION_CODES_FILE', '')
+
+
+def region_name(lawd_cd: str, regions: Optional[Dict[str, str]] = None) -> str:
+    """
+    법정동코드의 표시 이름 (예: '11680' -> '서울특별시 강남구')
+
+    Args:
+        lawd_cd: 법정동코드 (5자리)
+        regions: 지역 코드 표 (None이면 REGION_CODES)
+    """
+    name = (regions or REGION_CODES).get(lawd_cd, lawd_cd)
+    sido = SIDO_NAMES.get(lawd_cd[:2])
+    if not sido or name == sido:
+        return name
+    return f"{sido} {name}"
+
+
+def load_region_codes(
+    sido: Optional[Iterable[str]] = None,
+    path: Optional[Path] = None
+) -> Dict[str, str]:
+    """
+    수집 대상 지역 코드 표
+
+    Args:
+        sido: 포함할 시도 코드(앞 2자리) 또는 법정동코드 (None이면 전국)
+        path: 지역 코드 CSV (None이면 COLLECT_REGION_CODES_FILE, 없으면 내장 표)
+
+    Returns:
+        법정동코드 -> 시군구 이름 (코드 순)
+
+    Raises:
+        ValueError: CSV의 법정동코드가 5자리 숫자가 아닌 경우
+    """
+    path = path or (Path(COLLECT_REGION_CODES_FILE) if COLLECT_REGION_CODES_FILE else None)
+
+    if path:
+        regions = {}
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                lawd_cd = (row.get('lawd_cd') or '').strip()
+                if len(lawd_cd) != 5 or not lawd_cd.isdigit():
+                    raise ValueError(f"법정동코드는 5자리 숫자여야 합니다. ({path}: {lawd_cd})")
+                regions[lawd_cd] = (row.get('name') or lawd_cd).strip()
+    else:
+        regions = dict(REGION_CODES)
+
+    if sido:
+        prefixes = tuple(sido)
+        regions = {code: name for code, name in regions.items() if code.startswith(prefixes)}
+
+    return dict(sorted(regions.items()))
@@ -0,0 +1,390 @@
+"""
+API 재시도 정책 / 회로 차단기
+국토교통부 API 호출의 재시도 대기(지수 백오프 + Full Jitter)와 엔드포인트별 회로 차단기
+
+재시도 분류:
+- 재시도: 타임아웃, 연결 오류(연결 끊김/리셋), 429/5xx 응답
+- 즉시 반환: 그 밖의 4xx 응답, 응답 처리 오류
+
+회로 차단기 (엔드포인트별, 동기/비동기 클라이언트 공유):
+- closed: 정상. 재시도까지 모두 실패한 요청이 연속 CIRCUIT_BREAKER_FAILURE_THRESHOLD회면 open
+- open: 요청을 보내지 않고 즉시 실패 반환 (CIRCUIT_BREAKER_RESET_SECONDS 동안)
+- half_open: 대기 후 요청 1개만 시험 통과. 성공하면 closed, 실패하면 다시 open
+
+상태가 바뀔 때마다 Redis(USE_REDIS=true)에 프로세스별 상태를 기록해
+수집 프로세스 밖(FastAPI /api/health/detailed)에서도 확인할 수 있습니다.
+기록에 실패하면 백오프 후 다음 요청 때 다시 기록하고, 프로세스 종료 시
+closed 상태를 기록합니다.
+
+Usage:
+    breaker = get_circuit_breaker(client.full_url)
+    if breaker and not breaker.allow_request():
+        ...  # 즉시 실패
+    time.sleep(backoff_delay(attempt))
+"""
+import os
+import json
+import atexit
+import time
+import random
+import socket
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from logger import get_logger
+from rate_limiter import THROTTLE_STATUS_CODES
+
+logger = get_logger(__name__)
+
+# 재시도 설정
+API_MAX_RETRIES = int(os.getenv('API_MAX_RETRIES', '3'))
+API_RETRY_DELAY = float(os.getenv('API_RETRY_DELAY', '1'))            # 백오프 기준 대기 (초)
+API_RETRY_MAX_DELAY = float(os.getenv('API_RETRY_MAX_DELAY', '30'))   # 백오프 상한 (초)
+
+# 회로 차단기 설정
+CIRCUIT_BREAKER_ENABLED = os.getenv('CIRCUIT_BREAKER_ENABLED', 'true').lower() == 'true'
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '5'))
+CIRCUIT_BREAKER_RESET_SECONDS = float(os.getenv('CIRCUIT_BREAKER_RESET_SECONDS', '30'))
+
+USE_REDIS = os.getenv('USE_REDIS', 'False').lower() == 'true'
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# 재시도할 HTTP 상태 코드 (429, 5xx)
+RETRYABLE_STATUS_CODES = THROTTLE_STATUS_CODES
+
+# 회로 차단 응답 에러 코드
+CIRCUIT_OPEN_ERROR_CODE = 'CIRCUIT_OPEN'
+
+# 프로세스별 회로 상태 (field: "{엔드포인트}|{호스트}:{pid}", value: JSON)
+CIRCUIT_STATE_KEY = "apt_insights:circuit_breakers"
+CIRCUIT_STATE_TTL = 3600
+
+# Redis 기록 실패 시 재시도 백오프 (초)
+CIRCUIT_STATE_RETRY_DELAY = 1
+CIRCUIT_STATE_RETRY_MAX_DELAY = 60
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = API_RETRY_DELAY,
+    cap: float = API_RETRY_MAX_DELAY
+) -> float:
+    """
+    지수 백오프 + Full Jitter 대기 시간
+
+    여러 클라이언트가 동시에 실패해도 재시도가 한 시점에 몰리지 않도록
+    0 ~ min(cap, base * 2^attempt) 사이에서 무작위로 고릅니다.
+
+    Args:
+        attempt: 실패한 시도 번호 (0부터)
+        base: 기준 대기 (초)
+        cap: 상한 (초)
+
+    Returns:
+        대기 시간 (초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def is_retryable_status(status_code: Optional[int]) -> bool:
+    """재시도할 HTTP 상태 코드인지 확인 (429, 5xx)"""
+    return status_code in RETRYABLE_STATUS_CODES
+
+
+class CircuitBreaker:
+    """
+    엔드포인트 회로 차단기
+
+    요청 1건(재시도 포함)의 최종 결과를 기록합니다. 호출자는 allow_request()가
+    True를 반환한 요청마다 record_success() 또는 record_failure()를 한 번 호출해야 합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_SECONDS
+    ):
+        """
+        Args:
+            name: 엔드포인트 이름 (보통 API 전체 URL)
+            failure_threshold: open으로 바꾸는 연속 실패 요청 수
+            reset_timeout: open 유지 시간 (초), 이후 half_open 시험 요청 허용
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self.stats = {
+            'opens': 0,
+            'rejected': 0,
+            'successes': 0,
+            'failures': 0,
+        }
+
+    def retry_after(self) -> float:
+        """open 상태에서 다음 시험 요청까지 남은 시간 (초)"""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부
+
+        Returns:
+            closed면 True, open이면 False (대기 시간이 지나면 half_open으로 바꾸고
+            시험 요청 1개만 True), half_open에서 시험 요청이 진행 중이면 False
+        """
+        changed = None
+        with self._lock:
+            now = time.monotonic()
+            if self.state == STATE_OPEN and now - self._opened_at >= self.reset_timeout:
+                changed = self._transition(STATE_HALF_OPEN)
+
+            if self.state == STATE_CLOSED:
+                allowed = True
+            # 시험 요청이 결과를 기록하지 못한 채 오래 걸리면 새 시험 요청 허용
+            elif self.state == STATE_HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.reset_timeout
+            ):
+                self._probe_started = now
+                allowed = True
+            else:
+                self.stats['rejected'] += 1
+                allowed = False
+
+        # 기록하지 못한 상태가 있으면 백오프가 지난 뒤 요청 때 다시 기록
+        if changed or _pending_states:
+            _publish_state(changed)
+        return allowed
+
+    def record_success(self):
+        """요청 성공 (엔드포인트가 응답함)"""
+        changed = None
+        with self._lock:
+            self.stats['successes'] += 1
+            self.consecutive_failures = 0
+            if self.state != STATE_CLOSED:
+                changed = self._transition(STATE_CLOSED)
+
+        if changed:
+            _publish_state(changed)
+
+    def record_failure(self):
+        """요청 실패 (재시도까지 타임아웃/연결 오류/429·5xx)"""
+        changed = None
+        with self._lock:
+            self.stats['failures'] += 1
+            self.consecutive_failures += 1
+            if self.state == STATE_HALF_OPEN or (
+                self.state == STATE_CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self.stats['opens'] += 1
+                changed = self._transition(STATE_OPEN)
+
+        if changed:
+            _publish_state(changed)
+
+    def _transition(self, state: str) -> Dict[str, Any]:
+        """상태 변경 (락 안에서 호출, Redis 기록은 락 밖에서 하도록 새 상태 반환)"""
+        previous, self.state = self.state, state
+        self._probe_started = None
+        log = logger.warning if state == STATE_OPEN else logger.info
+        log(
+            "circuit_breaker_state_changed",
+            endpoint=self.name,
+            previous=previous,
+            state=state,
+            consecutive_failures=self.consecutive_failures
+        )
+        return self.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        회로 상태
+
+        Returns:
+            상태, 연속 실패 수, 다음 시험 요청까지 남은 시간, 통계
+        """
+        return {
+            'endpoint': self.name,
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'failure_threshold': self.failure_threshold,
+            'retry_after_seconds': round(self.retry_after(), 1),
+            'reset_timeout': self.reset_timeout,
+            'updated_at': datetime.now().isoformat(),
+            **self.stats,
+        }
+
+
+# 회로 상태 공유용 Redis 클라이언트 (지연 생성)
+_state_client = None
+_process_id = f"{socket.gethostname()}:{os.getpid()}"
+
+# 아직 기록하지 못한 상태 (엔드포인트 -> 상태)와 재시도 백오프
+_pending_states: Dict[str, Dict[str, Any]] = {}
+_state_failures = 0
+_state_retry_at = 0.0
+_state_lock = threading.Lock()
+
+
+def _write_states(states: Dict[str, Dict[str, Any]]):
+    """회로 상태를 Redis 해시에 기록 (필드: "{엔드포인트}|{호스트}:{pid}")"""
+    global _state_client
+    if _state_client is None:
+        _state_client = redis.from_url(
+            REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+    pipe = _state_client.pipeline(transaction=False)
+    pipe.hset(CIRCUIT_STATE_KEY, mapping={
+        f"{endpoint}|{_process_id}": json.dumps({**state, 'process': _process_id}, ensure_ascii=False)
+        for endpoint, state in states.items()
+    })
+    pipe.expire(CIRCUIT_STATE_KEY, CIRCUIT_STATE_TTL)
+    pipe.execute()
+
+
+def _publish_state(state: Optional[Dict[str, Any]] = None):
+    """
+    회로 상태를 Redis에 기록 (상태 변경 시 호출)
+
+    실패한 상태는 보관했다가 백오프(지수 + Full Jitter)가 지난 뒤 다음 호출에서
+    다시 기록합니다. 같은 엔드포인트는 최신 상태만 남깁니다.
+
+    Args:
+        state: 새 회로 상태 (None이면 보관 중인 상태만 다시 기록)
+    """
+    global _state_failures, _state_retry_at
+    if not (USE_REDIS and REDIS_AVAILABLE):
+        return
+
+    with _state_lock:
+        if state is not None:
+            _pending_states[state['endpoint']] = state
+        if not _pending_states or time.monotonic() < _state_retry_at:
+            return
+        states = dict(_pending_states)
+        _pending_states.clear()
+
+    try:
+        _write_states(states)
+    except Exception as e:
+        with _state_lock:
+            # 그 사이 기록된 더 새로운 상태는 유지
+            for endpoint, pending in states.items():
+                _pending_states.setdefault(endpoint, pending)
+            delay = backoff_delay(
+                _state_failures,
+                base=CIRCUIT_STATE_RETRY_DELAY,
+                cap=CIRCUIT_STATE_RETRY_MAX_DELAY
+            )
+            _state_failures += 1
+            _state_retry_at = time.monotonic() + delay
+        logger.warning("circuit_breaker_publish_failed", error=str(e), retry_in=round(delay, 1))
+        return
+
+    with _state_lock:
+        _state_failures = 0
+        _state_retry_at = 0.0
+
+
+def _publish_shutdown():
+    """프로세스 종료 시 이 프로세스의 회로를 모두 closed로 기록 (백오프 무시)"""
+    if not (USE_REDIS and REDIS_AVAILABLE):
+        return
+
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    states = {
+        breaker.name: {**breaker.to_dict(), 'state': STATE_CLOSED, 'retry_after_seconds': 0}
+        for breaker in breakers
+    }
+    if not states:
+        return
+
+    try:
+        _write_states(states)
+    except Exception as e:
+        logger.warning("circuit_breaker_publish_failed", error=str(e), shutdown=True)
+
+
+# 엔드포인트별 공유 인스턴스
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> Optional[CircuitBreaker]:
+    """
+    엔드포인트별 회로 차단기 싱글톤 (같은 엔드포인트의 동기/비동기 클라이언트가 공유)
+
+    Args:
+        name: 엔드포인트 이름 (보통 API 전체 URL)
+
+    Returns:
+        CircuitBreaker 인스턴스 (CIRCUIT_BREAKER_ENABLED=false면 None)
+    """
+    if not CIRCUIT_BREAKER_ENABLED:
+        return None
+
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _circuit_breakers[name] = breaker
+        return breaker
+
+
+atexit.register(_publish_shutdown)
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """
+    이 프로세스의 모든 회로 상태
+
+    Returns:
+        엔드포인트 -> 회로 상태
+    """
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.name: breaker.to_dict() for breaker in breakers}
+
+
+def circuit_open_error(breaker: CircuitBreaker) -> Dict[str, Any]:
+    """
+    회로 차단으로 요청을 보내지 않았을 때의 에러 응답
+
+    Args:
+        breaker: open/half_open 상태의 회로 차단기
+
+    Returns:
+        클라이언트 에러 응답 형식 (error_code=CIRCUIT_OPEN, retry_after 초 포함)
+    """
+    retry_after = breaker.retry_after() or breaker.reset_timeout
+    return {
+        'error': True,
+        'error_code': CIRCUIT_OPEN_ERROR_CODE,
+        'message': f'API 회로 차단 중 ({retry_after:.0f}초 후 재시도)',
+        'retry_after': round(retry_after, 1)
+    }
@@ -57,14 +57,15 @@ echo "========================================="
 
 if [[ -z "$REDIS_URL" ]]; then
     echo "WARNING: REDIS_URL not set"
-    echo "Skipping cache warming"
+    echo "Skipping cache report"
 else
-    echo "Warming cache with popular queries..."
+    # Hot queries are warmed by the API processes (WARM_CACHE_ON_STARTUP=true)
+    echo "Checking cache stats and health..."
     cd "$PROJECT_ROOT/fastapi-backend"
     python cache/cache_warming.py
 
     echo ""
-    echo "✓ Cache warming complete"
+    echo "✓ Cache report complete"
 fi
 
 # 3. Performance Benchmark
@@ -7,7 +7,9 @@ from backend.analyzer.investment import (
     calculate_jeonse_ratio,
     analyze_gap_investment,
     detect_bargain_sales,
+    iter_bargain_rows,
 )
+from backend.analyzer.utils import AnalysisCancelled, CancellationToken, cancellation_scope
 
 
 class TestCalculateJeonseRatio:
@@ -670,6 +672,83 @@ class TestDetectBargainSales:
                     assert gangnam[0]['bargain_count'] >= 1
 
 
+class TestBargainSalesFields:
+    """Test fields selector on bargain sale detection"""
+
+    def test_only_stats(self):
+        items = TestIterBargainRows._items()
+        result = detect_bargain_sales(items, threshold_pct=10.0, fields={'stats'})
+        full = detect_bargain_sales(items, threshold_pct=10.0)
+
+        assert set(result) == {'has_data', 'stats'}
+        assert result['stats'] == full['stats']
+
+
+class TestIterBargainRows:
+    """Test incremental bargain sale iteration"""
+
+    @staticmethod
+    def _items():
+        items = []
+        for i in range(20):
+            items.append({
+                '_api_type': 'api_02',
+                'aptNm': '래미안',
+                '_region_name': '강남구',
+                '_area_numeric': 84,
+                # Every third trade drops sharply below the recent average
+                '_deal_amount_numeric': 70000 + i * 100 if i % 3 == 2 else 100000,
+                '_deal_date': datetime(2024, 1, i + 1),
+                '_deal_date_str': f'2024-01-{i + 1:02d}',
+            })
+        return items
+
+    def test_insufficient_data(self):
+        assert list(iter_bargain_rows([])) == []
+
+    def test_matches_detect_bargain_sales_order(self):
+        items = self._items()
+        rows = [row for _, row in iter_bargain_rows(items, threshold_pct=10.0)]
+        result = detect_bargain_sales(items, threshold_pct=10.0)
+
+        assert len(rows) == result['stats']['bargain_count']
+        assert rows[:50] == result['bargain_items']
+
+    def test_cursor_pages_cover_all_rows(self):
+        items = self._items()
+        full = list(iter_bargain_rows(items, threshold_pct=10.0))
+
+        collected = []
+        after = None
+        while True:
+            page = list(iter_bargain_rows(items, threshold_pct=10.0, after=after, limit=2))
+            if not page:
+                break
+            collected.extend(page)
+            after = page[-1][0]
+
+        assert collected == full
+
+
+class TestBargainSalesCancellation:
+    """Test cooperative cancellation in bargain detection"""
+
+    def test_cancelled_token_aborts(self):
+        items = TestIterBargainRows._items()
+        token = CancellationToken()
+        token.cancel('client_disconnected')
+
+        with cancellation_scope(token):
+            with pytest.raises(AnalysisCancelled):
+                detect_bargain_sales(items, threshold_pct=10.0)
+
+    def test_live_token_completes(self):
+        items = TestIterBargainRows._items()
+        with cancellation_scope(CancellationToken()):
+            result = detect_bargain_sales(items, threshold_pct=10.0)
+        assert result == detect_bargain_sales(items, threshold_pct=10.0)
+
+
 class TestIntegration:
     """Integration tests combining multiple functions"""
 
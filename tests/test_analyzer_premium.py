@@ -70,6 +70,22 @@ class TestCalculatePricePerArea:
         assert regions['강남구']['count'] == 2
         assert regions['강남구']['avg_price_per_area'] == 1500.0  # (1000 + 2000) / 2
 
+    def test_fields_selects_sections(self):
+        """Test that unrequested sections are omitted"""
+        items = [
+            {'_area_numeric': 84, '_deal_amount_numeric': 84000, '_region_name': '강남구'},
+            {'_area_numeric': 59, '_deal_amount_numeric': 118000, '_region_name': '서초구'},
+        ]
+        result = calculate_price_per_area(items, fields={'stats', 'top_expensive'})
+
+        assert set(result) == {'stats', 'top_expensive'}
+        assert result['stats'] == calculate_price_per_area(items)['stats']
+        assert result['top_expensive'][0]['region'] == '서초구'
+
+    def test_fields_on_empty_items(self):
+        result = calculate_price_per_area([], fields={'by_region'})
+        assert result == {'by_region': []}
+
     def test_area_range_classification(self):
         """Test classification by area size"""
         items = [
@@ -9,6 +9,7 @@ from backend.analyzer.segmentation import (
     analyze_by_region,
     analyze_by_apartment,
     get_apartment_detail,
+    iter_apartment_rows,
 )
 
 
@@ -196,6 +197,31 @@ class TestAnalyzeByApartment:
         assert result['data'][0]['count'] == 2
 
 
+class TestIterApartmentRows:
+    """Test incremental apartment iteration"""
+
+    items = [
+        {'아파트': '푸르지오', '_region_name': '서초구', '_deal_amount_numeric': 90000},
+        {'아파트': '래미안', '_region_name': '강남구', '_deal_amount_numeric': 100000},
+        {'아파트': '자이', '_region_name': '송파구', '_deal_amount_numeric': 80000},
+        {'아파트': '자이', '_region_name': '송파구', '_deal_amount_numeric': 85000},
+    ]
+
+    def test_matches_analyze_by_apartment(self):
+        rows = [row for _, row in iter_apartment_rows(self.items)]
+        assert rows == analyze_by_apartment(self.items)['data']
+
+    def test_after_and_limit(self):
+        first = list(iter_apartment_rows(self.items, limit=1))
+        rest = list(iter_apartment_rows(self.items, after=first[-1][0]))
+
+        assert [key for key, _ in first + rest] == [('래미안',), ('자이',), ('푸르지오',)]
+
+    def test_min_count(self):
+        rows = [row for _, row in iter_apartment_rows(self.items, min_count=2)]
+        assert [row['apartment'] for row in rows] == ['자이']
+
+
 class TestGetApartmentDetail:
     """Test apartment detail retrieval"""
     
@@ -14,6 +14,11 @@ from backend.analyzer.utils import (
     format_price,
     parse_year_month,
     calculate_percentage_change,
+    wants_section,
+    AnalysisCancelled,
+    CancellationToken,
+    cancellation_scope,
+    checkpoint,
 )
 
 
@@ -269,5 +274,51 @@ class TestCalculatePercentageChange:
         assert result == 200.0
 
 
+class TestWantsSection:
+    """Test fields selector helper"""
+
+    def test_none_selects_all(self):
+        assert wants_section(None, 'stats') is True
+
+    def test_selected_section(self):
+        assert wants_section({'stats'}, 'stats') is True
+        assert wants_section({'stats'}, 'by_region') is False
+
+
+class TestCancellation:
+    """Test cooperative cancellation checkpoints"""
+
+    def test_checkpoint_without_scope_is_noop(self):
+        checkpoint()
+
+    def test_cancelled_token_raises(self):
+        token = CancellationToken()
+        token.cancel('client_disconnected')
+        with cancellation_scope(token):
+            with pytest.raises(AnalysisCancelled) as exc_info:
+                checkpoint()
+        assert exc_info.value.reason == 'client_disconnected'
+
+    def test_expired_deadline_raises(self):
+        token = CancellationToken(deadline=0)
+        with cancellation_scope(token):
+            with pytest.raises(AnalysisCancelled) as exc_info:
+                checkpoint()
+        assert exc_info.value.reason == 'deadline_exceeded'
+
+    def test_scope_is_reset(self):
+        token = CancellationToken()
+        token.cancel()
+        with cancellation_scope(token):
+            pass
+        checkpoint()
+
+    def test_first_reason_is_kept(self):
+        token = CancellationToken()
+        token.cancel('client_disconnected')
+        token.cancel('deadline_exceeded')
+        assert token.reason == 'client_disconnected'
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
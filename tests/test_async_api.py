@@ -5,12 +5,14 @@ import pytest
 import asyncio
 import aiohttp
 from datetime import datetime
+from unittest.mock import patch
 
 # Async APIs
 from api_01.async_silv_trade import AsyncSilvTradeAPI
 from api_02.async_apt_trade import AsyncAptTradeAPI
 from api_03.async_apt_trade_dev import AsyncAptTradeDevAPI
 from api_04.async_apt_rent import AsyncAptRentAPI
+from common import is_complete_result
 
 
 @pytest.mark.asyncio
@@ -136,5 +138,29 @@ class TestAsyncAPIAllTypes:
             assert len(successful) > 0
 
 
+def test_get_all_pages_async_middle_page_failure_is_partial():
+    """3페이지 중 2페이지 요청이 예외로 끝나면 일부 수집 에러로 반환 (네트워크 불필요)"""
+    async def fetch(self, session, lawd_cd, deal_ymd, num_of_rows, page_no, **kwargs):
+        if page_no == 2:
+            raise aiohttp.ClientError('connection reset')
+        start = (page_no - 1) * num_of_rows
+        items = [{'id': i} for i in range(start, min(start + num_of_rows, 250))]
+        return {'error': False, 'total_count': 250, 'num_of_rows': num_of_rows, 'items': items}
+
+    async def run():
+        with patch.object(AsyncAptTradeAPI, 'get_trade_data_parsed_async', fetch):
+            return await AsyncAptTradeAPI().get_all_pages_async(
+                session=None, lawd_cd='11680', deal_ymd='202312', num_of_rows=100
+            )
+
+    result = asyncio.run(run())
+
+    assert result['error'] is True and result['partial'] is True
+    assert result['failed_pages'] == [2]
+    assert [item['id'] for item in result['items']] == list(range(100)) + list(range(200, 250))
+    assert not is_complete_result(result)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '-s'])
+
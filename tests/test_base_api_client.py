@@ -3,11 +3,13 @@ BaseAPIClient 단위 테스트
 
 pytest를 사용하여 BaseAPIClient의 핵심 기능을 테스트합니다.
 """
+import time
 import pytest
 from unittest.mock import Mock, patch
 import requests
 
 from base_api_client import BaseAPIClient
+from common import is_complete_result
 from config import SERVICE_KEY
 
 
@@ -265,6 +267,85 @@ class TestBaseAPIClientGetAllPages:
         assert len(result['items']) == 0
         assert mock_parsed.call_count == 1
 
+    @patch.object(TestAPIClient, 'get_trade_data_parsed')
+    def test_get_all_pages_first_page_error_propagates(self, mock_parsed):
+        """첫 페이지 실패는 빈 결과가 아닌 에러로 반환"""
+        mock_parsed.return_value = {
+            'error': True,
+            'message': 'API 에러'
+        }
+
+        client = TestAPIClient()
+        result = client.get_all_pages('11680', '202312')
+
+        assert result['error'] is True
+        assert result['message'] == 'API 에러'
+
+    @patch.object(TestAPIClient, 'get_trade_data_parsed')
+    def test_get_all_pages_concurrent_fan_out(self, mock_parsed):
+        """1페이지의 total_count로 나머지 페이지를 동시에 조회하고 순서대로 병합"""
+        pages = {
+            1: [{'id': i} for i in range(100)],
+            2: [{'id': i} for i in range(99, 199)],  # 경계 밀림으로 99 중복
+            3: [{'id': i} for i in range(199, 250)],
+        }
+
+        def fetch(lawd_cd, deal_ymd, num_of_rows, page_no, **kwargs):
+            time.sleep(0.05 if page_no == 2 else 0)  # 2페이지가 늦게 도착해도 순서 유지
+            return {
+                'error': False,
+                'total_count': 250,
+                'num_of_rows': num_of_rows,
+                'items': pages[page_no],
+            }
+
+        mock_parsed.side_effect = fetch
+
+        client = TestAPIClient()
+        result = client.get_all_pages('11680', '202312', num_of_rows=100)
+
+        assert mock_parsed.call_count == 3
+        assert [item['id'] for item in result['items']] == list(range(250))
+        assert result['totalCount'] == 250
+
+    @patch.object(TestAPIClient, 'get_trade_data_parsed')
+    def test_get_all_pages_middle_page_failure_is_partial(self, mock_parsed):
+        """3페이지 중 2페이지가 실패하면 정상 결과가 아닌 일부 수집 에러로 반환"""
+        pages = {
+            1: [{'id': i} for i in range(100)],
+            3: [{'id': i} for i in range(200, 250)],
+        }
+
+        def fetch(lawd_cd, deal_ymd, num_of_rows, page_no, **kwargs):
+            if page_no == 2:
+                return {'error': True, 'message': 'timeout'}
+            return {'error': False, 'total_count': 250, 'num_of_rows': num_of_rows, 'items': pages[page_no]}
+
+        mock_parsed.side_effect = fetch
+
+        client = TestAPIClient()
+        result = client.get_all_pages('11680', '202312', num_of_rows=100)
+
+        assert result['error'] is True
+        assert result['partial'] is True
+        assert result['failed_pages'] == [2]
+        assert (result['fetchedCount'], result['reportedCount']) == (150, 250)
+        assert not is_complete_result(result)
+
+    @patch.object(TestAPIClient, 'get_trade_data_parsed')
+    def test_get_all_pages_respects_max_pages(self, mock_parsed):
+        """max_pages를 넘는 페이지는 요청하지 않음"""
+        mock_parsed.return_value = {
+            'error': False,
+            'total_count': 1000,
+            'items': [{'id': 1}],
+        }
+
+        client = TestAPIClient()
+        client.get_all_pages('11680', '202312', num_of_rows=1, max_pages=3)
+
+        assert mock_parsed.call_count == 3
+
 
 class TestBaseAPIClientSubclassValidation:
     """서브클래스 검증 테스트"""
@@ -0,0 +1,89 @@
+"""
+캐시 코덱 테스트
+"""
+import json
+import pytest
+
+# backend.cache 패키지는 프로젝트 설정(config)을 필요로 함
+codec_module = pytest.importorskip("backend.cache.codec")
+
+CacheCodec = codec_module.CacheCodec
+MSGPACK_AVAILABLE = codec_module.MSGPACK_AVAILABLE
+HEADER_FLAG = codec_module.HEADER_FLAG
+
+
+@pytest.fixture
+def payload():
+    """API 응답 형태의 테스트 데이터"""
+    return {
+        'items': [
+            {'아파트': '테스트아파트', '거래금액': '100,000', '층': str(i)}
+            for i in range(50)
+        ],
+        'totalCount': 50,
+        'error': False,
+    }
+
+
+class TestCacheCodec:
+    """직렬화/압축 코덱 테스트"""
+
+    @pytest.mark.parametrize('compression', ['none', 'zlib'])
+    def test_json_round_trip(self, payload, compression):
+        codec = CacheCodec('json', compression)
+        assert codec.decode(codec.encode(payload)) == payload
+
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack 미설치")
+    def test_msgpack_round_trip(self, payload):
+        codec = CacheCodec('msgpack', 'zlib')
+        assert codec.decode(codec.encode(payload)) == payload
+
+    def test_legacy_plain_json(self, payload):
+        """헤더 없는 이전 형식(평문 JSON)도 읽을 수 있어야 함"""
+        codec = CacheCodec('json', 'zlib')
+        legacy = json.dumps(payload, ensure_ascii=False)
+
+        assert codec.decode(legacy) == payload
+        assert codec.decode(legacy.encode('utf-8')) == payload
+
+    def test_decode_uses_header_not_settings(self, payload):
+        """설정이 달라도 저장 시점의 형식으로 디코딩"""
+        encoded = CacheCodec('json', 'zlib').encode(payload)
+        assert encoded[0] & HEADER_FLAG
+        assert CacheCodec('json', 'none').decode(encoded) == payload
+
+    def test_small_payload_not_compressed(self):
+        codec = CacheCodec('json', 'zlib', compress_min_bytes=512)
+        encoded = codec.encode({'a': 1})
+        assert encoded[1:] == b'{"a":1}'
+
+    def test_compression_reduces_size(self, payload):
+        plain = CacheCodec('json', 'none').encode(payload)
+        compressed = CacheCodec('json', 'zlib').encode(payload)
+        assert len(compressed) < len(plain) / 3
+
+    def test_unavailable_codec(self):
+        with pytest.raises(ValueError):
+            CacheCodec('pickle', 'none')
+
+    def test_uninstalled_codec_falls_back(self, payload, monkeypatch):
+        """지정했지만 설치되지 않은 방식은 json / zlib로 대체"""
+        monkeypatch.setattr(codec_module, 'MSGPACK_AVAILABLE', False)
+        monkeypatch.setattr(codec_module, 'ZSTD_AVAILABLE', False)
+        codec = CacheCodec('msgpack', 'zstd')
+
+        assert (codec.serializer, codec.compression) == ('json', 'zlib')
+        assert codec.decode(codec.encode(payload)) == payload
+
+    def test_stats(self, payload):
+        codec = CacheCodec('json', 'zlib')
+        codec.decode(codec.encode(payload))
+
+        stats = codec.get_stats()
+        assert stats['encoded'] == 1
+        assert stats['decoded'] == 1
+        assert stats['compression_ratio'] > 1
+        assert stats['avg_stored_bytes'] > 0
+
+        codec.reset_stats()
+        assert codec.get_stats()['encoded'] == 0
@@ -0,0 +1,86 @@
+"""
+수집 저널 테스트
+"""
+import pytest
+
+# collection_journal은 프로젝트 설정(config)을 필요로 하는 캐시 모듈을 사용
+journal_module = pytest.importorskip("collection_journal")
+
+CollectionJournal = journal_module.CollectionJournal
+
+KEY = ('api_02', '11680', '202401')
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CollectionJournal(tmp_path / 'journal.sqlite3')
+    yield journal
+    journal.close()
+
+
+def test_record_and_lookup(journal):
+    result = {'error': False, 'items': [{'a': 1}, {'a': 2}], 'pageNo': 2}
+    assert journal.record(KEY, result)
+
+    assert journal.completed_results([KEY, ('api_02', '11680', '202402')]) == {KEY: result}
+    stats = journal.stats()
+    assert (stats['units'], stats['pages'], stats['items']) == (1, 2, 2)
+
+
+def test_errors_not_recorded(journal):
+    assert not journal.record(KEY, {'error': True, 'message': 'timeout'})
+    assert journal.completed_results([KEY]) == {}
+
+
+def test_incomplete_fetch_not_recorded(journal):
+    # 3페이지 중 2페이지만 받은 결과 (파티셜 플래그가 없어도 건수로 판단)
+    short = {'error': False, 'items': [{'a': 1}], 'reportedCount': 250, 'fetchedCount': 150}
+    assert not journal.record(KEY, short)
+    assert not journal.record(KEY, {**short, 'error': True, 'partial': True, 'failed_pages': [2]})
+    assert journal.completed_results([KEY]) == {}
+
+    assert journal.record(KEY, {**short, 'fetchedCount': 250})
+    assert list(journal.completed_results([KEY])) == [KEY]
+
+
+def test_survives_reopen(tmp_path):
+    path = tmp_path / 'journal.sqlite3'
+    journal = CollectionJournal(path)
+    journal.record(KEY, {'error': False, 'items': []})
+    journal.close()
+
+    reopened = CollectionJournal(path)
+    assert KEY in reopened.completed_results([KEY])
+    reopened.reset()
+    assert reopened.completed_results([KEY]) == {}
+    reopened.close()
+
+
+def test_new_run_keeps_history(journal):
+    journal.record(KEY, {'error': False, 'items': [{'a': 1}], 'pageNo': 1})
+    journal.start_run()
+
+    # 이전 실행의 기록은 재개 대상이 아니지만 이력으로 남음
+    assert journal.completed_results([KEY]) == {}
+    history = journal.history([KEY])
+    assert history[KEY]['item_count'] == 1
+    assert journal.stats()['units'] == 0
+
+    journal.record(KEY, {'error': False, 'items': [], 'pageNo': 1})
+    assert KEY in journal.completed_results([KEY])
+
+
+def test_lookup_many_keys(journal):
+    keys = [('api_01', f'{11000 + i}', '202401') for i in range(700)]
+    for key in keys[::2]:
+        journal.record(key, {'error': False, 'items': []})
+
+    assert set(journal.completed_results(keys)) == set(keys[::2])
+
+
+def test_for_run_rejects_unsafe_names(tmp_path):
+    with pytest.raises(ValueError):
+        CollectionJournal.for_run('../x', '202401', '202412', journal_dir=tmp_path)
+    journal = CollectionJournal.for_run('11680', '202401', '202412', journal_dir=tmp_path)
+    assert journal.path.name == 'collect_11680_202401_202412.sqlite3'
+    journal.close()
@@ -0,0 +1,97 @@
+"""
+전국 수집 계획 테스트
+"""
+from datetime import datetime, timedelta
+import pytest
+
+# collection_planner는 프로젝트 설정(config)을 필요로 하는 모듈을 사용
+planner_module = pytest.importorskip("collection_planner")
+
+CollectionPlanner = planner_module.CollectionPlanner
+PlanProgress = planner_module.PlanProgress
+CollectionJournal = planner_module.CollectionJournal
+
+NOW = datetime(2024, 7, 15, 12, 0)
+MONTHS = ['202312', '202401', '202406']
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CollectionJournal(tmp_path / 'journal.sqlite3')
+    yield journal
+    journal.close()
+
+
+def test_recent_months_first():
+    plan = CollectionPlanner(now=NOW).plan(['api_02'], ['11680', '11650'], MONTHS)
+
+    assert [key[2] for key in plan['units']] == ['202406', '202406', '202401', '202401', '202312', '202312']
+    assert plan['total_requests'] == 6
+    assert plan['skipped'] == 0
+
+
+def test_history_prioritizes_stale_and_busy_regions(journal):
+    # 11680, 11650: 방금 수집 (11680은 거래가 많음), 11710: 수집 이력 없음
+    journal.record(('api_02', '11680', '202406'), {'error': False, 'items': [{}] * 2500, 'pageNo': 3})
+    journal.record(('api_02', '11650', '202406'), {'error': False, 'items': [{}], 'pageNo': 1})
+    planner = CollectionPlanner(journal, now=datetime.now() + timedelta(minutes=1))
+
+    plan = planner.plan(['api_02'], ['11680', '11650', '11710'], ['202406'])
+
+    assert [key[1] for key in plan['units']] == ['11710', '11680', '11650']
+    assert plan['requests'][('api_02', '11680', '202406')] == 3
+    assert plan['by_api']['api_02']['used_today'] == 4
+
+
+def test_resume_skips_units_of_current_run(journal):
+    journal.record(('api_02', '11680', '202401'), {'error': False, 'items': []})
+    journal.start_run()
+    journal.record(('api_02', '11680', '202406'), {'error': False, 'items': []})
+
+    plan = CollectionPlanner(journal, now=NOW).plan(['api_02'], ['11680'], MONTHS, skip_completed=True)
+
+    assert plan['skipped'] == 1
+    assert ('api_02', '11680', '202406') not in plan['units']
+    assert ('api_02', '11680', '202401') in plan['units']
+
+
+def test_incremental_plans_missing_and_recent_months(tmp_path):
+    catalog_module = pytest.importorskip("freshness_catalog")
+    catalog = catalog_module.FreshnessCatalog(tmp_path / 'catalog.sqlite3')
+    for deal_ymd in MONTHS:
+        catalog.record(('api_02', '11680', deal_ymd), {'error': False, 'items': []})
+
+    plan = CollectionPlanner(now=NOW, catalog=catalog).plan(
+        ['api_02'], ['11680', '11650'], MONTHS, incremental=True, recheck_months=3
+    )
+
+    # 11680은 재확인 기간(202405~202407)의 202406만, 11650은 전부 새로 수집
+    assert sorted(plan['units']) == sorted(
+        [('api_02', '11680', '202406')] + [('api_02', '11650', month) for month in MONTHS]
+    )
+    assert plan['fresh'] == 2
+    catalog.close()
+
+
+def test_quota_defers_lowest_priority_units():
+    planner = CollectionPlanner(daily_quota=2, now=NOW)
+    plan = planner.plan(['api_01', 'api_02'], ['11680'], MONTHS, respect_quota=True)
+
+    assert plan['deferred'] == 2
+    assert plan['by_api']['api_01'] == {'units': 2, 'requests': 2, 'used_today': 0, 'quota': 2, 'deferred': 1}
+    assert ('api_01', '11680', '202312') not in plan['units']
+
+
+def test_progress_reports_eta_and_quota():
+    plan = CollectionPlanner(now=NOW).plan(['api_02'], ['11680'], MONTHS)
+    lines = []
+    progress = PlanProgress(plan, report_every=0, printer=lines.append)
+
+    progress(1, 3, plan['units'][0], {'error': False, 'items': [{}] * 5, 'pageNo': 1})
+    progress(2, 3, plan['units'][1], {'error': True, 'message': 'timeout'})
+    snapshot = progress.snapshot()
+
+    assert (snapshot['completed'], snapshot['failed'], snapshot['items']) == (2, 1, 5)
+    assert snapshot['quota']['api_02']['used'] == 2
+    assert snapshot['eta_seconds'] is not None
+    assert lines == []
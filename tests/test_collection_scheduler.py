@@ -0,0 +1,284 @@
+"""
+수집 스케줄러 테스트 (네트워크 불필요)
+"""
+import asyncio
+import json
+from urllib.parse import urlparse
+import pytest
+
+# collection_scheduler는 aiohttp와 프로젝트 설정(config)을 필요로 함
+scheduler_module = pytest.importorskip("collection_scheduler")
+
+CollectionScheduler = scheduler_module.CollectionScheduler
+MemorySink = scheduler_module.MemorySink
+JsonLinesSink = scheduler_module.JsonLinesSink
+JournalSink = scheduler_module.JournalSink
+CollectionJournal = scheduler_module.CollectionJournal
+CatalogSink = scheduler_module.CatalogSink
+FreshnessCatalog = scheduler_module.FreshnessCatalog
+DatabaseSink = scheduler_module.DatabaseSink
+CacheSink = scheduler_module.CacheSink
+
+
+class FakeClient:
+    """get_all_pages_async만 흉내내는 클라이언트 (동시 실행 수 기록)"""
+
+    def __init__(self, base_url, tracker, fail_months=()):
+        self.BASE_URL = base_url
+        self.tracker = tracker
+        self.fail_months = set(fail_months)
+
+    async def get_all_pages_async(self, session, lawd_cd, deal_ymd, num_of_rows, **kwargs):
+        host = urlparse(self.BASE_URL).netloc
+        self.tracker['total'] += 1
+        self.tracker[host] = self.tracker.get(host, 0) + 1
+        self.tracker['peak'] = max(self.tracker['peak'], self.tracker['total'])
+        self.tracker[f'peak:{host}'] = max(self.tracker.get(f'peak:{host}', 0), self.tracker[host])
+        await asyncio.sleep(0.01)
+        self.tracker['total'] -= 1
+        self.tracker[host] -= 1
+
+        if deal_ymd in self.fail_months:
+            raise RuntimeError('boom')
+        return {'error': False, 'totalCount': 1, 'items': [{'m': deal_ymd}]}
+
+
+@pytest.fixture
+def tracker():
+    return {'total': 0, 'peak': 0}
+
+
+def _units(api_types, months):
+    return [(api_type, '11680', month) for api_type in api_types for month in months]
+
+
+def test_global_and_per_host_limits(tracker):
+    clients = {
+        'api_a': FakeClient('https://a.example/x', tracker),
+        'api_b': FakeClient('https://a.example/y', tracker),  # 같은 호스트
+        'api_c': FakeClient('https://c.example/z', tracker),
+    }
+    memory = MemorySink()
+    scheduler = CollectionScheduler(clients, sinks=[memory], max_concurrency=5, per_host_concurrency=2)
+
+    units = _units(clients, [f'2024{m:02d}' for m in range(1, 13)])
+    stats = asyncio.run(scheduler.run(units))
+
+    assert stats['completed'] == len(units) == 36
+    assert stats['failed'] == 0
+    assert set(memory.results) == set(units)
+    assert tracker['peak'] <= 5
+    # 호스트별 제한은 URL 경로가 아닌 호스트 기준 (api_a + api_b 합계)
+    assert tracker['peak:a.example'] <= 2
+    assert tracker['peak:c.example'] <= 2
+
+
+def test_failures_are_recorded_not_raised(tracker):
+    clients = {'api_a': FakeClient('https://a.example', tracker, fail_months={'202402'})}
+    memory = MemorySink()
+    scheduler = CollectionScheduler(clients, sinks=[memory], max_concurrency=2)
+
+    stats = asyncio.run(scheduler.run(_units(clients, ['202401', '202402'])))
+
+    assert stats['failed'] == 1
+    assert memory.results[('api_a', '11680', '202402')]['error'] is True
+    assert memory.results[('api_a', '11680', '202401')]['items'] == [{'m': '202401'}]
+
+
+def test_results_stream_to_jsonl(tracker, tmp_path):
+    clients = {'api_a': FakeClient('https://a.example', tracker)}
+    path = tmp_path / 'results.jsonl'
+    progress = []
+    scheduler = CollectionScheduler(clients, sinks=[JsonLinesSink(path, batch_size=2)], max_concurrency=3)
+
+    asyncio.run(scheduler.run(
+        _units(clients, ['202401', '202402', '202403']),
+        progress_callback=lambda done, total, unit, result: progress.append((done, total))
+    ))
+
+    lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert sorted(line['deal_ymd'] for line in lines) == ['202401', '202402', '202403']
+    assert progress[-1] == (3, 3)
+
+
+class CircuitClient:
+    """처음 한 번은 회로 차단 응답을 돌려주는 클라이언트 (호출 순서 기록)"""
+
+    def __init__(self, base_url, calls):
+        self.BASE_URL = base_url
+        self.calls = calls
+        self.tripped = False
+
+    async def get_all_pages_async(self, session, lawd_cd, deal_ymd, num_of_rows, **kwargs):
+        self.calls.append(('api_a', deal_ymd))
+        if not self.tripped:
+            self.tripped = True
+            return {'error': True, 'error_code': scheduler_module.CIRCUIT_OPEN_ERROR_CODE, 'retry_after': 0.05}
+        return {'error': False, 'items': [{'m': deal_ymd}]}
+
+
+def test_open_circuit_pauses_only_its_api(tracker):
+    calls = []
+    clients = {
+        'api_a': CircuitClient('https://a.example', calls),
+        'api_b': FakeClient('https://b.example', tracker),
+    }
+    memory = MemorySink()
+    scheduler = CollectionScheduler(clients, sinks=[memory], max_concurrency=1)
+
+    units = [('api_a', '11680', '202401'), ('api_b', '11680', '202401'), ('api_b', '11680', '202402')]
+    stats = asyncio.run(scheduler.run(units))
+
+    # api_a 회로가 열린 동안 워커는 api_b 작업을 먼저 처리하고, 회로가 반쯤 열리면 다시 시도
+    assert stats['circuit_waits'] == 1
+    assert stats['failed'] == 0
+    assert calls == [('api_a', '202401'), ('api_a', '202401')]
+    assert memory.results[('api_a', '11680', '202401')]['items'] == [{'m': '202401'}]
+    assert tracker['peak'] == 1
+
+
+def test_journal_records_completed_units_only(tracker, tmp_path):
+    clients = {'api_a': FakeClient('https://a.example', tracker, fail_months={'202402'})}
+    journal = CollectionJournal(tmp_path / 'journal.sqlite3')
+    scheduler = CollectionScheduler(clients, sinks=[JournalSink(journal)], max_concurrency=2)
+
+    units = _units(clients, ['202401', '202402', '202403'])
+    asyncio.run(scheduler.run(units))
+
+    completed = journal.completed_results(units)
+    # 실패한 월은 기록하지 않으므로 재개 시 그 월만 다시 수집
+    assert set(completed) == {('api_a', '11680', '202401'), ('api_a', '11680', '202403')}
+    assert completed[('api_a', '11680', '202401')]['items'] == [{'m': '202401'}]
+
+
+def test_catalog_forwards_changed_units_only(tracker, tmp_path):
+    clients = {'api_a': FakeClient('https://a.example', tracker, fail_months={'202403'})}
+    catalog = FreshnessCatalog(tmp_path / 'catalog.sqlite3')
+    catalog.record(('api_a', '11680', '202401'), {'error': False, 'items': [{'m': '202401'}]})
+    catalog.record(('api_a', '11680', '202402'), {'error': False, 'items': [{'m': 'old'}]})
+
+    memory = MemorySink()
+    sink = CatalogSink(catalog, sinks=[memory])
+    scheduler = CollectionScheduler(clients, sinks=[sink], max_concurrency=2)
+    asyncio.run(scheduler.run(_units(clients, ['202401', '202402', '202403', '202404'])))
+
+    # 내용이 같은 202401은 다음 저장소로 넘기지 않음, 실패(202403)는 그대로 전달
+    assert sorted(key[2] for key in memory.results) == ['202402', '202403', '202404']
+    assert sink.counts == {'unchanged': 1, 'changed': 1, 'new': 1}
+
+
+def test_journal_and_catalog_wait_for_downstream_flush(tracker, tmp_path, monkeypatch):
+    clients = {'api_a': FakeClient('https://a.example', tracker)}
+    journal = CollectionJournal(tmp_path / 'journal.sqlite3')
+    catalog = FreshnessCatalog(tmp_path / 'catalog.sqlite3')
+    units = _units(clients, ['202401', '202402', '202403'])
+
+    def failing_append(self, lines):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(JsonLinesSink, '_append', failing_append)
+    lines = JsonLinesSink(tmp_path / 'out.jsonl', batch_size=10)
+    sink = JournalSink(journal, sinks=[CatalogSink(catalog, sinks=[lines])])
+    with pytest.raises(OSError):
+        asyncio.run(CollectionScheduler(clients, sinks=[sink]).run(units))
+
+    # 파일에 쓰지 못한 작업은 저널/카탈로그에도 남기지 않아 다음 실행에서 다시 수집
+    assert journal.completed_results(units) == {}
+    assert catalog.lookup(units) == {}
+
+    monkeypatch.undo()
+    lines = JsonLinesSink(tmp_path / 'out.jsonl', batch_size=10)
+    sink = JournalSink(journal, sinks=[CatalogSink(catalog, sinks=[lines])])
+    asyncio.run(CollectionScheduler(clients, sinks=[sink]).run(units))
+
+    assert set(journal.completed_results(units)) == set(units)
+    assert set(catalog.lookup(units)) == set(units)
+    assert sink.recorded == 3
+
+
+def test_database_sink_batches_units(tracker, monkeypatch):
+    pytest.importorskip("sqlalchemy")
+    clients = {'api_a': FakeClient('https://a.example', tracker, fail_months=['202403'])}
+    batches = []
+
+    def fake_copy(self, items):
+        batches.append(items)
+        return {'staged': len(items), 'inserted': len(items), 'updated': 0}
+
+    monkeypatch.setattr(DatabaseSink, '_copy', fake_copy)
+    sink = DatabaseSink(batch_size=2)
+    scheduler = CollectionScheduler(clients, sinks=[sink], max_concurrency=1)
+    asyncio.run(scheduler.run(_units(clients, ['202401', '202402', '202403', '202404'])))
+
+    # 실패(202403)는 적재하지 않고, 2개 작업씩 한 번에 적재
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0] == {'m': '202401', '_api_type': 'api_a', '_source_file': 'api:api_a/11680/202401'}
+    assert sink.stats == {'units': 3, 'staged': 3, 'inserted': 3, 'updated': 0}
+
+
+def test_catalog_sends_units_the_database_lacks(tracker, tmp_path, monkeypatch):
+    pytest.importorskip("sqlalchemy")
+    clients = {'api_a': FakeClient('https://a.example', tracker)}
+    catalog = FreshnessCatalog(tmp_path / 'catalog.sqlite3')
+    # 이전 실행(예: --to-db 없이)이 카탈로그에 기록한 월
+    catalog.record(('api_a', '11680', '202401'), {'error': False, 'items': [{'m': '202401'}]})
+    batches = []
+
+    def fake_copy(self, items):
+        batches.append(items)
+        return {'staged': len(items), 'inserted': len(items), 'updated': 0}
+
+    monkeypatch.setattr(DatabaseSink, '_copy', fake_copy)
+    units = _units(clients, ['202401', '202402'])
+
+    sink = CatalogSink(catalog, sinks=[DatabaseSink()])
+    asyncio.run(CollectionScheduler(clients, sinks=[sink]).run(units))
+
+    # 카탈로그에는 있지만 DB에 없던 202401도 적재하고, 적재한 내용을 저장소별로 기록
+    assert sorted(item['m'] for batch in batches for item in batch) == ['202401', '202402']
+    assert set(catalog.held_by_sinks(units[0])) == {'database'}
+    assert catalog.split_due(units, recheck_months=0, sinks=['database']) == ([], units)
+
+    batches.clear()
+    sink = CatalogSink(catalog, sinks=[DatabaseSink()])
+    asyncio.run(CollectionScheduler(clients, sinks=[sink]).run(units))
+    assert batches == []
+
+
+def test_cache_sink_serves_units_another_collector_is_fetching(tracker):
+    cache = asyncio.run(scheduler_module.get_async_redis_cache())
+    if not cache:
+        pytest.skip("Redis가 비활성화되어 있습니다")
+    clients = {'api_a': FakeClient('https://a.example', tracker)}
+    busy, free = ('api_a', '99997', '202401'), ('api_a', '99997', '202402')
+
+    async def run():
+        # 다른 수집기가 busy를 받는 중 (락 보유, 논리적으로 만료된 값만 있음)
+        await cache.set_many({busy: {'error': False, 'items': [{'m': 'stale'}]}}, ttl=0)
+        token = await cache.acquire_lock(*busy)
+        memory, sink = MemorySink(), CacheSink()
+        stats = await CollectionScheduler(clients, sinks=[sink, memory]).run([busy, free])
+        entry = await cache.get_entry(*free)
+        for key in (busy, free):
+            await cache.delete(*key)
+            await cache.client.delete(cache._lock_key(cache._build_key(*key)))
+        return token, memory, sink, stats, entry
+
+    token, memory, sink, stats, entry = asyncio.run(run())
+
+    assert token is not None
+    assert memory.results[busy]['items'] == [{'m': 'stale'}]
+    assert memory.results[free]['items'] == [{'m': '202402'}]
+    assert stats['served_cached'] == 1 and sink.served == 1
+    # 직접 받은 작업은 재계산 시간과 함께 기록
+    assert entry.data['items'] == [{'m': '202402'}] and entry.delta > 0
+
+
+def test_unknown_api_type_rejected(tracker):
+    scheduler = CollectionScheduler({'api_a': FakeClient('https://a.example', tracker)})
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run([('api_x', '11680', '202401')]))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
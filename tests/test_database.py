@@ -6,7 +6,7 @@ from datetime import datetime, date
 from decimal import Decimal
 from backend.db.models import Transaction
 from backend.db.session import get_session, init_db, drop_db
-from backend.db.repository import TransactionRepository
+from backend.db.repository import TransactionRepository, COPY_COLUMNS, build_copy_buffer
 
 
 @pytest.fixture(scope='module')
@@ -67,6 +67,22 @@ class TestTransactionModel:
         assert result['아파트'] == '테스트아파트'
         assert result['_deal_amount_numeric'] == 150000.0
 
+    def test_copy_buffer(self, sample_transaction_data):
+        """COPY CSV 변환 (빈 aptSeq와 None은 NULL, 빈 문자열은 그대로)"""
+        import csv
+
+        no_seq = {**sample_transaction_data, 'aptSeq': '', '아파트': '테스트, "A"동'}
+        buffer, count = build_copy_buffer([sample_transaction_data, no_seq])
+        rows = [dict(zip(COPY_COLUMNS, row)) for row in csv.reader(buffer)]
+
+        assert count == len(rows) == 2
+        assert rows[0]['apt_seq'] == '12345'
+        assert rows[0]['_deal_date'] == '2023-12-15'
+        assert rows[0]['deposit'] == ''
+        assert rows[0]['_deposit_numeric'] == '\\N'
+        assert rows[1]['apt_seq'] == '\\N'
+        assert rows[1]['apt_nm'] == '테스트, "A"동'
+
 
 class TestTransactionRepository:
     """TransactionRepository 테스트"""
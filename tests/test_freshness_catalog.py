@@ -0,0 +1,98 @@
+"""
+신선도 카탈로그 테스트
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+# freshness_catalog는 프로젝트 설정(config)을 필요로 하는 캐시 모듈을 사용
+catalog_module = pytest.importorskip("freshness_catalog")
+
+FreshnessCatalog = catalog_module.FreshnessCatalog
+
+KEY = ('api_02', '11680', '202401')
+ITEMS = [{'aptNm': 'A', 'dealAmount': '100,000'}, {'aptNm': 'B', 'dealAmount': '90,000'}]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = FreshnessCatalog(tmp_path / 'catalog.sqlite3')
+    yield catalog
+    catalog.close()
+
+
+def test_record_detects_changes(catalog):
+    assert catalog.record(KEY, {'error': False, 'items': ITEMS}) == 'new'
+    first = catalog.lookup([KEY])[KEY]
+
+    # 순서만 다른 같은 내용은 변경 없음 (받은 시각만 갱신)
+    assert catalog.record(KEY, {'error': False, 'items': ITEMS[::-1]}) == 'unchanged'
+    second = catalog.lookup([KEY])[KEY]
+    assert second['changed_at'] == first['changed_at']
+    assert second['fetched_at'] > first['fetched_at']
+
+    # 해제 신고 반영
+    cancelled = [ITEMS[0], {**ITEMS[1], 'cdealDay': '15'}]
+    assert catalog.record(KEY, {'error': False, 'items': cancelled}) == 'changed'
+    assert catalog.record(KEY, {'error': True, 'message': 'timeout'}) is None
+    assert catalog.lookup([KEY])[KEY]['item_count'] == 2
+
+
+def test_partial_results_not_recorded(catalog):
+    partial = {'error': False, 'items': ITEMS[:1], 'reportedCount': 2, 'fetchedCount': 1}
+    assert catalog.record(KEY, partial) is None
+    assert catalog.record(KEY, {**partial, 'error': True, 'partial': True, 'failed_pages': [2]}) is None
+    assert catalog.lookup([KEY]) == {}
+
+    # 카탈로그에 없으므로 재확인 기간이 지난 월도 증분 수집 대상
+    due, fresh = catalog.split_due([KEY], recheck_months=0)
+    assert (due, fresh) == ([KEY], [])
+
+
+def test_split_due_keeps_missing_and_recent_months(catalog):
+    today = datetime(2024, 6, 10)
+    for deal_ymd in ('202401', '202404', '202405'):
+        catalog.record(('api_02', '11680', deal_ymd), {'error': False, 'items': []})
+
+    keys = [('api_02', '11680', f'2024{month:02d}') for month in range(1, 7)]
+    due, fresh = catalog.split_due(keys, recheck_months=3, today=today)
+
+    # 202402, 202403은 기록 없음, 202404~202406은 재확인 기간
+    assert [key[2] for key in due] == ['202402', '202403', '202404', '202405', '202406']
+    assert [key[2] for key in fresh] == ['202401']
+
+
+def test_split_due_keeps_units_missing_from_sinks(catalog):
+    today = datetime(2024, 6, 10)
+    keys = [('api_02', '11680', f'2024{month:02d}') for month in range(1, 4)]
+    for key in keys:
+        catalog.record(key, {'error': False, 'items': ITEMS})
+    digest = catalog.lookup(keys)[keys[0]]['content_hash']
+    catalog.record_sink('database', {keys[0]: digest, keys[1]: 'old'})
+
+    due, fresh = catalog.split_due(keys, recheck_months=0, today=today, sinks=['database'])
+
+    # 202402는 DB에 다른 내용, 202403은 DB에 없음
+    assert (due, fresh) == (keys[1:], keys[:1])
+    assert catalog.split_due(keys, recheck_months=0, today=today) == ([], keys)
+
+
+def test_import_output_files(catalog, tmp_path):
+    output_dir = tmp_path / 'api_02' / 'output'
+    output_dir.mkdir(parents=True)
+    (output_dir / 'batch_test_results_11680.json').write_text(json.dumps({
+        'test_results': [
+            {'lawd_cd': '11680', 'deal_ymd': '202401', 'result': {'error': False, 'items': ITEMS}},
+            {'lawd_cd': '11680', 'deal_ymd': '202402', 'result': {'error': True, 'message': 'timeout'}},
+        ]
+    }), encoding='utf-8')
+
+    assert catalog.import_output_files(tmp_path) == 1
+    assert catalog.import_output_files(tmp_path) == 0
+
+    entry = catalog.lookup([KEY])[KEY]
+    assert (entry['source'], entry['item_count']) == ('file', 2)
+    # 파일과 같은 내용을 API로 다시 받으면 변경 없음
+    assert catalog.record(KEY, {'error': False, 'items': ITEMS}) == 'unchanged'
+    assert catalog.stats()['by_source'] == {'api': 1}
@@ -0,0 +1,74 @@
+"""
+커서 페이지네이션 테스트
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("structlog")
+pytest.importorskip("pydantic")
+
+# fastapi-backend 패키지(services, schemas)는 루트 모듈보다 뒤에서 찾도록 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fastapi-backend'))
+
+from services import analyzer_service  # noqa: E402
+from services.pagination import (  # noqa: E402
+    APARTMENT_CURSOR,
+    BARGAIN_CURSOR,
+    InvalidCursorError,
+    build_page,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(('래미안',)), APARTMENT_CURSOR) == ('래미안',)
+    assert decode_cursor(encode_cursor((-12.5, 3)), BARGAIN_CURSOR) == (-12.5, 3)
+    assert decode_cursor(None, APARTMENT_CURSOR) is None
+
+
+@pytest.mark.parametrize('sort_key, part_types', [
+    ((1,), APARTMENT_CURSOR),
+    (('래미안', 'extra'), APARTMENT_CURSOR),
+    (('래미안',), BARGAIN_CURSOR),
+    ((-12.5, 'x'), BARGAIN_CURSOR),
+    ((True, 1), BARGAIN_CURSOR),
+])
+def test_cursor_of_wrong_shape_rejected(sort_key, part_types):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(sort_key), part_types)
+
+
+def test_apartment_pages_group_once(monkeypatch):
+    items = [
+        {'아파트': name, '_deal_date': '2024-03-15', '_region_name': '강남구',
+         '_deal_amount_numeric': 100000, '_area_numeric': 84.9}
+        for name in ('가', '나', '다')
+    ]
+    monkeypatch.setattr(
+        analyzer_service, 'load_all_json_data',
+        lambda base_path=None, debug=False: (list(items), {'data_source': 'test'}),
+    )
+    groupings = []
+    original = analyzer_service.group_apartments
+    monkeypatch.setattr(
+        analyzer_service, 'group_apartments',
+        lambda rows: groupings.append(len(rows)) or original(rows),
+    )
+    service = analyzer_service.AnalyzerService()
+
+    names = []
+    after = None
+    while True:
+        rows, metadata = service.iter_apartment_analysis(after=after, limit=2)
+        page = build_page(rows, 1)
+        names += [row['apartment'] for row in page['items']]
+        if not page['has_more']:
+            break
+        after = decode_cursor(page['next_cursor'], APARTMENT_CURSOR)
+
+    assert names == ['가', '나', '다']
+    assert metadata['filtered_records'] == 3
+    assert groupings == [3]
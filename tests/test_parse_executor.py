@@ -0,0 +1,59 @@
+"""
+응답 파싱 실행기 테스트
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from common import parse_xml_response
+
+# parse_executor는 프로젝트 설정(config)을 필요로 하는 logger를 사용
+parse_executor = pytest.importorskip("parse_executor")
+
+ParseExecutor = parse_executor.ParseExecutor
+
+PAGE = (Path(__file__).parent / 'fixtures' / 'molit' / 'api_02_apt_trade_page.xml').read_bytes()
+NODATA = (Path(__file__).parent / 'fixtures' / 'molit' / 'nodata.xml').read_bytes()
+
+
+@pytest.mark.parametrize('mode', ['inline', 'thread', 'process'])
+def test_parse_matches_direct_parse(mode):
+    executor = ParseExecutor(mode=mode, workers=2, inline_bytes=1024)
+
+    async def run():
+        return await asyncio.gather(executor.parse_xml(PAGE), executor.parse_xml(NODATA))
+
+    try:
+        (page, page_time), (nodata, _) = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert page == parse_xml_response(PAGE)
+    assert nodata == parse_xml_response(NODATA)
+    assert page_time >= 0
+    stats = executor.get_stats()
+    # 작은 응답은 모드와 관계없이 바로 파싱
+    assert (stats['offloaded'], stats['inline']) == ((0, 2) if mode == 'inline' else (1, 1))
+
+
+def test_pending_parses_are_bounded():
+    executor = ParseExecutor(mode='thread', workers=1, max_pending=2, inline_bytes=0)
+
+    async def run():
+        return await asyncio.gather(*(executor.parse_xml(PAGE) for _ in range(8)))
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert all(result == results[0][0] for result, _ in results)
+    stats = executor.get_stats()
+    assert stats['offloaded'] == 8
+    assert 1 <= stats['peak_pending'] <= 2
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        ParseExecutor(mode='gpu')
@@ -0,0 +1,81 @@
+"""
+적응형 토큰 버킷 Rate Limiter 테스트
+"""
+import time
+import asyncio
+import pytest
+
+# rate_limiter는 프로젝트 설정(config)을 필요로 하는 logger를 사용
+rate_limiter = pytest.importorskip("rate_limiter")
+
+TokenBucketLimiter = rate_limiter.TokenBucketLimiter
+
+
+class TestTokenBucket:
+    """토큰 버킷 대기 테스트"""
+
+    def test_burst_without_wait(self):
+        limiter = TokenBucketLimiter(rate=10, burst=5)
+        waits = [limiter.acquire() for _ in range(5)]
+        assert waits == [0.0] * 5
+        assert limiter.stats['waits'] == 0
+
+    def test_waits_when_bucket_empty(self):
+        limiter = TokenBucketLimiter(rate=20, burst=1, max_rate=20)
+        limiter.acquire()
+
+        start = time.monotonic()
+        wait = limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert wait == pytest.approx(0.05, abs=0.02)
+        assert elapsed >= wait * 0.9
+        assert limiter.stats['waits'] == 1
+
+    def test_concurrent_async_reservations_are_spaced(self):
+        """동시에 몰린 코루틴은 예약 순서대로 1/rate 간격으로 대기"""
+        limiter = TokenBucketLimiter(rate=50, burst=1, max_rate=50)
+
+        async def run():
+            return await asyncio.gather(*[limiter.acquire_async() for _ in range(5)])
+
+        waits = sorted(asyncio.run(run()))
+        assert waits[0] == 0.0
+        assert waits[-1] == pytest.approx(4 / 50, abs=0.02)
+
+
+class TestAIMD:
+    """AIMD 속도 조정 테스트"""
+
+    def test_throttle_halves_rate(self):
+        limiter = TokenBucketLimiter(rate=10, min_rate=1, max_rate=30, decrease=0.5, cooldown=0)
+        limiter.on_throttle('http_429')
+        assert limiter.rate == 5
+        assert limiter.stats['decreases'] == 1
+
+    def test_rate_bounded_by_min(self):
+        limiter = TokenBucketLimiter(rate=2, min_rate=1.5, decrease=0.5, cooldown=0)
+        limiter.on_throttle('timeout')
+        limiter.on_throttle('timeout')
+        assert limiter.rate == 1.5
+
+    def test_cooldown_prevents_repeated_decrease(self):
+        """같은 순간 몰린 실패로는 한 번만 감속"""
+        limiter = TokenBucketLimiter(rate=10, decrease=0.5, cooldown=60)
+        for _ in range(5):
+            limiter.on_throttle('http_503')
+        assert limiter.rate == 5
+        assert limiter.stats['throttles'] == 5
+        assert limiter.stats['decreases'] == 1
+
+    def test_success_increases_up_to_max(self):
+        limiter = TokenBucketLimiter(rate=10, max_rate=12, increase=5)
+        limiter.on_success()
+        assert limiter.rate == pytest.approx(10.5)
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.rate == 12
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
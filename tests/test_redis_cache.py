@@ -5,7 +5,11 @@ import pytest
 import time
 from datetime import datetime
 
-from backend.cache.redis_client import RedisCache, get_redis_cache, USE_REDIS
+from backend.cache.redis_client import (
+    RedisCache, CacheEntry, get_redis_cache, USE_REDIS,
+    CACHE_NEGATIVE_TTL_RECENT, CACHE_NEGATIVE_TTL_HISTORICAL,
+)
+from common import is_empty_result
 
 
 @pytest.mark.skipif(not USE_REDIS, reason="Redis가 비활성화되어 있습니다")
@@ -127,6 +131,131 @@ class TestRedisCache:
         # 삭제 확인
         assert cache.get('api_02', '11680', '202312') is None
 
+    def test_get_many_and_set_many(self, cache):
+        """벌크 조회/저장 테스트 (MGET + 파이프라인 SETEX)"""
+        if not cache:
+            pytest.skip("Redis 연결 실패")
+
+        entries = {
+            ('api_02', '11680', '202001'): {'items': [1], 'totalCount': 1},
+            ('api_04', '11680', '202001'): {'items': [1, 2], 'totalCount': 2},
+        }
+        assert cache.set_many(entries) == 2
+
+        keys = list(entries) + [('api_02', '11680', '199001')]
+        hits = cache.get_many(keys)
+
+        assert hits == entries
+        assert cache.stats['hits'] == 2
+        assert cache.stats['misses'] == 1
+
+        # 키별 Adaptive TTL 적용
+        ttl = cache.client.ttl(cache._build_key('api_02', '11680', '202001'))
+        assert ttl > cache._calculate_ttl(datetime.now().strftime('%Y%m'))
+
+        for key in entries:
+            cache.delete(*key)
+
+    def test_stale_entries_are_misses_for_plain_reads(self, cache):
+        """논리적 TTL이 지난 값은 get/get_many에서 미스, get_entry에서만 stale 값"""
+        if not cache:
+            pytest.skip("Redis 연결 실패")
+
+        key = ('api_02', '11680', '202002')
+        assert cache.set_many({key: {'items': [1]}}, ttl=0) == 1
+
+        assert cache.get_many([key]) == {}
+        assert cache.get(*key) is None
+        entry = cache.get_entry(*key)
+        assert entry.is_stale and entry.data == {'items': [1]}
+
+        cache.delete(*key)
+
+    def test_get_many_early_refresh(self, cache):
+        """xfetch_beta를 주면 재계산이 오래 걸린 값은 만료 전에도 미스"""
+        if not cache:
+            pytest.skip("Redis 연결 실패")
+
+        key = ('api_02', '11680', '202003')
+        assert cache.set_many({key: {'items': [1]}}, ttl=60, deltas={key: 1e9}) == 1
+
+        assert cache.get_many([key]) == {key: {'items': [1]}}
+        assert cache.get_many([key], xfetch_beta=1.0) == {}
+        assert cache.get_entry(*key).delta == 1e9
+
+        cache.delete(*key)
+
+    def test_client_fetch_is_cached(self, cache):
+        """get_all_pages는 캐싱되고, use_cache=False면 캐시를 거치지 않음"""
+        if not cache:
+            pytest.skip("Redis 연결 실패")
+
+        from backend.cache.decorators import cache_api_response
+
+        class FakeClient:
+            BASE_URL = 'https://apis.data.go.kr/1613000/RTMSDataSvcAptTrade'
+            calls = 0
+
+            @cache_api_response()
+            def get_all_pages(self, lawd_cd, deal_ymd, **kwargs):
+                FakeClient.calls += 1
+                return {'error': False, 'items': [{'m': deal_ymd}]}
+
+        client = FakeClient()
+        cache.delete('api_02', '99998', '202001')
+
+        assert client.get_all_pages('99998', '202001') == {'error': False, 'items': [{'m': '202001'}]}
+        assert client.get_all_pages('99998', '202001')['items'] == [{'m': '202001'}]
+        assert FakeClient.calls == 1
+
+        client.get_all_pages('99998', '202001', use_cache=False)
+        assert FakeClient.calls == 2
+
+        key = cache._build_key('api_02', '99998', '202001')
+        cache.client.delete(key, cache._lock_key(key))
+
+    def test_mark_and_get_empty_months(self, cache):
+        """거래 없는 월 기록/조회 테스트 (월별 빈 결과 TTL)"""
+        if not cache:
+            pytest.skip("Redis 연결 실패")
+
+        current_month = datetime.now().strftime('%Y%m')
+        assert cache._calculate_negative_ttl(current_month) == CACHE_NEGATIVE_TTL_RECENT
+        assert cache._calculate_negative_ttl('202001') == CACHE_NEGATIVE_TTL_HISTORICAL
+
+        assert cache.mark_empty('api_01', '99999', ['202001', '202002']) == 2
+
+        empty = cache.get_empty_months([('api_01', '99999'), ('api_02', '99999')])
+        assert empty[('api_01', '99999')] == {'202001', '202002'}
+        assert empty[('api_02', '99999')] == set()
+
+        # 특정 월 무효화 시 빈 월 맵에서도 제거
+        cache.invalidate('api_01', '99999', '202001')
+        assert cache.get_empty_months([('api_01', '99999')])[('api_01', '99999')] == {'202002'}
+
+        cache.client.delete(cache._empty_map_key('api_01', '99999'))
+
+    def test_clear_all_keeps_non_cache_keys(self, cache):
+        """기본 패턴 삭제/인벤토리는 API 응답 캐시 키만 대상"""
+        if not cache:
+            pytest.skip("Redis 연결 실패")
+
+        others = ['apt_insights:ratelimit:test', 'apt_insights:export_job:test']
+        for key in others:
+            cache.client.set(key, '1')
+        cache.set('api_02', '99999', '202001', {'items': []})
+        cache.mark_empty('api_02', '99999', ['202002'])
+
+        report = cache.inventory(with_memory=False)
+        assert report['empty_map_keys'] == 1
+        assert set(report['by_api_type']) == {'api_02'}
+        assert set(report['by_month']) == {'202001'}
+
+        assert cache.clear_all() == 2
+        for key in others:
+            assert cache.client.get(key) is not None
+            cache.client.delete(key)
+
     def test_cache_performance(self, cache):
         """캐시 성능 테스트"""
         if not cache:
@@ -190,5 +319,63 @@ class TestCacheIntegration:
         print(f"   히트율: {stats['hit_rate_percent']:.2f}%")
 
 
+class TestCacheEntry:
+    """만료 메타데이터 / XFetch 조기 갱신 테스트 (Redis 불필요)"""
+
+    def test_plain_value_never_refreshes(self):
+        """메타데이터 없는 이전 값은 Redis TTL로만 만료"""
+        assert CacheEntry({'a': 1}).should_refresh() is False
+
+    def test_stale_entry_refreshes(self):
+        entry = CacheEntry({'a': 1}, expires_at=time.time() - 1, delta=0.1)
+        assert entry.is_stale is True
+        assert entry.should_refresh() is True
+
+    def test_early_refresh_probability(self):
+        """만료가 가까울수록, 재계산이 느릴수록 조기 갱신 확률 증가"""
+        near = CacheEntry({}, expires_at=time.time() + 0.5, delta=0.5)
+        far = CacheEntry({}, expires_at=time.time() + 60, delta=0.5)
+
+        near_rate = sum(near.should_refresh() for _ in range(1000)) / 1000
+        far_rate = sum(far.should_refresh() for _ in range(1000)) / 1000
+
+        assert near_rate > 0.2
+        assert far_rate == 0
+
+    def test_beta_zero_disables_early_refresh(self):
+        entry = CacheEntry({}, expires_at=time.time() + 0.01, delta=10)
+        assert entry.should_refresh(beta=0) is False
+
+
+class TestKeyPatterns:
+    """무효화 패턴 생성 테스트 (Redis 불필요)"""
+
+    def test_all(self):
+        assert RedisCache.build_pattern() == 'apt_insights:api_*'
+
+    def test_scoped(self):
+        assert RedisCache.build_pattern('api_02') == 'apt_insights:api_02:*:*'
+        assert RedisCache.build_pattern(lawd_cd='11680') == 'apt_insights:api_*:11680:*'
+        # extra 식별자와 락 키까지 포함
+        assert RedisCache.build_pattern('api_02', '11680', '202401') == 'apt_insights:api_02:11680:202401*'
+        assert RedisCache.build_pattern(deal_ymd='2023*') == 'apt_insights:api_*:*:2023*'
+
+
+class TestEmptyResult:
+    """거래 없는 월 판별 테스트 (Redis 불필요)"""
+
+    def test_empty_success(self):
+        assert is_empty_result({'error': False, 'items': []}) is True
+        assert is_empty_result({'error': False, 'items': [{'a': 1}]}) is False
+
+    def test_nodata_code(self):
+        assert is_empty_result({'error': True, 'result_code': '03'}) is True
+
+    def test_other_errors_are_not_empty(self):
+        """네트워크/인증 오류는 빈 결과로 기록하면 안 됨"""
+        assert is_empty_result({'error': True, 'message': 'timeout'}) is False
+        assert is_empty_result({'error': True, 'result_code': '30'}) is False
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '-s'])
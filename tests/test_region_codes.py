@@ -0,0 +1,31 @@
+"""
+시군구 법정동코드 표 테스트
+"""
+import pytest
+
+from region_codes import REGION_CODES, SIDO_NAMES, load_region_codes, region_name
+
+
+def test_codes_are_five_digits_with_known_sido():
+    assert len(REGION_CODES) == 250
+    for lawd_cd in REGION_CODES:
+        assert len(lawd_cd) == 5 and lawd_cd.isdigit()
+        assert lawd_cd[:2] in SIDO_NAMES
+
+
+def test_filter_by_sido():
+    regions = load_region_codes(sido=['11'])
+    assert len(regions) == 25
+    assert list(regions)[0] == '11110'
+    assert region_name('11680') == '서울특별시 강남구'
+
+
+def test_csv_override(tmp_path):
+    path = tmp_path / 'regions.csv'
+    path.write_text('lawd_cd,name\n41192,부천시 원미구\n11680,강남구\n', encoding='utf-8')
+
+    assert load_region_codes(path=path) == {'11680': '강남구', '41192': '부천시 원미구'}
+
+    path.write_text('lawd_cd,name\n4119,잘못된 코드\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        load_region_codes(path=path)
@@ -0,0 +1,60 @@
+"""
+PDF 리포트 서비스 테스트
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("structlog")
+pytest.importorskip("pydantic")
+pytest.importorskip("reportlab")
+
+# fastapi-backend 패키지(services, schemas)는 루트 모듈보다 뒤에서 찾도록 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fastapi-backend'))
+
+from schemas.subscription import ExportFilters  # noqa: E402
+from services import analyzer_service, report_service  # noqa: E402
+
+
+def _item(region, amount, deal_date='2024-03-15'):
+    return {
+        '_deal_date': deal_date,
+        '_region_name': region,
+        '_deal_amount_numeric': amount,
+        '_area_numeric': 84.9,
+        'aptNm': f'{region} 아파트',
+    }
+
+
+@pytest.fixture
+def service(monkeypatch):
+    items = (
+        [_item('강남구', 200000 + i * 1000) for i in range(3)]
+        + [_item('노원구', 60000), _item('노원구', 62000)]
+        + [_item('종로구', 90000)]
+    )
+    monkeypatch.setattr(
+        analyzer_service, 'load_all_json_data',
+        lambda base_path=None, debug=False: (list(items), {'data_source': 'test'}),
+    )
+    monkeypatch.setattr(analyzer_service, '_analyzer_service', None)
+    yield analyzer_service.get_analyzer_service()
+    monkeypatch.setattr(analyzer_service, '_analyzer_service', None)
+
+
+def test_regional_section_lists_busiest_regions(service, monkeypatch):
+    monkeypatch.setattr(report_service, 'REPORT_TOP_REGIONS', 2)
+
+    sections = report_service.build_report_sections(ExportFilters())
+
+    regions = sections['regional']['data']
+    assert [row['region'] for row in regions] == ['강남구', '노원구']
+    assert [row['count'] for row in regions] == [3, 2]
+
+
+def test_write_pdf_report(service, tmp_path):
+    path = tmp_path / 'report.pdf'
+
+    assert report_service.write_pdf_report(ExportFilters(), str(path)) == 6
+    assert path.read_bytes().startswith(b'%PDF')
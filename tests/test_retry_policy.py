@@ -0,0 +1,139 @@
+"""
+재시도 정책 / 회로 차단기 테스트
+"""
+import time
+import pytest
+
+# retry_policy는 프로젝트 설정(config)을 필요로 하는 logger를 사용
+retry_policy = pytest.importorskip("retry_policy")
+
+CircuitBreaker = retry_policy.CircuitBreaker
+
+
+class TestBackoff:
+    """지수 백오프 + Full Jitter 테스트"""
+
+    def test_delay_within_exponential_bound(self):
+        for attempt in range(5):
+            for _ in range(50):
+                delay = retry_policy.backoff_delay(attempt, base=0.5, cap=100)
+                assert 0 <= delay <= 0.5 * (2 ** attempt)
+
+    def test_delay_capped(self):
+        delays = [retry_policy.backoff_delay(20, base=1, cap=2) for _ in range(50)]
+        assert max(delays) <= 2
+
+    def test_retryable_status(self):
+        assert retry_policy.is_retryable_status(429)
+        assert retry_policy.is_retryable_status(503)
+        assert not retry_policy.is_retryable_status(404)
+        assert not retry_policy.is_retryable_status(None)
+
+
+class TestCircuitBreaker:
+    """회로 차단기 상태 전이 테스트"""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+        for _ in range(2):
+            assert breaker.allow_request()
+            breaker.record_failure()
+        assert breaker.state == retry_policy.STATE_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == retry_policy.STATE_OPEN
+        assert not breaker.allow_request()
+        assert breaker.stats['rejected'] == 1
+        assert breaker.retry_after() > 0
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == retry_policy.STATE_CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        time.sleep(0.06)
+        assert breaker.allow_request()
+        assert breaker.state == retry_policy.STATE_HALF_OPEN
+        # 시험 요청이 진행 중이면 다른 요청은 거부
+        assert not breaker.allow_request()
+
+    def test_probe_success_closes(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == retry_policy.STATE_CLOSED
+        assert breaker.allow_request()
+
+    def test_probe_failure_reopens(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == retry_policy.STATE_OPEN
+        assert breaker.stats['opens'] == 2
+
+    def test_circuit_open_error(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        error = retry_policy.circuit_open_error(breaker)
+        assert error['error'] is True
+        assert error['error_code'] == retry_policy.CIRCUIT_OPEN_ERROR_CODE
+        assert 0 < error['retry_after'] <= 30
+
+
+class TestStatePublishing:
+    """회로 상태 Redis 기록 테스트"""
+
+    @pytest.fixture
+    def writes(self, monkeypatch):
+        writes = []
+        monkeypatch.setattr(retry_policy, 'USE_REDIS', True)
+        monkeypatch.setattr(retry_policy, 'REDIS_AVAILABLE', True)
+        monkeypatch.setattr(retry_policy, '_write_states', writes.append)
+        monkeypatch.setattr(retry_policy, '_pending_states', {})
+        monkeypatch.setattr(retry_policy, '_state_failures', 0)
+        monkeypatch.setattr(retry_policy, '_state_retry_at', 0.0)
+        return writes
+
+    def test_failed_publish_retried_after_backoff(self, writes, monkeypatch):
+        def fail(states):
+            raise ConnectionError("redis down")
+
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+        monkeypatch.setattr(retry_policy, '_write_states', fail)
+        breaker.record_failure()
+        assert retry_policy._state_failures == 1
+
+        # 백오프 중에는 다시 기록하지 않고, 지나면 다음 요청 때 기록
+        monkeypatch.setattr(retry_policy, '_write_states', writes.append)
+        monkeypatch.setattr(retry_policy, '_state_retry_at', time.monotonic() + 60)
+        breaker.allow_request()
+        assert writes == []
+
+        monkeypatch.setattr(retry_policy, '_state_retry_at', 0.0)
+        breaker.allow_request()
+        assert writes[0]['test']['state'] == retry_policy.STATE_OPEN
+        assert retry_policy._pending_states == {}
+        assert retry_policy._state_failures == 0
+
+    def test_shutdown_publishes_closed(self, writes, monkeypatch):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        monkeypatch.setattr(retry_policy, '_circuit_breakers', {"test": breaker})
+
+        retry_policy._publish_shutdown()
+
+        assert writes[-1]['test']['state'] == retry_policy.STATE_CLOSED
@@ -0,0 +1,76 @@
+"""
+MOLIT XML 응답 파싱 테스트 (tests/fixtures/molit)
+"""
+import gc
+from pathlib import Path
+
+import pytest
+
+import common
+from common import parse_xml_response, parse_api_response, is_empty_result
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'molit'
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURE_DIR / name).read_bytes()
+
+
+@pytest.mark.parametrize('name', sorted(p.name for p in FIXTURE_DIR.glob('api_*_page.xml')))
+def test_bytes_and_str_parse_identically(name):
+    data = _fixture(name)
+    parsed = parse_xml_response(data)
+
+    assert parsed == parse_xml_response(data.decode('utf-8'))
+    body = parsed['response']['body']
+    assert list(body) == ['totalCount', 'numOfRows', 'pageNo', 'items']
+    assert len(body['items']['item']) == body['totalCount'] == 30
+
+
+def test_item_fields_keep_raw_text():
+    items = parse_xml_response(_fixture('api_02_apt_trade_page.xml'))['response']['body']['items']['item']
+
+    # 값은 공백(해제되지 않은 거래의 cdealDay)과 쉼표를 포함해 그대로
+    assert {item['cdealDay'] for item in items} >= {' '}
+    assert all(',' in item['dealAmount'] for item in items if len(item['dealAmount']) > 3)
+    # 필드 이름은 모든 아이템이 같은 문자열 객체를 공유
+    assert all(a is b for a, b in zip(items[0], items[1]))
+
+
+def test_parse_api_response_contract():
+    result = parse_api_response(parse_xml_response(_fixture('api_04_apt_rent_page.xml')))
+
+    assert result['error'] is False
+    assert (result['result_code'], result['total_count'], result['num_of_rows'], result['page_no']) == ('000', 30, 1000, 1)
+    assert result['item_count'] == len(result['items']) == 30
+
+
+def test_nodata_and_service_errors():
+    nodata = parse_api_response(parse_xml_response(_fixture('nodata.xml')))
+    assert nodata['error'] and is_empty_result(nodata)
+
+    # 인증키 오류는 response/header가 없는 다른 루트로 옴
+    key_error = parse_api_response(parse_xml_response(_fixture('service_key_error.xml')))
+    assert key_error['error'] and not is_empty_result(key_error)
+
+
+def test_malformed_xml_returns_error_and_restores_gc():
+    assert gc.isenabled()
+    result = parse_xml_response(b'<response><body><items><item>')
+
+    assert result['error'] is True
+    assert result['message'].startswith('XML 파싱 실패')
+    assert result['raw_response'] == '<response><body><items><item>'
+    assert gc.isenabled()
+
+
+def test_lxml_backend_matches(monkeypatch):
+    pytest.importorskip('lxml')
+    data = _fixture('api_02_apt_trade_page.xml')
+    expected = parse_xml_response(data)
+
+    monkeypatch.setattr(common, 'XML_PARSER_BACKEND', 'lxml')
+    parsed = parse_xml_response(data)
+    assert parsed == expected
+    items = parsed['response']['body']['items']['item']
+    assert all(a is b for a, b in zip(items[0], items[1]))